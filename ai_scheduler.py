@@ -0,0 +1,99 @@
+"""
+AI_SCHEDULER.PY
+===============
+Ce fichier contient l'étalement des décisions des ennemis sur plusieurs frames.
+BaseEnemy.update se sépare en deux étapes :
+- le déplacement (et l'attaque), bon marché, fait à chaque frame avec la cible en cache ;
+- la décision (BaseEnemy.think : mur visé ou joueur), coûteuse, confiée à ce planificateur.
+À chaque frame, le planificateur fait décider les ennemis tant que son budget (en millisecondes)
+n'est pas épuisé : d'abord ceux proches d'un joueur (trouvés par la grille spatiale des ennemis,
+sans parcourir toute la liste), puis les autres, chacun à tour de rôle. Les proches n'ont droit
+qu'à une part du budget : même au contact d'une foule, les lointains continuent de décider.
+Une vague de 2000 ennemis coûte donc le même temps de décision par frame qu'une vague de 200 ;
+seul l'âge des décisions des ennemis lointains augmente.
+"""
+
+import time
+from constants import *
+
+
+class AIThinkScheduler:
+    """Fait décider les ennemis à tour de rôle dans un budget de temps par frame"""
+
+    def __init__(self, budget_ms=AI_THINK_BUDGET_MS, priority_distance=AI_THINK_PRIORITY_DISTANCE,
+                 priority_share=AI_THINK_PRIORITY_SHARE, clock=time.perf_counter):
+        """
+        Initialise le planificateur
+        Args:
+            budget_ms: Temps accordé aux décisions à chaque frame (en millisecondes)
+            priority_distance: Distance à un joueur (en pixels) sous laquelle un ennemi décide en priorité
+            priority_share: Part du budget (entre 0 et 1) que les ennemis proches peuvent consommer
+            clock: Horloge en secondes (remplaçable pour des mesures reproductibles)
+        """
+        self.budget = budget_ms / 1000
+        self.priority_distance = priority_distance
+        self.priority_share = priority_share
+        self.clock = clock
+        self.frame = 0
+        # Position du tour de rôle dans chacune des deux files (proches, tous les ennemis)
+        self._cursors = [0, 0]
+
+        # Statistiques de la dernière frame (utiles pour les benchmarks)
+        self.thinks = 0
+        self.priority_count = 0
+
+    def update(self, enemies, player, priority_points, enemy_hash, buildings_list=None, obstacles=None):
+        """
+        Fait décider autant d'ennemis que le budget de la frame le permet
+        Args:
+            enemies: Liste des ennemis
+            player: Joueur poursuivi
+            priority_points: Positions (x, y) des joueurs autour desquels les ennemis décident en priorité
+            enemy_hash: Grille spatiale des ennemis de la frame (trouve les proches sans parcourir la liste)
+            buildings_list: Liste des bâtiments (optionnelle, voir BaseEnemy.think)
+            obstacles: Calque des murs (optionnel)
+        """
+        self.frame += 1
+        start = self.clock()
+        deadline = start + self.budget
+
+        priority = []
+        for point_x, point_y in priority_points:
+            priority.extend(enemy_hash.query_radius(point_x, point_y, self.priority_distance))
+        self.priority_count = len(priority)
+
+        self.thinks = self._run(priority, 0, start + self.budget * self.priority_share,
+                                player, buildings_list, obstacles)
+        if self.clock() < deadline:
+            self.thinks += self._run(enemies, 1, deadline, player, buildings_list, obstacles)
+
+    def _run(self, queue, lane, deadline, player, buildings_list, obstacles):
+        """
+        Fait décider les ennemis d'une file à partir de son tour de rôle, jusqu'à l'échéance
+        (chaque ennemi au plus une fois par frame, les morts sont sautés)
+        Args:
+            queue: Ennemis de la file
+            lane: Indice de la file (0 : proches, 1 : tous)
+            deadline: Instant (horloge du planificateur) où le budget de la frame est épuisé
+            player, buildings_list, obstacles: Voir update
+        Returns:
+            Nombre d'ennemis qui ont décidé
+        """
+        if not queue:
+            return 0
+        clock = self.clock
+        frame = self.frame
+        start = self._cursors[lane] % len(queue)
+        visited = thinks = 0
+        while visited < len(queue):
+            enemy = queue[(start + visited) % len(queue)]
+            visited += 1
+            if not enemy.is_alive or enemy.think_frame == frame:
+                continue
+            enemy.think(player, buildings_list, obstacles)
+            enemy.think_frame = frame
+            thinks += 1
+            if clock() >= deadline:
+                break
+        self._cursors[lane] = start + visited
+        return thinks
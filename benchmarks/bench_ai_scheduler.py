@@ -0,0 +1,118 @@
+"""
+BENCH_AI_SCHEDULER.PY
+=====================
+Mesure le coût par frame des décisions des ennemis (BaseEnemy.think : mur visé ou joueur)
+quand une vague de 2000 ennemis arrive d'un coup sur une base fortifiée : décision de chaque
+ennemi à chaque frame contre le planificateur à budget (ai_scheduler.py).
+Vérifie aussi que tous les ennemis finissent par décider, les proches du joueur plus souvent.
+Usage : python benchmarks/bench_ai_scheduler.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+from constants import *
+from ai_scheduler import AIThinkScheduler
+from buildings import Wall
+from enemies import Zombie, Mutant, Wolf
+from obstacle_layer import ObstacleLayer
+from spatial_hash import SpatialHash
+
+SEED = 1234
+BASE_SIZE = 60  # Côté (en cases) de la base fortifiée, joueur au centre
+FIRST_WAVE = 200
+WAVE = 2000
+WAVE_FRAME = 30  # Frame d'arrivée de la grande vague
+FRAMES = 120
+
+
+class BenchPlayer:
+    """Joueur minimal (position fixe, vie illimitée)"""
+
+    def __init__(self, position_x, position_y):
+        self.position_x = position_x
+        self.position_y = position_y
+        self.is_alive = True
+
+    def take_damage(self, damage_amount):
+        pass
+
+
+def spawn(rng, count, area):
+    """Tire des ennemis dans la base"""
+    return [(rng.choice((Zombie, Mutant, Wolf)), rng.uniform(0, area), rng.uniform(0, area)) for _ in range(count)]
+
+
+def run(spawns, player, obstacles, scheduler):
+    """
+    Joue la vague ; retourne le temps de décision de chaque frame (ms) et les ennemis
+    Sans planificateur, chaque ennemi décide à chaque frame.
+    """
+    enemies = [enemy_class(x, y) for enemy_class, x, y in spawns[:FIRST_WAVE]]
+    enemy_hash = SpatialHash()
+    think_ms = []
+    for frame in range(FRAMES):
+        if frame == WAVE_FRAME:
+            enemies.extend(enemy_class(x, y) for enemy_class, x, y in spawns[FIRST_WAVE:])
+        start = time.perf_counter()
+        if scheduler is None:
+            for enemy in enemies:
+                enemy.think(player, obstacles=obstacles)
+        else:
+            # La grille des ennemis est reconstruite par Game.update pour les tourelles : hors mesure
+            enemy_hash.rebuild(enemies)
+            start = time.perf_counter()
+            scheduler.update(enemies, player, [(player.position_x, player.position_y)], enemy_hash,
+                             obstacles=obstacles)
+        think_ms.append((time.perf_counter() - start) * 1000)
+        for enemy in enemies:
+            enemy.update(1 / 60, player, obstacles=obstacles, think=False)
+    return think_ms, enemies
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    rng = random.Random(SEED)
+
+    # Base : murs indestructibles en damier
+    obstacles = ObstacleLayer()
+    for grid_y in range(BASE_SIZE):
+        for grid_x in range(BASE_SIZE):
+            if (grid_x + grid_y) % 3 == 0:
+                wall = Wall(grid_x, grid_y)
+                wall.durability = 10 ** 9  # Les murs ne cèdent pas pendant la mesure
+                obstacles.add(wall)
+    area = BASE_SIZE * TILE_SIZE
+    player = BenchPlayer(area / 2, area / 2)
+    spawns = spawn(rng, FIRST_WAVE + WAVE, area)
+
+    full_ms, _ = run(spawns, player, obstacles, None)
+    scheduler = AIThinkScheduler()
+    scheduled_ms, enemies = run(spawns, player, obstacles, scheduler)
+
+    # Les ennemis proches du joueur décident en priorité, les autres à tour de rôle ; tous finissent par décider
+    near_sq = AI_THINK_PRIORITY_DISTANCE ** 2
+    near = [enemy for enemy in enemies
+            if (enemy.position_x - player.position_x) ** 2 + (enemy.position_y - player.position_y) ** 2 <= near_sq]
+    assert all(enemy.think_frame > 0 for enemy in enemies)
+    near_age = scheduler.frame - min(enemy.think_frame for enemy in near)
+    oldest = scheduler.frame - min(enemy.think_frame for enemy in enemies)
+    print(f"{len(enemies)} ennemis ont tous décidé : OK ({len(near)} proches, dernière décision au plus "
+          f"{near_age} frames ; tous au plus {oldest} frames)")
+
+    def report(label, think_ms):
+        before, after = think_ms[:WAVE_FRAME], think_ms[WAVE_FRAME:]
+        print(f"  {label:<22} : avant la vague {np.median(before):6.2f} ms | "
+              f"après {np.median(after):6.2f} ms (max {max(after):6.2f} ms)")
+
+    print(f"{FIRST_WAVE} puis {FIRST_WAVE + WAVE} ennemis, {len(obstacles)} murs, décisions par frame :")
+    report("à chaque frame", full_ms)
+    report(f"budget de {AI_THINK_BUDGET_MS:g} ms", scheduled_ms)
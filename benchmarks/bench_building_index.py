@@ -0,0 +1,78 @@
+"""
+BENCH_BUILDING_INDEX.PY
+=======================
+Mesure les requêtes d'occupation sur une grande base (2500 bâtiments) : vérification de
+toutes les cases d'un plan de 20x20 cases avant sa pose et recherche du bâtiment sous la
+souris, par parcours de buildings_list (World.is_tile_buildable sans index) puis avec
+l'index d'occupation des cases (building_index.py).
+Vérifie que les deux méthodes donnent les mêmes réponses.
+Usage : python benchmarks/bench_building_index.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import *
+from buildings import Wall, Turret
+from world import World
+from building_index import BuildingIndex
+
+SEED = 1234
+BASE_SIZE = 50  # Côté (en cases) de la base, entièrement construite
+BLUEPRINT_SIZE = 20  # Côté (en cases) du plan posé d'un coup
+LOOKUPS = 1000
+
+
+def find_building(buildings_list, grid_x, grid_y):
+    """Référence : bâtiment d'une case, par parcours de la liste"""
+    for building in buildings_list:
+        if building.grid_x == grid_x and building.grid_y == grid_y:
+            return building
+    return None
+
+
+if __name__ == "__main__":
+    rng = random.Random(SEED)
+    world = World()
+    buildings_list = [rng.choice((Wall, Turret))(grid_x, grid_y)
+                      for grid_y in range(BASE_SIZE) for grid_x in range(BASE_SIZE)]
+    building_index = BuildingIndex()
+    for building in buildings_list:
+        building_index.add(building)
+
+    # Plan à cheval sur le bord de la base : une partie des cases est occupée
+    blueprint = [(BASE_SIZE - BLUEPRINT_SIZE // 2 + offset_x, BASE_SIZE - BLUEPRINT_SIZE // 2 + offset_y)
+                 for offset_y in range(BLUEPRINT_SIZE) for offset_x in range(BLUEPRINT_SIZE)]
+    lookups = [(rng.randrange(BASE_SIZE * 2), rng.randrange(BASE_SIZE * 2)) for _ in range(LOOKUPS)]
+
+    # Exactitude
+    assert all(world.is_tile_buildable(x, y, buildings_list) == world.is_tile_buildable(x, y, buildings_list, building_index)
+               for x, y in blueprint)
+    assert all(find_building(buildings_list, x, y) is building_index.get(x, y) for x, y in lookups)
+
+    print(f"Base de {len(buildings_list)} bâtiments :")
+    start = time.perf_counter()
+    free_scan = sum(world.is_tile_buildable(x, y, buildings_list) for x, y in blueprint)
+    scan_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    free_index = sum(world.is_tile_buildable(x, y, buildings_list, building_index) for x, y in blueprint)
+    index_ms = (time.perf_counter() - start) * 1000
+    assert free_scan == free_index
+    print(f"  plan de {len(blueprint)} cases ({free_index} libres) : parcours de la liste {scan_ms:8.2f} ms, "
+          f"index {index_ms:6.3f} ms")
+
+    start = time.perf_counter()
+    for x, y in lookups:
+        find_building(buildings_list, x, y)
+    scan_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    for x, y in lookups:
+        building_index.get(x, y)
+    index_ms = (time.perf_counter() - start) * 1000
+    print(f"  {LOOKUPS} recherches du bâtiment d'une case : parcours de la liste {scan_ms:8.2f} ms, "
+          f"index {index_ms:6.3f} ms")
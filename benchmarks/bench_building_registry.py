@@ -0,0 +1,101 @@
+"""
+BENCH_BUILDING_REGISTRY.PY
+==========================
+Mesure le passage par frame sur les bâtiments d'une grande base (3000 bâtiments, surtout des
+murs) : mise à jour de tous les bâtiments puis tri des tourelles par isinstance (ancienne
+boucle de Game.update) contre le registre par catégorie (building_registry.py), qui ne met
+à jour que les bâtiments actifs et ne lit que les tourelles. Mesure aussi le retrait de
+murs détruits : reconstruction de la liste contre retrait dans le registre.
+Vérifie que les deux passages mettent à jour les mêmes bâtiments et trouvent les mêmes tourelles.
+Usage : python benchmarks/bench_building_registry.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from constants import *
+from buildings import BUILDING_TYPES, Building, Turret, Wall
+from building_registry import BuildingRegistry
+from player import Player
+
+SEED = 1234
+BUILDINGS = 3000
+WALL_SHARE = 0.7  # Part des murs dans la base
+FRAMES = 120
+DESTROYED = 50  # Murs détruits d'un coup
+DELTA_TIME = 1 / 60
+
+
+def build_base(rng):
+    """Base de BUILDINGS bâtiments : des murs, puis des bâtiments de tous types"""
+    classes = [info['class'] for info in BUILDING_TYPES.values()]
+    buildings = []
+    for index in range(BUILDINGS):
+        building_class = Wall if rng.random() < WALL_SHARE else rng.choice(classes)
+        buildings.append(building_class(index % 100, index // 100))
+    return buildings
+
+
+def does_update(building):
+    """Vrai si la classe du bâtiment redéfinit update"""
+    return type(building).update is not Building.update
+
+
+if __name__ == "__main__":
+    rng = random.Random(SEED)
+    buildings_list = build_base(rng)
+    registry = BuildingRegistry()
+    for building in buildings_list:
+        registry.add(building)
+
+    # Exactitude : mêmes bâtiments actifs, mêmes tourelles, même ordre de construction par catégorie
+    assert {id(b) for b in registry.updated()} == {id(b) for b in buildings_list if does_update(b)}
+    assert list(registry.of('turret')) == [b for b in buildings_list if isinstance(b, Turret)]
+    assert len(registry) == len(buildings_list) and all(b in registry for b in buildings_list)
+    inventory = Player(0, 0).inventory
+
+    list_costs, registry_costs = [], []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        ready = []
+        for building in buildings_list:
+            building.update(DELTA_TIME, inventory)
+            if isinstance(building, Turret) and building.shoot_cooldown <= 0:
+                ready.append(building)
+        list_costs.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        ready = []
+        for building in registry.updated():
+            building.update(DELTA_TIME, inventory)
+        for turret in registry.of('turret'):
+            if turret.shoot_cooldown <= 0:
+                ready.append(turret)
+        registry_costs.append((time.perf_counter() - start) * 1000)
+        inventory.pop('_factory_craft', None)
+
+    active = sum(1 for _ in registry.updated())
+    print(f"Base de {BUILDINGS} bâtiments ({len(registry.of('wall'))} murs, {active} bâtiments actifs), "
+          f"médiane sur {FRAMES} frames :")
+    print(f"  passage par frame : liste + isinstance {np.median(list_costs):6.3f} ms, "
+          f"registre par catégorie {np.median(registry_costs):6.3f} ms")
+
+    # Retrait de murs détruits
+    destroyed = rng.sample(list(registry.of('wall')), DESTROYED)
+    start = time.perf_counter()
+    destroyed_ids = {id(wall) for wall in destroyed}
+    remaining = [building for building in buildings_list if id(building) not in destroyed_ids]
+    list_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    for wall in destroyed:
+        registry.remove(wall)
+    registry_ms = (time.perf_counter() - start) * 1000
+    assert list(registry) == remaining
+    print(f"  retrait de {DESTROYED} murs détruits : reconstruction de la liste {list_ms:6.3f} ms, "
+          f"registre {registry_ms:6.3f} ms")
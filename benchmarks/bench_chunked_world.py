@@ -0,0 +1,84 @@
+"""
+BENCH_CHUNKED_WORLD.PY
+======================
+Compare le coût de démarrage d'une carte fixe (générée entièrement au lancement)
+et du monde infini par chunks (généré à la demande), puis mesure le streaming
+pendant une longue marche en ligne droite et le respect du plafond mémoire.
+Vérifie qu'un respawn échu sur un chunk évincé n'oblige pas la boucle de jeu à le générer.
+Usage : python benchmarks/bench_chunked_world.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import world as world_module
+from chunked_world import ChunkedWorld
+from constants import *
+
+SEED = 1234
+WALK_TILES = 20000  # Longueur de la marche (en cases)
+VIEW_RADIUS = 40  # Demi-côté de la zone consultée autour du joueur (en cases)
+CACHE_MB = 1  # Plafond mémoire réduit pour forcer des évictions pendant la marche
+
+
+def time_fixed_world(grid_size):
+    """Génère une carte fixe complète et retourne (secondes, octets de terrain)"""
+    world_module.GRID_SIZE = grid_size
+    start = time.perf_counter()
+    world = world_module.World(seed=SEED, use_cache=False)
+    elapsed = time.perf_counter() - start
+    return elapsed, world.terrain.base.nbytes
+
+
+if __name__ == "__main__":
+    for size in (200, 1000, 2000):
+        fixed_s, fixed_bytes = time_fixed_world(size)
+        print(f"Carte fixe GRID_SIZE={size:5d} : démarrage {fixed_s * 1000:7.1f} ms, "
+              f"terrain {fixed_bytes / 1024 / 1024:6.2f} Mo")
+
+    with tempfile.TemporaryDirectory() as store_directory:
+        start = time.perf_counter()
+        world = ChunkedWorld(seed=SEED, store_directory=store_directory)
+        world.max_cache_bytes = CACHE_MB * 1024 * 1024
+        world.get_spawn_position()
+        print(f"Monde par chunks : démarrage {(time.perf_counter() - start) * 1000:7.1f} ms "
+              f"({world.loaded_chunk_count} chunks générés)")
+
+        # Marche en ligne droite : on consulte les coins de la zone visible et on récolte une case par pas
+        start = time.perf_counter()
+        for x in range(WALK_TILES):
+            world.is_tile_walkable(x - VIEW_RADIUS, -VIEW_RADIUS)
+            world.is_tile_walkable(x + VIEW_RADIUS, VIEW_RADIUS)
+            if x % 16 == 0:
+                world.set_terrain(x, 0, TERRAIN_GRASS)
+        elapsed = time.perf_counter() - start
+        print(f"Marche de {WALK_TILES} cases : {elapsed * 1000:7.1f} ms, "
+              f"{world.chunks_generated} chunks générés, {world.chunks_evicted} évincés, "
+              f"{world.chunks_written} écrits sur le disque")
+        print(f"Cache : {world.loaded_chunk_count} chunks, {world.cache_bytes / 1024 / 1024:6.2f} Mo "
+              f"(plafond {CACHE_MB} Mo)")
+
+        # Les modifications des chunks évincés sont relues depuis le disque
+        world.set_terrain(0, 0, TERRAIN_WATER)
+        world.is_tile_walkable(WALK_TILES * 2, 0)
+        for step in range(WALK_TILES):
+            world.is_tile_walkable(WALK_TILES * 2 + step, 0)
+        assert world.get_terrain(0, 0) == TERRAIN_WATER
+        print(f"Modifications relues après éviction : OK ({world.chunks_loaded} chunks relus)")
+
+        # Respawn échu sur un chunk évincé : mis en attente (aucune génération), appliqué au rechargement
+        original = world.get_original_terrain(0, 1)
+        world.set_terrain(0, 1, TERRAIN_WATER if original != TERRAIN_WATER else TERRAIN_GRASS)
+        world.schedule_respawn(0, 1, delay=1.0)
+        for step in range(WALK_TILES):
+            world.get_terrain_code(WALK_TILES * 3 + step, 0, blocking=True)
+        assert (0, 0) not in world._chunks
+        world.update(2.0)
+        assert (0, 0) not in world._chunks and (0, 0) in world._pending_respawns and not world.depleted_tiles
+        world.get_terrain_code(0, 1, blocking=True)
+        assert world.get_terrain(0, 1) == original
+        print("Respawn sur un chunk évincé : mis en attente sans génération, appliqué au rechargement : OK")
@@ -0,0 +1,119 @@
+"""
+BENCH_CROWD.PY
+==============
+Stress test : 3000 ennemis convergent vers un joueur immobile (déplacement vectorisé comme
+dans enemy_store.py). Sans séparation, ils s'entassent sur un seul pixel ; avec la séparation
+(crowd.py), ils s'étalent autour de lui : moins de 1 % d'ennemis superposés à 3000 ennemis, aucun
+pour une vague au plafond du directeur (SPAWN_MAX_LIVE_ENEMIES ennemis).
+Vérifie aussi qu'une vague entière entassée sur un pixel ne lit pas plus de
+CROWD_MAX_NEIGHBORS_PER_CELL voisins par cellule (coût linéaire).
+Mesure le coût par frame de la séparation pour 750, 1500 et 3000 ennemis (croissance linéaire)
+contre un calcul naïf de toutes les paires, et vérifie que les poussées sont identiques à ce
+calcul naïf quand le nombre de voisins n'est pas limité.
+Usage : python benchmarks/bench_crowd.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from constants import *
+from crowd import CrowdSeparation
+
+SEED = 1234
+ENEMY_COUNTS = (750, 1500, 3000)
+FRAMES = 900
+TIMED_FRAMES = 60  # Dernières frames mesurées (foule déjà compacte)
+SPEED = 1.0
+
+
+def brute_offsets(crowd, position_x, position_y):
+    """Référence : toutes les paires (coût quadratique)"""
+    delta_x = position_x[:, None] - position_x[None, :]
+    delta_y = position_y[:, None] - position_y[None, :]
+    distance = np.hypot(delta_x, delta_y)
+    close = (distance < crowd.radius) & (distance > 0)
+    weight = np.where(close, crowd.strength * (1 - distance / crowd.radius) / np.where(close, distance, 1), 0)
+    return (delta_x * weight).sum(axis=1), (delta_y * weight).sum(axis=1)
+
+
+def converge(count, crowd, rng):
+    """
+    Fait converger des ennemis vers le joueur ; retourne leurs positions finales et
+    le coût médian (ms) de la séparation sur les dernières frames
+    """
+    angle = rng.uniform(0, 2 * np.pi, count)
+    distance = rng.uniform(600, 900, count)
+    position_x, position_y = np.cos(angle) * distance, np.sin(angle) * distance
+    costs = []
+    for frame in range(FRAMES):
+        # Déplacement vers le joueur (à l'origine), sans le dépasser
+        gap = np.hypot(position_x, position_y)
+        step = np.divide(np.minimum(SPEED, gap), gap, out=np.zeros(count), where=gap > 0)
+        position_x -= position_x * step
+        position_y -= position_y * step
+        if crowd is not None:
+            start = time.perf_counter()
+            push_x, push_y = crowd.offsets(position_x, position_y)
+            costs.append((time.perf_counter() - start) * 1000)
+            position_x += push_x
+            position_y += push_y
+    return position_x, position_y, np.median(costs[-TIMED_FRAMES:]) if costs else 0.0
+
+
+def nearest_gaps(position_x, position_y):
+    """Distance de chaque ennemi à son plus proche voisin"""
+    distance = np.hypot(position_x[:, None] - position_x[None, :], position_y[:, None] - position_y[None, :])
+    np.fill_diagonal(distance, np.inf)
+    return distance.min(axis=1)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(SEED)
+
+    # Exactitude contre le calcul naïf (voisins non limités, poussée non bornée)
+    position_x, position_y = rng.uniform(0, 400, 800), rng.uniform(0, 400, 800)
+    unlimited = CrowdSeparation(max_neighbors=10 ** 9, max_push=float('inf'))
+    push_x, push_y = unlimited.offsets(position_x, position_y)
+    brute_x, brute_y = brute_offsets(unlimited, position_x, position_y)
+    assert np.allclose(push_x, brute_x) and np.allclose(push_y, brute_y)
+    print("Poussées identiques au calcul de toutes les paires : OK")
+
+    # Vague entière sur un seul pixel : paires bornées par le plafond de voisins par cellule
+    pile = np.zeros(ENEMY_COUNTS[-1])
+    crowd = CrowdSeparation()
+    push_x, push_y = crowd.offsets(pile, pile)
+    assert crowd.pair_count <= len(pile) * crowd.max_neighbors and np.all(np.hypot(push_x, push_y) > 0)
+    print(f"{len(pile)} ennemis sur un pixel : {crowd.pair_count} paires lues (au plus "
+          f"{crowd.max_neighbors} par ennemi), tous repoussés : OK")
+
+    def report(label, final_x, final_y):
+        gaps = nearest_gaps(final_x, final_y)
+        print(f"  {label:<16}: {np.mean(gaps < 1):6.1%} superposés à un autre (< 1 px), "
+              f"écart médian au plus proche {np.median(gaps):5.1f} px, "
+              f"rayon de la foule {np.hypot(final_x, final_y).max():6.1f} px")
+
+    print(f"{ENEMY_COUNTS[-1]} ennemis après {FRAMES} frames :")
+    stacked_x, stacked_y, _ = converge(ENEMY_COUNTS[-1], None, rng)
+    report("sans séparation", stacked_x, stacked_y)
+
+    wave_x, wave_y, _ = converge(SPAWN_MAX_LIVE_ENEMIES, crowd, rng)
+    assert np.min(nearest_gaps(wave_x, wave_y)) >= 1
+    timings = []
+    for count in ENEMY_COUNTS:
+        final_x, final_y, cost = converge(count, crowd, rng)
+        timings.append((count, cost, crowd.pair_count))
+    assert np.mean(nearest_gaps(final_x, final_y) < 1) < 0.01
+    report("avec séparation", final_x, final_y)
+    print(f"{SPAWN_MAX_LIVE_ENEMIES} ennemis (plafond du directeur) après {FRAMES} frames :")
+    report("avec séparation", wave_x, wave_y)
+
+    print("Séparation par frame (foule compacte, médiane) :")
+    for count, cost, pairs in timings:
+        print(f"  {count:5d} ennemis : {cost:6.2f} ms ({pairs} paires proches)")
+    start = time.perf_counter()
+    brute_offsets(crowd, final_x, final_y)
+    print(f"  calcul de toutes les paires pour {ENEMY_COUNTS[-1]} ennemis : {(time.perf_counter() - start) * 1000:6.2f} ms")
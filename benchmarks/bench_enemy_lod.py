@@ -0,0 +1,128 @@
+"""
+BENCH_ENEMY_LOD.PY
+==================
+Mesure le coût par frame de la mise à jour de 3000 ennemis répartis sur la carte 200x200
+(champ de flux vers le joueur, enceinte de murs autour de lui) : simulation complète
+(BaseEnemy.update pour chacun) contre le niveau de détail (lod.py).
+Vérifie aussi que des ennemis partis de loin arrivent au contact du joueur aux mêmes
+positions et lui infligent les mêmes dégâts qu'avec la simulation complète.
+Usage : python benchmarks/bench_enemy_lod.py
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+from constants import *
+from buildings import Wall
+from enemies import Zombie, Mutant, Wolf
+from flow_field import FlowField
+from lod import EnemyLODScheduler
+from obstacle_layer import ObstacleLayer
+from world import World
+
+SEED = 1234
+ENEMIES = 3000
+FRAMES = 60
+MAP_PIXELS = GRID_SIZE * TILE_SIZE
+CONTACT_ENEMIES = 300
+CONTACT_FRAMES = 1500
+BASE_RADIUS = 12  # Rayon (en cases) de l'enceinte de murs autour du joueur
+
+
+class BenchPlayer:
+    """Joueur minimal (position fixe, vie illimitée) qui compte les dégâts reçus"""
+
+    def __init__(self, position_x, position_y):
+        self.position_x = position_x
+        self.position_y = position_y
+        self.is_alive = True
+        self.damage_taken = 0
+
+    def take_damage(self, damage_amount):
+        self.damage_taken += damage_amount
+
+
+def spawn(rng, count, min_distance, max_distance, center):
+    """Tire des ennemis entre deux distances du centre"""
+    spawns = []
+    for _ in range(count):
+        angle = rng.uniform(0, 2 * math.pi)
+        distance = rng.uniform(min_distance, max_distance)
+        spawns.append((rng.choice((Zombie, Mutant, Wolf)),
+                       center + math.cos(angle) * distance, center + math.sin(angle) * distance))
+    return spawns
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    rng = random.Random(SEED)
+    center = MAP_PIXELS / 2
+    anchors = [(center, center, ENEMY_LOD_PLAYER_DISTANCE)]
+    obstacles = ObstacleLayer()
+
+    # Exactitude : arrivée au contact depuis la zone lointaine
+    spawns = spawn(rng, CONTACT_ENEMIES, ENEMY_LOD_PLAYER_DISTANCE + 100, ENEMY_LOD_PLAYER_DISTANCE + 300, center)
+    results = []
+    for use_lod in (False, True):
+        player = BenchPlayer(center, center)
+        enemies = [enemy_class(x, y) for enemy_class, x, y in spawns]
+        scheduler = EnemyLODScheduler()
+        for _ in range(CONTACT_FRAMES):
+            if use_lod:
+                scheduler.update(enemies, 1 / 60, player, anchors, obstacles)
+            else:
+                for enemy in enemies:
+                    enemy.update(1 / 60, player, obstacles=obstacles)
+        results.append(([(enemy.position_x, enemy.position_y) for enemy in enemies], player.damage_taken))
+    (full_positions, full_damage), (lod_positions, lod_damage) = results
+    max_gap = max(math.hypot(a[0] - b[0], a[1] - b[1]) for a, b in zip(full_positions, lod_positions))
+    assert max_gap < 1e-6 and full_damage == lod_damage, (max_gap, full_damage, lod_damage)
+    print(f"{CONTACT_ENEMIES} ennemis arrivés au contact, mêmes positions (écart max {max_gap:.1e} px) "
+          f"et mêmes dégâts ({lod_damage}) : OK")
+
+    # Coût par frame : ennemis répartis sur toute la carte, joueur au centre dans une enceinte de murs
+    world = World(seed=SEED, use_cache=False)
+    center_tile = int(center // TILE_SIZE)
+    for grid_y in range(center_tile - BASE_RADIUS, center_tile + BASE_RADIUS + 1):
+        for grid_x in range(center_tile - BASE_RADIUS, center_tile + BASE_RADIUS + 1):
+            on_ring = max(abs(grid_x - center_tile), abs(grid_y - center_tile)) == BASE_RADIUS
+            if on_ring and world.is_tile_open(grid_x, grid_y):
+                wall = Wall(grid_x, grid_y)
+                wall.durability = 10 ** 9  # Les murs ne cèdent pas pendant la mesure
+                world.set_obstacle(grid_x, grid_y, True)
+                obstacles.add(wall)
+    flow_field = FlowField()
+    flow_field.update(world, center, center)
+
+    spawns = [(rng.choice((Zombie, Mutant, Wolf)), rng.uniform(0, MAP_PIXELS), rng.uniform(0, MAP_PIXELS))
+              for _ in range(ENEMIES)]
+    player = BenchPlayer(center, center)
+    enemies = [enemy_class(x, y) for enemy_class, x, y in spawns]
+    full_ms = []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        for enemy in enemies:
+            enemy.update(1 / 60, player, obstacles=obstacles, flow_field=flow_field)
+        full_ms.append((time.perf_counter() - start) * 1000)
+
+    enemies = [enemy_class(x, y) for enemy_class, x, y in spawns]
+    scheduler = EnemyLODScheduler()
+    lod_ms = []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        scheduler.update(enemies, 1 / 60, player, anchors, obstacles, flow_field)
+        lod_ms.append((time.perf_counter() - start) * 1000)
+
+    print(f"{ENEMIES} ennemis, {scheduler.near_count} proches du joueur, {len(obstacles)} murs, par frame (médiane) :")
+    print(f"  simulation complète : {np.median(full_ms):7.2f} ms")
+    print(f"  niveau de détail    : {np.median(lod_ms):7.2f} ms "
+          f"(lointains simulés une frame sur {ENEMY_LOD_FAR_INTERVAL})")
@@ -0,0 +1,135 @@
+"""
+BENCH_ENEMY_POOL.PY
+===================
+Mesure l'apparition de grosses vagues de nuit (vague d'ennemis, tous tués avant la suivante) :
+création d'un nouvel ennemi à chaque apparition contre la réserve des ennemis morts (enemy_pool.py).
+Les points d'apparition sont tirés d'avance par le directeur des apparitions (hors mesure).
+Compte les ennemis créés et les passages du ramasse-miettes pendant les apparitions.
+Vérifie aussi les vagues demandées au jeu (Game.spawn_wave, solo et multijoueur) : ennemis ajoutés
+à la partie, IDs réseau en multijoueur, morts réutilisés à la vague suivante.
+Usage : python benchmarks/bench_enemy_pool.py
+"""
+
+import gc
+import importlib
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+from constants import *
+from enemies import ENEMY_CLASSES
+from enemy_pool import EnemyPool
+from spawn_director import SpawnDirector
+from world import World
+
+SEED = 1234
+WAVES = 20
+WAVE_PER_KIND = int(200 * NIGHT_ENEMY_SPAWN_MULTIPLIER)  # Ennemis de chaque type par vague de nuit
+SCREEN_SIZE = (1280, 720)
+
+
+def spawn_points(count):
+    """Points d'apparition hors de l'écran d'un joueur au centre de la carte (SpawnDirector.pick_spawn_point)"""
+    random.seed(SEED)
+    world = World()
+    director = SpawnDirector()
+    player_x, player_y = world.get_spawn_position()
+    views = [(player_x - SCREEN_SIZE[0] / 2, player_y - SCREEN_SIZE[1] / 2,
+              player_x + SCREEN_SIZE[0] / 2, player_y + SCREEN_SIZE[1] / 2)]
+    points = []
+    while len(points) < count:
+        point = director.pick_spawn_point([(player_x, player_y)], views, world)
+        if point is not None:
+            points.append(point)
+    return points
+
+
+def run_waves(pool, points):
+    """
+    Joue les vagues (points : un point d'apparition par ennemi d'une vague) ; retourne le temps
+    d'apparition de chaque vague (ms), les ennemis créés et les passages du ramasse-miettes
+    """
+    collections = []
+    gc.callbacks.append(lambda phase, info: collections.append(info['generation']) if phase == 'start' else None)
+    allocations = 0
+    spawn_ms = []
+    try:
+        for _ in range(WAVES):
+            start = time.perf_counter()
+            enemies = []
+            for kind_index, kind in enumerate(('zombie', 'mutant', 'wolf')):
+                enemy_class = ENEMY_CLASSES[kind]
+                for spawn_x, spawn_y in points[kind_index * WAVE_PER_KIND:(kind_index + 1) * WAVE_PER_KIND]:
+                    if pool is None:
+                        enemies.append(enemy_class(spawn_x, spawn_y))
+                        allocations += 1
+                    else:
+                        enemies.append(pool.acquire(enemy_class, spawn_x, spawn_y))
+            spawn_ms.append((time.perf_counter() - start) * 1000)
+
+            # La vague est anéantie : les morts sont abandonnés ou rendus à la réserve
+            for enemy in enemies:
+                enemy.take_damage(enemy.health_points)
+            if pool is not None:
+                pool.release(enemy for enemy in enemies if not enemy.is_alive)
+    finally:
+        gc.callbacks.pop()
+    if pool is not None:
+        allocations = pool.allocations
+    return spawn_ms, allocations, collections
+
+
+def run_game_waves(module_name, waves=3, count=40):
+    """
+    Vagues demandées au jeu (Game.spawn_wave), toutes tuées avant la suivante ; retourne le jeu,
+    les ennemis apparus à chaque vague et leurs IDs réseau (relevés à l'apparition)
+    """
+    game = importlib.import_module(module_name).Game()
+    game.spawn_director.max_live = game.spawn_director.day_budget = 10 ** 6
+    game.spawn_director.phase = None
+    if module_name == 'main_multiplayer':
+        game.is_multiplayer = True
+    spawned, network_ids = [], []
+    for _ in range(waves):
+        enemies = game.spawn_wave('zombie', count)
+        assert len(enemies) == count and all(enemy in game.enemies_list for enemy in enemies)
+        spawned.append(enemies)
+        network_ids.extend(getattr(enemy, 'network_id', None) for enemy in enemies)
+        for enemy in enemies:
+            enemy.take_damage(enemy.health_points)
+        game.remove_dead_enemies()
+    return game, spawned, network_ids
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    points = spawn_points(3 * WAVE_PER_KIND)
+    plain_ms, plain_allocations, plain_gc = run_waves(None, points)
+    pool = EnemyPool()
+    pooled_ms, pooled_allocations, pooled_gc = run_waves(pool, points)
+
+    assert pooled_allocations == 3 * WAVE_PER_KIND and pool.reuses == (WAVES - 1) * 3 * WAVE_PER_KIND
+    print(f"Réserve : {pooled_allocations} ennemis créés pour {WAVES} vagues, {pool.reuses} réutilisés : OK")
+
+    print(f"{WAVES} vagues de {3 * WAVE_PER_KIND} ennemis :")
+    print(f"  sans réserve : {plain_allocations:6d} ennemis créés | apparition médiane {np.median(plain_ms):6.2f} ms "
+          f"(max {max(plain_ms):6.2f} ms) | ramasse-miettes {len(plain_gc)} fois (dont {plain_gc.count(2)} complets)")
+    print(f"  avec réserve : {pooled_allocations:6d} ennemis créés | apparition médiane {np.median(pooled_ms):6.2f} ms "
+          f"(max {max(pooled_ms):6.2f} ms) | ramasse-miettes {len(pooled_gc)} fois (dont {pooled_gc.count(2)} complets)")
+
+    # Vagues du jeu : ennemis ajoutés à la partie, réserve réutilisée, IDs réseau uniques en multijoueur
+    for module_name in ('main', 'main_multiplayer'):
+        game, spawned, network_ids = run_game_waves(module_name)
+        if game.enemy_pool is not None:
+            assert {id(enemy) for enemy in spawned[-1]} <= {id(enemy) for enemy in spawned[0]}
+        if module_name == 'main_multiplayer':
+            assert None not in network_ids and len(set(network_ids)) == len(network_ids)
+        print(f"Game.spawn_wave ({module_name}) : {len(spawned)} vagues de {len(spawned[0])} ennemis ajoutées à la partie : OK")
@@ -0,0 +1,112 @@
+"""
+BENCH_ENEMY_STORE.PY
+====================
+Mesure le coût d'une frame de simulation de 10000 ennemis : mise à jour objet par objet
+(BaseEnemy.update) contre le stockage en tableaux NumPy (enemy_store.py), tri des morts compris.
+Vérifie aussi que les deux simulations donnent les mêmes positions, dégâts et murs attaqués.
+Usage : python benchmarks/bench_enemy_store.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+from constants import *
+from buildings import Wall
+from enemies import Zombie, Mutant, Wolf
+from enemy_store import EnemyStore
+from obstacle_layer import ObstacleLayer
+
+SEED = 1234
+ENEMIES = 10000
+WALLS = 200
+FRAMES = 60
+AREA = 150 * TILE_SIZE  # Côté de la zone peuplée (en pixels)
+
+
+class BenchPlayer:
+    """Joueur minimal (position fixe, vie illimitée) qui compte les dégâts reçus"""
+
+    def __init__(self, position_x, position_y):
+        self.position_x = position_x
+        self.position_y = position_y
+        self.is_alive = True
+        self.damage_taken = 0
+
+    def take_damage(self, damage_amount):
+        self.damage_taken += damage_amount
+
+
+def build_walls(rng):
+    """Crée des murs aléatoires et leur calque des obstacles"""
+    walls = [Wall(rng.randrange(AREA // TILE_SIZE), rng.randrange(AREA // TILE_SIZE)) for _ in range(WALLS)]
+    for wall in walls:
+        wall.durability = 10 ** 9  # Les murs ne cèdent pas pendant la mesure
+    obstacles = ObstacleLayer()
+    for wall in walls:
+        obstacles.add(wall)
+    return walls, obstacles
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    rng = random.Random(SEED)
+    spawns = [(rng.choice((Zombie, Mutant, Wolf)), rng.uniform(0, AREA), rng.uniform(0, AREA)) for _ in range(ENEMIES)]
+    kills = [rng.randrange(ENEMIES) for _ in range(FRAMES * 5)]
+
+    # Objet par objet
+    player = BenchPlayer(AREA / 2, AREA / 2)
+    walls, obstacles = build_walls(random.Random(SEED))
+    enemies = [enemy_class(x, y) for enemy_class, x, y in spawns]
+    object_ms = []
+    for frame in range(FRAMES):
+        for index in kills[frame * 5:(frame + 1) * 5]:
+            enemies[index].take_damage(1000)
+        start = time.perf_counter()
+        for enemy in enemies:
+            enemy.update(1 / 60, player, obstacles=obstacles)
+        alive_enemies = [enemy for enemy in enemies if enemy.is_alive]
+        object_ms.append((time.perf_counter() - start) * 1000)
+    object_result = sorted((round(enemy.position_x, 6), round(enemy.position_y, 6)) for enemy in alive_enemies)
+    object_damage = (player.damage_taken, sum(10 ** 9 - wall.durability for wall in walls))
+
+    # Stockage NumPy
+    player = BenchPlayer(AREA / 2, AREA / 2)
+    walls, obstacles = build_walls(random.Random(SEED))
+    store = EnemyStore()
+    enemies = [store.view_class(enemy_class)(x, y) for enemy_class, x, y in spawns]
+    store_ms = []
+    for frame in range(FRAMES):
+        for index in kills[frame * 5:(frame + 1) * 5]:
+            enemies[index].take_damage(1000)
+        start = time.perf_counter()
+        store.update(1 / 60, player, obstacles)
+        store.remove_dead()
+        store_ms.append((time.perf_counter() - start) * 1000)
+    store_result = sorted((round(enemy.position_x, 6), round(enemy.position_y, 6)) for enemy in store.enemies)
+    store_damage = (player.damage_taken, sum(10 ** 9 - wall.durability for wall in walls))
+
+    assert object_result == store_result, "positions différentes"
+    assert object_damage == store_damage, (object_damage, store_damage)
+    print(f"Simulations identiques ({len(store_result)} survivants, dégâts joueur/murs {store_damage}) : OK")
+    print(f"{ENEMIES} ennemis, {WALLS} murs, par frame (médiane) :")
+    print(f"  objet par objet : {np.median(object_ms):7.2f} ms")
+    print(f"  tableaux NumPy  : {np.median(store_ms):7.2f} ms")
+
+    # Sans murs : seulement la poursuite du joueur et les attaques
+    store = EnemyStore()
+    for enemy_class, x, y in spawns:
+        store.view_class(enemy_class)(x, y)
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        store.update(1 / 60, player)
+        store.remove_dead()
+    print(f"  tableaux NumPy sans murs : {(time.perf_counter() - start) * 1000 / FRAMES:7.2f} ms")
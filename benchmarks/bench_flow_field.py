@@ -0,0 +1,105 @@
+"""
+BENCH_FLOW_FIELD.PY
+===================
+Mesure le coût du champ de flux (flow_field.py) sur la carte générée : recalcul complet quand
+le joueur change de case, et lecture des directions pour 10000 ennemis (une par ennemi ou vectorisée).
+Vérifie aussi que les distances sont celles d'un Dijkstra case par case.
+Usage : python benchmarks/bench_flow_field.py
+"""
+
+import heapq
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from constants import *
+from flow_field import FlowField, BLOCKED_COST
+from terrain_grid import WALKABLE_TABLE
+from world import World
+
+SEED = 1234
+ENEMIES = 10000
+WALLS = 300
+MOVES = 20  # Nombre de changements de case du joueur mesurés
+
+
+def dijkstra(costs, target_x, target_y):
+    """Référence : Dijkstra 4-voisinage, chaque case du chemin compte sauf la cible"""
+    height, width = costs.shape
+    distances = np.full(costs.shape, np.inf)
+    distances[target_y, target_x] = 0.0
+    heap = [(0.0, target_x, target_y)]
+    while heap:
+        distance, x, y = heapq.heappop(heap)
+        if distance > distances[y, x]:
+            continue
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < width and 0 <= ny < height:
+                # Chemin de (nx, ny) vers la cible : on quitte (nx, ny) pour (x, y)
+                candidate = distance + costs[ny, nx]
+                if candidate < distances[ny, nx]:
+                    distances[ny, nx] = candidate
+                    heapq.heappush(heap, (candidate, nx, ny))
+    return distances
+
+
+if __name__ == "__main__":
+    rng = random.Random(SEED)
+    world = World(seed=SEED, use_cache=False)
+    center_x, center_y = world.get_spawn_position()
+
+    # Quelques murs autour du centre
+    for _ in range(WALLS):
+        grid_x = int(center_x // TILE_SIZE) + rng.randint(-40, 40)
+        grid_y = int(center_y // TILE_SIZE) + rng.randint(-40, 40)
+        if world.is_tile_open(grid_x, grid_y):
+            world.set_obstacle(grid_x, grid_y, True)
+
+    # Exactitude : le Dijkstra utilise les mêmes coûts de case (voir FlowField.update)
+    field = FlowField()
+    field.update(world, center_x, center_y)
+    height, width = field.distances.shape
+    codes = world.get_codes_region(field.origin_x, field.origin_y, field.origin_x + width, field.origin_y + height)
+    costs = np.where(WALKABLE_TABLE[codes], 1.0, BLOCKED_COST)
+    for wall_x, wall_y in world.get_obstacle_tiles():
+        local_x, local_y = wall_x - field.origin_x, wall_y - field.origin_y
+        if 0 <= local_x < width and 0 <= local_y < height and costs[local_y, local_x] == 1.0:
+            costs[local_y, local_x] = field.wall_cost
+    reference = dijkstra(costs, field.target_grid_x - field.origin_x, field.target_grid_y - field.origin_y)
+    reachable = reference < BLOCKED_COST
+    assert np.array_equal(reachable, field.distances < BLOCKED_COST)
+    assert np.array_equal(reference[reachable], field.distances[reachable])
+    print(f"Distances identiques au Dijkstra ({int(reachable.sum())} cases atteignables) : OK")
+
+    # Recalcul : le joueur change de case à chaque mesure
+    start = time.perf_counter()
+    for move in range(MOVES):
+        assert field.update(world, center_x + (move + 1) * TILE_SIZE, center_y)
+    recompute_ms = (time.perf_counter() - start) * 1000 / MOVES
+    start = time.perf_counter()
+    for _ in range(1000):
+        field.update(world, center_x + MOVES * TILE_SIZE, center_y)
+    cached_us = (time.perf_counter() - start) * 1e6 / 1000
+
+    # Lecture des directions
+    radius_pixels = field.radius * TILE_SIZE
+    positions_x = np.array([center_x + rng.uniform(-radius_pixels, radius_pixels) for _ in range(ENEMIES)])
+    positions_y = np.array([center_y + rng.uniform(-radius_pixels, radius_pixels) for _ in range(ENEMIES)])
+    start = time.perf_counter()
+    scalar = [field.direction_at(x, y) for x, y in zip(positions_x.tolist(), positions_y.tolist())]
+    scalar_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    direction_x, direction_y, valid = field.directions_at(positions_x, positions_y)
+    vector_ms = (time.perf_counter() - start) * 1000
+    assert [direction is not None for direction in scalar] == valid.tolist()
+
+    print(f"Fenêtre {width}x{height} cases, {len(world.get_obstacle_tiles())} murs :")
+    print(f"  recalcul complet          : {recompute_ms:7.2f} ms")
+    print(f"  cible sur la même case    : {cached_us:7.2f} µs")
+    print(f"  {ENEMIES} directions (une par une) : {scalar_ms:7.2f} ms")
+    print(f"  {ENEMIES} directions (vectorisé)   : {vector_ms:7.2f} ms")
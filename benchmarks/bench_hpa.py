@@ -0,0 +1,123 @@
+"""
+BENCH_HPA.PY
+============
+Mesure le pathfinding hiérarchique (hpa.py) sur la carte générée : construction du graphe,
+requêtes longues (A* plat sur toute la carte contre HPA*, avec et sans cache), et mise à jour
+après la construction d'un mur (clusters touchés seulement) contre une reconstruction complète.
+Vérifie aussi que les itinéraires suivis case par case arrivent à destination.
+Usage : python benchmarks/bench_hpa.py
+"""
+
+import heapq
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import *
+from hpa import HierarchicalPathfinder, NEIGHBOR_OFFSETS, manhattan
+from world import World
+
+SEED = 1234
+QUERIES = 200
+WALLS = 200
+MIN_DISTANCE = GRID_SIZE // 2  # Distance de Manhattan minimale des requêtes (agents qui traversent la carte)
+
+
+def flat_astar(pathfinder, start, goal):
+    """Référence : A* 4-voisinage sur toute la carte"""
+    best = {start: 0}
+    heap = [(manhattan(start, goal), 0, start)]
+    while heap:
+        _, cost, tile = heapq.heappop(heap)
+        if tile == goal:
+            return cost
+        if cost > best[tile]:
+            continue
+        for offset_x, offset_y in NEIGHBOR_OFFSETS:
+            neighbor = (tile[0] + offset_x, tile[1] + offset_y)
+            if pathfinder.is_open(neighbor) and cost + 1 < best.get(neighbor, float('inf')):
+                best[neighbor] = cost + 1
+                heapq.heappush(heap, (cost + 1 + manhattan(neighbor, goal), cost + 1, neighbor))
+    return None
+
+
+def follow(path, start):
+    """Suit un itinéraire case par case (raffinement des sauts suivants compris), retourne (longueur, case finale)"""
+    length, tile = 0, start
+    while True:
+        next_tile = path.next_tile()
+        if next_tile is None:
+            return length, tile
+        assert manhattan(tile, next_tile) == 1
+        tile = next_tile
+        path.advance()
+        length += 1
+
+
+if __name__ == "__main__":
+    rng = random.Random(SEED)
+    world = World(seed=SEED, use_cache=False)
+
+    start = time.perf_counter()
+    pathfinder = HierarchicalPathfinder(world)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    # Requêtes longues entre cases libres et reliées
+    queries = []
+    while len(queries) < QUERIES:
+        start_tile = (rng.randrange(GRID_SIZE), rng.randrange(GRID_SIZE))
+        goal_tile = (rng.randrange(GRID_SIZE), rng.randrange(GRID_SIZE))
+        if manhattan(start_tile, goal_tile) >= MIN_DISTANCE and pathfinder.is_open(start_tile) \
+                and pathfinder.is_open(goal_tile) and world.are_connected(*start_tile, *goal_tile):
+            queries.append((start_tile, goal_tile))
+
+    start = time.perf_counter()
+    flat_lengths = [flat_astar(pathfinder, start_tile, goal_tile) for start_tile, goal_tile in queries]
+    flat_ms = (time.perf_counter() - start) * 1000 / QUERIES
+
+    start = time.perf_counter()
+    paths = [pathfinder.find_path(*start_tile, *goal_tile) for start_tile, goal_tile in queries]
+    hpa_ms = (time.perf_counter() - start) * 1000 / QUERIES
+
+    # Mêmes paires de clusters : itinéraires abstraits relus depuis le cache
+    start = time.perf_counter()
+    for start_tile, goal_tile in queries:
+        pathfinder.find_path(*start_tile, *goal_tile)
+    cached_ms = (time.perf_counter() - start) * 1000 / QUERIES
+
+    ratios = []
+    for (start_tile, goal_tile), path, flat_length in zip(queries, paths, flat_lengths):
+        length, end_tile = follow(path, start_tile)
+        assert end_tile == goal_tile
+        ratios.append(length / flat_length)
+    print(f"{QUERIES} itinéraires suivis jusqu'à l'arrivée : OK (longueur / optimale : "
+          f"moyenne {sum(ratios) / len(ratios):.3f}, max {max(ratios):.3f})")
+
+    # Murs : mise à jour ciblée contre reconstruction complète
+    walls = []
+    while len(walls) < WALLS:
+        tile = (rng.randrange(GRID_SIZE), rng.randrange(GRID_SIZE))
+        if world.is_tile_open(*tile):
+            world.set_obstacle(*tile, True)
+            walls.append(tile)
+    start = time.perf_counter()
+    for tile in walls:
+        pathfinder.on_tile_changed(*tile)
+    update_ms = (time.perf_counter() - start) * 1000 / WALLS
+    start = time.perf_counter()
+    rebuilt = HierarchicalPathfinder(world)
+    rebuild_ms = (time.perf_counter() - start) * 1000
+    assert rebuilt._edges == pathfinder._edges and rebuilt._links == pathfinder._links
+    print("Graphe mis à jour mur par mur identique à une reconstruction : OK")
+
+    print(f"Carte {GRID_SIZE}x{GRID_SIZE}, clusters de {HPA_CLUSTER_SIZE} cases "
+          f"({pathfinder.clusters_x * pathfinder.clusters_y} clusters, {len(pathfinder._links)} transitions) :")
+    print(f"  construction du graphe      : {build_ms:8.1f} ms")
+    print(f"  A* plat par requête         : {flat_ms:8.2f} ms")
+    print(f"  HPA* par requête            : {hpa_ms:8.2f} ms")
+    print(f"  HPA* depuis le cache        : {cached_ms:8.2f} ms ({pathfinder.cache_hits} succès)")
+    print(f"  mur construit (mise à jour) : {update_ms:8.2f} ms | reconstruction complète {rebuild_ms:.1f} ms")
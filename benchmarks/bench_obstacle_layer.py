@@ -0,0 +1,118 @@
+"""
+BENCH_OBSTACLE_LAYER.PY
+=======================
+Mesure le coût par frame de la recherche de murs par les ennemis dans une base très fortifiée :
+ancien parcours de tous les bâtiments (hasattr sur chacun, pour chaque ennemi) contre le calque
+des obstacles (obstacle_layer.py), qui ne lit que les cases voisines de l'ennemi.
+Mesure aussi le retrait des murs détruits : ancien double filtrage de la liste des bâtiments
+contre le relevé des murs sortis du calque.
+Usage : python benchmarks/bench_obstacle_layer.py
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from constants import *
+from buildings import Wall, Farm
+from obstacle_layer import ObstacleLayer
+
+SEED = 1234
+ENEMIES = 1000
+BASE_SIZE = 80  # Côté (en cases) de la base fortifiée
+WALL_ATTACK_RANGE = 50  # Portée de recherche des murs par un ennemi (voir BaseEnemy.update)
+FRAMES = 10
+
+
+def brute_wall_target(position_x, position_y, buildings):
+    """Ancienne recherche de BaseEnemy.update : mur le plus proche en parcourant tous les bâtiments"""
+    best, best_distance = None, float('inf')
+    for building in buildings:
+        if hasattr(building, 'is_obstacle') and building.is_obstacle:
+            wall_x = building.grid_x * TILE_SIZE + TILE_SIZE // 2
+            wall_y = building.grid_y * TILE_SIZE + TILE_SIZE // 2
+            distance = math.sqrt((wall_x - position_x) ** 2 + (wall_y - position_y) ** 2)
+            if distance < WALL_ATTACK_RANGE and distance < best_distance:
+                best, best_distance = building, distance
+    return best
+
+
+def wall_distance(position, wall):
+    """Distance entre une position et le centre d'un mur (None si aucun mur)"""
+    if wall is None:
+        return None
+    return round(math.hypot(wall.grid_x * TILE_SIZE + TILE_SIZE // 2 - position[0],
+                            wall.grid_y * TILE_SIZE + TILE_SIZE // 2 - position[1]), 6)
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    rng = random.Random(SEED)
+
+    # Base : murs en damier serré, quelques fermes au milieu
+    buildings = []
+    for grid_y in range(BASE_SIZE):
+        for grid_x in range(BASE_SIZE):
+            if (grid_x + grid_y) % 3 == 0:
+                buildings.append(Wall(grid_x, grid_y))
+            elif (grid_x * 7 + grid_y) % 29 == 0:
+                buildings.append(Farm(grid_x, grid_y))
+    walls = [building for building in buildings if isinstance(building, Wall)]
+    obstacles = ObstacleLayer()
+    for wall in walls:
+        obstacles.add(wall)
+
+    area = BASE_SIZE * TILE_SIZE
+    positions = [(rng.uniform(0, area), rng.uniform(0, area)) for _ in range(ENEMIES)]
+
+    # Recherche des murs : une frame de l'ancienne méthode suffit à la mesurer
+    start = time.perf_counter()
+    brute_targets = [brute_wall_target(x, y, buildings) for x, y in positions]
+    brute_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        layer_targets = [obstacles.nearest(x, y, WALL_ATTACK_RANGE) for x, y in positions]
+    layer_ms = (time.perf_counter() - start) * 1000 / FRAMES
+
+    # Même distance au mur choisi (l'ancienne recherche excluait la distance exacte de 50 pixels)
+    for position, brute_wall, layer_wall in zip(positions, brute_targets, layer_targets):
+        layer_result = wall_distance(position, layer_wall)
+        if layer_result is not None and layer_result >= WALL_ATTACK_RANGE:
+            layer_result = None
+        assert wall_distance(position, brute_wall) == layer_result
+    print("Murs trouvés identiques au parcours complet : OK")
+
+    # Retrait de 20 murs détruits
+    destroyed = rng.sample(walls, 20)
+    for wall in destroyed:
+        wall.durability = 0
+    start = time.perf_counter()
+    walls_before = len([b for b in buildings if hasattr(b, 'is_obstacle') and b.is_obstacle])
+    remaining = [b for b in buildings if not (hasattr(b, 'durability') and b.durability <= 0)]
+    walls_after = len([b for b in remaining if hasattr(b, 'is_obstacle') and b.is_obstacle])
+    brute_removal_ms = (time.perf_counter() - start) * 1000
+    assert walls_before - walls_after == len(destroyed)
+
+    for wall in destroyed:
+        wall.durability = 1
+    start = time.perf_counter()
+    for wall in destroyed:
+        obstacles.damage(wall, 1)
+    destroyed_walls = obstacles.pop_destroyed()
+    destroyed_ids = {id(wall) for wall in destroyed_walls}
+    remaining = [building for building in buildings if id(building) not in destroyed_ids]
+    layer_removal_ms = (time.perf_counter() - start) * 1000
+    assert len(destroyed_walls) == len(destroyed) and len(obstacles) == len(walls) - len(destroyed)
+
+    print(f"{ENEMIES} ennemis, {len(walls)} murs ({len(buildings)} bâtiments) :")
+    print(f"  recherche des murs : parcours complet {brute_ms:8.1f} ms | calque {layer_ms:6.2f} ms par frame")
+    print(f"  retrait de {len(destroyed)} murs détruits : double filtrage {brute_removal_ms:6.2f} ms"
+          f" | calque {layer_removal_ms:6.2f} ms")
@@ -0,0 +1,124 @@
+"""
+BENCH_PRODUCTION.PY
+===================
+Mesure le coût de la production d'une base de 5000 producteurs (mines, fermes, générateurs,
+entrepôts, hôpitaux) pendant 60 secondes de jeu à 60 FPS : un appel d'update par producteur
+et par frame (chaque bâtiment tient son timer) contre le moteur de production (production.py),
+qui compte les producteurs par phase et par type.
+Vérifie que les deux méthodes produisent les mêmes quantités, à un tick près par producteur
+(les phases arrondissent le prochain tick d'un producteur au plus d'un 20e d'intervalle, et un
+bâtiment seul perd le dépassement de la frame à chaque tick alors que les phases n'ont pas de dérive).
+Usage : python benchmarks/bench_production.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from constants import *
+from buildings import Mine, Farm, Generator, Warehouse, Hospital
+from player import Player
+from production import ProductionEngine
+
+SEED = 1234
+PRODUCERS = 5000
+SECONDS = 60
+DELTA_TIME = 1 / 60
+RESEARCH_LEVEL = 5  # Tous les bonus de production débloqués
+
+
+def build_producers(rng):
+    """Producteurs de tous types, timers répartis sur l'intervalle (bâtiments posés à des moments différents)"""
+    classes = (Mine, Farm, Generator, Warehouse, Hospital)
+    producers = []
+    for index in range(PRODUCERS):
+        producer = rng.choice(classes)(index % 100, index // 100)
+        producer.production_timer = rng.uniform(0, PRODUCTION_TICK_INTERVAL)
+        producers.append(producer)
+    return producers
+
+
+def fresh_inventory():
+    """Inventaire de départ, recherche au niveau RESEARCH_LEVEL"""
+    inventory = Player(0, 0).inventory.copy()
+    inventory['_research_level'] = RESEARCH_LEVEL
+    return inventory
+
+
+if __name__ == "__main__":
+    frames = int(SECONDS / DELTA_TIME)
+
+    # Un update par producteur et par frame
+    producers = build_producers(random.Random(SEED))
+    building_inventory = fresh_inventory()
+    building_costs = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        for producer in producers:
+            producer.update(DELTA_TIME, building_inventory)
+        building_costs.append((time.perf_counter() - start) * 1000)
+
+    # Moteur de production (mêmes timers de départ)
+    producers = build_producers(random.Random(SEED))
+    engine = ProductionEngine()
+    start = time.perf_counter()
+    for producer in producers:
+        engine.add(producer)
+    add_ms = (time.perf_counter() - start) * 1000
+    engine_inventory = fresh_inventory()
+    engine_costs = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        engine.update(DELTA_TIME, engine_inventory)
+        engine_costs.append((time.perf_counter() - start) * 1000)
+
+    print(f"{PRODUCERS} producteurs, {SECONDS} s à 60 FPS ({engine.ticks} phases de production) :")
+    print(f"  rangement des producteurs dans le moteur : {add_ms:6.2f} ms (une fois)")
+    print(f"  par frame : update de chaque producteur {np.median(building_costs):6.3f} ms, "
+          f"moteur de production {np.median(engine_costs):6.4f} ms (max {max(engine_costs):6.4f} ms)")
+
+    # Exactitude : mêmes quantités, à un tick près par producteur
+    start_inventory = fresh_inventory()
+    for resource in building_inventory:
+        if resource == '_research_level' or building_inventory[resource] == start_inventory.get(resource, 0):
+            continue
+        by_building = building_inventory[resource] - start_inventory.get(resource, 0)
+        by_engine = engine_inventory[resource] - start_inventory.get(resource, 0)
+        per_tick = max(max(producer.production(RESEARCH_LEVEL).get(resource, 0) for producer in producers), 1)
+        assert abs(by_building - by_engine) <= PRODUCERS * per_tick, resource
+        print(f"  {resource:<15}: {by_building:8d} produits bâtiment par bâtiment, {by_engine:8d} par le moteur")
+
+    # Sauvegarde : les timers recalculés par le moteur redonnent la même production au rechargement
+    engine.sync_timers()
+    reloaded = ProductionEngine()
+    reloaded.clock, reloaded._last_boundary = engine.clock, engine._last_boundary
+    for producer in producers:
+        reloaded.add(producer)
+    inventories = fresh_inventory(), fresh_inventory()
+    for _ in range(int(3 * PRODUCTION_TICK_INTERVAL / DELTA_TIME)):
+        engine.update(DELTA_TIME, inventories[0])
+        reloaded.update(DELTA_TIME, inventories[1])
+    assert inventories[0] == inventories[1]
+    print("Timers recopiés pour la sauvegarde : même production au rechargement")
+
+    # Producteur posé entre deux débuts de phase : premier tick un intervalle plus tard
+    # (au plus une phase de retard), pas au prochain début de sa phase
+    step = 1 / 600
+    for placed_at in (0.537, 1.0, 3.95):
+        engine = ProductionEngine()
+        inventory = fresh_inventory()
+        while engine.clock < placed_at:
+            engine.update(step, inventory)
+        mine = Mine(0, 0)
+        engine.add(mine)
+        added_at, metal = engine.clock, inventory[RESOURCE_METAL]
+        while inventory[RESOURCE_METAL] == metal:
+            engine.update(step, inventory)
+        waited = engine.clock - added_at
+        assert PRODUCTION_TICK_INTERVAL <= waited + 1e-9 < PRODUCTION_TICK_INTERVAL + engine.slot_duration + step, waited
+    print(f"Nouveau producteur : premier tick un intervalle après sa pose (dernier : {waited:.3f} s)")
@@ -0,0 +1,159 @@
+"""
+BENCH_PROJECTILES.PY
+====================
+Mesure le coût d'une frame avec 10000 projectiles en vol au milieu de 2000 ennemis
+(projectiles.py) : déplacement, collisions sur la grille des ennemis et dégâts, avec des ennemis
+objets puis rangés dans le stockage NumPy ; mesure aussi le dessin des projectiles visibles.
+Le nombre de projectiles est maintenu à 10000 (les projectiles terminés sont remplacés hors mesure).
+Vérifie que les ennemis touchés sont les mêmes qu'avec un test de toutes les paires, et que
+chaque choix de cible des tourelles désigne le bon ennemi.
+Usage : python benchmarks/bench_projectiles.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+from constants import *
+from buildings import Turret
+from enemies import Zombie, Mutant, Wolf
+from enemy_store import EnemyStore
+from projectiles import ProjectileSystem
+
+SEED = 1234
+PROJECTILES = 10000
+ENEMIES = 2000
+FRAMES = 120
+AREA = 3000  # Côté de la zone peuplée (en pixels)
+DELTA_TIME = 1 / 60
+SCREEN_SIZE = (1280, 720)
+
+
+def spawn_enemies(rng, store=None):
+    """Crée des ennemis increvables répartis dans la zone"""
+    classes = (Zombie, Mutant, Wolf)
+    enemies = []
+    for _ in range(ENEMIES):
+        enemy_class = rng.choice(classes)
+        if store is not None:
+            enemy_class = store.view_class(enemy_class)
+        enemy = enemy_class(rng.uniform(0, AREA), rng.uniform(0, AREA))
+        enemy.health_points = 10 ** 9
+        enemies.append(enemy)
+    return enemies
+
+
+def refill(projectiles, rng, enemies):
+    """Complète jusqu'à PROJECTILES projectiles, tirés vers un ennemi depuis la portée d'une tourelle"""
+    while len(projectiles) < PROJECTILES:
+        target = rng.choice(enemies)
+        angle = rng.uniform(0, 2 * np.pi)
+        distance = rng.uniform(0, TURRET_RANGE)
+        # Un tir sur deux vise un peu à côté (projectiles qui manquent et vont au bout de leur vie)
+        miss = rng.uniform(-40, 40) if rng.random() < 0.5 else 0
+        projectiles.fire(target.position_x + np.cos(angle) * distance, target.position_y + np.sin(angle) * distance,
+                         target.position_x + miss, target.position_y + miss, TURRET_DAMAGE, 0)
+
+
+def measure(enemies, store, rng):
+    """Coûts (ms) d'une frame de projectiles sur FRAMES frames, et nombre de tirs touchés"""
+    projectiles = ProjectileSystem()
+    costs = []
+    hits = 0
+    for _ in range(FRAMES):
+        refill(projectiles, rng, enemies)
+        start = time.perf_counter()
+        hits += projectiles.update(DELTA_TIME, enemies, store)
+        costs.append((time.perf_counter() - start) * 1000)
+    return costs, hits, projectiles
+
+
+def brute_force_hits(projectiles, enemies):
+    """Référence : premier ennemi touché par chaque projectile, en testant toutes les paires"""
+    count = len(projectiles)
+    start_x = projectiles.position_x[:count].copy()
+    start_y = projectiles.position_y[:count].copy()
+    step_x = projectiles.velocity_x[:count] * DELTA_TIME
+    step_y = projectiles.velocity_y[:count] * DELTA_TIME
+    half_size = np.array([enemy.enemy_size / 2 for enemy in enemies])
+    center_x = np.array([enemy.position_x for enemy in enemies]) + half_size
+    center_y = np.array([enemy.position_y for enemy in enemies]) + half_size
+
+    relative_x = center_x[None, :] - start_x[:, None]
+    relative_y = center_y[None, :] - start_y[:, None]
+    length_sq = np.maximum(step_x ** 2 + step_y ** 2, 1e-12)[:, None]
+    along = np.clip((relative_x * step_x[:, None] + relative_y * step_y[:, None]) / length_sq, 0, 1)
+    gap_sq = (relative_x - along * step_x[:, None]) ** 2 + (relative_y - along * step_y[:, None]) ** 2
+    touching = gap_sq <= (half_size[None, :] + projectiles.radius) ** 2
+    along = np.where(touching, along, np.inf)
+    first = along.argmin(axis=1)
+    hit = touching.any(axis=1)
+    damage = {}
+    for bullet in np.flatnonzero(hit):
+        enemy = enemies[first[bullet]]
+        damage[id(enemy)] = damage.get(id(enemy), 0) + projectiles.damage[bullet]
+    return damage
+
+
+def check_targeting():
+    """Chaque choix de cible désigne le bon ennemi (sans grille, la liste n'est plus lue dans l'ordre)"""
+    turret = Turret(10, 10)
+    center = 10 * TILE_SIZE + TILE_SIZE // 2
+    far_weak = Wolf(center + 120, center)
+    near = Zombie(center + 30, center)
+    close_to_goal = Mutant(center - 100, center)
+    out_of_range = Zombie(center + 400, center)
+    far_weak.health_points = 5
+    enemies = [out_of_range, far_weak, close_to_goal, near]
+    goal = (center - 300, center)
+    expected = {'closest': near, 'weakest': far_weak, 'first': close_to_goal}
+    for mode in TURRET_TARGETING_MODES:
+        turret.targeting = mode
+        projectiles = ProjectileSystem()
+        turret.shoot_cooldown = 0
+        turret.attack_enemies(enemies, DELTA_TIME, projectiles=projectiles, goal=goal)
+        target = expected[mode]
+        aim_x = target.position_x + target.enemy_size / 2 - center
+        assert len(projectiles) == 1 and np.sign(projectiles.velocity_x[0]) == np.sign(aim_x), mode
+
+
+if __name__ == "__main__":
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    rng = random.Random(SEED)
+
+    check_targeting()
+    print("Choix de cible des tourelles (plus proche, plus faible, premier arrivé) : OK")
+
+    # Exactitude : mêmes dégâts par ennemi qu'en testant toutes les paires
+    enemies = spawn_enemies(rng)
+    projectiles = ProjectileSystem()
+    refill(projectiles, rng, enemies)
+    expected = brute_force_hits(projectiles, enemies)
+    health_before = {id(enemy): enemy.health_points for enemy in enemies}
+    projectiles.update(DELTA_TIME, enemies)
+    damage = {id(enemy): health_before[id(enemy)] - enemy.health_points for enemy in enemies
+              if enemy.health_points != health_before[id(enemy)]}
+    assert damage.keys() == expected.keys() and all(np.isclose(damage[key], expected[key]) for key in damage)
+    print(f"Collisions identiques au test de toutes les paires : OK ({projectiles.hits} projectiles ont touché)")
+
+    print(f"{PROJECTILES} projectiles en vol, {ENEMIES} ennemis, {FRAMES} frames à 60 FPS :")
+    for label, store in (("ennemis objets", None), ("stockage NumPy", EnemyStore())):
+        enemies = spawn_enemies(random.Random(SEED), store)
+        costs, hits, projectiles = measure(enemies, store, random.Random(SEED))
+        print(f"  {label:<15}: {np.median(costs):6.2f} ms par frame (max {max(costs):6.2f} ms), "
+              f"{hits} tirs touchés")
+
+    # Dessin : vue centrée sur la zone, tous les projectiles en vol
+    camera_x, camera_y = AREA / 2 - SCREEN_SIZE[0] / 2, AREA / 2 - SCREEN_SIZE[1] / 2
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        projectiles.draw(screen, camera_x, camera_y, *SCREEN_SIZE)
+    print(f"  dessin des projectiles visibles : {(time.perf_counter() - start) * 1000 / FRAMES:6.2f} ms par frame")
+    pygame.quit()
@@ -0,0 +1,82 @@
+"""
+BENCH_RESOURCE_INDEX.PY
+=======================
+Mesure les requêtes de l'index spatial des ressources (resource_index.py) sur une carte
+1000x1000 et les compare à un parcours complet de la grille avec NumPy.
+Vérifie aussi que les résultats sont identiques et que l'index suit les récoltes/respawns.
+Usage : python benchmarks/bench_resource_index.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import world as world_module
+from constants import *
+
+SEED = 1234
+GRID = 1000
+QUERIES = 2000
+
+
+def brute_nearest(codes, terrain_type, grid_x, grid_y):
+    """Plus proche case d'un terrain par parcours complet de la grille"""
+    tile_ys, tile_xs = np.nonzero(codes == TERRAIN_CODES[terrain_type])
+    if len(tile_xs) == 0:
+        return None, None
+    distances = (tile_xs - grid_x) ** 2 + (tile_ys - grid_y) ** 2
+    best = np.argmin(distances)
+    return int(distances[best]), (int(tile_xs[best]), int(tile_ys[best]))
+
+
+def time_per_call(function, arguments):
+    """Retourne le temps moyen d'un appel en microsecondes"""
+    start = time.perf_counter()
+    for call_arguments in arguments:
+        function(*call_arguments)
+    return (time.perf_counter() - start) / len(arguments) * 1e6
+
+
+if __name__ == "__main__":
+    world_module.GRID_SIZE = GRID
+    start = time.perf_counter()
+    world = world_module.World(seed=SEED)
+    print(f"Monde {GRID}x{GRID} (index compris) : {(time.perf_counter() - start) * 1000:.0f} ms")
+    index = world.resource_index
+    for terrain_type in index.counts:
+        print(f"  {terrain_type:15s} {index.counts[terrain_type]:7d} cases")
+
+    rng = random.Random(SEED)
+    points = [(rng.randrange(GRID), rng.randrange(GRID)) for _ in range(QUERIES)]
+    codes = world.terrain.to_array()
+
+    # Exactitude : même distance que le parcours complet
+    for terrain_type in (TERRAIN_METAL, TERRAIN_FOOD, TERRAIN_ENERGY_CRYSTAL):
+        for grid_x, grid_y in points[:50]:
+            expected_distance, _ = brute_nearest(codes, terrain_type, grid_x, grid_y)
+            found = index.nearest(terrain_type, grid_x, grid_y)
+            assert (found[0] - grid_x) ** 2 + (found[1] - grid_y) ** 2 == expected_distance
+    assert index.count_in_rect(TERRAIN_WOOD, 100, 200, 399, 599) == int(
+        np.count_nonzero(codes[200:600, 100:400] == TERRAIN_CODES[TERRAIN_WOOD]))
+    print("Exactitude face au parcours complet : OK")
+
+    for terrain_type in (TERRAIN_METAL, TERRAIN_WOOD, TERRAIN_ENERGY_CRYSTAL):
+        nearest_us = time_per_call(index.nearest, [(terrain_type, x, y) for x, y in points])
+        radius_us = time_per_call(index.within_radius, [(terrain_type, x, y, 20) for x, y in points])
+        rect_us = time_per_call(index.count_in_rect, [(terrain_type, x, y, x + 63, y + 63) for x, y in points])
+        brute_us = time_per_call(brute_nearest, [(codes, terrain_type, x, y) for x, y in points[:50]])
+        print(f"{terrain_type:15s} nearest {nearest_us:7.1f} µs | within_radius(20) {radius_us:7.1f} µs | "
+              f"count_in_rect(64x64) {rect_us:7.1f} µs | parcours complet {brute_us:9.1f} µs")
+
+    # Suivi des récoltes et des respawns
+    metal_x, metal_y = index.nearest(TERRAIN_METAL, GRID // 2, GRID // 2)
+    world.set_terrain(metal_x, metal_y, TERRAIN_GRASS)
+    world.schedule_respawn(metal_x, metal_y, 1.0)
+    assert index.nearest(TERRAIN_METAL, metal_x, metal_y) != (metal_x, metal_y)
+    world.update(1.5)
+    assert index.nearest(TERRAIN_METAL, metal_x, metal_y) == (metal_x, metal_y)
+    print("Mise à jour après récolte et respawn : OK")
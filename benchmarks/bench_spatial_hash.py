@@ -0,0 +1,130 @@
+"""
+BENCH_SPATIAL_HASH.PY
+=====================
+Mesure le coût par frame des requêtes de proximité avec 5000 ennemis, 1000 tourelles et 500 murs :
+ancien parcours complet (chaque tourelle parcourt tous les ennemis, chaque ennemi tous les bâtiments)
+contre la grille spatiale (spatial_hash.py) reconstruite à chaque frame.
+Vérifie aussi que les deux méthodes trouvent les mêmes cibles.
+Usage : python benchmarks/bench_spatial_hash.py
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import *
+from spatial_hash import SpatialHash
+
+SEED = 1234
+ENEMIES = 5000
+TURRETS = 1000
+WALLS = 500
+AREA = 200 * TILE_SIZE  # Côté de la zone peuplée (en pixels)
+WALL_ATTACK_RANGE = 50  # Portée de recherche des murs par un ennemi (voir BaseEnemy.update)
+
+
+class BenchEntity:
+    """Entité minimale (position en pixels, case de grille) pour isoler le coût des requêtes"""
+
+    def __init__(self, position_x, position_y):
+        self.position_x = position_x
+        self.position_y = position_y
+        self.grid_x = int(position_x // TILE_SIZE)
+        self.grid_y = int(position_y // TILE_SIZE)
+        self.is_alive = True
+        self.is_obstacle = True
+
+
+def brute_turret_target(turret, enemies):
+    """Ancienne recherche : ennemi le plus proche à portée en parcourant toute la liste"""
+    best, best_distance = None, float('inf')
+    for enemy in enemies:
+        distance = math.sqrt((enemy.position_x - turret.position_x) ** 2 + (enemy.position_y - turret.position_y) ** 2)
+        if distance <= TURRET_RANGE and distance < best_distance:
+            best, best_distance = enemy, distance
+    return best
+
+
+def brute_wall_target(enemy, buildings):
+    """Ancienne recherche de BaseEnemy.update : mur le plus proche en parcourant tous les bâtiments"""
+    best, best_distance = None, float('inf')
+    for building in buildings:
+        if hasattr(building, 'is_obstacle') and building.is_obstacle:
+            wall_x = building.grid_x * TILE_SIZE + TILE_SIZE // 2
+            wall_y = building.grid_y * TILE_SIZE + TILE_SIZE // 2
+            distance = math.sqrt((wall_x - enemy.position_x) ** 2 + (wall_y - enemy.position_y) ** 2)
+            if distance <= WALL_ATTACK_RANGE and distance < best_distance:
+                best, best_distance = building, distance
+    return best
+
+
+def distance_to(entity, target):
+    """Distance entre une entité et la cible trouvée (None si aucune cible)"""
+    if target is None:
+        return None
+    return round(math.hypot(entity.position_x - target.position_x, entity.position_y - target.position_y), 6)
+
+
+if __name__ == "__main__":
+    rng = random.Random(SEED)
+
+    def random_entity():
+        return BenchEntity(rng.uniform(0, AREA), rng.uniform(0, AREA))
+
+    enemies = [random_entity() for _ in range(ENEMIES)]
+    turrets = [random_entity() for _ in range(TURRETS)]
+    walls = [random_entity() for _ in range(WALLS)]
+    for wall in walls:
+        wall.position_x = wall.grid_x * TILE_SIZE + TILE_SIZE // 2
+        wall.position_y = wall.grid_y * TILE_SIZE + TILE_SIZE // 2
+
+    # Ancienne méthode : une frame
+    start = time.perf_counter()
+    brute_turrets = [brute_turret_target(turret, enemies) for turret in turrets]
+    brute_turret_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    brute_walls = [brute_wall_target(enemy, walls) for enemy in enemies]
+    brute_wall_ms = (time.perf_counter() - start) * 1000
+
+    # Grille spatiale : reconstruction des ennemis + requêtes (murs insérés une fois)
+    enemy_hash = SpatialHash()
+    wall_hash = SpatialHash()
+    for wall in walls:
+        wall_hash.insert(wall, wall.position_x, wall.position_y)
+
+    frames = 20
+    start = time.perf_counter()
+    for _ in range(frames):
+        enemy_hash.rebuild(enemies)
+    rebuild_ms = (time.perf_counter() - start) * 1000 / frames
+    start = time.perf_counter()
+    for _ in range(frames):
+        hash_turrets = [enemy_hash.nearest(turret.position_x, turret.position_y, TURRET_RANGE) for turret in turrets]
+    hash_turret_ms = (time.perf_counter() - start) * 1000 / frames
+    start = time.perf_counter()
+    for _ in range(frames):
+        hash_walls = [wall_hash.nearest(enemy.position_x, enemy.position_y, WALL_ATTACK_RANGE) for enemy in enemies]
+    hash_wall_ms = (time.perf_counter() - start) * 1000 / frames
+    start = time.perf_counter()
+    for _ in range(frames):
+        for turret in turrets[:100]:
+            enemy_hash.query_radius(turret.position_x, turret.position_y, TURRET_RANGE)
+    radius_ms = (time.perf_counter() - start) * 1000 / frames
+
+    # Exactitude : mêmes distances de cible (à égalité de distance, la cible peut différer)
+    assert [distance_to(t, a) for t, a in zip(turrets, brute_turrets)] == \
+           [distance_to(t, b) for t, b in zip(turrets, hash_turrets)]
+    assert [distance_to(e, a) for e, a in zip(enemies, brute_walls)] == \
+           [distance_to(e, b) for e, b in zip(enemies, hash_walls)]
+    print("Cibles identiques au parcours complet : OK")
+
+    print(f"{ENEMIES} ennemis, {TURRETS} tourelles, {WALLS} murs (par frame) :")
+    print(f"  parcours complet : tourelles {brute_turret_ms:8.1f} ms | murs {brute_wall_ms:8.1f} ms")
+    print(f"  grille spatiale  : tourelles {hash_turret_ms:8.1f} ms | murs {hash_wall_ms:8.1f} ms"
+          f" | reconstruction {rebuild_ms:.1f} ms")
+    print(f"  query_radius (portée d'une tourelle) : {radius_ms * 10:.1f} µs par requête")
@@ -0,0 +1,114 @@
+"""
+BENCH_SPAWN_DIRECTOR.PY
+=======================
+Simule une longue partie sans qu'aucun ennemi ne meure (pire cas : le joueur ne se défend pas) :
+anciens minuteurs indépendants (un par type, aucun plafond) contre le directeur des apparitions
+(spawn_director.py). Compare la population finale et le coût par frame de sa mise à jour.
+Vérifie aussi que les points d'apparition du directeur sont hors de l'écran, sur des cases libres.
+Usage : python benchmarks/bench_spawn_director.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+from constants import *
+from enemies import ENEMY_CLASSES
+from spawn_director import SpawnDirector
+from world import World
+
+SEED = 1234
+DAYS = 40
+STEP = 0.25  # Pas de temps de la simulation des apparitions (secondes)
+VIEW_WIDTH, VIEW_HEIGHT = 1280, 720
+FRAMES = 30
+
+
+class BenchPlayer:
+    """Joueur minimal (position fixe, vie illimitée)"""
+
+    def __init__(self, position_x, position_y):
+        self.position_x = position_x
+        self.position_y = position_y
+        self.is_alive = True
+
+    def take_damage(self, damage_amount):
+        pass
+
+
+def legacy_spawns(duration):
+    """Anciens minuteurs de Game.update : nombre d'ennemis apparus par type"""
+    timers = {kind: 0.0 for kind in SPAWN_SCHEDULE}
+    counts = {kind: 0 for kind in SPAWN_SCHEDULE}
+    elapsed = 0.0
+    while elapsed < duration:
+        is_night = (elapsed % SECONDS_PER_DAY) / SECONDS_PER_DAY > DAY_PHASE_DURATION
+        multiplier = NIGHT_ENEMY_SPAWN_MULTIPLIER if is_night else 1.0
+        for kind, (interval, min_size, max_size) in SPAWN_SCHEDULE.items():
+            timers[kind] += STEP * multiplier
+            if timers[kind] >= interval:
+                timers[kind] = 0
+                counts[kind] += random.randint(min_size, max_size)
+        elapsed += STEP
+    return counts
+
+
+def frame_cost(counts, player, rng):
+    """Coût médian (ms) d'une frame de mise à jour d'une population d'ennemis"""
+    enemies = [ENEMY_CLASSES[kind](rng.uniform(0, GRID_SIZE * TILE_SIZE), rng.uniform(0, GRID_SIZE * TILE_SIZE))
+               for kind, count in counts.items() for _ in range(count)]
+    costs = []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        for enemy in enemies:
+            enemy.update(1 / 60, player)
+        costs.append((time.perf_counter() - start) * 1000)
+    return np.median(costs)
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    random.seed(SEED)
+    rng = random.Random(SEED)
+    world = World(seed=SEED, use_cache=False)
+    player_x, player_y = world.get_spawn_position()
+    player = BenchPlayer(player_x, player_y)
+    view = (player_x - VIEW_WIDTH / 2, player_y - VIEW_HEIGHT / 2, player_x + VIEW_WIDTH / 2, player_y + VIEW_HEIGHT / 2)
+    duration = DAYS * SECONDS_PER_DAY
+
+    legacy_counts = legacy_spawns(duration)
+
+    director = SpawnDirector()
+    live = 0
+    points = []
+    elapsed = 0.0
+    start = time.perf_counter()
+    while elapsed < duration:
+        for kind, positions in director.update(STEP, elapsed, live, [(player_x, player_y)], [view], world):
+            live += len(positions)
+            points.extend(positions)
+        elapsed += STEP
+    director_ms = (time.perf_counter() - start) * 1000
+
+    left, top, right, bottom = view
+    margin = SPAWN_OFFSCREEN_MARGIN
+    assert live == len(points) <= SPAWN_MAX_LIVE_ENEMIES
+    for spawn_x, spawn_y in points:
+        assert not (left - margin < spawn_x < right + margin and top - margin < spawn_y < bottom + margin)
+        assert world.is_tile_open(int(spawn_x // TILE_SIZE), int(spawn_y // TILE_SIZE))
+    print(f"{len(points)} points d'apparition hors de l'écran sur des cases libres, plafond respecté : OK")
+
+    telemetry = director.telemetry(live)
+    print(f"{DAYS} jours sans pertes ennemies (directeur : {director_ms:.0f} ms de décisions au total) :")
+    print(f"  anciens minuteurs : {sum(legacy_counts.values()):5d} ennemis vivants | "
+          f"{frame_cost(legacy_counts, player, rng):6.2f} ms par frame")
+    print(f"  directeur         : {live:5d} ennemis vivants | "
+          f"{frame_cost(director.spawned, player, rng):6.2f} ms par frame")
+    print(f"  télémétrie : {telemetry['spawned']}, limites {telemetry['limits']}, en attente {telemetry['held']}")
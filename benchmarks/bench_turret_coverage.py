@@ -0,0 +1,112 @@
+"""
+BENCH_TURRET_COVERAGE.PY
+========================
+Mesure la recherche des ennemis à portée de 60 tourelles groupées en base, par frame :
+une requête de rayon par tourelle dans la grille spatiale des ennemis (reconstruite à chaque
+frame de toute façon, sa reconstruction n'est pas comptée) contre la carte de couverture
+(turret_coverage.py), calculée une fois à la pose, où les ennemis sont triés par case en une
+passe NumPy. Trois cas : une tourelle sur 60 prête à tirer (tir chaque seconde, tourelles
+décalées : cas courant en jeu), TURRET_COVERAGE_BATCH_MIN tourelles prêtes (seuil à partir duquel
+Game lit la carte de couverture) et toutes les tourelles prêtes.
+Vérifie que chaque tourelle reçoit exactement les ennemis à sa portée, et que le retrait d'une
+tourelle efface ses cases.
+Usage : python benchmarks/bench_turret_coverage.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from constants import *
+from buildings import Turret
+from spatial_hash import SpatialHash
+from turret_coverage import TurretCoverage, turret_center
+
+SEED = 1234
+TURRETS = 60
+ENEMY_COUNTS = (200, 2000)
+FRAMES = 60
+BASE_SIZE = 30  # Côté (en cases) de la base où les tourelles sont posées
+AREA = 60 * TILE_SIZE  # Côté (en pixels) de la zone où les ennemis rôdent, base au centre
+
+
+class BenchEnemy:
+    """Ennemi minimal (position, vivant)"""
+
+    def __init__(self, position_x, position_y):
+        self.position_x = position_x
+        self.position_y = position_y
+        self.is_alive = True
+
+
+def in_range(turret, enemies):
+    """Référence : ennemis vivants à portée, par calcul de distance"""
+    center_x, center_y = turret_center(turret)
+    return {id(enemy) for enemy in enemies if enemy.is_alive and
+            (enemy.position_x - center_x) ** 2 + (enemy.position_y - center_y) ** 2 <= TURRET_RANGE ** 2}
+
+
+if __name__ == "__main__":
+    rng = random.Random(SEED)
+    offset = (AREA // TILE_SIZE - BASE_SIZE) // 2
+    turrets = [Turret(offset + rng.randrange(BASE_SIZE), offset + rng.randrange(BASE_SIZE)) for _ in range(TURRETS)]
+
+    start = time.perf_counter()
+    coverage = TurretCoverage()
+    for turret in turrets:
+        coverage.add(turret)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Carte de couverture de {TURRETS} tourelles : {build_ms:.2f} ms (une fois, à la pose)")
+
+    # Retrait d'une tourelle : ses cases quittent la carte, la reposer redonne la même couverture
+    points = [(rng.uniform(0, AREA), rng.uniform(0, AREA)) for _ in range(2000)]
+    before = [coverage.is_covered(x, y) for x, y in points]
+    assert coverage.remove(turrets[0]) and not coverage.remove(turrets[0])
+    assert all(turret is not turrets[0] for entries in coverage._tiles.values() for turret, _ in entries)
+    coverage.add(turrets[0])
+    assert [coverage.is_covered(x, y) for x, y in points] == before
+    print("Retrait puis nouvelle pose d'une tourelle : couverture identique")
+
+    print(f"Recherche des ennemis à portée de toutes les tourelles, par frame (médiane sur {FRAMES} frames) :")
+    for enemy_count in ENEMY_COUNTS:
+        enemies = [BenchEnemy(rng.uniform(0, AREA), rng.uniform(0, AREA)) for _ in range(enemy_count)]
+        for enemy in rng.sample(enemies, enemy_count // 10):
+            enemy.is_alive = False
+
+        # Exactitude
+        found = coverage.targets(turrets, enemies)
+        assert all({id(enemy) for enemy in found[turret]} == in_range(turret, enemies) for turret in turrets)
+
+        for ready_count in (max(1, TURRETS // 60), TURRET_COVERAGE_BATCH_MIN, TURRETS):
+            ready = turrets[:ready_count]
+            hash_costs, coverage_costs = [], []
+            enemy_hash = SpatialHash()
+            for _ in range(FRAMES):
+                for enemy in enemies:
+                    enemy.position_x += rng.uniform(-1, 1)
+                    enemy.position_y += rng.uniform(-1, 1)
+
+                enemy_hash.rebuild(enemies)
+                start = time.perf_counter()
+                for turret in ready:
+                    center_x, center_y = turret_center(turret)
+                    [enemy for enemy in enemy_hash.query_radius(center_x, center_y, TURRET_RANGE) if enemy.is_alive]
+                hash_costs.append((time.perf_counter() - start) * 1000)
+
+                start = time.perf_counter()
+                coverage.targets(ready, enemies)
+                coverage_costs.append((time.perf_counter() - start) * 1000)
+
+            choice = "carte" if ready_count >= TURRET_COVERAGE_BATCH_MIN else "requêtes"
+            print(f"  {enemy_count:5d} ennemis, {ready_count:2d} prêtes : requête par tourelle {np.median(hash_costs):6.2f} ms, "
+                  f"carte de couverture {np.median(coverage_costs):6.2f} ms (jeu : {choice})")
+
+    # Apparitions : part des points tirés autour de la base qui tombent sous le feu
+    points = [(rng.uniform(0, AREA), rng.uniform(0, AREA)) for _ in range(10000)]
+    covered = sum(coverage.is_covered(x, y) for x, y in points)
+    print(f"Points d'apparition sous le feu des tourelles (écartés par le directeur) : {covered / len(points):.1%}")
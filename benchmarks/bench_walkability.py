@@ -0,0 +1,77 @@
+"""
+BENCH_WALKABILITY.PY
+====================
+Mesure la carte de franchissabilité (walkability.py) sur une carte 1000x1000 :
+construction des bitmaps et des régions, is_tile_walkable, are_connected,
+et mises à jour incrémentales quand des murs sont construits puis détruits.
+Usage : python benchmarks/bench_walkability.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import worldgen
+from terrain_grid import WALKABLE_BY_CODE
+from walkability import WalkabilityMap
+
+SEED = 1234
+GRID = 1000
+CALLS = 200000
+WALL_LENGTH = 200
+
+
+def time_per_call(function, arguments):
+    """Retourne le temps moyen d'un appel en microsecondes"""
+    start = time.perf_counter()
+    for call_arguments in arguments:
+        function(*call_arguments)
+    return (time.perf_counter() - start) / len(arguments) * 1e6
+
+
+def old_is_tile_walkable(codes, grid_x, grid_y):
+    """Ancienne vérification : limites puis table des codes sur le tableau NumPy"""
+    if not (0 <= grid_x < GRID and 0 <= grid_y < GRID):
+        return False
+    return WALKABLE_BY_CODE[codes[grid_y, grid_x]]
+
+
+if __name__ == "__main__":
+    codes = worldgen.generate_world(SEED, GRID, GRID)
+
+    start = time.perf_counter()
+    walkability = WalkabilityMap(codes)
+    print(f"Construction {GRID}x{GRID} (2 bitmaps + 2 étiquetages) : {(time.perf_counter() - start) * 1000:.0f} ms, "
+          f"bitmap {len(walkability.walkable_bits) / 1024:.0f} Ko")
+
+    rng = random.Random(SEED)
+    points = [(rng.randrange(GRID), rng.randrange(GRID)) for _ in range(CALLS)]
+    old_us = time_per_call(old_is_tile_walkable, [(codes, x, y) for x, y in points])
+    new_us = time_per_call(walkability.is_walkable, points)
+    connected_us = time_per_call(walkability.are_connected, [(x, y, GRID // 2, GRID // 2) for x, y in points])
+    print(f"is_tile_walkable : ancien {old_us:.2f} µs, bitmap {new_us:.2f} µs | are_connected {connected_us:.2f} µs")
+
+    # Un long mur construit case par case, puis détruit
+    row = GRID // 2
+    start = time.perf_counter()
+    for x in range(100, 100 + WALL_LENGTH):
+        walkability.set_wall(x, row, True)
+    build_ms = (time.perf_counter() - start) * 1000 / WALL_LENGTH
+    start = time.perf_counter()
+    for x in range(100, 100 + WALL_LENGTH):
+        walkability.set_wall(x, row, False)
+    destroy_ms = (time.perf_counter() - start) * 1000 / WALL_LENGTH
+    print(f"Mur de {WALL_LENGTH} cases : construction {build_ms:.3f} ms/case, destruction {destroy_ms:.3f} ms/case")
+
+    # Enclos fermé : l'intérieur devient une région isolée, sauf en traversant les murs
+    for offset in range(-3, 4):
+        for x, y in ((row + offset, row - 3), (row + offset, row + 3), (row - 3, row + offset), (row + 3, row + offset)):
+            walkability.set_wall(x, y, True)
+    inside_open = walkability.is_open(row, row)
+    assert not inside_open or not walkability.are_connected(row, row, 0, 0)
+    assert not inside_open or walkability.are_connected(row, row, row + 1, row + 1)
+    print("Enclos isolé détecté : OK")
+    assert walkability.walkable_bits == WalkabilityMap(codes).walkable_bits
@@ -0,0 +1,62 @@
+"""
+BENCH_WORLD_DRAW.PY
+===================
+Compare le coût d'une frame de rendu du terrain : ancien rendu case par case
+(toute la grille parcourue) contre le rendu par chunks mis en cache.
+Usage : python benchmarks/bench_world_draw.py
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import world as world_module
+from constants import *
+
+FRAMES = 60
+
+
+def legacy_draw(world, screen, camera_offset_x, camera_offset_y, grid_size):
+    """Ancien World.draw : parcourt toutes les cases à chaque frame"""
+    for grid_y in range(grid_size):
+        for grid_x in range(grid_size):
+            pixel_x = grid_x * TILE_SIZE - camera_offset_x
+            pixel_y = grid_y * TILE_SIZE - camera_offset_y
+            if -TILE_SIZE < pixel_x < SCREEN_WIDTH and -TILE_SIZE < pixel_y < SCREEN_HEIGHT:
+                terrain_color = world.get_terrain_color(world.grid_terrain[grid_y][grid_x])
+                tile_rect = pygame.Rect(pixel_x, pixel_y, TILE_SIZE, TILE_SIZE)
+                pygame.draw.rect(screen, terrain_color, tile_rect)
+                pygame.draw.rect(screen, COLOR_BLACK, tile_rect, 1)
+
+
+def time_frames(draw_function, screen, grid_size):
+    """Mesure le temps moyen d'une frame (caméra qui se déplace lentement)"""
+    center = grid_size * TILE_SIZE // 2
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        draw_function(screen, center + frame * 5, center)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def run(grid_size):
+    """Lance la comparaison pour une taille de carte donnée"""
+    world_module.GRID_SIZE = grid_size
+    world = world_module.World(seed=42)
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    legacy_ms = time_frames(
+        lambda s, cx, cy: legacy_draw(world, s, cx, cy, grid_size), screen, grid_size)
+    chunked_ms = time_frames(world.draw, screen, grid_size)
+    print(f"GRID_SIZE={grid_size:5d} | ancien rendu : {legacy_ms:8.2f} ms/frame"
+          f" | chunks en cache : {chunked_ms:6.2f} ms/frame")
+
+
+if __name__ == "__main__":
+    pygame.init()
+    for size in (200, 1000):
+        run(size)
+    pygame.quit()
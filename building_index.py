@@ -0,0 +1,92 @@
+"""
+BUILDING_INDEX.PY
+=================
+Ce fichier contient l'index d'occupation des cases : les bâtiments rangés par case,
+{(case_x, case_y): bâtiment}.
+- "La case est-elle libre ?" et "quel bâtiment est sur cette case ?" coûtent une lecture de
+  dictionnaire, quel que soit le nombre de bâtiments de la base (au lieu d'un parcours de
+  buildings_list à chaque essai de placement).
+- Les voisins d'une case (bonus d'adjacence) se lisent sur les 4 ou 8 cases autour.
+Game tient l'index à jour avec buildings_list : ajout (construction locale, réseau, chargement,
+synchronisation), retrait des murs détruits et remise à zéro au chargement.
+"""
+
+# Décalages des cases voisines (côtés, puis diagonales)
+SIDE_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIAGONAL_OFFSETS = ((1, 1), (-1, 1), (1, -1), (-1, -1))
+
+
+class BuildingIndex:
+    """Bâtiments indexés par case, requêtes d'occupation en O(1)"""
+
+    def __init__(self):
+        """Initialise un index vide"""
+        self._tiles = {}
+
+    def __len__(self):
+        return len(self._tiles)
+
+    def __iter__(self):
+        return iter(self._tiles.values())
+
+    # --- Mise à jour ---
+
+    def clear(self):
+        """Vide l'index"""
+        self._tiles.clear()
+
+    def add(self, building):
+        """
+        Range un bâtiment sur sa case
+        Args:
+            building: Bâtiment (grid_x, grid_y)
+        Returns:
+            True si le bâtiment est rangé, False si la case était déjà occupée
+        """
+        tile = (building.grid_x, building.grid_y)
+        if tile in self._tiles:
+            return False
+        self._tiles[tile] = building
+        return True
+
+    def remove(self, building):
+        """
+        Retire un bâtiment de sa case
+        Args:
+            building: Bâtiment à retirer
+        Returns:
+            True si le bâtiment était dans l'index
+        """
+        tile = (building.grid_x, building.grid_y)
+        if self._tiles.get(tile) is not building:
+            return False
+        del self._tiles[tile]
+        return True
+
+    # --- Requêtes ---
+
+    def get(self, grid_x, grid_y):
+        """Retourne le bâtiment d'une case, ou None"""
+        return self._tiles.get((grid_x, grid_y))
+
+    def is_occupied(self, grid_x, grid_y):
+        """Indique si un bâtiment occupe une case"""
+        return (grid_x, grid_y) in self._tiles
+
+    def neighbors(self, grid_x, grid_y, diagonal=False):
+        """
+        Liste les bâtiments des cases voisines
+        Args:
+            grid_x, grid_y: Case centrale
+            diagonal: Compter aussi les 4 cases en diagonale
+        Returns:
+            Liste des bâtiments voisins
+        """
+        offsets = SIDE_OFFSETS + DIAGONAL_OFFSETS if diagonal else SIDE_OFFSETS
+        tiles = self._tiles
+        found = []
+        for offset_x, offset_y in offsets:
+            building = tiles.get((grid_x + offset_x, grid_y + offset_y))
+            if building is not None:
+                found.append(building)
+        return found
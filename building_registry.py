@@ -0,0 +1,97 @@
+"""
+BUILDING_REGISTRY.PY
+====================
+Ce fichier contient le registre des bâtiments : tous les bâtiments construits, rangés aussi
+par catégorie (attribut category des classes de buildings.py : producteurs, tourelles, murs,
+laboratoires, usines).
+- Chaque système ne parcourt que sa catégorie (les tourelles pour le tir, les bâtiments
+  dont update fait quelque chose pour la production) au lieu de filtrer toute la liste
+  avec isinstance ou hasattr à chaque frame.
+- Ajout et retrait en O(1) (dictionnaires utilisés comme ensembles ordonnés) ; l'ordre de
+  parcours reste l'ordre de construction, un bâtiment détruit est retiré sans reconstruire
+  de liste.
+Le registre se parcourt comme une liste (for, len, in) : il remplace Game.buildings_list
+sans changer les lecteurs (sauvegarde, dessin, réseau).
+"""
+
+# Catégories des bâtiments
+BUILDING_CATEGORIES = ('producer', 'lab', 'factory', 'turret', 'wall', 'other')
+# Catégories dont la méthode update fait quelque chose, dans l'ordre de mise à jour
+# (les laboratoires d'abord : un niveau de recherche atteint compte dès cette frame)
+UPDATED_CATEGORIES = ('lab', 'producer', 'factory', 'turret')
+
+
+class BuildingRegistry:
+    """Bâtiments construits, rangés par catégorie"""
+
+    def __init__(self):
+        """Initialise un registre vide"""
+        self._buildings = {}
+        self._categories = {category: {} for category in BUILDING_CATEGORIES}
+
+    def __len__(self):
+        return len(self._buildings)
+
+    def __iter__(self):
+        return iter(self._buildings)
+
+    def __contains__(self, building):
+        return building in self._buildings
+
+    # --- Mise à jour ---
+
+    def clear(self):
+        """Vide le registre"""
+        self._buildings.clear()
+        for buildings in self._categories.values():
+            buildings.clear()
+
+    def add(self, building):
+        """
+        Ajoute un bâtiment dans sa catégorie
+        Args:
+            building: Bâtiment (attribut category)
+        Returns:
+            True si le bâtiment est ajouté, False s'il était déjà dans le registre
+        """
+        if building in self._buildings:
+            return False
+        self._buildings[building] = None
+        self._categories.setdefault(building.category, {})[building] = None
+        return True
+
+    def remove(self, building):
+        """
+        Retire un bâtiment
+        Args:
+            building: Bâtiment à retirer
+        Returns:
+            True si le bâtiment était dans le registre
+        """
+        if building not in self._buildings:
+            return False
+        del self._buildings[building]
+        del self._categories[building.category][building]
+        return True
+
+    # --- Parcours ---
+
+    def of(self, category):
+        """
+        Bâtiments d'une catégorie, dans l'ordre de construction
+        Args:
+            category: Catégorie (voir BUILDING_CATEGORIES)
+        Returns:
+            Vue sur les bâtiments (à ne pas modifier pendant le parcours)
+        """
+        return self._categories.get(category, {}).keys()
+
+    def updated(self, categories=UPDATED_CATEGORIES):
+        """
+        Génère les bâtiments dont update fait quelque chose
+        Args:
+            categories: Catégories à parcourir, dans l'ordre (sans 'producer' quand le moteur
+                        de production s'en charge, voir production.py)
+        """
+        for category in categories:
+            yield from self._categories[category]
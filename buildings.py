@@ -7,12 +7,18 @@ Chaque bâtiment a un coût, une position, et peut produire des ressources.
 
 import pygame
 import math
+import itertools
 from constants import *
 from sprite_loader import SpriteLoader
 
+# Identifiants des tourelles (tireur de chaque projectile)
+_turret_ids = itertools.count(1)
+
 
 class Building:
     """Classe de base pour tous les bâtiments"""
+    # Catégorie du bâtiment, pour le rangement par type (voir building_registry.py)
+    category = 'other'
 
     def __init__(self, grid_x, grid_y, building_name, building_color, sprite_filename=None):
         """
@@ -65,104 +71,194 @@ class Building:
         pygame.draw.rect(screen, COLOR_WHITE, building_rect, 2)
 
 
-class Mine(Building):
-    """Mine : produit du métal automatiquement"""
+class Producer(Building):
+    """Bâtiment producteur : ajoute sa production à l'inventaire à chaque tick de production"""
+    category = 'producer'
 
-    def __init__(self, grid_x, grid_y):
-        super().__init__(grid_x, grid_y, "Mine", COLOR_DARK_GRAY, 'mine.png')
+    @staticmethod
+    def production(research_level):
+        """
+        Production d'un tick (à surcharger dans les sous-classes)
+        Args:
+            research_level: Niveau de recherche atteint (bonus de production)
+        Returns:
+            Dictionnaire {ressource: quantité}
+        """
+        return {}
 
     def update(self, delta_time, player_inventory):
-        """Produit du métal à intervalle régulier"""
+        """
+        Produit à intervalle régulier (bâtiment seul ; en jeu, les producteurs sont regroupés
+        par le moteur de production, voir production.py)
+        """
         self.production_timer += delta_time
 
-        # Produire du métal tous les X secondes
         if self.production_timer >= PRODUCTION_TICK_INTERVAL:
             self.production_timer = 0
-            production = BUILDING_MINE_PRODUCTION
-            # Bonus de recherche niveau 3 : Production Optimisée
-            if player_inventory.get('_research_level', 0) >= 3:
-                production += 1
-            player_inventory[RESOURCE_METAL] += production
+            for resource, amount in self.production(player_inventory.get('_research_level', 0)).items():
+                player_inventory[resource] = player_inventory.get(resource, 0) + amount
 
 
-class Farm(Building):
+class Mine(Producer):
+    """Mine : produit du métal automatiquement"""
+
+    def __init__(self, grid_x, grid_y):
+        super().__init__(grid_x, grid_y, "Mine", COLOR_DARK_GRAY, 'mine.png')
+
+    @staticmethod
+    def production(research_level):
+        """Produit du métal à intervalle régulier"""
+        production = BUILDING_MINE_PRODUCTION
+        # Bonus de recherche niveau 3 : Production Optimisée
+        if research_level >= 3:
+            production += 1
+        return {RESOURCE_METAL: production}
+
+
+class Farm(Producer):
     """Ferme : produit de la nourriture automatiquement"""
 
     def __init__(self, grid_x, grid_y):
         super().__init__(grid_x, grid_y, "Ferme", COLOR_YELLOW, 'farm.png')
 
-    def update(self, delta_time, player_inventory):
+    @staticmethod
+    def production(research_level):
         """Produit de la nourriture à intervalle régulier"""
-        self.production_timer += delta_time
-
-        if self.production_timer >= PRODUCTION_TICK_INTERVAL:
-            self.production_timer = 0
-            production = BUILDING_FARM_PRODUCTION
-            # Bonus de recherche niveau 3 : Production Optimisée
-            if player_inventory.get('_research_level', 0) >= 3:
-                production += 1
-            player_inventory[RESOURCE_FOOD] += production
+        production = BUILDING_FARM_PRODUCTION
+        # Bonus de recherche niveau 3 : Production Optimisée
+        if research_level >= 3:
+            production += 1
+        return {RESOURCE_FOOD: production}
 
 
-class Generator(Building):
+class Generator(Producer):
     """Générateur : produit de l'énergie automatiquement"""
 
     def __init__(self, grid_x, grid_y):
         super().__init__(grid_x, grid_y, "Générateur", COLOR_ORANGE, 'generator.png')
 
-    def update(self, delta_time, player_inventory):
+    @staticmethod
+    def production(research_level):
         """Produit de l'énergie à intervalle régulier"""
-        self.production_timer += delta_time
-
-        if self.production_timer >= PRODUCTION_TICK_INTERVAL:
-            self.production_timer = 0
-            production = BUILDING_GENERATOR_PRODUCTION
-            # Bonus de recherche niveau 3 : Production Optimisée
-            if player_inventory.get('_research_level', 0) >= 3:
-                production += 1
-            # Bonus de recherche niveau 5 : Efficacité Énergétique
-            if player_inventory.get('_research_level', 0) >= 5:
-                production += 1
-            player_inventory[RESOURCE_ENERGY] += production
+        production = BUILDING_GENERATOR_PRODUCTION
+        # Bonus de recherche niveau 3 : Production Optimisée
+        if research_level >= 3:
+            production += 1
+        # Bonus de recherche niveau 5 : Efficacité Énergétique
+        if research_level >= 5:
+            production += 1
+        return {RESOURCE_ENERGY: production}
 
 
 class Turret(Building):
     """Tourelle : défend contre les ennemis"""
+    category = 'turret'
 
     def __init__(self, grid_x, grid_y):
         super().__init__(grid_x, grid_y, "Tourelle", COLOR_RED, 'turret.png')
         self.shoot_cooldown = 0  # Temps avant de pouvoir tirer à nouveau
+        self.targeting = TURRET_DEFAULT_TARGETING  # Choix de la cible (voir TURRET_TARGETING_MODES)
+        self.turret_id = next(_turret_ids)  # Tireur des projectiles de cette tourelle
 
     def update(self, delta_time, player_inventory):
         """Met à jour le cooldown de tir"""
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= delta_time
 
-    def attack_enemies(self, enemies_list, delta_time):
+    def cycle_targeting(self):
+        """
+        Passe au choix de cible suivant (plus proche, plus faible, premier arrivé)
+        Returns:
+            Nouveau choix de cible
         """
-        Attaque les ennemis à portée
+        modes = TURRET_TARGETING_MODES
+        position = modes.index(self.targeting) if self.targeting in modes else -1
+        self.targeting = modes[(position + 1) % len(modes)]
+        return self.targeting
+
+    def select_target(self, candidates, goal=None, flow_field=None):
+        """
+        Choisit la cible parmi les ennemis à portée selon self.targeting
+        Args:
+            candidates: Ennemis vivants à portée
+            goal: Position (x, y) du joueur visé par les ennemis (choix 'first')
+            flow_field: Champ de flux vers le joueur (optionnel, distance par le chemin pour 'first')
+        Returns:
+            L'ennemi choisi, ou None
+        """
+        if not candidates:
+            return None
+        turret_pixel_x = self.grid_x * TILE_SIZE + TILE_SIZE // 2
+        turret_pixel_y = self.grid_y * TILE_SIZE + TILE_SIZE // 2
+
+        def distance_sq(enemy):
+            return (enemy.position_x - turret_pixel_x) ** 2 + (enemy.position_y - turret_pixel_y) ** 2
+
+        if self.targeting == 'weakest':
+            return min(candidates, key=lambda enemy: (enemy.health_points, distance_sq(enemy)))
+        if self.targeting == 'first' and goal is not None:
+            goal_x, goal_y = goal
+
+            def remaining_path(enemy):
+                # Coût du chemin restant (en cases) par le champ de flux, sinon distance à vol d'oiseau
+                path = None
+                if flow_field is not None:
+                    path = flow_field.distance_at(int(enemy.position_x // TILE_SIZE), int(enemy.position_y // TILE_SIZE))
+                if path is None:
+                    path = math.hypot(enemy.position_x - goal_x, enemy.position_y - goal_y) / TILE_SIZE
+                return path, distance_sq(enemy)
+
+            return min(candidates, key=remaining_path)
+        return min(candidates, key=distance_sq)
+
+    def attack_enemies(self, enemies_list, delta_time, enemy_hash=None, projectiles=None, goal=None, flow_field=None,
+                       candidates=None):
+        """
+        Attaque un ennemi à portée, choisi selon self.targeting
         Args:
             enemies_list: Liste des ennemis dans le jeu
             delta_time: Temps écoulé
+            enemy_hash: Grille spatiale des ennemis (optionnelle, évite de parcourir toute la liste)
+            projectiles: Système de projectiles (optionnel : sans lui, les dégâts sont instantanés)
+            goal: Position (x, y) du joueur visé par les ennemis (choix 'first')
+            flow_field: Champ de flux vers le joueur (optionnel, choix 'first')
+            candidates: Ennemis vivants à portée déjà trouvés (optionnel, voir turret_coverage.py)
         """
         # Ne peut tirer que si le cooldown est terminé
-        if self.shoot_cooldown <= 0:
-            # Position de la tourelle en pixels
-            turret_pixel_x = self.grid_x * TILE_SIZE + TILE_SIZE // 2
-            turret_pixel_y = self.grid_y * TILE_SIZE + TILE_SIZE // 2
-
-            # Chercher un ennemi à portée
-            for enemy in enemies_list:
-                # Calculer la distance
-                distance_x = enemy.position_x - turret_pixel_x
-                distance_y = enemy.position_y - turret_pixel_y
-                distance = math.sqrt(distance_x ** 2 + distance_y ** 2)
-
-                # Si l'ennemi est à portée, tirer
-                if distance <= TURRET_RANGE:
-                    enemy.take_damage(TURRET_DAMAGE)
-                    self.shoot_cooldown = 1.0  # 1 seconde de cooldown
-                    break  # Une tourelle tire sur un seul ennemi à la fois
+        if self.shoot_cooldown > 0:
+            return
+
+        # Position de la tourelle en pixels
+        turret_pixel_x = self.grid_x * TILE_SIZE + TILE_SIZE // 2
+        turret_pixel_y = self.grid_y * TILE_SIZE + TILE_SIZE // 2
+
+        if candidates is not None:
+            # Ennemis à portée donnés par la carte de couverture
+            target = self.select_target(candidates, goal, flow_field)
+        elif enemy_hash is not None and self.targeting == 'closest':
+            # Viser l'ennemi vivant le plus proche à portée
+            target = enemy_hash.nearest(turret_pixel_x, turret_pixel_y, TURRET_RANGE,
+                                        predicate=lambda enemy: enemy.is_alive)
+        else:
+            # Ennemis vivants à portée, puis choix de la cible
+            if enemy_hash is not None:
+                candidates = [enemy for enemy in enemy_hash.query_radius(turret_pixel_x, turret_pixel_y, TURRET_RANGE)
+                              if enemy.is_alive]
+            else:
+                candidates = [enemy for enemy in enemies_list if enemy.is_alive and
+                              math.hypot(enemy.position_x - turret_pixel_x, enemy.position_y - turret_pixel_y) <= TURRET_RANGE]
+            target = self.select_target(candidates, goal, flow_field)
+        if target is None:
+            return
+
+        if projectiles is not None:
+            # Tirer vers le centre de l'ennemi
+            half_size = target.enemy_size / 2
+            projectiles.fire(turret_pixel_x, turret_pixel_y, target.position_x + half_size, target.position_y + half_size,
+                             TURRET_DAMAGE, self.turret_id)
+        else:
+            target.take_damage(TURRET_DAMAGE)
+        self.shoot_cooldown = 1.0  # 1 seconde de cooldown
 
     def draw(self, screen, camera_offset_x, camera_offset_y):
         """Dessine la tourelle avec un indicateur de portée"""
@@ -196,29 +292,26 @@ class Rocket(Building):
         pygame.draw.rect(screen, COLOR_YELLOW, rocket_rect, 3)
 
 
-class Hospital(Building):
+class Hospital(Producer):
     """Hôpital : soigne le joueur automatiquement"""
 
     def __init__(self, grid_x, grid_y):
         super().__init__(grid_x, grid_y, "Hôpital", COLOR_LIGHT_BLUE, 'hospital.png')
 
-    def update(self, delta_time, player_inventory):
+    @staticmethod
+    def production(research_level):
         """Produit des soins pour le joueur"""
-        self.production_timer += delta_time
-        if self.production_timer >= PRODUCTION_TICK_INTERVAL:
-            self.production_timer = 0
-            # Utiliser une clé spéciale dans l'inventaire pour stocker les soins
-            if '_hospital_heal' not in player_inventory:
-                player_inventory['_hospital_heal'] = 0
-            heal_amount = HOSPITAL_HEAL_RATE
-            # Bonus de recherche niveau 4 : Soins Améliorés
-            if player_inventory.get('_research_level', 0) >= 4:
-                heal_amount += 1
-            player_inventory['_hospital_heal'] += heal_amount
+        heal_amount = HOSPITAL_HEAL_RATE
+        # Bonus de recherche niveau 4 : Soins Améliorés
+        if research_level >= 4:
+            heal_amount += 1
+        # Utiliser une clé spéciale dans l'inventaire pour stocker les soins
+        return {'_hospital_heal': heal_amount}
 
 
 class Laboratory(Building):
     """Laboratoire : effectue des recherches (système extensible)"""
+    category = 'lab'
 
     def __init__(self, grid_x, grid_y):
         super().__init__(grid_x, grid_y, "Laboratoire", COLOR_PURPLE, 'laboratory.png')
@@ -244,6 +337,7 @@ class Laboratory(Building):
 
 class Wall(Building):
     """Mur : bloque les ennemis et peut être détruit"""
+    category = 'wall'
 
     def __init__(self, grid_x, grid_y):
         super().__init__(grid_x, grid_y, "Mur", COLOR_STONE_GRAY, 'wall.png')
@@ -276,26 +370,22 @@ class Wall(Building):
         pygame.draw.rect(screen, COLOR_GREEN, (pixel_x, pixel_y - 6, TILE_SIZE * durability_pct, 4))
 
 
-class Warehouse(Building):
+class Warehouse(Producer):
     """Entrepôt : augmente capacité ou produit passivement des ressources"""
 
     def __init__(self, grid_x, grid_y):
         super().__init__(grid_x, grid_y, "Entrepôt", COLOR_WOOD_BROWN, 'warehouse.png')
 
-    def update(self, delta_time, player_inventory):
+    @staticmethod
+    def production(research_level):
         """Produit passivement un peu de toutes les ressources (hub commercial)"""
-        self.production_timer += delta_time
-        if self.production_timer >= PRODUCTION_TICK_INTERVAL:
-            self.production_timer = 0
-            # Produire un peu de chaque ressource
-            player_inventory[RESOURCE_METAL] += WAREHOUSE_PRODUCTION
-            player_inventory[RESOURCE_FOOD] += WAREHOUSE_PRODUCTION
-            player_inventory[RESOURCE_WOOD] += WAREHOUSE_PRODUCTION
-            player_inventory[RESOURCE_STONE] += WAREHOUSE_PRODUCTION
+        return {RESOURCE_METAL: WAREHOUSE_PRODUCTION, RESOURCE_FOOD: WAREHOUSE_PRODUCTION,
+                RESOURCE_WOOD: WAREHOUSE_PRODUCTION, RESOURCE_STONE: WAREHOUSE_PRODUCTION}
 
 
 class Factory(Building):
     """Usine : automatise le crafting"""
+    category = 'factory'
 
     def __init__(self, grid_x, grid_y):
         super().__init__(grid_x, grid_y, "Usine", COLOR_DARK_GRAY, 'factory.png')
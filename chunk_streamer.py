@@ -0,0 +1,163 @@
+"""
+CHUNK_STREAMER.PY
+=================
+Ce fichier gère la génération des chunks du monde en arrière-plan.
+Les chunks sont générés dans des processus séparés (ProcessPoolExecutor) pour ne jamais
+bloquer la boucle de jeu. Chaque chunk ne dépend que de (seed, chunk_x, chunk_y) :
+le hasard vient du hachage des coordonnées (worldgen.py), pas du module random global.
+Les résultats reviennent sous forme d'octets bruts, installés sans copie avec np.frombuffer.
+"""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from constants import *
+import worldgen
+
+
+def generate_chunk_bytes(seed, chunk_x, chunk_y, chunk_size):
+    """
+    Génère un chunk dans un processus de travail
+    Args:
+        seed: Graine du monde
+        chunk_x, chunk_y: Coordonnées du chunk
+        chunk_size: Taille du chunk en cases
+    Returns:
+        Codes de terrain sous forme d'octets (chunk_size * chunk_size octets)
+    """
+    codes = worldgen.generate_region(seed, chunk_x * chunk_size, chunk_y * chunk_size, chunk_size, chunk_size)
+    return codes.tobytes()
+
+
+def codes_from_bytes(raw, chunk_size):
+    """
+    Installe un chunk reçu sous forme d'octets (vue en lecture seule, sans copie)
+    Args:
+        raw: Octets produits par generate_chunk_bytes
+        chunk_size: Taille du chunk en cases
+    Returns:
+        Tableau uint8 (chunk_size, chunk_size) en lecture seule
+    """
+    return np.frombuffer(raw, dtype=np.uint8).reshape((chunk_size, chunk_size))
+
+
+class ChunkStreamer:
+    """Génération asynchrone des chunks autour du joueur, avec préchargement dans la direction de marche"""
+
+    def __init__(self, seed, chunk_size, max_workers=WORLD_CHUNK_WORKERS):
+        """
+        Initialise le streamer (les processus sont créés à la première demande)
+        Args:
+            seed: Graine du monde
+            chunk_size: Taille d'un chunk en cases
+            max_workers: Nombre de processus de génération
+        """
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self._executor = None
+
+        # Générations en cours : {(chunk_x, chunk_y): Future}
+        self._pending = {}
+
+        # Dernier chunk du joueur (pour estimer la direction de marche)
+        self._last_focus_chunk = None
+        self._direction = (0, 0)
+
+    def _get_executor(self):
+        """Crée le pool de processus à la première utilisation"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def is_pending(self, chunk_x, chunk_y):
+        """Vérifie si un chunk est en cours de génération"""
+        return (chunk_x, chunk_y) in self._pending
+
+    def request(self, chunk_x, chunk_y):
+        """
+        Demande la génération d'un chunk (sans effet s'il est déjà demandé)
+        Args:
+            chunk_x, chunk_y: Coordonnées du chunk
+        """
+        chunk_key = (chunk_x, chunk_y)
+        if chunk_key not in self._pending:
+            self._pending[chunk_key] = self._get_executor().submit(
+                generate_chunk_bytes, self.seed, chunk_x, chunk_y, self.chunk_size)
+
+    def wait_for(self, chunk_x, chunk_y):
+        """
+        Attend la fin de la génération d'un chunk déjà demandé (cas rare : accès hors de la zone chargée)
+        Returns:
+            Octets du chunk
+        """
+        future = self._pending.pop((chunk_x, chunk_y))
+        return future.result()
+
+    def poll(self):
+        """
+        Récupère les chunks terminés sans jamais attendre
+        Returns:
+            Liste de ((chunk_x, chunk_y), octets)
+        """
+        completed = []
+        for chunk_key, future in list(self._pending.items()):
+            if future.done():
+                del self._pending[chunk_key]
+                completed.append((chunk_key, future.result()))
+        return completed
+
+    def wanted_chunks(self, focus_chunk_x, focus_chunk_y):
+        """
+        Liste les chunks à avoir en mémoire autour du joueur, du plus urgent au moins urgent
+        Args:
+            focus_chunk_x, focus_chunk_y: Chunk où se trouve le joueur
+        Returns:
+            Liste de coordonnées de chunks
+        """
+        # Direction de marche estimée d'après le dernier changement de chunk
+        if self._last_focus_chunk is not None and self._last_focus_chunk != (focus_chunk_x, focus_chunk_y):
+            self._direction = (focus_chunk_x - self._last_focus_chunk[0], focus_chunk_y - self._last_focus_chunk[1])
+        self._last_focus_chunk = (focus_chunk_x, focus_chunk_y)
+
+        # Chunks autour du joueur, les plus proches d'abord
+        radius = WORLD_CHUNK_LOAD_RADIUS
+        wanted = [(focus_chunk_x + offset_x, focus_chunk_y + offset_y)
+                  for offset_y in range(-radius, radius + 1)
+                  for offset_x in range(-radius, radius + 1)]
+        wanted.sort(key=lambda chunk_key: max(abs(chunk_key[0] - focus_chunk_x), abs(chunk_key[1] - focus_chunk_y)))
+
+        # Préchargement : bande de chunks devant le joueur dans sa direction de marche
+        direction_x, direction_y = self._direction
+        if direction_x or direction_y:
+            length = math.hypot(direction_x, direction_y)
+            step_x, step_y = direction_x / length, direction_y / length
+            for distance in range(radius + 1, radius + 1 + WORLD_CHUNK_PREFETCH_DISTANCE):
+                ahead_x = focus_chunk_x + round(step_x * distance)
+                ahead_y = focus_chunk_y + round(step_y * distance)
+                for side in range(-radius, radius + 1):
+                    # Décalage perpendiculaire à la direction de marche
+                    chunk_key = (ahead_x - round(step_y * side), ahead_y + round(step_x * side))
+                    if chunk_key not in wanted:
+                        wanted.append(chunk_key)
+        return wanted
+
+    def reset(self, seed):
+        """
+        Oublie les générations en cours (changement de monde, chargement de partie)
+        Args:
+            seed: Nouvelle graine du monde
+        """
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self.seed = seed
+        self._last_focus_chunk = None
+        self._direction = (0, 0)
+
+    def shutdown(self):
+        """Arrête les processus de génération sans attendre les chunks en cours"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
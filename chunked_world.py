@@ -0,0 +1,610 @@
+"""
+CHUNKED_WORLD.PY
+================
+Ce fichier gère le monde infini découpé en chunks (mode WORLD_MODE = 'chunked').
+Chaque chunk de WORLD_CHUNK_SIZE x WORLD_CHUNK_SIZE cases est généré à la demande,
+de façon déterministe à partir de (seed, chunk_x, chunk_y) via worldgen.generate_region.
+Les chunks sont gardés dans un cache LRU limité en mémoire ; un chunk modifié
+(ressource récoltée) qui est évincé est écrit dans un dossier sur le disque et relu au besoin ;
+un respawn échu sur un chunk évincé attend la prochaine installation du chunk.
+Ce dossier est propre au monde et au processus (deux clients lancés sur la même machine avec
+la même seed ne partagent pas leurs chunks) et supprimé à la fermeture du monde.
+La génération se fait en arrière-plan (voir chunk_streamer.py) : un chunk pas encore
+généré est infranchissable et n'est pas dessiné, la boucle de jeu n'attend jamais.
+"""
+
+import base64
+import os
+import random
+import zlib
+from collections import OrderedDict
+from itertools import count
+import numpy as np
+from constants import *
+from terrain_grid import WALKABLE_BY_CODE, SPEED_BY_CODE
+from terrain_renderer import ChunkedTerrainRenderer
+from chunk_streamer import ChunkStreamer, codes_from_bytes
+from resource_index import ResourceIndex
+from world import World
+import worldgen
+
+# Numéro des mondes créés par ce processus (dossier de stockage propre à chaque monde)
+_store_sessions = count(1)
+
+
+class ChunkStore:
+    """Stockage sur disque des chunks modifiés (un fichier binaire brut par chunk)"""
+
+    def __init__(self, directory, chunk_size):
+        """
+        Initialise le stockage
+        Args:
+            directory: Dossier des fichiers de chunks
+            chunk_size: Taille d'un chunk en cases
+        """
+        self.directory = directory
+        self.chunk_size = chunk_size
+
+    def _path(self, chunk_x, chunk_y):
+        """Retourne le chemin du fichier d'un chunk"""
+        return os.path.join(self.directory, f"chunk_{chunk_x}_{chunk_y}.bin")
+
+    def save(self, chunk_x, chunk_y, codes):
+        """Écrit les codes de terrain d'un chunk sur le disque"""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(chunk_x, chunk_y), 'wb') as chunk_file:
+            chunk_file.write(codes.tobytes())
+
+    def load(self, chunk_x, chunk_y):
+        """
+        Relit un chunk depuis le disque
+        Returns:
+            Tableau uint8 (chunk_size, chunk_size), ou None si le chunk n'a jamais été écrit
+        """
+        try:
+            with open(self._path(chunk_x, chunk_y), 'rb') as chunk_file:
+                raw = chunk_file.read()
+        except FileNotFoundError:
+            return None
+
+        if len(raw) != self.chunk_size * self.chunk_size:
+            print(f"⚠️ Chunk ({chunk_x}, {chunk_y}) corrompu, régénération")
+            return None
+        return np.frombuffer(raw, dtype=np.uint8).reshape((self.chunk_size, self.chunk_size)).copy()
+
+    def stored_chunks(self):
+        """Retourne la liste des coordonnées des chunks présents sur le disque"""
+        if not os.path.isdir(self.directory):
+            return []
+
+        chunk_keys = []
+        for filename in os.listdir(self.directory):
+            if filename.startswith('chunk_') and filename.endswith('.bin'):
+                _, chunk_x, chunk_y = filename[:-4].split('_')
+                chunk_keys.append((int(chunk_x), int(chunk_y)))
+        return chunk_keys
+
+    def clear(self):
+        """Supprime tous les chunks stockés (nouvelle partie)"""
+        for chunk_x, chunk_y in self.stored_chunks():
+            os.remove(self._path(chunk_x, chunk_y))
+
+    def remove(self):
+        """Supprime les chunks stockés et leur dossier (fermeture du monde)"""
+        self.clear()
+        if os.path.isdir(self.directory) and not os.listdir(self.directory):
+            os.rmdir(self.directory)
+
+
+class WorldChunk:
+    """Un chunk du monde : terrain d'origine (généré) et terrain actuel"""
+
+    __slots__ = ('original', 'codes', 'modified', 'dirty')
+
+    def __init__(self, original, codes=None):
+        """
+        Initialise un chunk
+        Args:
+            original: Codes générés (terrain d'origine, utilisé pour les respawns)
+            codes: Codes actuels s'ils diffèrent du terrain d'origine (chunk relu du disque)
+        """
+        self.original = original
+        # Tant que le chunk n'est pas modifié, le terrain actuel partage le tableau d'origine
+        self.codes = original if codes is None else codes
+        self.modified = codes is not None
+        # Modifié depuis la dernière écriture sur le disque
+        self.dirty = False
+
+    def set_code(self, local_x, local_y, code):
+        """Modifie une case du chunk (copie le terrain d'origine à la première modification)"""
+        if not self.modified:
+            self.codes = self.original.copy()
+            self.modified = True
+        self.codes[local_y, local_x] = code
+        self.dirty = True
+
+    @property
+    def memory_bytes(self):
+        """Mémoire occupée par le chunk (en octets)"""
+        if self.modified:
+            return self.original.nbytes + self.codes.nbytes
+        return self.original.nbytes
+
+
+class ChunkedWorld(World):
+    """Monde infini généré et chargé par chunks autour du joueur"""
+
+    mode = 'chunked'
+    is_infinite = True
+
+    def __init__(self, seed=None, store_directory=WORLD_CHUNK_STORE_DIR):
+        """
+        Initialise le monde (aucun chunk n'est généré avant d'être demandé)
+        Args:
+            seed: Graine du monde (tirée au hasard si absente)
+            store_directory: Dossier racine du stockage des chunks modifiés
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 31)
+        self.seed = seed
+        self.generator = 'noise'
+        self.chunk_size = WORLD_CHUNK_SIZE
+        self.store_directory = store_directory
+
+        # Cache LRU des chunks : {(chunk_x, chunk_y): WorldChunk}, du moins au plus récent
+        self._chunks = OrderedDict()
+        self.cache_bytes = 0
+        self.max_cache_bytes = WORLD_CHUNK_CACHE_MB * 1024 * 1024
+        # Dernier chunk consulté (raccourci pour les accès répétés au même chunk)
+        self._last_chunk_key = None
+        self._last_chunk = None
+
+        # Stockage sur disque propre à la seed, au processus et à ce monde (jamais partagé)
+        self._store_session = f"{os.getpid()}_{next(_store_sessions)}"
+        self.store = self._create_store(seed)
+
+        # Génération en arrière-plan (None : génération synchrone)
+        self.streamer = ChunkStreamer(seed, self.chunk_size) if WORLD_CHUNK_WORKERS > 0 else None
+
+        # Statistiques (utiles pour les benchmarks)
+        self.chunks_generated = 0
+        self.chunks_loaded = 0
+        self.chunks_evicted = 0
+        self.chunks_written = 0
+
+        self._init_respawns()
+
+        # Index spatial des ressources des chunks chargés
+        self.resource_index = ResourceIndex()
+
+        # Cases occupées par un mur
+        self.obstacles = set()
+        # Incrémenté quand la franchissabilité ou les murs changent (champ de flux à recalculer)
+        self.navigation_version = 0
+
+        # Rendu du terrain par chunks mis en cache (carte sans bords)
+        self.renderer = ChunkedTerrainRenderer(self)
+
+    # --- Gestion des chunks ---
+
+    def _get_chunk(self, chunk_x, chunk_y, blocking=True):
+        """
+        Retourne un chunk (depuis le cache, le disque, ou en le générant)
+        Args:
+            chunk_x, chunk_y: Coordonnées du chunk
+            blocking: Si False, un chunk absent est demandé en arrière-plan et None est retourné
+        Returns:
+            WorldChunk, ou None si le chunk est en cours de génération
+        """
+        chunk_key = (chunk_x, chunk_y)
+        if chunk_key == self._last_chunk_key:
+            return self._last_chunk
+
+        chunk = self._chunks.get(chunk_key)
+        if chunk is None:
+            if not blocking and self.streamer is not None:
+                self.streamer.request(chunk_x, chunk_y)
+                return None
+            chunk = self._install_chunk(chunk_x, chunk_y, self._generate_codes(chunk_x, chunk_y))
+        else:
+            self._chunks.move_to_end(chunk_key)
+
+        self._last_chunk_key = chunk_key
+        self._last_chunk = chunk
+        return chunk
+
+    def _generate_codes(self, chunk_x, chunk_y):
+        """Génère immédiatement le terrain d'origine d'un chunk (ou attend sa génération en cours)"""
+        if self.streamer is not None and self.streamer.is_pending(chunk_x, chunk_y):
+            return codes_from_bytes(self.streamer.wait_for(chunk_x, chunk_y), self.chunk_size)
+        size = self.chunk_size
+        return worldgen.generate_region(self.seed, chunk_x * size, chunk_y * size, size, size)
+
+    def _install_chunk(self, chunk_x, chunk_y, original):
+        """
+        Ajoute un chunk généré au cache en appliquant ses modifications stockées sur le disque
+        Args:
+            chunk_x, chunk_y: Coordonnées du chunk
+            original: Codes de terrain générés (jamais modifiés, peuvent être en lecture seule)
+        Returns:
+            WorldChunk installé
+        """
+        self.chunks_generated += 1
+
+        stored_codes = self.store.load(chunk_x, chunk_y)
+        if stored_codes is not None:
+            self.chunks_loaded += 1
+
+        chunk = WorldChunk(original, stored_codes)
+        # Respawns échus pendant que le chunk n'était pas chargé
+        for local_x, local_y in self._pending_respawns.pop((chunk_x, chunk_y), ()):
+            chunk.set_code(local_x, local_y, chunk.original[local_y, local_x])
+            self.renderer.invalidate_tile(chunk_x * self.chunk_size + local_x, chunk_y * self.chunk_size + local_y)
+        self._chunks[(chunk_x, chunk_y)] = chunk
+        self.resource_index.add_region(chunk.codes, chunk_x * self.chunk_size, chunk_y * self.chunk_size)
+        self.cache_bytes += chunk.memory_bytes
+        self.navigation_version += 1
+        self._evict_chunks()
+        return chunk
+
+    def _evict_chunks(self):
+        """Évince les chunks les moins récemment utilisés au-delà du plafond mémoire"""
+        while self.cache_bytes > self.max_cache_bytes and len(self._chunks) > 1:
+            (chunk_x, chunk_y), chunk = self._chunks.popitem(last=False)
+            self.cache_bytes -= chunk.memory_bytes
+            self.chunks_evicted += 1
+            self.resource_index.remove_region(chunk_x * self.chunk_size, chunk_y * self.chunk_size,
+                                              self.chunk_size, self.chunk_size)
+
+            # Seuls les chunks modifiés depuis leur dernière écriture vont sur le disque
+            if chunk.dirty:
+                self.store.save(chunk_x, chunk_y, chunk.codes)
+                self.chunks_written += 1
+
+            if (chunk_x, chunk_y) == self._last_chunk_key:
+                self._last_chunk_key = None
+                self._last_chunk = None
+
+    def set_focus(self, position_x, position_y):
+        """
+        Demande les chunks autour du joueur et devant lui (sans attendre leur génération)
+        Args:
+            position_x, position_y: Position du joueur en pixels
+        """
+        chunk_pixels = self.chunk_size * TILE_SIZE
+        focus_chunk_x = int(position_x // chunk_pixels)
+        focus_chunk_y = int(position_y // chunk_pixels)
+
+        if self.streamer is None:
+            wanted = [(focus_chunk_x + offset_x, focus_chunk_y + offset_y)
+                      for offset_y in range(-WORLD_CHUNK_LOAD_RADIUS, WORLD_CHUNK_LOAD_RADIUS + 1)
+                      for offset_x in range(-WORLD_CHUNK_LOAD_RADIUS, WORLD_CHUNK_LOAD_RADIUS + 1)]
+        else:
+            wanted = self.streamer.wanted_chunks(focus_chunk_x, focus_chunk_y)
+
+        for chunk_x, chunk_y in wanted:
+            # Les chunks voulus déjà chargés restent en tête du cache LRU
+            self._get_chunk(chunk_x, chunk_y, blocking=False)
+
+    def update(self, delta_time):
+        """
+        Installe les chunks générés en arrière-plan puis met à jour les respawns
+        Args:
+            delta_time: Temps écoulé depuis la dernière frame
+        """
+        if self.streamer is not None:
+            for (chunk_x, chunk_y), raw in self.streamer.poll():
+                if (chunk_x, chunk_y) not in self._chunks:
+                    self._install_chunk(chunk_x, chunk_y, codes_from_bytes(raw, self.chunk_size))
+
+        super().update(delta_time)
+
+    def _init_respawns(self):
+        """Initialise l'état des respawns de ressources"""
+        super()._init_respawns()
+        # Respawns échus sur des chunks pas chargés, appliqués à leur installation :
+        # {(chunk_x, chunk_y): [(case_x, case_y) locales, ...]}
+        self._pending_respawns = {}
+
+    def close(self):
+        """Arrête les processus de génération et supprime le stockage des chunks modifiés"""
+        if self.streamer is not None:
+            self.streamer.shutdown()
+        self.store.remove()
+
+    def _create_store(self, seed):
+        """
+        Crée le stockage des chunks modifiés d'une seed, vide
+        Args:
+            seed: Graine du monde
+        Returns:
+            ChunkStore dans store_directory/<seed>_<processus>_<monde>
+        """
+        store = ChunkStore(os.path.join(self.store_directory, f"{seed}_{self._store_session}"), self.chunk_size)
+        store.clear()
+        return store
+
+    @property
+    def loaded_chunk_count(self):
+        """Nombre de chunks actuellement en mémoire"""
+        return len(self._chunks)
+
+    # --- Accès au terrain (même interface que World) ---
+
+    def get_terrain_code(self, grid_x, grid_y, blocking=False):
+        """
+        Retourne le code entier du terrain d'une case
+        Args:
+            grid_x, grid_y: Coordonnées de la case
+            blocking: Si True, le chunk est généré immédiatement s'il manque
+        Returns:
+            Code du terrain, ou None si le chunk est en cours de génération
+        """
+        size = self.chunk_size
+        chunk = self._get_chunk(grid_x // size, grid_y // size, blocking)
+        if chunk is None:
+            return None
+        return chunk.codes[grid_y % size, grid_x % size]
+
+    def get_terrain(self, grid_x, grid_y):
+        """
+        Retourne le type de terrain d'une case
+        Args:
+            grid_x, grid_y: Coordonnées de la case
+        Returns:
+            Nom du terrain, ou None si la case n'est pas encore générée
+        """
+        code = self.get_terrain_code(grid_x, grid_y)
+        if code is None:
+            return None
+        return TERRAIN_TYPES[code]
+
+    def get_original_terrain(self, grid_x, grid_y):
+        """Retourne le terrain d'origine d'une case (avant récolte)"""
+        size = self.chunk_size
+        chunk = self._get_chunk(grid_x // size, grid_y // size)
+        return TERRAIN_TYPES[chunk.original[grid_y % size, grid_x % size]]
+
+    def restore_original_terrain(self, grid_x, grid_y):
+        """
+        Rend à une case son terrain d'origine (respawn d'une ressource) ; si son chunk n'est pas
+        chargé, le respawn attend son installation (ni génération ni attente dans la boucle de jeu)
+        Args:
+            grid_x, grid_y: Coordonnées de la case
+        """
+        size = self.chunk_size
+        chunk_key = (grid_x // size, grid_y // size)
+        if chunk_key not in self._chunks:
+            self._pending_respawns.setdefault(chunk_key, []).append((grid_x % size, grid_y % size))
+            return
+        super().restore_original_terrain(grid_x, grid_y)
+
+    def get_speed_multiplier(self, grid_x, grid_y):
+        """Retourne le multiplicateur de vitesse de déplacement sur une case"""
+        code = self.get_terrain_code(grid_x, grid_y)
+        if code is None:
+            return 1.0
+        return SPEED_BY_CODE[code]
+
+    def set_terrain(self, grid_x, grid_y, terrain_type):
+        """
+        Modifie le terrain d'une case et invalide son rendu
+        Args:
+            grid_x, grid_y: Coordonnées de la case
+            terrain_type: Nouveau type de terrain
+        """
+        size = self.chunk_size
+        chunk = self._get_chunk(grid_x // size, grid_y // size)
+        memory_before = chunk.memory_bytes
+        old_terrain = TERRAIN_TYPES[chunk.codes[grid_y % size, grid_x % size]]
+        chunk.set_code(grid_x % size, grid_y % size, TERRAIN_CODES[terrain_type])
+        self.resource_index.update_tile(grid_x, grid_y, old_terrain, terrain_type)
+        self.cache_bytes += chunk.memory_bytes - memory_before
+        self.renderer.invalidate_tile(grid_x, grid_y)
+        if WALKABLE_BY_CODE[TERRAIN_CODES[old_terrain]] != WALKABLE_BY_CODE[TERRAIN_CODES[terrain_type]]:
+            self.navigation_version += 1
+
+    def is_tile_walkable(self, grid_x, grid_y):
+        """
+        Vérifie si une case est franchissable (le monde n'a pas de bords)
+        Args:
+            grid_x, grid_y: Coordonnées de la case dans la grille
+        Returns:
+            True si la case est franchissable, False sinon (ou pas encore générée)
+        """
+        code = self.get_terrain_code(grid_x, grid_y)
+        if code is None:
+            return False
+        return WALKABLE_BY_CODE[code]
+
+    def is_tile_open(self, grid_x, grid_y):
+        """Vérifie si une case est libre pour les ennemis (franchissable et sans mur)"""
+        return (grid_x, grid_y) not in self.obstacles and self.is_tile_walkable(grid_x, grid_y)
+
+    def set_obstacle(self, grid_x, grid_y, is_obstacle):
+        """Enregistre la construction ou la destruction d'un mur"""
+        if is_obstacle:
+            self.obstacles.add((grid_x, grid_y))
+        else:
+            self.obstacles.discard((grid_x, grid_y))
+        self.navigation_version += 1
+
+    def get_obstacle_tiles(self):
+        """Retourne l'ensemble des cases (x, y) occupées par un mur"""
+        return self.obstacles
+
+    def are_connected(self, start_x, start_y, goal_x, goal_y, through_walls=False):
+        """
+        Les régions connexes d'un monde infini ne sont pas calculées :
+        on considère toute case franchissable comme atteignable
+        """
+        if through_walls:
+            return self.is_tile_walkable(start_x, start_y) and self.is_tile_walkable(goal_x, goal_y)
+        return self.is_tile_open(start_x, start_y) and self.is_tile_open(goal_x, goal_y)
+
+    def in_bounds(self, grid_x, grid_y):
+        """Toutes les cases existent dans un monde infini"""
+        return True
+
+    def contains_position(self, position_x, position_y, size):
+        """Un monde infini n'a pas de bords"""
+        return True
+
+    def get_spawn_position(self):
+        """
+        Retourne la position d'apparition du joueur : la case franchissable
+        la plus proche de l'origine (recherche en anneaux carrés)
+        Returns:
+            Tuple (x, y) en pixels
+        """
+        for radius in range(WORLD_CHUNK_SIZE):
+            for grid_y in range(-radius, radius + 1):
+                for grid_x in range(-radius, radius + 1):
+                    if max(abs(grid_x), abs(grid_y)) != radius:
+                        continue
+                    if WALKABLE_BY_CODE[self.get_terrain_code(grid_x, grid_y, blocking=True)]:
+                        return grid_x * TILE_SIZE, grid_y * TILE_SIZE
+        return 0, 0
+
+    def get_codes_region(self, start_x, start_y, end_x, end_y):
+        """
+        Retourne les codes de terrain d'une zone rectangulaire (assemblée depuis les chunks)
+        Args:
+            start_x, start_y: Coin haut-gauche (inclus, en cases)
+            end_x, end_y: Coin bas-droit (exclu, en cases)
+        Returns:
+            Tableau uint8 (hauteur, largeur), ou None si un des chunks est en cours de génération
+        """
+        size = self.chunk_size
+        first_chunk_x, first_chunk_y = start_x // size, start_y // size
+
+        # Cas courant : la zone tient dans un seul chunk (chunks de rendu alignés)
+        if (end_x - 1) // size == first_chunk_x and (end_y - 1) // size == first_chunk_y:
+            chunk = self._get_chunk(first_chunk_x, first_chunk_y, blocking=False)
+            if chunk is None:
+                return None
+            local_x, local_y = start_x - first_chunk_x * size, start_y - first_chunk_y * size
+            return chunk.codes[local_y:local_y + end_y - start_y, local_x:local_x + end_x - start_x]
+
+        region = np.empty((end_y - start_y, end_x - start_x), dtype=np.uint8)
+        for chunk_y in range(first_chunk_y, (end_y - 1) // size + 1):
+            for chunk_x in range(first_chunk_x, (end_x - 1) // size + 1):
+                chunk = self._get_chunk(chunk_x, chunk_y, blocking=False)
+                if chunk is None:
+                    return None
+                # Intersection de la zone et du chunk
+                x0, y0 = max(start_x, chunk_x * size), max(start_y, chunk_y * size)
+                x1, y1 = min(end_x, (chunk_x + 1) * size), min(end_y, (chunk_y + 1) * size)
+                region[y0 - start_y:y1 - start_y, x0 - start_x:x1 - start_x] = \
+                    chunk.codes[y0 - chunk_y * size:y1 - chunk_y * size, x0 - chunk_x * size:x1 - chunk_x * size]
+        return region
+
+    @property
+    def grid_terrain(self):
+        """Le monde infini n'a pas de grille complète"""
+        raise AttributeError("Le monde par chunks n'a pas de grille complète, utiliser get_terrain(x, y)")
+
+    # --- Sauvegarde ---
+
+    def to_save_data(self):
+        """
+        Sérialise le monde : seed et cases modifiées uniquement (le reste est régénéré)
+        Returns:
+            dict: Seed, calque des cases modifiées, ressources épuisées
+        """
+        chunks = {}
+        # Chunks modifiés écrits sur le disque puis évincés (terrain d'origine régénéré pour comparer)
+        for chunk_x, chunk_y in self.store.stored_chunks():
+            if (chunk_x, chunk_y) not in self._chunks:
+                codes = self.store.load(chunk_x, chunk_y)
+                if codes is not None:
+                    chunks[(chunk_x, chunk_y)] = (self._generate_codes(chunk_x, chunk_y), codes)
+        # Chunks modifiés encore en mémoire
+        for chunk_key, chunk in self._chunks.items():
+            if chunk.modified:
+                chunks[chunk_key] = (chunk.original, chunk.codes)
+
+        overlay = []
+        for (chunk_x, chunk_y), (original, codes) in chunks.items():
+            local_ys, local_xs = np.nonzero(codes != original)
+            overlay.extend([chunk_x * self.chunk_size + local_x, chunk_y * self.chunk_size + local_y,
+                            int(codes[local_y, local_x])]
+                           for local_x, local_y in zip(local_xs.tolist(), local_ys.tolist()))
+
+        return {
+            'mode': self.mode,
+            'seed': self.seed,
+            'chunk_size': self.chunk_size,
+            'overlay': overlay,
+            # Temps restant avant respawn (format historique [x, y, timer]) ; les respawns
+            # échus en attente de leur chunk sont à appliquer dès le chargement
+            'depleted_tiles': [[x, y, max(0.0, respawn_time - self.world_time)]
+                               for (x, y), respawn_time in self.depleted_tiles.items()]
+                              + [[chunk_x * self.chunk_size + local_x, chunk_y * self.chunk_size + local_y, 0.0]
+                                 for (chunk_x, chunk_y), tiles in self._pending_respawns.items()
+                                 for local_x, local_y in tiles]
+        }
+
+    def load_save_data(self, world_data):
+        """
+        Restaure le monde depuis une sauvegarde produite par to_save_data
+        Les chunks modifiés sont réécrits dans le stockage et relus à la demande.
+        Formats acceptés : calque de cases modifiées (actuel) ou chunks complets encodés (ancien).
+        Args:
+            world_data: Dictionnaire de sauvegarde du monde
+        """
+        if world_data.get('chunk_size', WORLD_CHUNK_SIZE) != self.chunk_size and 'chunks' in world_data:
+            print("⚠️ Taille de chunk différente dans la sauvegarde, chunks modifiés ignorés")
+            world_data = dict(world_data, chunks=[])
+
+        # Les chunks évincés de la partie en cours sont remplacés par ceux de la sauvegarde
+        self.seed = world_data['seed']
+        self.store.remove()
+        self.store = self._create_store(self.seed)
+
+        if self.streamer is not None:
+            self.streamer.reset(self.seed)
+        self._chunks.clear()
+        self.resource_index.clear()
+        self.obstacles.clear()
+        self.cache_bytes = 0
+        self._last_chunk_key = None
+        self._last_chunk = None
+
+        for chunk_x, chunk_y, encoded in world_data.get('chunks', []):
+            raw = zlib.decompress(base64.b64decode(encoded))
+            codes = np.frombuffer(raw, dtype=np.uint8).reshape((self.chunk_size, self.chunk_size))
+            self.store.save(chunk_x, chunk_y, codes)
+
+        # Calque : regrouper les cases par chunk, appliquer au terrain régénéré puis stocker
+        size = self.chunk_size
+        overlay_by_chunk = {}
+        for x, y, code in world_data.get('overlay', []):
+            overlay_by_chunk.setdefault((x // size, y // size), []).append((x % size, y % size, code))
+        for (chunk_x, chunk_y), entries in overlay_by_chunk.items():
+            codes = self._generate_codes(chunk_x, chunk_y).copy()
+            for local_x, local_y, code in entries:
+                codes[local_y, local_x] = code
+            self.store.save(chunk_x, chunk_y, codes)
+
+        # Restaurer les tiles épuisées
+        self._init_respawns()
+        for x, y, remaining_time in world_data.get('depleted_tiles', []):
+            self.schedule_respawn(x, y, remaining_time)
+
+        self.navigation_version += 1
+        self.renderer.invalidate_all()
+
+
+def create_world(mode=WORLD_MODE, seed=None):
+    """
+    Crée le monde correspondant au mode demandé
+    Args:
+        mode: 'fixed' (carte de GRID_SIZE cases) ou 'chunked' (monde infini)
+        seed: Graine du monde (optionnelle)
+    Returns:
+        Instance de World ou de ChunkedWorld
+    """
+    if mode == 'chunked':
+        return ChunkedWorld(seed)
+    return World(seed)
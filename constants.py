@@ -15,6 +15,11 @@ SCREEN_SCALE_PERCENT = 0.85  # Pourcentage de l'écran utilisé (85%)
 # === CONFIGURATION DE LA GRILLE ===
 GRID_SIZE = 200  # Taille de la grille (20x20 cases)
 TILE_SIZE = 32  # Taille d'une case en pixels (32x32)
+RENDER_CHUNK_SIZE = 16  # Taille d'un chunk de rendu du terrain (16x16 cases)
+RENDER_CHUNK_CACHE_SIZE = 48  # Nombre max de chunks pré-rendus gardés en mémoire
+RESOURCE_INDEX_BUCKET_SIZE = 16  # Côté (en cases) d'un seau de l'index spatial des ressources
+SPATIAL_HASH_CELL_SIZE = 128  # Côté (en pixels) d'une cellule de la grille des ennemis et des murs
+CELL_GRID_DENSE_LIMIT = 1 << 20  # Cellules au plus pour qu'une grille NumPy (CellGrid) garde une table de toutes ses cellules
 
 # === COULEURS (format RGB: Red, Green, Blue) ===
 COLOR_BLACK = (0, 0, 0)
@@ -49,6 +54,40 @@ TERRAIN_FOREST = 'forest'  # Forêt (contient du bois)
 TERRAIN_DESERT = 'desert'  # Désert (terrain stérile)
 TERRAIN_ENERGY_CRYSTAL = 'energy_crystal'  # Cristal d'énergie (trouvé dans le désert)
 
+# Table des codes de terrain : le monde stocke un entier (uint8) par case,
+# l'index du terrain dans cette liste. Ne pas réordonner (sauvegardes).
+TERRAIN_TYPES = [
+    TERRAIN_GRASS,  # 0
+    TERRAIN_METAL,  # 1
+    TERRAIN_FOOD,  # 2
+    TERRAIN_WOOD,  # 3
+    TERRAIN_STONE,  # 4
+    TERRAIN_WATER,  # 5
+    TERRAIN_MOUNTAIN,  # 6
+    TERRAIN_FOREST,  # 7
+    TERRAIN_DESERT,  # 8
+    TERRAIN_ENERGY_CRYSTAL,  # 9
+]
+TERRAIN_CODES = {terrain_type: code for code, terrain_type in enumerate(TERRAIN_TYPES)}
+
+# Couleur d'affichage de chaque terrain
+COLOR_ENERGY_CRYSTAL = (0, 255, 255)  # Cyan brillant pour les cristaux d'énergie
+TERRAIN_COLORS = {
+    TERRAIN_GRASS: COLOR_GREEN,
+    TERRAIN_METAL: COLOR_GRAY,
+    TERRAIN_FOOD: COLOR_DARK_GREEN,
+    TERRAIN_WOOD: COLOR_WOOD_BROWN,
+    TERRAIN_STONE: COLOR_STONE_GRAY,
+    TERRAIN_WATER: COLOR_WATER_BLUE,
+    TERRAIN_MOUNTAIN: COLOR_MOUNTAIN_GRAY,
+    TERRAIN_FOREST: COLOR_FOREST_GREEN,
+    TERRAIN_DESERT: COLOR_DESERT_YELLOW,
+    TERRAIN_ENERGY_CRYSTAL: COLOR_ENERGY_CRYSTAL,
+}
+
+# Terrains infranchissables (obstacles)
+TERRAIN_BLOCKING = [TERRAIN_WATER, TERRAIN_MOUNTAIN]
+
 # === TYPES DE RESSOURCES ===
 RESOURCE_METAL = 'metal'  # Métal pour construire
 RESOURCE_FOOD = 'food'  # Nourriture pour survivre
@@ -62,6 +101,15 @@ CRAFTING_RESOURCE_COMPONENTS = 'components'  # Composants
 CRAFTING_RESOURCE_MEDICINE = 'medicine'  # Médecine
 CRAFTING_RESOURCE_ADVANCED_MATERIALS = 'advanced_materials'  # Matériaux avancés
 
+# Récolte : terrain -> (ressource obtenue, terrain laissé après épuisement)
+TERRAIN_HARVEST_RESULTS = {
+    TERRAIN_METAL: (RESOURCE_METAL, TERRAIN_GRASS),
+    TERRAIN_FOOD: (RESOURCE_FOOD, TERRAIN_GRASS),
+    TERRAIN_WOOD: (RESOURCE_WOOD, TERRAIN_GRASS),
+    TERRAIN_STONE: (RESOURCE_STONE, TERRAIN_GRASS),
+    TERRAIN_ENERGY_CRYSTAL: (RESOURCE_ENERGY, TERRAIN_DESERT),  # Redevient désert
+}
+
 # === STATISTIQUES DU JOUEUR ===
 PLAYER_INITIAL_HEALTH = 100  # Points de vie de départ
 PLAYER_INITIAL_HUNGER = 100  # Niveau de faim de départ (100 = pas faim)
@@ -75,6 +123,10 @@ MEDICINE_HEAL_AMOUNT = 30  # Quantité de vie restaurée par médecine
 
 # Effets du terrain
 DESERT_SPEED_PENALTY = 0.5  # Multiplicateur de vitesse dans le désert
+TERRAIN_SPEED_MULTIPLIERS = {  # Multiplicateur de vitesse par terrain (1.0 si absent)
+    TERRAIN_DESERT: DESERT_SPEED_PENALTY,
+    TERRAIN_ENERGY_CRYSTAL: DESERT_SPEED_PENALTY,
+}
 RESOURCE_RESPAWN_TIME = 30.0  # Temps de respawn des ressources en secondes
 
 # Cycle jour/nuit
@@ -107,6 +159,10 @@ WALL_DURABILITY = 100  # Points de durabilité d'un mur
 WAREHOUSE_PRODUCTION = 1  # Ressources produites par tick par l'entrepôt
 FACTORY_PRODUCTION_INTERVAL = 10.0  # Intervalle de production de l'usine en secondes
 
+# Moteur de production (production.py)
+PRODUCTION_ENGINE_ENABLED = True  # Regrouper la production des producteurs par type et par phase (production.py)
+PRODUCTION_PHASE_SLOTS = 20  # Phases par intervalle de production (les producteurs d'une même phase produisent ensemble)
+
 # Niveaux de recherche (débloqués par le laboratoire)
 RESEARCH_LEVELS = {
     1: {'name': 'Outils Améliorés', 'effect': 'harvest_bonus', 'value': 2},
@@ -137,9 +193,75 @@ WOLF_SPEED = 1  # Vitesse de déplacement des loups (très rapide)
 WOLF_HEALTH = 20  # Points de vie d'un loup (moins que zombie)
 COLOR_WOLF_BROWN = (139, 90, 43)  # Marron pour les loups
 
+# Directeur des apparitions (spawn_director.py) : toutes les apparitions d'ennemis
+SPAWN_SCHEDULE = {  # Type d'ennemi : (intervalle en secondes, taille min, taille max du groupe)
+    'zombie': (ZOMBIE_SPAWN_INTERVAL, 1, 1),
+    'mutant': (MUTANT_SPAWN_INTERVAL, 1, 1),
+    'wolf': (WOLF_SPAWN_INTERVAL, 1, 3),  # Meutes de 1 à 3 loups
+}
+ENEMY_THREAT = {'zombie': 1, 'mutant': 3, 'wolf': 1}  # Menace d'un ennemi (coût sur le budget)
+SPAWN_DAY_THREAT_BUDGET = 20  # Menace pouvant apparaître pendant un jour (phase claire)
+SPAWN_NIGHT_THREAT_BUDGET = 40  # Menace pouvant apparaître pendant une nuit
+SPAWN_THREAT_BUDGET_GROWTH = 0.15  # Hausse des budgets par jour survécu (0.15 = +15 % par jour)
+SPAWN_MAX_LIVE_ENEMIES = 200  # Plafond d'ennemis vivants (les apparitions attendent qu'il y ait de la place)
+SPAWN_OFFSCREEN_MARGIN = 64  # Distance minimale (en pixels) entre un point d'apparition et le bord de l'écran
+SPAWN_BAND_WIDTH = 320  # Largeur (en pixels) de la bande hors écran où les points d'apparition sont tirés
+SPAWN_POINT_ATTEMPTS = 12  # Nombre d'essais pour trouver un point d'apparition libre et relié au joueur
+SPAWN_DECISION_LOG_SIZE = 64  # Nombre de décisions gardées pour la télémétrie
+
+# Stockage NumPy des ennemis (enemy_store.py)
+ENEMY_STORE_ENABLED = False  # Simuler les ennemis en tableaux NumPy (enemy_store.py) plutôt qu'objet par objet
+ENEMY_STORE_WALL_GRID_MAX_TILES = 4_000_000  # Taille max de la grille dense des murs du stockage NumPy (en cases)
+
+# Niveau de détail : ennemis lointains simulés moins souvent (lod.py)
+ENEMY_LOD_ENABLED = True  # Simuler les ennemis lointains à fréquence réduite (lod.py)
+ENEMY_LOD_PLAYER_DISTANCE = 1100  # Distance (en pixels) à un joueur sous laquelle un ennemi est simulé à chaque frame
+ENEMY_LOD_TURRET_MARGIN = 64  # Marge (en pixels) ajoutée à la portée des tourelles pour la simulation complète
+ENEMY_LOD_FAR_INTERVAL = 8  # Un ennemi lointain n'est simulé qu'une frame sur N (pas de temps N fois plus grand)
+
+# Décisions des ennemis étalées sur plusieurs frames (ai_scheduler.py)
+AI_THINK_ENABLED = True  # Étaler les décisions des ennemis (choix de la cible, mur visé) sur plusieurs frames (ai_scheduler.py)
+AI_THINK_BUDGET_MS = 2.0  # Temps (en millisecondes) accordé aux décisions des ennemis à chaque frame
+AI_THINK_PRIORITY_DISTANCE = 400  # Distance (en pixels) à un joueur sous laquelle un ennemi décide en priorité
+AI_THINK_PRIORITY_SHARE = 0.75  # Part du budget réservée aux ennemis proches (le reste garantit le tour des autres)
+
+# Réserve des ennemis morts (enemy_pool.py)
+ENEMY_POOL_ENABLED = True  # Réutiliser les ennemis morts aux apparitions suivantes (enemy_pool.py)
+ENEMY_POOL_PRELOAD = 32  # Ennemis de chaque type créés d'avance au lancement de la partie
+ENEMY_POOL_MAX_FREE = 1024  # Nombre maximal d'ennemis morts gardés en réserve par type
+
+# Écartement des ennemis voisins (crowd.py)
+CROWD_SEPARATION_ENABLED = True  # Écarter les ennemis voisins pour étaler les meutes (crowd.py)
+CROWD_SEPARATION_RADIUS = 20  # Distance (en pixels) sous laquelle deux ennemis se repoussent
+CROWD_SEPARATION_STRENGTH = 10.0  # Poussée (en pixels par frame) entre deux ennemis superposés
+CROWD_MAX_PUSH = 2.0  # Poussée totale maximale d'un ennemi (en pixels par frame, le double de la vitesse des ennemis)
+CROWD_MAX_NEIGHBORS_PER_CELL = 32  # Voisins lus au plus dans chaque cellule (coût linéaire même si toute une vague est entassée)
+
 # Tourelles
 TURRET_DAMAGE = 15  # Dégâts d'une tourelle
 TURRET_RANGE = 150  # Portée de tir d'une tourelle (en pixels)
+TURRET_TARGETING_MODES = ('closest', 'weakest', 'first')  # Choix de la cible : plus proche, plus faible, premier arrivé au joueur
+TURRET_TARGETING_NAMES = {'closest': 'le plus proche', 'weakest': 'le plus faible', 'first': 'le premier arrivé'}  # Noms affichés des choix de cible
+TURRET_DEFAULT_TARGETING = 'closest'  # Choix de la cible d'une nouvelle tourelle (touche T pour changer)
+TURRET_COVERAGE_BATCH_MIN = 24  # Tourelles prêtes à la même frame à partir desquelles les cibles sont lues dans la carte de couverture (turret_coverage.py)
+
+# Projectiles des tourelles (projectiles.py)
+PROJECTILES_ENABLED = True  # Les tourelles tirent des projectiles (projectiles.py) au lieu de toucher instantanément
+PROJECTILE_SPEED = 600  # Vitesse d'un projectile (en pixels par seconde)
+PROJECTILE_RADIUS = 3  # Rayon d'un projectile (en pixels) pour les collisions
+PROJECTILE_TTL = 0.4  # Durée de vie d'un projectile (en secondes) : un tir manqué disparaît un peu après la portée
+PROJECTILE_CAPACITY = 16384  # Projectiles alloués au lancement (tableaux agrandis au besoin)
+PROJECTILE_GRID_CELL_SIZE = 32  # Côté minimal (en pixels) des cellules de la grille des collisions
+
+# === NAVIGATION DES ENNEMIS ===
+# Champ de flux (flow_field.py)
+FLOW_FIELD_RADIUS = 64  # Demi-côté (en cases) de la zone où les ennemis suivent le champ de flux
+FLOW_FIELD_WALL_COST = 12  # Coût de traversée d'un mur pour le champ de flux (en cases de détour)
+
+# Pathfinding hiérarchique (hpa.py)
+HPA_CLUSTER_SIZE = 16  # Côté (en cases) des clusters du pathfinding hiérarchique (hpa.py)
+HPA_ENTRANCE_MAX_WIDTH = 6  # Largeur (en cases) à partir de laquelle une entrée de cluster a deux transitions
+HPA_PATH_CACHE_SIZE = 256  # Nombre d'itinéraires abstraits gardés en cache (par paire de clusters)
 
 # === OBJECTIFS DE VICTOIRE ===
 SURVIVAL_DAYS_TO_WIN = 10  # Nombre de jours à survivre
@@ -148,3 +270,35 @@ SECONDS_PER_DAY = 60  # Durée d'un jour en secondes (1 minute = 1 jour)
 # === GÉNÉRATION DE RESSOURCES ===
 WOOD_SOURCES_COUNT = 10  # Nombre de sources de bois sur la carte
 STONE_SOURCES_COUNT = 8  # Nombre de gisements de pierre sur la carte
+
+# === GÉNÉRATION DU MONDE (générateur par bruit, voir worldgen.py) ===
+WORLD_GENERATOR = 'noise'  # 'noise' (vectorisé NumPy) ou 'legacy' (ancien générateur case par case)
+WORLDGEN_OCTAVES = 3  # Nombre d'octaves de bruit (niveaux de détail)
+WORLDGEN_ELEVATION_SCALE = 48.0  # Taille des reliefs en cases (lacs)
+WORLDGEN_RIDGE_SCALE = 64.0  # Taille des crêtes en cases (chaînes de montagnes)
+WORLDGEN_MOISTURE_SCALE = 40.0  # Taille des zones d'humidité en cases (forêts, déserts)
+WORLDGEN_WATER_LEVEL = 0.30  # Altitude sous laquelle on trouve de l'eau
+WORLDGEN_MOUNTAIN_RIDGE = 0.97  # Intensité de crête au-dessus de laquelle on a une montagne
+WORLDGEN_MOUNTAIN_MIN_ELEVATION = 0.40  # Pas de montagne dans les zones basses
+WORLDGEN_FOREST_MOISTURE = 0.64  # Humidité au-dessus de laquelle on a une forêt
+WORLDGEN_DESERT_MOISTURE = 0.33  # Humidité sous laquelle on a un désert
+WORLDGEN_STONE_RADIUS = 1  # Distance max (en cases) entre la pierre et une montagne
+WORLDGEN_STONE_DENSITY = 0.15  # Probabilité de pierre sur l'herbe près des montagnes
+WORLDGEN_METAL_DENSITY = 0.004  # Probabilité de métal sur une case d'herbe
+WORLDGEN_FOOD_DENSITY = 0.003  # Probabilité de nourriture sur une case d'herbe
+WORLDGEN_WOOD_DENSITY = 0.3  # Proportion de bois dans les forêts
+WORLDGEN_CRYSTAL_DENSITY = 0.4  # Proportion de cristaux d'énergie dans les déserts
+WORLDGEN_SPAWN_CLEAR_RADIUS = 4  # Rayon (en cases) dégagé autour du point d'apparition
+WORLD_SEED = None  # Graine du monde utilisée au lancement en solo (None = nouveau monde aléatoire à chaque partie)
+MULTIPLAYER_WORLD_SEED = 20260223  # Graine du monde en multijoueur (la même pour tous les clients : même carte)
+WORLD_CACHE_ENABLED = True  # Garder les mondes générés sur le disque pour un démarrage instantané
+WORLD_CACHE_DIR = 'world_cache'  # Dossier du cache des mondes générés
+
+# === MONDE PAR CHUNKS (monde infini streamé, voir chunked_world.py) ===
+WORLD_MODE = 'fixed'  # 'fixed' (carte de GRID_SIZE cases) ou 'chunked' (monde infini généré à la demande)
+WORLD_CHUNK_SIZE = 64  # Taille d'un chunk de monde (64x64 cases, multiple de RENDER_CHUNK_SIZE)
+WORLD_CHUNK_CACHE_MB = 32  # Mémoire max des chunks gardés en RAM (les plus anciens sont évincés)
+WORLD_CHUNK_STORE_DIR = 'world_chunks'  # Dossier où sont écrits les chunks modifiés évincés
+WORLD_CHUNK_WORKERS = 2  # Processus de génération des chunks en arrière-plan (0 = génération synchrone)
+WORLD_CHUNK_LOAD_RADIUS = 1  # Rayon (en chunks) gardé chargé autour du joueur
+WORLD_CHUNK_PREFETCH_DISTANCE = 2  # Nombre de chunks préchargés devant le joueur dans sa direction de marche
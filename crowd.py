@@ -0,0 +1,180 @@
+"""
+CROWD.PY
+========
+Ce fichier contient la séparation des foules d'ennemis (évitement local).
+Tous les ennemis visent le même point : sans séparation, une meute s'empile sur un seul pixel.
+Après le déplacement, chaque ennemi est repoussé par ses voisins à moins de CROWD_SEPARATION_RADIUS
+pixels (poussée d'autant plus forte qu'ils sont proches), ce qui étale les meutes autour de la cible.
+Les voisins sont trouvés en passes NumPy sur une grille uniforme de cellules de la taille du rayon
+(CellGrid, spatial_hash.py) : les ennemis sont triés par cellule, puis chaque paire de voisins est
+lue une seule fois (sa propre cellule et 4 des 8 cellules voisines) et repousse ses deux ennemis.
+Au plus CROWD_MAX_NEIGHBORS_PER_CELL voisins sont lus par cellule : le coût reste linéaire en nombre
+d'ennemis, même quand toute une vague est entassée au même endroit, et une foule compacte (moins
+de voisins par cellule que ce plafond) est séparée exactement.
+Un ennemi qui serait poussé sur une case bloquée (eau, montagne, mur) reste sur place.
+"""
+
+import numpy as np
+from constants import *
+from spatial_hash import CellGrid
+
+# Angle d'or : directions bien réparties pour séparer deux ennemis exactement superposés
+GOLDEN_ANGLE = np.pi * (3 - np.sqrt(5))
+
+
+class CrowdSeparation:
+    """Poussées de séparation entre ennemis voisins, calculées sur une grille uniforme"""
+
+    def __init__(self, radius=CROWD_SEPARATION_RADIUS, strength=CROWD_SEPARATION_STRENGTH,
+                 max_push=CROWD_MAX_PUSH, max_neighbors=CROWD_MAX_NEIGHBORS_PER_CELL):
+        """
+        Initialise la séparation
+        Args:
+            radius: Distance (en pixels) sous laquelle deux ennemis se repoussent (côté des cellules)
+            strength: Poussée (en pixels par frame) entre deux ennemis superposés
+            max_push: Poussée totale maximale d'un ennemi (en pixels par frame)
+            max_neighbors: Nombre maximal de voisins lus dans chaque cellule
+        """
+        self.radius = radius
+        self.strength = strength
+        self.max_push = max_push
+        self.max_neighbors = max_neighbors
+
+        # Statistiques du dernier calcul (utiles pour les benchmarks)
+        self.pair_count = 0
+
+    def offsets(self, position_x, position_y):
+        """
+        Calcule la poussée de séparation de chaque ennemi
+        Args:
+            position_x, position_y: Tableaux des positions (en pixels)
+        Returns:
+            Tuple de tableaux (poussée x, poussée y), de norme au plus max_push
+        """
+        count = len(position_x)
+        push_x = np.zeros(count)
+        push_y = np.zeros(count)
+        self.pair_count = 0
+        if count < 2:
+            return push_x, push_y
+
+        # Ennemis triés par cellule : tranche de la cellule de chaque ennemi et rang dans cette tranche
+        grid = CellGrid(position_x, position_y, self.radius)
+        order = grid.order
+        own_start = np.empty(count, dtype=np.int64)
+        own_size = np.empty(count, dtype=np.int64)
+        own_start[order] = np.repeat(grid.cell_starts, grid.cell_sizes)
+        own_size[order] = np.repeat(grid.cell_sizes, grid.cell_sizes)
+        own_rank = np.empty(count, dtype=np.int64)
+        own_rank[order] = np.arange(count)
+        own_rank -= own_start
+
+        # Chaque paire n'est lue qu'une fois : dans la cellule de l'ennemi, les ennemis de rang
+        # supérieur ; puis les 4 cellules voisines « en avant » (droite et ligne du dessous).
+        # Au plus max_neighbors voisins par cellule ; dans une cellule voisine bondée, la lecture
+        # tourne à partir du rang de l'ennemi (chacun est repoussé par des voisins différents).
+        starts, sizes = grid.forward_neighbors(grid.keys)
+        later = own_size - own_rank - 1
+        begins = np.concatenate([(own_start + own_rank + 1)[:, None], starts], axis=1).ravel()
+        spans = np.concatenate([later[:, None], sizes], axis=1).ravel()
+        rotations = np.concatenate([np.zeros((count, 1), dtype=np.int64), own_rank[:, None] % np.maximum(sizes, 1)],
+                                   axis=1).ravel()
+        taken = np.minimum(spans, self.max_neighbors)
+        total = int(taken.sum())
+        if total == 0:
+            return push_x, push_y
+
+        # Paires (ennemi, voisin) à plat
+        slices = np.repeat(np.arange(len(taken)), taken)
+        ranks = np.arange(total) - np.repeat(np.cumsum(taken) - taken, taken)
+        ranks = (ranks + rotations[slices]) % np.maximum(spans[slices], 1)
+        pair_enemies = slices // (len(grid.forward) + 1)
+        pair_neighbors = order[begins[slices] + ranks]
+
+        delta_x = position_x[pair_enemies] - position_x[pair_neighbors]
+        delta_y = position_y[pair_enemies] - position_y[pair_neighbors]
+        distance = np.sqrt(delta_x * delta_x + delta_y * delta_y)
+        close = np.flatnonzero(distance < self.radius)
+        self.pair_count = len(close)
+        if self.pair_count == 0:
+            return push_x, push_y
+        pair_enemies, pair_neighbors = pair_enemies[close], pair_neighbors[close]
+        delta_x, delta_y, distance = delta_x[close], delta_y[close], distance[close]
+
+        # Ennemis superposés : direction tirée de la paire
+        stacked = np.flatnonzero(distance == 0)
+        if len(stacked):
+            low = np.minimum(pair_enemies[stacked], pair_neighbors[stacked])
+            high = np.maximum(pair_enemies[stacked], pair_neighbors[stacked])
+            angle = GOLDEN_ANGLE * (low * 7919 + high)
+            side = np.where(pair_enemies[stacked] < pair_neighbors[stacked], 1.0, -1.0)
+            delta_x[stacked] = np.cos(angle) * side
+            delta_y[stacked] = np.sin(angle) * side
+            distance[stacked] = 1.0
+
+        # Poussée linéaire : maximale au contact, nulle au rayon ; chaque paire repousse
+        # ses deux ennemis en sens opposés (deux ennemis superposés se voient toujours l'un l'autre)
+        weight = self.strength * (1 - distance / self.radius) / distance
+        force_x, force_y = delta_x * weight, delta_y * weight
+        push_x = np.bincount(pair_enemies, force_x, count) - np.bincount(pair_neighbors, force_x, count)
+        push_y = np.bincount(pair_enemies, force_y, count) - np.bincount(pair_neighbors, force_y, count)
+
+        norm = np.hypot(push_x, push_y)
+        scale = np.divide(self.max_push, norm, out=np.ones(count), where=norm > self.max_push)
+        return push_x * scale, push_y * scale
+
+    def _blocked(self, world, old_x, old_y, new_x, new_y):
+        """
+        Indices des ennemis que la poussée ferait entrer sur une case bloquée
+        (seuls les ennemis qui changent de case sont vérifiés)
+        """
+        old_tile_x = np.floor_divide(old_x, TILE_SIZE)
+        old_tile_y = np.floor_divide(old_y, TILE_SIZE)
+        new_tile_x = np.floor_divide(new_x, TILE_SIZE)
+        new_tile_y = np.floor_divide(new_y, TILE_SIZE)
+        changed = np.flatnonzero((old_tile_x != new_tile_x) | (old_tile_y != new_tile_y))
+        return [index for index in changed.tolist()
+                if not world.is_tile_open(int(new_tile_x[index]), int(new_tile_y[index]))]
+
+    def apply(self, enemies, world=None):
+        """
+        Écarte les ennemis vivants d'une liste les uns des autres
+        Args:
+            enemies: Liste des ennemis
+            world: Instance du monde (optionnelle) : pas de poussée vers une case bloquée
+        """
+        alive = [enemy for enemy in enemies if enemy.is_alive]
+        if len(alive) < 2:
+            return
+        position_x = np.fromiter((enemy.position_x for enemy in alive), dtype=np.float64, count=len(alive))
+        position_y = np.fromiter((enemy.position_y for enemy in alive), dtype=np.float64, count=len(alive))
+        push_x, push_y = self.offsets(position_x, position_y)
+        new_x, new_y = position_x + push_x, position_y + push_y
+        if world is not None:
+            for index in self._blocked(world, position_x, position_y, new_x, new_y):
+                new_x[index], new_y[index] = position_x[index], position_y[index]
+
+        for index in np.flatnonzero((push_x != 0) | (push_y != 0)).tolist():
+            enemy = alive[index]
+            enemy.position_x = float(new_x[index])
+            enemy.position_y = float(new_y[index])
+
+    def apply_store(self, store, world=None):
+        """
+        Écarte les ennemis vivants du stockage NumPy (mise à jour directe des tableaux)
+        Args:
+            store: Stockage des ennemis (EnemyStore)
+            world: Instance du monde (optionnelle) : pas de poussée vers une case bloquée
+        """
+        slots = np.flatnonzero(store.is_alive[:store.count])
+        if len(slots) < 2:
+            return
+        position_x = store.position_x[slots]
+        position_y = store.position_y[slots]
+        push_x, push_y = self.offsets(position_x, position_y)
+        new_x, new_y = position_x + push_x, position_y + push_y
+        if world is not None:
+            blocked = self._blocked(world, position_x, position_y, new_x, new_y)
+            new_x[blocked], new_y[blocked] = position_x[blocked], position_y[blocked]
+        store.position_x[slots] = new_x
+        store.position_y[slots] = new_y
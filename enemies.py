@@ -7,10 +7,16 @@ Les ennemis apparaissent aléatoirement et attaquent le joueur.
 
 import pygame
 import math
-import random
+from itertools import count
 from constants import *
 from sprite_loader import SpriteLoader
 
+# Décalages des frames de mise à jour des ennemis lointains, distribués à tour de rôle
+_lod_phases = count()
+
+# Sprites déjà chargés par (fichier, taille) : un nouvel ennemi ne repasse pas par SpriteLoader
+_enemy_sprites = {}
+
 
 class BaseEnemy:
     """Classe de base pour tous les ennemis"""
@@ -29,38 +35,68 @@ class BaseEnemy:
             fallback_color: Couleur de fallback si sprite manquant
             max_health_constant: HP max pour la barre de vie
         """
-        self.position_x = spawn_x
-        self.position_y = spawn_y
         self.enemy_size = size
-        self.health_points = health
+        self.spawn_health = health
         self.max_health = max_health_constant
         self.speed = speed
         self.damage = damage
+        self.enemy_type = 'base'  # Surchargé par les sous-classes
+
+        # Simulation à fréquence réduite quand l'ennemi est loin (voir lod.py) : décalage de
+        # sa frame de mise à jour
+        self.lod_phase = next(_lod_phases) % ENEMY_LOD_FAR_INTERVAL
+
+        # Charger le sprite avec fallback (une seule fois par type d'ennemi)
+        sprite_key = (sprite_file, size)
+        self.sprite = _enemy_sprites.get(sprite_key)
+        if self.sprite is None:
+            self.sprite = SpriteLoader.load_sprite(
+                sprite_file,
+                size=(self.enemy_size, self.enemy_size),
+                fallback_color=fallback_color
+            )
+            _enemy_sprites[sprite_key] = self.sprite
+
+        self.reset(spawn_x, spawn_y)
+
+    def reset(self, spawn_x, spawn_y):
+        """
+        Remet l'ennemi dans son état d'apparition (réutilisation d'un ennemi mort, voir enemy_pool.py)
+        Args:
+            spawn_x, spawn_y: Position d'apparition (en pixels)
+        """
+        self.position_x = spawn_x
+        self.position_y = spawn_y
+        self.health_points = self.spawn_health
         self.is_alive = True
         self.attack_cooldown = 0
-        self.enemy_type = 'base'  # Surchargé par les sous-classes
+        # Identifiant réseau de la vie précédente (multijoueur)
+        if hasattr(self, 'network_id'):
+            del self.network_id
 
-        # Charger le sprite avec fallback
-        self.sprite = SpriteLoader.load_sprite(
-            sprite_file,
-            size=(self.enemy_size, self.enemy_size),
-            fallback_color=fallback_color
-        )
+        # Dernière frame simulée à fréquence réduite (-1 : pas encore) et temps écoulé à sa fin (voir lod.py)
+        self.lod_last_frame = -1
+        self.lod_last_time = 0.0
 
-    def update(self, delta_time, player, buildings_list=None):
+        # Décision mise en cache par think() : mur visé (None : le joueur) et frame de la décision
+        # (-1 : jamais, voir ai_scheduler.py)
+        self.wall_target = None
+        self.think_frame = -1
+
+    def think(self, player, buildings_list=None, obstacles=None):
         """
-        Met à jour l'ennemi (déplacement vers le joueur, attaque)
+        Décision coûteuse : choisit la cible (mur à portée en priorité, sinon le joueur)
         Args:
-            delta_time: Temps écoulé depuis la dernière frame
             player: Instance du joueur
             buildings_list: Liste des bâtiments (pour attaquer les murs)
+            obstacles: Calque des murs (ObstacleLayer, optionnel, remplace le parcours de buildings_list)
         """
-        if not self.is_alive or not player.is_alive:
-            return
-
         # Chercher un mur à proximité à attaquer en priorité
         wall_to_attack = None
-        if buildings_list:
+        if obstacles is not None:
+            # Le mur le plus proche à portée (centre du mur à moins de 50 pixels)
+            wall_to_attack = obstacles.nearest(self.position_x, self.position_y, 50)
+        elif buildings_list:
             closest_wall_distance = float('inf')
             for building in buildings_list:
                 if hasattr(building, 'is_obstacle') and building.is_obstacle:
@@ -75,6 +111,33 @@ class BaseEnemy:
                     if distance_to_wall < 50 and distance_to_wall < closest_wall_distance:
                         closest_wall_distance = distance_to_wall
                         wall_to_attack = building
+        self.wall_target = wall_to_attack
+
+    def update(self, delta_time, player, buildings_list=None, obstacles=None, flow_field=None, steps=1, think=True):
+        """
+        Met à jour l'ennemi (déplacement vers le joueur, attaque)
+        Args:
+            delta_time: Temps écoulé depuis la dernière frame
+            player: Instance du joueur
+            buildings_list: Liste des bâtiments (pour attaquer les murs)
+            obstacles: Calque des murs (ObstacleLayer, optionnel, remplace le parcours de buildings_list)
+            flow_field: Champ de flux vers le joueur (optionnel, contourne l'eau et les montagnes)
+            steps: Nombre de frames simulées d'un coup (ennemis lointains, voir lod.py) :
+                   delta_time couvre alors toutes ces frames
+            think: Si False, garde la cible choisie lors du dernier think() (décisions étalées
+                   sur plusieurs frames par ai_scheduler.py)
+        """
+        if not self.is_alive or not player.is_alive:
+            return
+        step_length = self.speed * steps
+
+        if think:
+            self.think(player, buildings_list, obstacles)
+        elif self.wall_target is not None and (self.wall_target.durability <= 0 or (
+                obstacles is not None and obstacles.get(self.wall_target.grid_x, self.wall_target.grid_y) is not self.wall_target)):
+            # Un mur détruit depuis la dernière décision n'est plus une cible
+            self.wall_target = None
+        wall_to_attack = self.wall_target
 
         # Si un mur est à portée, l'attaquer au lieu du joueur
         if wall_to_attack:
@@ -88,14 +151,18 @@ class BaseEnemy:
             if distance > 0:
                 direction_x /= distance
                 direction_y /= distance
-                self.position_x += direction_x * self.speed
-                self.position_y += direction_y * self.speed
+                self.position_x += direction_x * step_length
+                self.position_y += direction_y * step_length
 
             # Attaquer le mur
             if distance < 30:
                 self.attack_cooldown -= delta_time
                 if self.attack_cooldown <= 0:
-                    wall_to_attack.take_damage(self.damage)
+                    # Avec le calque, un mur détruit le quitte aussitôt
+                    if obstacles is not None:
+                        obstacles.damage(wall_to_attack, self.damage)
+                    else:
+                        wall_to_attack.take_damage(self.damage)
                     self.attack_cooldown = 1.5
         else:
             # Sinon, se déplacer vers le joueur
@@ -106,14 +173,21 @@ class BaseEnemy:
             # Calculer la distance au joueur
             distance = math.sqrt(direction_x ** 2 + direction_y ** 2)
 
+            # Suivre le champ de flux s'il couvre la case de l'ennemi, sinon aller tout droit
+            flow_direction = flow_field.direction_at(self.position_x, self.position_y) if flow_field is not None else None
+            if flow_direction is not None:
+                direction_x, direction_y = flow_direction
+                self.position_x += direction_x * step_length
+                self.position_y += direction_y * step_length
+
             # Normaliser la direction (pour avoir une vitesse constante)
-            if distance > 0:
+            elif distance > 0:
                 direction_x /= distance
                 direction_y /= distance
 
                 # Se déplacer vers le joueur
-                self.position_x += direction_x * self.speed
-                self.position_y += direction_y * self.speed
+                self.position_x += direction_x * step_length
+                self.position_y += direction_y * step_length
 
             # Vérifier si l'ennemi est assez proche pour attaquer
             if distance < 30:  # Distance d'attaque
@@ -201,44 +275,6 @@ class Zombie(BaseEnemy):
         self.enemy_type = 'zombie'
 
 
-def spawn_enemy_randomly(enemy_class, map_size):
-    """
-    Fait apparaître un ennemi à une position aléatoire sur les bords de la carte
-    Args:
-        enemy_class: Classe de l'ennemi (Zombie, Mutant, Wolf, etc.)
-        map_size: Taille de la carte en pixels
-    Returns:
-        Instance de l'ennemi
-    """
-    # Choisir un bord aléatoire (0=haut, 1=droite, 2=bas, 3=gauche)
-    edge = random.randint(0, 3)
-
-    if edge == 0:  # Haut
-        spawn_x = random.randint(0, map_size)
-        spawn_y = 0
-    elif edge == 1:  # Droite
-        spawn_x = map_size
-        spawn_y = random.randint(0, map_size)
-    elif edge == 2:  # Bas
-        spawn_x = random.randint(0, map_size)
-        spawn_y = map_size
-    else:  # Gauche
-        spawn_x = 0
-        spawn_y = random.randint(0, map_size)
-
-    return enemy_class(spawn_x, spawn_y)
-
-
-def spawn_zombie_randomly(map_size):
-    """
-    Fait apparaître un zombie à une position aléatoire sur les bords de la carte
-    Args:
-        map_size: Taille de la carte en pixels
-    Returns:
-        Instance de Zombie
-    """
-    return spawn_enemy_randomly(Zombie, map_size)
-
 class Mutant(BaseEnemy):
     """Classe représentant un mutant (tank : lent mais résistant)"""
 
@@ -283,23 +319,4 @@ class Wolf(BaseEnemy):
         self.enemy_type = 'wolf'
 
 
-def spawn_mutant_randomly(map_size):
-    """
-    Fait apparaître un mutant sur les bords de la carte
-    Args:
-        map_size: Taille de la carte en pixels
-    Returns:
-        Instance de Mutant
-    """
-    return spawn_enemy_randomly(Mutant, map_size)
-
-
-def spawn_wolf_randomly(map_size):
-    """
-    Fait apparaître un loup sur les bords de la carte
-    Args:
-        map_size: Taille de la carte en pixels
-    Returns:
-        Instance de Wolf
-    """
-    return spawn_enemy_randomly(Wolf, map_size)
+ENEMY_CLASSES = {'zombie': Zombie, 'mutant': Mutant, 'wolf': Wolf}
@@ -0,0 +1,77 @@
+"""
+ENEMY_POOL.PY
+=============
+Ce fichier contient la réserve des ennemis : les ennemis morts retirés par Game.update
+sont gardés par classe, puis réinitialisés (BaseEnemy.reset) et réutilisés aux apparitions suivantes.
+Une grosse vague de nuit ne crée donc presque plus d'objets (ni de sprites, ni de travail pour
+le ramasse-miettes) une fois la réserve remplie par les premières vagues.
+Les compteurs allocations / reuses permettent de le mesurer.
+"""
+
+from constants import *
+
+
+class EnemyPool:
+    """Ennemis morts disponibles, rangés par classe : {classe: [ennemi, ...]}"""
+
+    def __init__(self, max_free=ENEMY_POOL_MAX_FREE):
+        """
+        Initialise une réserve vide
+        Args:
+            max_free: Nombre maximal d'ennemis gardés par classe (au-delà, les morts sont abandonnés)
+        """
+        self.max_free = max_free
+        self._free = {}
+
+        # Compteurs (utiles pour les benchmarks) : ennemis créés, réutilisés et rendus à la réserve
+        self.allocations = 0
+        self.reuses = 0
+        self.releases = 0
+
+    def __len__(self):
+        return sum(len(free) for free in self._free.values())
+
+    def acquire(self, enemy_class, spawn_x, spawn_y):
+        """
+        Fournit un ennemi prêt à apparaître (réutilisé si possible, sinon créé)
+        Args:
+            enemy_class: Classe de l'ennemi (Zombie, Mutant, Wolf ou leur vue sur le stockage NumPy)
+            spawn_x, spawn_y: Position d'apparition (en pixels)
+        Returns:
+            Instance de enemy_class
+        """
+        free = self._free.get(enemy_class)
+        if free:
+            enemy = free.pop()
+            enemy.reset(spawn_x, spawn_y)
+            self.reuses += 1
+            return enemy
+        self.allocations += 1
+        return enemy_class(spawn_x, spawn_y)
+
+    def release(self, enemies):
+        """
+        Rend des ennemis retirés du jeu à la réserve (plus aucune liste ne doit les contenir)
+        Args:
+            enemies: Ennemis retirés
+        """
+        free_lists = self._free
+        for enemy in enemies:
+            free = free_lists.get(type(enemy))
+            if free is None:
+                free = free_lists[type(enemy)] = []
+            if len(free) < self.max_free:
+                free.append(enemy)
+                self.releases += 1
+
+    def preload(self, enemy_class, count):
+        """
+        Crée des ennemis d'avance pour que les premières vagues n'en créent pas
+        Args:
+            enemy_class: Classe de l'ennemi (pas une vue sur le stockage NumPy, qui y prendrait une case)
+            count: Nombre d'ennemis à avoir en réserve
+        """
+        free = self._free.setdefault(enemy_class, [])
+        while len(free) < min(count, self.max_free):
+            free.append(enemy_class(0, 0))
+            self.allocations += 1
@@ -0,0 +1,358 @@
+"""
+ENEMY_STORE.PY
+==============
+Ce fichier contient le stockage des ennemis en tableaux NumPy parallèles (structure de tableaux),
+activé par ENEMY_STORE_ENABLED.
+Positions, vie, vitesse, dégâts et temps de recharge de tous les ennemis sont rangés dans des
+tableaux ; le déplacement vers le joueur, les attaques et le tri des morts sont calculés en
+quelques passes vectorisées au lieu d'un appel à BaseEnemy.update par ennemi.
+Les ennemis restent des objets Zombie, Mutant ou Wolf : ce sont des vues légères dont les
+attributs (position_x, health_points, ...) lisent et écrivent la case du tableau correspondante.
+Le rendu, la sauvegarde et les tourelles les utilisent donc sans changement.
+"""
+
+import numpy as np
+from constants import *
+
+# Mêmes valeurs que BaseEnemy.update
+ENEMY_ATTACK_RANGE = 30  # Distance d'attaque (en pixels)
+ENEMY_ATTACK_COOLDOWN = 1.5  # Secondes entre deux attaques
+ENEMY_WALL_SEARCH_RANGE = 50  # Distance à laquelle un mur est attaqué en priorité (en pixels)
+
+# Cases voisines où un centre de mur peut être à portée d'un ennemi (écart minimal sur un axe :
+# |d| cases moins une demi-case, un ennemi pouvant être n'importe où dans sa case)
+WALL_REACH = (ENEMY_WALL_SEARCH_RANGE + TILE_SIZE // 2) // TILE_SIZE + 1
+
+
+def _axis_gap(offset):
+    return max(0, abs(offset) * TILE_SIZE - TILE_SIZE // 2)
+
+
+WALL_REACH_OFFSETS = [(dx, dy) for dy in range(-WALL_REACH, WALL_REACH + 1) for dx in range(-WALL_REACH, WALL_REACH + 1)
+                      if _axis_gap(dx) ** 2 + _axis_gap(dy) ** 2 <= ENEMY_WALL_SEARCH_RANGE ** 2]
+
+# Attributs des ennemis rangés dans les tableaux : (nom, type NumPy, conversion à la lecture)
+STORED_FIELDS = (
+    ('position_x', np.float64, float),
+    ('position_y', np.float64, float),
+    ('health_points', np.float64, float),
+    ('max_health', np.float64, float),
+    ('speed', np.float64, float),
+    ('damage', np.float64, float),
+    ('attack_cooldown', np.float64, float),
+    ('enemy_size', np.int32, int),
+    ('is_alive', np.bool_, bool),
+)
+
+
+def _stored_attribute(name, convert):
+    """Crée une propriété qui lit et écrit la case de l'ennemi dans le tableau `name` du stockage"""
+
+    def getter(enemy):
+        return convert(getattr(enemy._store, name)[enemy._slot])
+
+    def setter(enemy, value):
+        getattr(enemy._store, name)[enemy._slot] = value
+
+    return property(getter, setter)
+
+
+class StoredEnemy:
+    """Vue sur un ennemi du stockage (classe de base mélangée à Zombie, Mutant, Wolf)"""
+
+    # Stockage de la classe de vue (défini par EnemyStore.view_class)
+    store = None
+
+    def __init__(self, spawn_x, spawn_y):
+        self._store = self.store
+        self._slot = self._store._allocate(self)
+        super().__init__(spawn_x, spawn_y)
+
+    def reset(self, spawn_x, spawn_y):
+        """Remet l'ennemi dans son état d'apparition ; une vue retirée reprend une case du stockage"""
+        if self._store is not self.store:
+            self.store._attach(self)
+        super().reset(spawn_x, spawn_y)
+
+
+for _name, _dtype, _convert in STORED_FIELDS:
+    setattr(StoredEnemy, _name, _stored_attribute(_name, _convert))
+
+
+class EnemyStore:
+    """Tableaux parallèles des ennemis : la case i de chaque tableau décrit l'ennemi enemies[i]"""
+
+    def __init__(self, capacity=256):
+        """
+        Initialise un stockage vide
+        Args:
+            capacity: Nombre d'ennemis alloués au départ (agrandi au besoin)
+        """
+        self.capacity = capacity
+        self.count = 0
+        for name, dtype, _ in STORED_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        # Vue propriétaire de chaque case (même ordre que les tableaux)
+        self.enemies = []
+        self._view_classes = {}
+
+        # Murs du calque des obstacles rangés en tableaux (voir _update_wall_arrays)
+        self._walls_version = None
+        self._walls = []
+
+    def __len__(self):
+        return self.count
+
+    def view_class(self, enemy_class):
+        """
+        Retourne la classe de vue d'un type d'ennemi : ses instances sont rangées dans ce stockage
+        Args:
+            enemy_class: Zombie, Mutant ou Wolf
+        Returns:
+            Sous-classe de enemy_class (isinstance(vue, enemy_class) reste vrai)
+        """
+        view_class = self._view_classes.get(enemy_class)
+        if view_class is None:
+            view_class = type('Stored' + enemy_class.__name__, (StoredEnemy, enemy_class), {'store': self})
+            self._view_classes[enemy_class] = view_class
+        return view_class
+
+    # --- Cases ---
+
+    def _allocate(self, enemy):
+        """Réserve une case pour un nouvel ennemi (les tableaux doublent quand ils sont pleins)"""
+        if self.count == self.capacity:
+            self.capacity *= 2
+            for name, _, _ in STORED_FIELDS:
+                array = getattr(self, name)
+                grown = np.zeros(self.capacity, dtype=array.dtype)
+                grown[:self.count] = array
+                setattr(self, name, grown)
+
+        slot = self.count
+        self.count += 1
+        self.is_alive[slot] = True
+        self.attack_cooldown[slot] = 0
+        self.enemies.append(enemy)
+        return slot
+
+    def remove(self, enemy):
+        """
+        Retire un ennemi du stockage (la dernière case prend sa place)
+        La vue retirée garde ses valeurs dans un petit stockage à elle.
+        """
+        slot = enemy._slot
+        if enemy._store is not self or slot >= self.count or self.enemies[slot] is not enemy:
+            return
+        self._detach(enemy)
+
+        last = self.count - 1
+        if slot != last:
+            moved = self.enemies[last]
+            for name, _, _ in STORED_FIELDS:
+                array = getattr(self, name)
+                array[slot] = array[last]
+            self.enemies[slot] = moved
+            moved._slot = slot
+        self.enemies.pop()
+        self.count = last
+
+    def _detach(self, enemy):
+        """Copie les valeurs d'une vue dans un stockage d'une seule case"""
+        detached = EnemyStore(capacity=1)
+        for name, _, _ in STORED_FIELDS:
+            getattr(detached, name)[0] = getattr(self, name)[enemy._slot]
+        detached.count = 1
+        detached.enemies.append(enemy)
+        enemy._store = detached
+        enemy._slot = 0
+
+    def _attach(self, enemy):
+        """Range à nouveau une vue retirée dans ce stockage, avec les valeurs de son stockage d'une case"""
+        detached, detached_slot = enemy._store, enemy._slot
+        slot = self._allocate(enemy)
+        for name, _, _ in STORED_FIELDS:
+            getattr(self, name)[slot] = getattr(detached, name)[detached_slot]
+        enemy._store = self
+        enemy._slot = slot
+
+    def remove_dead(self):
+        """
+        Retire les ennemis morts
+        Returns:
+            Liste des vues retirées
+        """
+        dead_slots = np.flatnonzero(~self.is_alive[:self.count])
+        dead = [self.enemies[slot] for slot in dead_slots.tolist()]
+        for enemy in dead:
+            self.remove(enemy)
+        return dead
+
+    def clear(self):
+        """Retire tous les ennemis (chargement d'une partie)"""
+        for enemy in list(self.enemies):
+            self.remove(enemy)
+
+    # --- Simulation ---
+
+    def update(self, delta_time, player, obstacles=None, flow_field=None):
+        """
+        Met à jour tous les ennemis vivants : même comportement que BaseEnemy.update
+        (attaquer le mur le plus proche s'il y en a un à portée, sinon poursuivre le joueur)
+        Args:
+            delta_time: Temps écoulé depuis la dernière frame
+            player: Instance du joueur
+            obstacles: Calque des murs (ObstacleLayer, optionnel)
+            flow_field: Champ de flux vers le joueur (optionnel)
+        """
+        count = self.count
+        if count == 0 or not player.is_alive:
+            return
+
+        position_x = self.position_x[:count]
+        position_y = self.position_y[:count]
+        alive = self.is_alive[:count]
+
+        # Cible : le mur le plus proche à portée, sinon le joueur
+        target_x = np.full(count, float(player.position_x))
+        target_y = np.full(count, float(player.position_y))
+        wall_slots, wall_indices = self._find_wall_targets(obstacles, position_x, position_y, alive)
+        if len(wall_slots):
+            target_x[wall_slots] = self._wall_center_x[wall_indices]
+            target_y[wall_slots] = self._wall_center_y[wall_indices]
+
+        # Direction normalisée vers la cible, distance mesurée avant le déplacement
+        direction_x = target_x - position_x
+        direction_y = target_y - position_y
+        distance = np.hypot(direction_x, direction_y)
+        moving = alive & (distance > 0)
+        step = np.divide(self.speed[:count], distance, out=np.zeros(count), where=moving)
+
+        # Poursuite du joueur : suivre le champ de flux là où il couvre la case de l'ennemi
+        if flow_field is not None:
+            flow_x, flow_y, following = flow_field.directions_at(position_x, position_y)
+            following &= alive
+            following[wall_slots] = False
+            direction_x = np.where(following, flow_x, direction_x)
+            direction_y = np.where(following, flow_y, direction_y)
+            step = np.where(following, self.speed[:count], step)
+        position_x += direction_x * step
+        position_y += direction_y * step
+
+        # Attaques : le temps de recharge ne s'écoule qu'à portée de la cible
+        attacking = alive & (distance < ENEMY_ATTACK_RANGE)
+        cooldown = self.attack_cooldown[:count]
+        cooldown[attacking] -= delta_time
+        striking = attacking & (cooldown <= 0)
+        if not striking.any():
+            return
+        cooldown[striking] = ENEMY_ATTACK_COOLDOWN
+
+        wall_targets = dict(zip(wall_slots.tolist(), wall_indices.tolist()))
+        damage = self.damage[:count]
+        for slot in np.flatnonzero(striking).tolist():
+            wall_index = wall_targets.get(slot)
+            if wall_index is not None:
+                obstacles.damage(self._walls[wall_index], float(damage[slot]))
+            elif player.is_alive:
+                player.take_damage(float(damage[slot]))
+
+    def _update_wall_arrays(self, obstacles):
+        """
+        Range les murs du calque dans des tableaux (refait seulement quand le calque a changé) :
+        centres des murs, et grille dense des cases autour des murs (indice du mur de chaque case,
+        cases à portée d'un mur)
+        """
+        if self._walls_version == (id(obstacles), obstacles.version):
+            return
+        self._walls_version = (id(obstacles), obstacles.version)
+
+        entries = list(obstacles.entries())
+        self._walls = [entity for _, _, entity in entries]
+        self._wall_center_x = np.array([x for x, _, _ in entries], dtype=np.float64)
+        self._wall_center_y = np.array([y for _, y, _ in entries], dtype=np.float64)
+        tile_x = np.floor_divide(self._wall_center_x, TILE_SIZE).astype(np.int64)
+        tile_y = np.floor_divide(self._wall_center_y, TILE_SIZE).astype(np.int64)
+
+        # Rectangle des murs, élargi pour que les voisines d'une case à portée y soient aussi
+        margin = 2 * WALL_REACH
+        self._wall_grid_origin = (int(tile_x.min()) - margin, int(tile_y.min()) - margin)
+        width = int(tile_x.max()) - int(tile_x.min()) + 2 * margin + 1
+        height = int(tile_y.max()) - int(tile_y.min()) + 2 * margin + 1
+        if width * height > ENEMY_STORE_WALL_GRID_MAX_TILES:
+            # Murs trop dispersés (monde infini) : recherche mur par mur dans le calque
+            self._wall_grid = None
+            self._wall_indices = {id(wall): index for index, wall in enumerate(self._walls)}
+            return
+
+        local_x = tile_x - self._wall_grid_origin[0]
+        local_y = tile_y - self._wall_grid_origin[1]
+        self._wall_grid = np.full((height, width), -1, dtype=np.int32)
+        self._wall_grid[local_y, local_x] = np.arange(len(entries), dtype=np.int32)
+        self._wall_reach = np.zeros((height, width), dtype=bool)
+        for dx, dy in WALL_REACH_OFFSETS:
+            self._wall_reach[local_y + dy, local_x + dx] = True
+
+    def _find_wall_targets(self, obstacles, position_x, position_y, alive):
+        """
+        Trouve le mur le plus proche à portée de chaque ennemi (passes vectorisées)
+        Seuls les ennemis dont la case est à portée d'un mur sont examinés ; pour eux,
+        chaque case voisine est lue dans la grille dense des murs.
+        Returns:
+            Tuple (cases des ennemis qui attaquent un mur, indices de leur mur dans self._walls)
+        """
+        no_target = np.zeros(0, dtype=np.int64)
+        if obstacles is None or len(obstacles) == 0:
+            return no_target, no_target
+        self._update_wall_arrays(obstacles)
+
+        if self._wall_grid is None:
+            slots, indices = [], []
+            for slot in np.flatnonzero(alive).tolist():
+                wall = obstacles.nearest(position_x[slot], position_y[slot], ENEMY_WALL_SEARCH_RANGE)
+                if wall is not None:
+                    slots.append(slot)
+                    indices.append(self._wall_indices[id(wall)])
+            return np.array(slots, dtype=np.int64), np.array(indices, dtype=np.int64)
+
+        height, width = self._wall_grid.shape
+        local_x = np.floor_divide(position_x, TILE_SIZE).astype(np.int64) - self._wall_grid_origin[0]
+        local_y = np.floor_divide(position_y, TILE_SIZE).astype(np.int64) - self._wall_grid_origin[1]
+        slots = np.flatnonzero(alive & (local_x >= 0) & (local_x < width) & (local_y >= 0) & (local_y < height))
+        slots = slots[self._wall_reach[local_y[slots], local_x[slots]]]
+        if len(slots) == 0:
+            return no_target, no_target
+
+        enemy_x, enemy_y = position_x[slots], position_y[slots]
+        enemy_tile_x, enemy_tile_y = local_x[slots], local_y[slots]
+        best_distance_sq = np.full(len(slots), np.inf)
+        best_wall = np.full(len(slots), -1, dtype=np.int64)
+        for dx, dy in WALL_REACH_OFFSETS:
+            wall_index = self._wall_grid[enemy_tile_y + dy, enemy_tile_x + dx]
+            distance_sq = (self._wall_center_x[wall_index] - enemy_x) ** 2 + (self._wall_center_y[wall_index] - enemy_y) ** 2
+            closer = ((wall_index >= 0) & (distance_sq <= ENEMY_WALL_SEARCH_RANGE ** 2)
+                      & (distance_sq < best_distance_sq))
+            best_distance_sq[closer] = distance_sq[closer]
+            best_wall[closer] = wall_index[closer]
+
+        found = best_wall >= 0
+        return slots[found], best_wall[found]
+
+    # --- Rendu ---
+
+    def visible_enemies(self, camera_offset_x, camera_offset_y, screen_width, screen_height):
+        """
+        Liste les ennemis vivants visibles à l'écran (barre de vie comprise)
+        Args:
+            camera_offset_x, camera_offset_y: Décalage de la caméra
+            screen_width, screen_height: Taille de l'écran en pixels
+        Returns:
+            Liste des vues à dessiner
+        """
+        count = self.count
+        screen_x = self.position_x[:count] - camera_offset_x
+        screen_y = self.position_y[:count] - camera_offset_y
+        size = self.enemy_size[:count]
+        visible = (self.is_alive[:count] & (screen_x > -size) & (screen_x < screen_width)
+                   & (screen_y > -size) & (screen_y - 8 < screen_height))
+        return [self.enemies[slot] for slot in np.flatnonzero(visible).tolist()]
@@ -0,0 +1,233 @@
+"""
+FLOW_FIELD.PY
+=============
+Ce fichier contient le champ de flux (flow field) qui guide les hordes d'ennemis vers une cible.
+Au lieu d'un A* par ennemi, un seul champ d'intégration est calculé depuis la case de la cible
+(le joueur) sur une fenêtre de FLOW_FIELD_RADIUS cases autour d'elle : coût du plus court chemin
+de chaque case vers la cible, en contournant l'eau et les montagnes. Un mur coûte
+FLOW_FIELD_WALL_COST cases : la horde passe à travers (en le détruisant) si le détour est plus long.
+Chaque case retient la case voisine vers laquelle avancer : un ennemi lit sa direction en O(1).
+Le champ n'est recalculé que si la cible change de case ou si les obstacles changent.
+
+Calcul : plus courts chemins (4-voisinage, coût de chaque case quittée) par balayages successifs
+de la grille dans les quatre sens, chaque balayage étant un minimum cumulé NumPy sur toutes
+les lignes (ou colonnes) à la fois ; on répète jusqu'à ce que plus rien ne change.
+"""
+
+import math
+import numpy as np
+from constants import *
+from terrain_grid import WALKABLE_TABLE
+
+# Coût d'une case infranchissable (eau, montagne, hors fenêtre) : au-delà, la case est inatteignable
+BLOCKED_COST = 1e9
+# Distance initiale des cases (supérieure à tout chemin, reste exacte en float64)
+UNREACHED = 1e15
+# Nombre maximal de séries de balayages (un chemin qui tourne souvent en demande plusieurs)
+MAX_SWEEPS = 64
+
+# Voisins candidats pour la direction (les diagonales lissent les trajectoires)
+NEIGHBOR_STEPS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def integrate(costs, target_x, target_y):
+    """
+    Calcule le coût du plus court chemin de chaque case vers la cible
+    Un balayage de gauche à droite relâche toutes les lignes d'un coup :
+    d[x] = min(d[x], min sur j < x de d[j] + coût des cases j+1..x), soit avec C = somme cumulée
+    des coûts : d[x] = C[x] + minimum cumulé de (d - C). Idem dans les trois autres sens.
+    Args:
+        costs: Tableau float64 (hauteur, largeur) du coût pour traverser chaque case
+        target_x, target_y: Case cible (coordonnées dans le tableau)
+    Returns:
+        Tableau float64 des distances (>= BLOCKED_COST : case inatteignable)
+    """
+    distances = np.full(costs.shape, UNREACHED)
+    distances[target_y, target_x] = 0.0
+
+    # Vues des distances et des coûts dans les quatre sens de balayage (lignes, lignes inversées,
+    # colonnes, colonnes inversées) ; les sommes cumulées des coûts ne changent pas entre balayages
+    sweeps = []
+    for distance_view, cost_view in ((distances, costs), (distances[:, ::-1], costs[:, ::-1]),
+                                     (distances.T, costs.T), (distances.T[:, ::-1], costs.T[:, ::-1])):
+        sweeps.append((distance_view, np.cumsum(cost_view, axis=1)))
+
+    for _ in range(MAX_SWEEPS):
+        previous = distances.copy()
+        for distance_view, cumulative in sweeps:
+            best = np.minimum.accumulate(distance_view - cumulative, axis=1)
+            best += cumulative
+            np.minimum(distance_view, best, out=distance_view)
+        if np.array_equal(previous, distances):
+            break
+    return distances
+
+
+class FlowField:
+    """Champ de flux vers une cible, sur une fenêtre carrée de cases autour d'elle"""
+
+    def __init__(self, radius=FLOW_FIELD_RADIUS, wall_cost=FLOW_FIELD_WALL_COST):
+        """
+        Initialise un champ vide
+        Args:
+            radius: Demi-côté de la fenêtre calculée (en cases)
+            wall_cost: Coût de traversée d'une case de mur (en cases parcourues)
+        """
+        self.radius = radius
+        self.wall_cost = wall_cost
+
+        # Clé du dernier calcul : (case cible, version des obstacles du monde)
+        self._key = None
+        self.origin_x = self.origin_y = 0
+        self.target_grid_x = self.target_grid_y = None
+        self.distances = None
+        # Case suivante de chaque case (décalage -1, 0 ou 1), (0, 0) si aucune
+        self.next_x = None
+        self.next_y = None
+        self.recompute_count = 0
+
+    def update(self, world, target_x, target_y):
+        """
+        Recalcule le champ si la cible a changé de case ou si les obstacles ont changé
+        Args:
+            world: Monde (terrain, murs)
+            target_x, target_y: Position de la cible en pixels
+        Returns:
+            True si le champ a été recalculé
+        """
+        target_grid_x, target_grid_y = int(target_x // TILE_SIZE), int(target_y // TILE_SIZE)
+        key = (target_grid_x, target_grid_y, world.navigation_version)
+        if key == self._key:
+            return False
+
+        # Fenêtre autour de la cible (limitée à la carte pour un monde fixe)
+        radius = self.radius
+        if world.is_infinite:
+            radius = min(radius, world.chunk_size * WORLD_CHUNK_LOAD_RADIUS)
+        start_x, start_y = target_grid_x - radius, target_grid_y - radius
+        end_x, end_y = target_grid_x + radius + 1, target_grid_y + radius + 1
+        if not world.is_infinite:
+            start_x, start_y = max(0, start_x), max(0, start_y)
+            end_x, end_y = min(GRID_SIZE, end_x), min(GRID_SIZE, end_y)
+        if start_x >= end_x or start_y >= end_y:
+            return False
+
+        codes = world.get_codes_region(start_x, start_y, end_x, end_y)
+        if codes is None:
+            # Terrain en cours de génération : on réessaiera à la prochaine frame
+            return False
+        self._key = key
+
+        costs = np.where(WALKABLE_TABLE[codes], 1.0, BLOCKED_COST)
+        for wall_x, wall_y in world.get_obstacle_tiles():
+            if start_x <= wall_x < end_x and start_y <= wall_y < end_y and costs[wall_y - start_y, wall_x - start_x] == 1.0:
+                costs[wall_y - start_y, wall_x - start_x] = self.wall_cost
+
+        self.origin_x, self.origin_y = start_x, start_y
+        self.target_grid_x, self.target_grid_y = target_grid_x, target_grid_y
+        self.distances = integrate(costs, target_grid_x - start_x, target_grid_y - start_y)
+        self._compute_next_steps()
+        self.recompute_count += 1
+        return True
+
+    def _compute_next_steps(self):
+        """
+        Choisit pour chaque case la voisine qui rapproche le plus vite de la cible
+        (gain de distance divisé par la longueur du pas ; une diagonale n'est prise
+        que si les deux cases qu'elle longe sont atteignables)
+        """
+        distances = self.distances
+        height, width = distances.shape
+        padded = np.full((height + 2, width + 2), UNREACHED)
+        padded[1:-1, 1:-1] = distances
+
+        def neighbor(step_x, step_y):
+            return padded[1 + step_y:1 + step_y + height, 1 + step_x:1 + step_x + width]
+
+        best_gain = np.zeros((height, width))
+        self.next_x = np.zeros((height, width), dtype=np.int8)
+        self.next_y = np.zeros((height, width), dtype=np.int8)
+        for step_x, step_y in NEIGHBOR_STEPS:
+            neighbor_distances = neighbor(step_x, step_y)
+            gain = (distances - neighbor_distances) / (1.4142135623730951 if step_x and step_y else 1.0)
+            better = (neighbor_distances < BLOCKED_COST) & (gain > best_gain)
+            if step_x and step_y:
+                better &= (neighbor(step_x, 0) < BLOCKED_COST) & (neighbor(0, step_y) < BLOCKED_COST)
+            best_gain[better] = gain[better]
+            self.next_x[better] = step_x
+            self.next_y[better] = step_y
+
+    # --- Lecture ---
+
+    def distance_at(self, grid_x, grid_y):
+        """
+        Coût du chemin d'une case vers la cible
+        Returns:
+            Distance, ou None si la case est hors de la fenêtre ou inatteignable
+        """
+        if self.distances is None:
+            return None
+        local_x, local_y = grid_x - self.origin_x, grid_y - self.origin_y
+        height, width = self.distances.shape
+        if not (0 <= local_x < width and 0 <= local_y < height):
+            return None
+        distance = self.distances[local_y, local_x]
+        return float(distance) if distance < BLOCKED_COST else None
+
+    def direction_at(self, position_x, position_y):
+        """
+        Direction à suivre depuis une position : vers le centre de la case suivante
+        Args:
+            position_x, position_y: Position en pixels
+        Returns:
+            Tuple (dx, dy) normalisé, ou None (hors de la fenêtre, inatteignable, ou case de la cible
+            ou voisine : la fin du trajet se fait en ligne droite)
+        """
+        if self.distances is None:
+            return None
+        grid_x, grid_y = int(position_x // TILE_SIZE), int(position_y // TILE_SIZE)
+        local_x, local_y = grid_x - self.origin_x, grid_y - self.origin_y
+        height, width = self.distances.shape
+        if not (0 <= local_x < width and 0 <= local_y < height):
+            return None
+        step_x, step_y = int(self.next_x[local_y, local_x]), int(self.next_y[local_y, local_x])
+        if (step_x == 0 and step_y == 0) or (grid_x + step_x, grid_y + step_y) == (self.target_grid_x, self.target_grid_y):
+            return None
+
+        direction_x = (grid_x + step_x + 0.5) * TILE_SIZE - position_x
+        direction_y = (grid_y + step_y + 0.5) * TILE_SIZE - position_y
+        length = math.sqrt(direction_x * direction_x + direction_y * direction_y)
+        if length == 0:
+            return None
+        return direction_x / length, direction_y / length
+
+    def directions_at(self, positions_x, positions_y):
+        """
+        Version vectorisée de direction_at (stockage NumPy des ennemis)
+        Args:
+            positions_x, positions_y: Tableaux de positions en pixels
+        Returns:
+            Tuple (dx, dy, valide) de tableaux ; dx et dy valent 0 là où valide est faux
+        """
+        count = len(positions_x)
+        direction_x, direction_y = np.zeros(count), np.zeros(count)
+        if self.distances is None:
+            return direction_x, direction_y, np.zeros(count, dtype=bool)
+
+        height, width = self.distances.shape
+        grid_x = np.floor_divide(positions_x, TILE_SIZE).astype(np.int64)
+        grid_y = np.floor_divide(positions_y, TILE_SIZE).astype(np.int64)
+        local_x, local_y = grid_x - self.origin_x, grid_y - self.origin_y
+        inside = (local_x >= 0) & (local_x < width) & (local_y >= 0) & (local_y < height)
+        step_x = np.zeros(count, dtype=np.int64)
+        step_y = np.zeros(count, dtype=np.int64)
+        step_x[inside] = self.next_x[local_y[inside], local_x[inside]]
+        step_y[inside] = self.next_y[local_y[inside], local_x[inside]]
+
+        direction_x = (grid_x + step_x + 0.5) * TILE_SIZE - positions_x
+        direction_y = (grid_y + step_y + 0.5) * TILE_SIZE - positions_y
+        length = np.sqrt(direction_x * direction_x + direction_y * direction_y)
+        next_is_target = (grid_x + step_x == self.target_grid_x) & (grid_y + step_y == self.target_grid_y)
+        valid = inside & ((step_x != 0) | (step_y != 0)) & ~next_is_target & (length > 0)
+        scale = np.divide(1.0, length, out=np.zeros(count), where=valid)
+        return direction_x * scale, direction_y * scale, valid
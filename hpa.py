@@ -0,0 +1,488 @@
+"""
+HPA.PY
+======
+Ce fichier contient le pathfinding hiérarchique (HPA*) pour les agents qui ont besoin de leur
+propre itinéraire à travers la carte (colons, caravanes, ennemis visant un bâtiment précis).
+- La carte est découpée en clusters carrés de HPA_CLUSTER_SIZE cases.
+- Sur chaque frontière entre deux clusters, chaque segment de cases libres des deux côtés
+  forme une entrée : une transition au milieu, ou une à chaque bout si le segment est large.
+- Le graphe abstrait relie les cases de transition : coût 1 entre les deux côtés d'une entrée,
+  longueur du plus court chemin interne entre deux transitions d'un même cluster.
+- Un A* sur ce petit graphe donne l'itinéraire abstrait ; seul le premier saut est raffiné
+  en cases, les suivants le sont quand l'agent y arrive.
+- Les itinéraires abstraits sont mis en cache par (cluster de départ, cluster d'arrivée).
+  Un mur construit ou détruit ne recalcule que les clusters qu'il touche et n'invalide que
+  les itinéraires qui les traversent.
+Carte de taille fixe uniquement ; déplacements en 4-voisinage, comme les régions de walkability.py.
+"""
+
+import heapq
+from collections import OrderedDict, deque
+import numpy as np
+import pygame
+from constants import *
+from terrain_grid import WALKABLE_TABLE
+
+NEIGHBOR_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def manhattan(tile_a, tile_b):
+    """Distance de Manhattan entre deux cases (heuristique exacte sans obstacle en 4-voisinage)"""
+    return abs(tile_a[0] - tile_b[0]) + abs(tile_a[1] - tile_b[1])
+
+
+class HierarchicalPath:
+    """Itinéraire d'un agent : points de passage abstraits, raffinés en cases saut par saut"""
+
+    def __init__(self, pathfinder, waypoints):
+        """
+        Crée l'itinéraire et raffine son premier saut
+        Args:
+            pathfinder: HierarchicalPathfinder qui a calculé l'itinéraire
+            waypoints: Cases [départ, transitions..., arrivée]
+        """
+        self.pathfinder = pathfinder
+        self.waypoints = waypoints
+        # Versions des clusters traversés à la création (voir is_stale)
+        self.cluster_versions = {cluster: pathfinder.cluster_version(cluster)
+                                 for cluster in {pathfinder.cluster_of(tile) for tile in waypoints}}
+        self.hop_index = 0
+        self.steps = deque()
+        self.is_blocked = False
+        self._refine_next_hop()
+
+    @property
+    def goal(self):
+        """Case d'arrivée"""
+        return self.waypoints[-1]
+
+    @property
+    def is_stale(self):
+        """True si un cluster traversé a changé depuis le calcul (l'agent devrait redemander un chemin)"""
+        return any(self.pathfinder.cluster_version(cluster) != version
+                   for cluster, version in self.cluster_versions.items())
+
+    def _refine_next_hop(self):
+        """Raffine le saut abstrait suivant en cases (un mur apparu entre-temps bloque l'itinéraire)"""
+        while not self.steps and self.hop_index < len(self.waypoints) - 1:
+            start, end = self.waypoints[self.hop_index], self.waypoints[self.hop_index + 1]
+            self.hop_index += 1
+            tiles = self.pathfinder.refine(start, end)
+            if tiles is None:
+                self.is_blocked = True
+                return
+            self.steps.extend(tiles[1:])
+
+    def next_tile(self):
+        """
+        Retourne la prochaine case à atteindre
+        Returns:
+            Tuple (x, y), ou None si l'arrivée est atteinte ou l'itinéraire bloqué
+        """
+        if not self.steps and not self.is_blocked:
+            self._refine_next_hop()
+        if self.is_blocked or not self.steps:
+            return None
+        return self.steps[0]
+
+    def advance(self):
+        """Marque la prochaine case comme atteinte"""
+        if self.steps:
+            self.steps.popleft()
+
+
+class HierarchicalPathfinder:
+    """Graphe abstrait des clusters d'une carte fixe, recherche A* hiérarchique et cache d'itinéraires"""
+
+    def __init__(self, world, cluster_size=HPA_CLUSTER_SIZE, cache_size=HPA_PATH_CACHE_SIZE):
+        """
+        Construit le graphe abstrait de toute la carte
+        Args:
+            world: Monde de taille fixe (terrain et murs)
+            cluster_size: Côté d'un cluster en cases
+            cache_size: Nombre maximal d'itinéraires abstraits gardés en cache
+        """
+        self.world = world
+        self.cluster_size = cluster_size
+        self.cache_size = cache_size
+
+        # Cases libres (terrain franchissable sans mur)
+        codes = world.get_codes_region(0, 0, GRID_SIZE, GRID_SIZE)
+        self.height, self.width = codes.shape
+        self.open = WALKABLE_TABLE[codes].copy()
+        for wall_x, wall_y in world.get_obstacle_tiles():
+            self.open[wall_y, wall_x] = False
+
+        self.clusters_x = (self.width + cluster_size - 1) // cluster_size
+        self.clusters_y = (self.height + cluster_size - 1) // cluster_size
+
+        # Entrées de chaque frontière : {(cluster_a, cluster_b): [(case côté a, case côté b), ...]}
+        self._entrances = {}
+        # Liaisons entre clusters (coût 1) : {case: {case voisine de l'autre cluster, ...}}
+        self._links = {}
+        # Arêtes internes : {cluster: {case: {autre case du cluster: distance}}}
+        self._edges = {}
+        self._versions = {}
+
+        # Cache LRU des itinéraires abstraits : {(cluster_départ, cluster_arrivée): [cases de transition]}
+        self._cache = OrderedDict()
+        # Clés de cache par cluster traversé (invalidation ciblée)
+        self._cache_keys_by_cluster = {}
+
+        # Statistiques (utiles pour les benchmarks)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.clusters_rebuilt = 0
+
+        for border in self._all_borders():
+            self._compute_border(*border)
+        for cluster_y in range(self.clusters_y):
+            for cluster_x in range(self.clusters_x):
+                self._compute_edges((cluster_x, cluster_y))
+
+    # --- Clusters et frontières ---
+
+    def cluster_of(self, tile):
+        """Retourne le cluster (cx, cy) d'une case"""
+        return tile[0] // self.cluster_size, tile[1] // self.cluster_size
+
+    def cluster_version(self, cluster):
+        """Nombre de recalculs d'un cluster"""
+        return self._versions.get(cluster, 0)
+
+    def cluster_bounds(self, cluster):
+        """Retourne (début_x, début_y, fin_x, fin_y) d'un cluster (fins exclues)"""
+        size = self.cluster_size
+        start_x, start_y = cluster[0] * size, cluster[1] * size
+        return start_x, start_y, min(start_x + size, self.width), min(start_y + size, self.height)
+
+    def is_open(self, tile):
+        """Vérifie si une case est dans la carte et libre"""
+        return 0 <= tile[0] < self.width and 0 <= tile[1] < self.height and bool(self.open[tile[1], tile[0]])
+
+    def _all_borders(self):
+        """Génère toutes les frontières (cluster_a, cluster_b), a à gauche ou au-dessus de b"""
+        for cluster_y in range(self.clusters_y):
+            for cluster_x in range(self.clusters_x):
+                if cluster_x + 1 < self.clusters_x:
+                    yield (cluster_x, cluster_y), (cluster_x + 1, cluster_y)
+                if cluster_y + 1 < self.clusters_y:
+                    yield (cluster_x, cluster_y), (cluster_x, cluster_y + 1)
+
+    def _compute_border(self, cluster_a, cluster_b):
+        """
+        Recalcule les entrées d'une frontière et les liaisons correspondantes
+        Args:
+            cluster_a, cluster_b: Clusters voisins (a à gauche ou au-dessus de b)
+        """
+        for tile_a, tile_b in self._entrances.pop((cluster_a, cluster_b), ()):
+            self._unlink(tile_a, tile_b)
+            self._unlink(tile_b, tile_a)
+
+        start_x, start_y, end_x, end_y = self.cluster_bounds(cluster_a)
+        if cluster_a[1] == cluster_b[1]:
+            # Frontière verticale : dernière colonne de a, première colonne de b
+            side_x = end_x - 1
+            both_open = self.open[start_y:end_y, side_x] & self.open[start_y:end_y, side_x + 1]
+            make_pair = lambda offset: ((side_x, start_y + offset), (side_x + 1, start_y + offset))
+        else:
+            # Frontière horizontale : dernière ligne de a, première ligne de b
+            side_y = end_y - 1
+            both_open = self.open[side_y, start_x:end_x] & self.open[side_y + 1, start_x:end_x]
+            make_pair = lambda offset: ((start_x + offset, side_y), (start_x + offset, side_y + 1))
+
+        # Segments de cases libres des deux côtés
+        edges = np.diff(np.concatenate(([0], both_open.view(np.int8), [0])))
+        entrances = []
+        for run_start, run_end in zip(np.flatnonzero(edges == 1).tolist(), np.flatnonzero(edges == -1).tolist()):
+            if run_end - run_start >= HPA_ENTRANCE_MAX_WIDTH:
+                offsets = (run_start, run_end - 1)
+            else:
+                offsets = ((run_start + run_end - 1) // 2,)
+            for offset in offsets:
+                tile_a, tile_b = make_pair(offset)
+                entrances.append((tile_a, tile_b))
+                self._links.setdefault(tile_a, set()).add(tile_b)
+                self._links.setdefault(tile_b, set()).add(tile_a)
+        if entrances:
+            self._entrances[(cluster_a, cluster_b)] = entrances
+
+    def _unlink(self, tile, other):
+        """Retire une liaison entre clusters"""
+        links = self._links.get(tile)
+        if links is None:
+            return
+        links.discard(other)
+        if not links:
+            del self._links[tile]
+
+    def _cluster_nodes(self, cluster):
+        """Liste les cases de transition d'un cluster (côté du cluster de chaque entrée)"""
+        cluster_x, cluster_y = cluster
+        nodes = set()
+        for neighbor, side in (((cluster_x - 1, cluster_y), 1), ((cluster_x, cluster_y - 1), 1),
+                               ((cluster_x + 1, cluster_y), 0), ((cluster_x, cluster_y + 1), 0)):
+            key = (neighbor, cluster) if side == 1 else (cluster, neighbor)
+            for pair in self._entrances.get(key, ()):
+                nodes.add(pair[side])
+        return sorted(nodes)
+
+    def _compute_edges(self, cluster):
+        """Recalcule les distances internes entre les transitions d'un cluster"""
+        nodes = self._cluster_nodes(cluster)
+        edges = {node: {} for node in nodes}
+        for index, node in enumerate(nodes[:-1]):
+            distances = self._cluster_distances(cluster, node)
+            for other in nodes[index + 1:]:
+                distance = distances.get(other)
+                if distance is not None:
+                    edges[node][other] = distance
+                    edges[other][node] = distance
+        self._edges[cluster] = edges
+        self._versions[cluster] = self._versions.get(cluster, 0) + 1
+        self.clusters_rebuilt += 1
+
+    def _cluster_distances(self, cluster, start):
+        """
+        Parcours en largeur depuis une case, sans sortir du cluster
+        Returns:
+            Dictionnaire {case: distance} des cases atteintes
+        """
+        start_x, start_y, end_x, end_y = self.cluster_bounds(cluster)
+        width = end_x - start_x
+        open_tiles = self.open[start_y:end_y, start_x:end_x].ravel().tolist()
+        height = len(open_tiles) // width
+
+        first = (start[1] - start_y) * width + (start[0] - start_x)
+        distances = {first: 0}
+        queue = deque([first])
+        while queue:
+            index = queue.popleft()
+            distance = distances[index] + 1
+            local_x = index % width
+            neighbors = []
+            if local_x > 0:
+                neighbors.append(index - 1)
+            if local_x < width - 1:
+                neighbors.append(index + 1)
+            if index >= width:
+                neighbors.append(index - width)
+            if index < (height - 1) * width:
+                neighbors.append(index + width)
+            for neighbor in neighbors:
+                if open_tiles[neighbor] and neighbor not in distances:
+                    distances[neighbor] = distance
+                    queue.append(neighbor)
+        return {(start_x + index % width, start_y + index // width): distance
+                for index, distance in distances.items()}
+
+    # --- Mises à jour ---
+
+    def on_tile_changed(self, grid_x, grid_y):
+        """
+        Prend en compte la construction ou la destruction d'un mur sur une case
+        Seuls le cluster de la case, et le cluster voisin si la case est sur une frontière,
+        sont recalculés ; les itinéraires en cache qui les traversent sont oubliés.
+        Args:
+            grid_x, grid_y: Coordonnées de la case
+        """
+        is_open = self.world.is_tile_open(grid_x, grid_y)
+        if bool(self.open[grid_y, grid_x]) == is_open:
+            return
+        self.open[grid_y, grid_x] = is_open
+
+        cluster = self.cluster_of((grid_x, grid_y))
+        cluster_x, cluster_y = cluster
+        start_x, start_y, end_x, end_y = self.cluster_bounds(cluster)
+        borders = []
+        if grid_x == start_x and cluster_x > 0:
+            borders.append(((cluster_x - 1, cluster_y), cluster))
+        if grid_x == end_x - 1 and cluster_x + 1 < self.clusters_x:
+            borders.append((cluster, (cluster_x + 1, cluster_y)))
+        if grid_y == start_y and cluster_y > 0:
+            borders.append(((cluster_x, cluster_y - 1), cluster))
+        if grid_y == end_y - 1 and cluster_y + 1 < self.clusters_y:
+            borders.append((cluster, (cluster_x, cluster_y + 1)))
+
+        affected = {cluster}
+        for border in borders:
+            self._compute_border(*border)
+            affected.update(border)
+        for affected_cluster in affected:
+            self._compute_edges(affected_cluster)
+            for key in self._cache_keys_by_cluster.pop(affected_cluster, ()):
+                self._cache.pop(key, None)
+
+    # --- Recherche ---
+
+    def find_path(self, start_x, start_y, goal_x, goal_y):
+        """
+        Calcule l'itinéraire d'un agent entre deux cases
+        Args:
+            start_x, start_y: Case de départ
+            goal_x, goal_y: Case d'arrivée
+        Returns:
+            HierarchicalPath (premier saut déjà raffiné), ou None si l'arrivée est inatteignable
+        """
+        start, goal = (start_x, start_y), (goal_x, goal_y)
+        if not self.is_open(start) or not self.is_open(goal):
+            return None
+        # Régions connexes en O(1) : évite d'explorer tout le graphe pour rien
+        if not self.world.are_connected(start_x, start_y, goal_x, goal_y):
+            return None
+
+        start_cluster, goal_cluster = self.cluster_of(start), self.cluster_of(goal)
+        if start_cluster == goal_cluster:
+            path = HierarchicalPath(self, [start, goal])
+            if not path.is_blocked:
+                return path
+
+        # Itinéraire en cache, utilisable si ses deux bouts sont accessibles depuis le départ et l'arrivée
+        key = (start_cluster, goal_cluster)
+        route = self._cache.get(key) if start_cluster != goal_cluster else None
+        start_distances = self._cluster_distances(start_cluster, start)
+        goal_distances = self._cluster_distances(goal_cluster, goal)
+        if route is not None and route[0] in start_distances and route[-1] in goal_distances:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return HierarchicalPath(self, [start] + route + [goal])
+        self.cache_misses += 1
+
+        waypoints = self._abstract_search(start, goal, start_distances, goal_distances)
+        if waypoints is None:
+            return None
+        route = waypoints[1:-1]
+        if route and start_cluster != goal_cluster:
+            self._store_route(key, route)
+        return HierarchicalPath(self, waypoints)
+
+    def _abstract_search(self, start, goal, start_distances, goal_distances):
+        """
+        A* sur le graphe abstrait, avec le départ et l'arrivée reliés aux transitions de leur cluster
+        Returns:
+            Liste de cases [départ, transitions..., arrivée], ou None
+        """
+        start_edges = {node: start_distances[node]
+                       for node in self._edges[self.cluster_of(start)] if node in start_distances}
+        goal_edges = {node: goal_distances[node]
+                      for node in self._edges[self.cluster_of(goal)] if node in goal_distances}
+
+        best = {start: 0}
+        came_from = {}
+        heap = [(manhattan(start, goal), 0, start)]
+        while heap:
+            _, cost, node = heapq.heappop(heap)
+            if node == goal:
+                waypoints = [goal]
+                while waypoints[-1] != start:
+                    waypoints.append(came_from[waypoints[-1]])
+                return waypoints[::-1]
+            if cost > best[node]:
+                continue
+
+            neighbors = []
+            if node == start:
+                neighbors.extend(start_edges.items())
+            if node in goal_edges:
+                neighbors.append((goal, goal_edges[node]))
+            node_edges = self._edges[self.cluster_of(node)].get(node)
+            if node_edges is not None:
+                neighbors.extend(node_edges.items())
+                neighbors.extend((other, 1) for other in self._links.get(node, ()))
+
+            for neighbor, step_cost in neighbors:
+                new_cost = cost + step_cost
+                if new_cost < best.get(neighbor, float('inf')):
+                    best[neighbor] = new_cost
+                    came_from[neighbor] = node
+                    heapq.heappush(heap, (new_cost + manhattan(neighbor, goal), new_cost, neighbor))
+        return None
+
+    def _store_route(self, key, route):
+        """Met un itinéraire abstrait en cache (LRU) et l'indexe par cluster traversé"""
+        self._cache[key] = route
+        self._cache.move_to_end(key)
+        for cluster in {self.cluster_of(tile) for tile in route} | set(key):
+            self._cache_keys_by_cluster.setdefault(cluster, set()).add(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def refine(self, start, goal):
+        """
+        Raffine un saut abstrait en cases (A* limité au cluster du saut)
+        Args:
+            start, goal: Cases du saut (même cluster, ou voisines de part et d'autre d'une frontière)
+        Returns:
+            Liste de cases de start à goal incluses, ou None si le saut est bloqué
+        """
+        if not self.is_open(start) or not self.is_open(goal):
+            return None
+        if manhattan(start, goal) <= 1:
+            return [start] if start == goal else [start, goal]
+
+        start_x, start_y, end_x, end_y = self.cluster_bounds(self.cluster_of(start))
+        best = {start: 0}
+        came_from = {}
+        heap = [(manhattan(start, goal), 0, start)]
+        while heap:
+            _, cost, tile = heapq.heappop(heap)
+            if tile == goal:
+                tiles = [goal]
+                while tiles[-1] != start:
+                    tiles.append(came_from[tiles[-1]])
+                return tiles[::-1]
+            if cost > best[tile]:
+                continue
+            for offset_x, offset_y in NEIGHBOR_OFFSETS:
+                neighbor = (tile[0] + offset_x, tile[1] + offset_y)
+                if not (start_x <= neighbor[0] < end_x and start_y <= neighbor[1] < end_y):
+                    continue
+                if not self.open[neighbor[1], neighbor[0]] or cost + 1 >= best.get(neighbor, float('inf')):
+                    continue
+                best[neighbor] = cost + 1
+                came_from[neighbor] = tile
+                heapq.heappush(heap, (cost + 1 + manhattan(neighbor, goal), cost + 1, neighbor))
+        return None
+
+    # --- Debug ---
+
+    def draw_debug(self, screen, camera_offset_x, camera_offset_y, path=None):
+        """
+        Dessine les clusters, les transitions et un itinéraire (mode debug)
+        Args:
+            screen: Surface Pygame
+            camera_offset_x, camera_offset_y: Décalage de la caméra
+            path: HierarchicalPath à afficher (optionnel) : sauts abstraits en orange,
+                  cases raffinées du saut en cours en cyan
+        """
+        screen_width, screen_height = screen.get_size()
+        size_pixels = self.cluster_size * TILE_SIZE
+        first_x = max(0, int(camera_offset_x // size_pixels))
+        first_y = max(0, int(camera_offset_y // size_pixels))
+        last_x = min(self.clusters_x - 1, int((camera_offset_x + screen_width) // size_pixels))
+        last_y = min(self.clusters_y - 1, int((camera_offset_y + screen_height) // size_pixels))
+
+        for cluster_y in range(first_y, last_y + 1):
+            for cluster_x in range(first_x, last_x + 1):
+                start_x, start_y, end_x, end_y = self.cluster_bounds((cluster_x, cluster_y))
+                rect = pygame.Rect(start_x * TILE_SIZE - camera_offset_x, start_y * TILE_SIZE - camera_offset_y,
+                                   (end_x - start_x) * TILE_SIZE, (end_y - start_y) * TILE_SIZE)
+                pygame.draw.rect(screen, COLOR_DARK_GRAY, rect, 1)
+                for node_x, node_y in self._edges[(cluster_x, cluster_y)]:
+                    pygame.draw.rect(screen, COLOR_YELLOW,
+                                     (node_x * TILE_SIZE - camera_offset_x + TILE_SIZE // 2 - 3,
+                                      node_y * TILE_SIZE - camera_offset_y + TILE_SIZE // 2 - 3, 6, 6))
+
+        if path is None:
+            return
+
+        def center(tile):
+            return (tile[0] * TILE_SIZE + TILE_SIZE // 2 - camera_offset_x,
+                    tile[1] * TILE_SIZE + TILE_SIZE // 2 - camera_offset_y)
+
+        if len(path.waypoints) > 1:
+            pygame.draw.lines(screen, COLOR_ORANGE, False, [center(tile) for tile in path.waypoints], 3)
+        for tile in path.steps:
+            pygame.draw.rect(screen, COLOR_ENERGY_CRYSTAL,
+                             (tile[0] * TILE_SIZE - camera_offset_x + TILE_SIZE // 2 - 4,
+                              tile[1] * TILE_SIZE - camera_offset_y + TILE_SIZE // 2 - 4, 8, 8))
@@ -0,0 +1,155 @@
+"""
+LOD.PY
+======
+Ce fichier contient le niveau de détail (LOD) de la simulation des ennemis.
+Sur une grande carte, la plupart des ennemis marchent longtemps hors de l'écran vers le joueur.
+- Proches (à moins de ENEMY_LOD_PLAYER_DISTANCE d'un joueur, ou de la portée d'une tourelle
+  plus ENEMY_LOD_TURRET_MARGIN) : BaseEnemy.update à chaque frame, comportement inchangé.
+- Lointains : simulés une frame sur ENEMY_LOD_FAR_INTERVAL, avec un pas de temps couvrant
+  toutes les frames en attente. Un ennemi lointain qui approche d'un mur rattrape son retard
+  frame par frame : le contact avec un mur reste identique.
+- Un ennemi qui redevient proche rattrape d'abord ses frames en attente.
+La proximité est décidée par cellules (taille SPATIAL_HASH_CELL_SIZE) : les cellules qui touchent
+le rayon d'un joueur ou d'une tourelle sont marquées une fois par frame, puis chaque ennemi
+ne fait qu'une recherche dans cet ensemble.
+Le dessin ne concerne que les ennemis visibles à l'écran (voir visible_enemies).
+"""
+
+from constants import *
+
+# Portée de recherche des murs par un ennemi (voir BaseEnemy.update)
+WALL_SEARCH_RANGE = 50
+
+
+def visible_enemies(enemies, camera_offset_x, camera_offset_y, screen_width, screen_height):
+    """
+    Liste les ennemis vivants visibles à l'écran (barre de vie comprise)
+    Args:
+        enemies: Liste des ennemis
+        camera_offset_x, camera_offset_y: Décalage de la caméra
+        screen_width, screen_height: Taille de l'écran en pixels
+    Returns:
+        Liste des ennemis à dessiner
+    """
+    visible = []
+    for enemy in enemies:
+        screen_x = enemy.position_x - camera_offset_x
+        screen_y = enemy.position_y - camera_offset_y
+        size = enemy.enemy_size
+        if enemy.is_alive and -size < screen_x < screen_width and -size < screen_y and screen_y - 8 < screen_height:
+            visible.append(enemy)
+    return visible
+
+
+class EnemyLODScheduler:
+    """Répartit les ennemis entre simulation complète (proches) et simulation espacée (lointains)"""
+
+    def __init__(self, cell_size=SPATIAL_HASH_CELL_SIZE, far_interval=ENEMY_LOD_FAR_INTERVAL):
+        """
+        Initialise le répartiteur
+        Args:
+            cell_size: Côté des cellules de proximité en pixels
+            far_interval: Un ennemi lointain est simulé une frame sur far_interval
+        """
+        self.cell_size = cell_size
+        self.far_interval = far_interval
+        self.frame = 0
+        self.elapsed_time = 0.0
+        # Cellules proches d'un joueur ou d'une tourelle (recalculées à chaque frame)
+        self._near_cells = set()
+
+        # Statistiques de la dernière frame (utiles pour les benchmarks)
+        self.near_count = 0
+        self.far_updates = 0
+
+    def _mark_near(self, anchors):
+        """
+        Marque les cellules qui touchent le rayon de chaque point d'ancrage
+        Args:
+            anchors: Liste de (x, y, rayon) en pixels
+        """
+        size = self.cell_size
+        near_cells = self._near_cells
+        near_cells.clear()
+        for anchor_x, anchor_y, radius in anchors:
+            radius_sq = radius * radius
+            for cell_y in range(int((anchor_y - radius) // size), int((anchor_y + radius) // size) + 1):
+                # Écart vertical entre l'ancre et la cellule (0 si l'ancre est dans sa rangée)
+                gap_y = max(cell_y * size - anchor_y, 0, anchor_y - (cell_y + 1) * size)
+                for cell_x in range(int((anchor_x - radius) // size), int((anchor_x + radius) // size) + 1):
+                    gap_x = max(cell_x * size - anchor_x, 0, anchor_x - (cell_x + 1) * size)
+                    if gap_x * gap_x + gap_y * gap_y <= radius_sq:
+                        near_cells.add((cell_x, cell_y))
+
+    def update(self, enemies, delta_time, player, anchors, obstacles=None, flow_field=None, think=True):
+        """
+        Met à jour les ennemis selon leur niveau de détail
+        Args:
+            enemies: Liste des ennemis
+            delta_time: Temps écoulé depuis la dernière frame
+            player: Joueur poursuivi
+            anchors: Points autour desquels la simulation est complète : liste de (x, y, rayon)
+            obstacles: Calque des murs (optionnel)
+            flow_field: Champ de flux vers le joueur (optionnel)
+            think: Si False, les ennemis gardent la cible de leur dernière décision (voir ai_scheduler.py)
+        """
+        self._mark_near(anchors)
+        self.frame += 1
+        near_cells = self._near_cells
+        size = self.cell_size
+        interval = self.far_interval
+        near_count = far_updates = 0
+
+        # Les frames en attente d'un ennemi se déduisent de la dernière frame où il a été simulé
+        frame = self.frame
+        previous_time = self.elapsed_time
+        self.elapsed_time = elapsed_time = previous_time + delta_time
+
+        for enemy in enemies:
+            if not enemy.is_alive:
+                continue
+            if enemy.lod_last_frame < 0:
+                # Nouvel ennemi : il entre dans la simulation à cette frame
+                enemy.lod_last_frame = frame - 1
+                enemy.lod_last_time = previous_time
+
+            # Clé de cellule en flottants : (3.0, 4.0) et (3, 4) désignent la même entrée de l'ensemble
+            if (enemy.position_x // size, enemy.position_y // size) in near_cells:
+                # Proche : rattraper les frames en attente, puis simulation normale
+                if enemy.lod_last_frame < frame - 1:
+                    self._advance(enemy, frame - 1, previous_time, player, obstacles, flow_field, think)
+                enemy.update(delta_time, player, obstacles=obstacles, flow_field=flow_field, think=think)
+                enemy.lod_last_frame = frame
+                enemy.lod_last_time = elapsed_time
+                near_count += 1
+            elif (frame + enemy.lod_phase) % interval == 0:
+                # Lointain : toutes les frames en attente d'un coup, à son tour
+                self._advance(enemy, frame, elapsed_time, player, obstacles, flow_field, think)
+                far_updates += 1
+
+        self.near_count = near_count
+        self.far_updates = far_updates
+
+    @staticmethod
+    def _advance(enemy, frame, elapsed_time, player, obstacles, flow_field, think):
+        """
+        Simule d'un coup les frames en attente d'un ennemi jusqu'à une frame donnée
+        (frame par frame si un mur est à portée)
+        Args:
+            enemy: Ennemi en retard
+            frame, elapsed_time: Numéro de la frame atteinte et temps écoulé à sa fin
+            player, obstacles, flow_field, think: Voir update
+        """
+        frames = frame - enemy.lod_last_frame
+        pending_time = elapsed_time - enemy.lod_last_time
+        enemy.lod_last_frame = frame
+        enemy.lod_last_time = elapsed_time
+        if frames <= 0:
+            return
+
+        reach = WALL_SEARCH_RANGE + enemy.speed * frames
+        if obstacles is not None and obstacles.nearest(enemy.position_x, enemy.position_y, reach) is not None:
+            for _ in range(frames):
+                enemy.update(pending_time / frames, player, obstacles=obstacles, flow_field=flow_field, think=think)
+            return
+        enemy.update(pending_time, player, obstacles=obstacles, flow_field=flow_field, steps=frames, think=think)
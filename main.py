@@ -7,16 +7,30 @@ C'est ici que tout s'orchestre : mise à jour des entités, rendu, gestion des 
 
 import pygame
 import sys
-import random
 from constants import *
 from player import Player
-from world import World
+from chunked_world import create_world
 from buildings import BUILDING_TYPES, Turret
 from ui import UserInterface
-from enemies import spawn_zombie_randomly, spawn_mutant_randomly, spawn_wolf_randomly, Zombie, Mutant, Wolf
+from enemies import Zombie, Mutant, Wolf, ENEMY_CLASSES
 from quests import QuestManager
 from crafting import CraftingSystem, CraftingQueue
 from save_system import SaveSystem
+from spatial_hash import SpatialHash
+from obstacle_layer import ObstacleLayer
+from building_index import BuildingIndex
+from building_registry import BuildingRegistry, UPDATED_CATEGORIES
+from production import ProductionEngine
+from enemy_store import EnemyStore
+from flow_field import FlowField
+from hpa import HierarchicalPathfinder
+from lod import EnemyLODScheduler, visible_enemies
+from ai_scheduler import AIThinkScheduler
+from enemy_pool import EnemyPool
+from spawn_director import SpawnDirector, spawn_message
+from crowd import CrowdSeparation
+from projectiles import ProjectileSystem
+from turret_coverage import TurretCoverage
 
 
 class Game:
@@ -98,16 +112,51 @@ class Game:
     def initialize_game(self):
         """Initialise tous les éléments du jeu"""
         # Créer le monde
-        self.world = World()
+        self.world = create_world(WORLD_MODE, WORLD_SEED)
 
-        # Créer le joueur au centre de la carte
-        start_position_x = (GRID_SIZE * TILE_SIZE) // 2
-        start_position_y = (GRID_SIZE * TILE_SIZE) // 2
+        # Créer le joueur au point d'apparition (centre de la carte, ou origine du monde infini)
+        start_position_x, start_position_y = self.world.get_spawn_position()
         self.player = Player(start_position_x, start_position_y)
 
         # Listes des entités
-        self.buildings_list = []  # Liste de tous les bâtiments construits
+        self.buildings_list = BuildingRegistry()  # Tous les bâtiments construits, rangés par catégorie
+        # Moteur de production (optionnel) : les producteurs produisent par phase et par type, hors de la boucle des bâtiments
+        self.production = ProductionEngine() if PRODUCTION_ENGINE_ENABLED else None
+        self.updated_categories = UPDATED_CATEGORIES if self.production is None else \
+            tuple(category for category in UPDATED_CATEGORIES if category != 'producer')
         self.enemies_list = []  # Liste de tous les ennemis
+        # Stockage NumPy des ennemis (optionnel) : les ennemis de la liste sont alors des vues sur ses tableaux
+        self.enemy_store = EnemyStore() if ENEMY_STORE_ENABLED else None
+        # Réserve des ennemis morts, réutilisés aux apparitions suivantes (remplie d'avance sans le stockage)
+        self.enemy_pool = EnemyPool() if ENEMY_POOL_ENABLED else None
+        if self.enemy_pool is not None and self.enemy_store is None:
+            for enemy_class in ENEMY_CLASSES.values():
+                self.enemy_pool.preload(enemy_class, ENEMY_POOL_PRELOAD)
+
+        # Grille spatiale des ennemis (reconstruite à chaque frame) et calque des murs par case
+        self.enemy_hash = SpatialHash()
+        self.obstacles = ObstacleLayer()
+        # Bâtiments par case (cases libres, bâtiment sous la souris, voisins)
+        self.building_index = BuildingIndex()
+        # Champ de flux vers le joueur, recalculé quand il change de case ou que les murs changent
+        self.flow_field = FlowField()
+        # Niveau de détail : les ennemis loin des joueurs et des tourelles sont simulés moins souvent
+        self.enemy_lod = EnemyLODScheduler() if ENEMY_LOD_ENABLED else None
+        # Décisions des ennemis (cible, mur visé) étalées sur les frames dans un budget de temps
+        self.ai_scheduler = AIThinkScheduler() if AI_THINK_ENABLED else None
+        # Séparation des ennemis voisins (les meutes s'étalent au lieu de s'empiler)
+        self.crowd = CrowdSeparation() if CROWD_SEPARATION_ENABLED else None
+        # Projectiles des tourelles (tableaux NumPy, collisions sur une grille des ennemis)
+        self.projectiles = ProjectileSystem() if PROJECTILES_ENABLED else None
+        # Cases couvertes par chaque tourelle, calculées à la pose (cibles, zones défendues, apparitions)
+        self.turret_coverage = TurretCoverage()
+        # Pathfinding hiérarchique des itinéraires individuels (carte fixe seulement)
+        self.pathfinder = self.create_pathfinder()
+        # Mode debug des chemins (F3) : itinéraire du joueur vers la case sous la souris
+        self.show_path_debug = False
+        # Affichage des zones défendues par les tourelles (F4)
+        self.show_turret_coverage = False
+        self.debug_path = None
 
         # Interface utilisateur
         self.user_interface = UserInterface()
@@ -142,9 +191,8 @@ class Game:
         self.camera_offset_y = 0
 
         # Timers
-        self.zombie_spawn_timer = 0  # Timer pour faire apparaître des zombies
-        self.mutant_spawn_timer = 0  # Timer pour faire apparaître des mutants
-        self.wolf_spawn_timer = 0  # Timer pour faire apparaître des loups
+        # Apparitions des ennemis : calendrier, budget de menace par phase, plafond d'ennemis vivants
+        self.spawn_director = SpawnDirector()
 
         # Victoire
         self.has_won = False
@@ -163,15 +211,22 @@ class Game:
         self.player.hunger_level = save_data['player']['hunger_level']
         self.player.is_alive = save_data['player']['is_alive']
 
-        # Restaurer le monde (terrain)
-        self.world.grid_terrain = save_data['world']['grid_terrain']
-        self.world.original_terrain = save_data['world'].get('original_terrain', self.world.grid_terrain)
-        # Restaurer les tiles épuisées
-        depleted_data = save_data['world'].get('depleted_tiles', [])
-        self.world.depleted_tiles = {(entry[0], entry[1]): entry[2] for entry in depleted_data}
-
-        # Restaurer les bâtiments
-        self.buildings_list = []
+        # Restaurer le monde (terrain), en recréant le monde si la sauvegarde vient de l'autre mode
+        world_mode = save_data['world'].get('mode', 'fixed')
+        if world_mode != self.world.mode:
+            self.world.close()
+            self.world = create_world(world_mode, save_data['world'].get('seed'))
+        self.world.load_save_data(save_data['world'])
+
+        # Restaurer les bâtiments (le graphe des chemins est reconstruit une fois les murs posés)
+        self.buildings_list.clear()
+        if self.production is not None:
+            self.production.clear()
+        self.obstacles.clear()
+        self.building_index.clear()
+        self.turret_coverage.clear()
+        self.pathfinder = None
+        self.debug_path = None
         for building_data in save_data['buildings']:
             building_type = building_data['type']
             building_class = BUILDING_TYPES[building_type]['class']
@@ -182,25 +237,37 @@ class Game:
             if hasattr(building, 'research_level'):
                 building.research_level = building_data.get('research_level', 0)
 
-            self.buildings_list.append(building)
+            # Restaurer le choix de cible des tourelles
+            if hasattr(building, 'targeting'):
+                building.targeting = building_data.get('targeting', TURRET_DEFAULT_TARGETING)
+
+            self.add_building(building)
+        self.pathfinder = self.create_pathfinder()
 
         # Restaurer les ennemis
         enemy_classes = {'zombie': Zombie, 'mutant': Mutant, 'wolf': Wolf}
+        if self.enemy_store is not None:
+            self.enemy_store.clear()
+        if self.enemy_pool is not None:
+            self.enemy_pool.release(self.enemies_list)
         self.enemies_list = []
+        if self.projectiles is not None:
+            self.projectiles.clear()
         for enemy_data in save_data['enemies']:
             enemy_type = enemy_data['type']
             if enemy_type in enemy_classes:
-                enemy_class = enemy_classes[enemy_type]
-                enemy = enemy_class(enemy_data['position_x'], enemy_data['position_y'])
+                enemy = self.create_enemy(enemy_classes[enemy_type], enemy_data['position_x'], enemy_data['position_y'])
                 enemy.health_points = enemy_data['health_points']
                 enemy.is_alive = enemy_data['is_alive']
                 self.enemies_list.append(enemy)
 
         # Restaurer les timers
         self.total_elapsed_time = save_data['timers']['total_elapsed_time']
-        self.zombie_spawn_timer = save_data['timers']['zombie_spawn_timer']
-        self.mutant_spawn_timer = save_data['timers'].get('mutant_spawn_timer', 0)
-        self.wolf_spawn_timer = save_data['timers'].get('wolf_spawn_timer', 0)
+        self.spawn_director.load_timers({
+            'zombie': save_data['timers']['zombie_spawn_timer'],
+            'mutant': save_data['timers'].get('mutant_spawn_timer', 0),
+            'wolf': save_data['timers'].get('wolf_spawn_timer', 0)
+        })
 
         # Restaurer l'état du jeu
         self.game_state = save_data['game_state']
@@ -257,6 +324,18 @@ class Game:
                     if save_data:
                         self.load_game_state(save_data)
 
+                # F3 pour afficher les chemins (mode debug)
+                if event.key == pygame.K_F3:
+                    self.show_path_debug = not self.show_path_debug
+
+                # F4 pour afficher les zones défendues par les tourelles
+                if event.key == pygame.K_F4:
+                    self.show_turret_coverage = not self.show_turret_coverage
+
+                # T pour changer le choix de cible de la tourelle sous la souris
+                if event.key == pygame.K_t:
+                    self.cycle_turret_targeting()
+
                 # F11 pour basculer plein écran
                 if event.key == pygame.K_F11:
                     self.toggle_fullscreen()
@@ -288,6 +367,16 @@ class Game:
                 if event.button == 1:  # Clic gauche
                     self.handle_left_click()
 
+    def cycle_turret_targeting(self):
+        """Change le choix de cible de la tourelle sous la souris (plus proche, plus faible, premier arrivé)"""
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        grid_x = int((mouse_x + self.camera_offset_x) // TILE_SIZE)
+        grid_y = int((mouse_y + self.camera_offset_y) // TILE_SIZE)
+        building = self.building_index.get(grid_x, grid_y)
+        if isinstance(building, Turret):
+            targeting = building.cycle_targeting()
+            print(f"Tourelle : vise {TURRET_TARGETING_NAMES[targeting]}")
+
     def handle_left_click(self):
         """Gère le clic gauche de la souris (récolte, construction ou crafting)"""
         mouse_x, mouse_y = pygame.mouse.get_pos()
@@ -335,22 +424,22 @@ class Game:
             return
 
         # Convertir la position souris en position grille
-        grid_x = (mouse_x + self.camera_offset_x) // TILE_SIZE
-        grid_y = (mouse_y + self.camera_offset_y) // TILE_SIZE
+        grid_x = int((mouse_x + self.camera_offset_x) // TILE_SIZE)
+        grid_y = int((mouse_y + self.camera_offset_y) // TILE_SIZE)
 
         # Vérifier que c'est dans les limites
-        if not (0 <= grid_x < GRID_SIZE and 0 <= grid_y < GRID_SIZE):
+        if not self.world.in_bounds(grid_x, grid_y):
             return
 
         # Vérifier que la case est libre
-        if not self.world.is_tile_buildable(grid_x, grid_y, self.buildings_list):
+        if not self.world.is_tile_buildable(grid_x, grid_y, self.buildings_list, self.building_index):
             print("Emplacement déjà occupé !")
             return
 
         # Construire le bâtiment
         building_class = building_info['class']
         new_building = building_class(grid_x, grid_y)
-        self.buildings_list.append(new_building)
+        self.add_building(new_building)
 
         # Dépenser les ressources
         self.player.spend_resources(building_info['cost'])
@@ -397,7 +486,8 @@ class Game:
         # Mettre à jour le joueur
         self.player.update(self.delta_time)
 
-        # Mettre à jour le monde (régénération des ressources)
+        # Mettre à jour le monde (chunks autour du joueur, régénération des ressources)
+        self.world.set_focus(self.player.position_x, self.player.position_y)
         self.world.update(self.delta_time)
 
         # Vérifier si le joueur est mort
@@ -405,13 +495,43 @@ class Game:
             self.game_state = "game_over"
             return
 
-        # Mettre à jour tous les bâtiments (production)
-        for building in self.buildings_list:
-            building.update(self.delta_time, self.player.inventory)
+        # Ranger les ennemis dans la grille spatiale (ennemis proches des joueurs, décidés en priorité)
+        if self.enemy_store is not None:
+            store = self.enemy_store
+            self.enemy_hash.rebuild(store.enemies, store.position_x[:store.count], store.position_y[:store.count])
+        else:
+            self.enemy_hash.rebuild(self.enemies_list)
 
-            # Si c'est une tourelle, elle attaque les ennemis
-            if isinstance(building, Turret):
-                building.attack_enemies(self.enemies_list, self.delta_time)
+        # Mettre à jour les bâtiments actifs (production, recherche, tir) ; les joueurs et les tourelles
+        # délimitent les zones où les ennemis sont simulés à chaque frame
+        lod_anchors = [(self.player.position_x, self.player.position_y, ENEMY_LOD_PLAYER_DISTANCE)]
+        ready_turrets = []
+        for building in self.buildings_list.updated(self.updated_categories):
+            building.update(self.delta_time, self.player.inventory)
+        if self.production is not None:
+            self.production.update(self.delta_time, self.player.inventory)
+        for turret in self.buildings_list.of('turret'):
+            if turret.shoot_cooldown <= 0:
+                ready_turrets.append(turret)
+            lod_anchors.append((turret.grid_x * TILE_SIZE + TILE_SIZE // 2, turret.grid_y * TILE_SIZE + TILE_SIZE // 2,
+                                TURRET_RANGE + ENEMY_LOD_TURRET_MARGIN))
+
+        # Les tourelles prêtes attaquent : assez de tourelles prêtes à la même frame pour amortir le tri des
+        # ennemis par case, cibles lues dans la carte de couverture ; sinon requête dans la grille spatiale
+        if ready_turrets:
+            turret_targets = {}
+            if len(ready_turrets) >= TURRET_COVERAGE_BATCH_MIN:
+                if self.enemy_store is not None:
+                    store = self.enemy_store
+                    turret_targets = self.turret_coverage.targets(ready_turrets, store.enemies, store.position_x[:store.count],
+                                                                  store.position_y[:store.count])
+                else:
+                    turret_targets = self.turret_coverage.targets(ready_turrets, self.enemies_list)
+            goal = (self.player.position_x, self.player.position_y)
+            for turret in ready_turrets:
+                turret.attack_enemies(self.enemies_list, self.delta_time, enemy_hash=self.enemy_hash,
+                                      projectiles=self.projectiles, goal=goal, flow_field=self.flow_field,
+                                      candidates=turret_targets.get(turret))
 
         # Traiter les demandes de craft automatique des usines
         if '_factory_craft' in self.player.inventory and self.player.inventory['_factory_craft']:
@@ -435,62 +555,55 @@ class Game:
             self.player.health_points = min(PLAYER_INITIAL_HEALTH, self.player.health_points + heal_amount)
             self.player.inventory['_hospital_heal'] = 0
 
-        # Mettre à jour tous les ennemis
-        for enemy in self.enemies_list:
-            enemy.update(self.delta_time, self.player, self.buildings_list)
-
-        # Compter les ennemis tués avant de les retirer
-        enemies_before = len(self.enemies_list)
-        self.enemies_list = [enemy for enemy in self.enemies_list if enemy.is_alive]
-        enemies_after = len(self.enemies_list)
-        enemies_killed = enemies_before - enemies_after
+        # Mettre à jour tous les ennemis (en quelques passes NumPy avec le stockage)
+        if self.enemies_list:
+            self.flow_field.update(self.world, self.player.position_x, self.player.position_y)
+        if self.enemy_store is not None:
+            self.enemy_store.update(self.delta_time, self.player, self.obstacles, self.flow_field)
+        else:
+            # Sans planificateur, chaque ennemi décide à chaque frame
+            think = self.ai_scheduler is None
+            if not think:
+                player_positions = [(self.player.position_x, self.player.position_y)]
+                self.ai_scheduler.update(self.enemies_list, self.player, player_positions, self.enemy_hash,
+                                         obstacles=self.obstacles)
+            if self.enemy_lod is not None:
+                self.enemy_lod.update(self.enemies_list, self.delta_time, self.player, lod_anchors,
+                                      self.obstacles, self.flow_field, think)
+            else:
+                for enemy in self.enemies_list:
+                    enemy.update(self.delta_time, self.player, obstacles=self.obstacles, flow_field=self.flow_field,
+                                 think=think)
+
+        # Écarter les ennemis qui se chevauchent
+        if self.crowd is not None:
+            if self.enemy_store is not None:
+                self.crowd.apply_store(self.enemy_store, self.world)
+            else:
+                self.crowd.apply(self.enemies_list, self.world)
+
+        # Faire avancer les projectiles des tourelles et infliger leurs dégâts
+        if self.projectiles is not None:
+            self.projectiles.update(self.delta_time, self.enemies_list, self.enemy_store)
+
+        # Retirer les ennemis tués et les compter
+        enemies_killed = len(self.remove_dead_enemies())
         if enemies_killed > 0:
             self.stats['enemies_killed'] += enemies_killed
 
-        # Retirer les murs détruits
-        walls_before = len([b for b in self.buildings_list if hasattr(b, 'is_obstacle') and b.is_obstacle])
-        self.buildings_list = [
-            building for building in self.buildings_list
-            if not (hasattr(building, 'durability') and building.durability <= 0)
-        ]
-        walls_after = len([b for b in self.buildings_list if hasattr(b, 'is_obstacle') and b.is_obstacle])
-        walls_destroyed = walls_before - walls_after
-        if walls_destroyed > 0:
-            print(f"{walls_destroyed} mur(s) détruit(s) !")
-
-        # Calculer si c'est la nuit pour spawn accéléré
-        day_progress = (self.total_elapsed_time % SECONDS_PER_DAY) / SECONDS_PER_DAY
-        is_night = day_progress > DAY_PHASE_DURATION
-        spawn_multiplier = NIGHT_ENEMY_SPAWN_MULTIPLIER if is_night else 1.0
-
-        # Faire apparaître des zombies périodiquement (plus rapide la nuit)
-        self.zombie_spawn_timer += self.delta_time * spawn_multiplier
-        if self.zombie_spawn_timer >= ZOMBIE_SPAWN_INTERVAL:
-            self.zombie_spawn_timer = 0
-            map_size = GRID_SIZE * TILE_SIZE
-            new_zombie = spawn_zombie_randomly(map_size)
-            self.enemies_list.append(new_zombie)
-            print("Un zombie est apparu !")
-
-        # Faire apparaître des mutants périodiquement (plus rapide la nuit)
-        self.mutant_spawn_timer += self.delta_time * spawn_multiplier
-        if self.mutant_spawn_timer >= MUTANT_SPAWN_INTERVAL:
-            self.mutant_spawn_timer = 0
-            map_size = GRID_SIZE * TILE_SIZE
-            new_mutant = spawn_mutant_randomly(map_size)
-            self.enemies_list.append(new_mutant)
-            print("Un mutant est apparu !")
-
-        # Faire apparaître des loups périodiquement en meutes (plus rapide la nuit)
-        self.wolf_spawn_timer += self.delta_time * spawn_multiplier
-        if self.wolf_spawn_timer >= WOLF_SPAWN_INTERVAL:
-            self.wolf_spawn_timer = 0
-            map_size = GRID_SIZE * TILE_SIZE
-            pack_size = random.randint(1, 3)  # Meute de 1 à 3 loups
-            for _ in range(pack_size):
-                new_wolf = spawn_wolf_randomly(map_size)
-                self.enemies_list.append(new_wolf)
-            print(f"Une meute de {pack_size} loup(s) est apparue !")
+        # Retirer les murs détruits (déjà sortis du calque des obstacles, leur case redevient libre dans le monde)
+        destroyed_walls = self.obstacles.pop_destroyed()
+        if destroyed_walls:
+            for wall in destroyed_walls:
+                self.remove_building(wall)
+            print(f"{len(destroyed_walls)} mur(s) détruit(s) !")
+
+        # Faire apparaître les ennemis décidés par le directeur (plus vite la nuit, dans le budget et sous le plafond)
+        player_positions, views = self.get_spawn_views()
+        for kind, positions in self.spawn_director.update(self.delta_time, self.total_elapsed_time, len(self.enemies_list),
+                                                          player_positions, views, self.world, self.turret_coverage):
+            self.spawn_wave(kind, positions=positions)
+            print(spawn_message(kind, len(positions)))
 
         # Mettre à jour la caméra (centrer sur le joueur)
         self.update_camera()
@@ -541,6 +654,10 @@ class Game:
         self.camera_offset_x = self.player.position_x - self.screen_width // 2
         self.camera_offset_y = self.player.position_y - self.screen_height // 2
 
+        # Le monde infini n'a pas de bords : la caméra suit librement le joueur
+        if self.world.is_infinite:
+            return
+
         # Limiter la caméra aux bords de la carte
         map_width = GRID_SIZE * TILE_SIZE
         map_height = GRID_SIZE * TILE_SIZE
@@ -548,6 +665,158 @@ class Game:
         self.camera_offset_x = max(0, min(self.camera_offset_x, map_width - self.screen_width))
         self.camera_offset_y = max(0, min(self.camera_offset_y, map_height - self.screen_height))
 
+    def get_spawn_views(self):
+        """
+        Positions et zones visibles des joueurs, pour placer les apparitions hors écran
+        Returns:
+            Tuple (positions (x, y), zones (gauche, haut, droite, bas)) en pixels
+        """
+        # Caméra recentrée sur la position actuelle du joueur
+        self.update_camera()
+        player_positions = [(self.player.position_x, self.player.position_y)]
+        views = [(self.camera_offset_x, self.camera_offset_y,
+                  self.camera_offset_x + self.screen_width, self.camera_offset_y + self.screen_height)]
+        return player_positions, views
+
+    def spawn_wave(self, kind, count=0, edge_distribution=None, positions=None):
+        """
+        Fait apparaître une vague d'ennemis d'un même type hors de l'écran et les ajoute à la partie
+        (ennemis morts réutilisés en priorité)
+        Args:
+            kind: Type d'ennemi ('zombie', 'mutant' ou 'wolf')
+            count: Nombre d'ennemis demandés hors calendrier (le directeur des apparitions peut
+                   réduire la vague : plafond, budget de menace)
+            edge_distribution: Poids des bords de l'écran (haut, droite, bas, gauche), optionnel (bords équiprobables)
+            positions: Points d'apparition déjà décidés par le directeur (SpawnDirector.update),
+                       optionnel (sinon la vague de count ennemis est décidée ici)
+        Returns:
+            Liste des ennemis apparus
+        """
+        if positions is None:
+            player_positions, views = self.get_spawn_views()
+            positions = self.spawn_director.plan_wave(kind, count, len(self.enemies_list), player_positions, views,
+                                                      self.world, self.total_elapsed_time, edge_distribution,
+                                                      coverage=self.turret_coverage)
+        enemy_class = ENEMY_CLASSES[kind]
+        new_enemies = [self.create_enemy(enemy_class, spawn_x, spawn_y) for spawn_x, spawn_y in positions]
+        self.enemies_list.extend(new_enemies)
+        return new_enemies
+
+    def create_enemy(self, enemy_class, spawn_x, spawn_y):
+        """
+        Crée un ennemi, ou réutilise un ennemi mort de la réserve
+        Args:
+            enemy_class: Classe de l'ennemi (Zombie, Mutant, Wolf)
+            spawn_x, spawn_y: Position d'apparition (en pixels)
+        Returns:
+            Instance de l'ennemi
+        """
+        enemy_class = self.resolve_enemy_class(enemy_class)
+        if self.enemy_pool is None:
+            return enemy_class(spawn_x, spawn_y)
+        return self.enemy_pool.acquire(enemy_class, spawn_x, spawn_y)
+
+    def resolve_enemy_class(self, enemy_class):
+        """
+        Retourne la classe à instancier pour un type d'ennemi
+        Args:
+            enemy_class: Classe de l'ennemi (Zombie, Mutant, Wolf)
+        Returns:
+            La classe elle-même, ou sa vue sur le stockage NumPy si ENEMY_STORE_ENABLED
+        """
+        if self.enemy_store is None:
+            return enemy_class
+        return self.enemy_store.view_class(enemy_class)
+
+    def remove_dead_enemies(self):
+        """
+        Retire les ennemis morts de la liste (rendus à la réserve pour être réutilisés)
+        Returns:
+            Liste des ennemis retirés
+        """
+        if self.enemy_store is not None:
+            # Morts trouvés en une passe sur les tableaux : la liste n'est refiltrée que s'il y en a
+            dead_enemies = self.enemy_store.remove_dead()
+            if dead_enemies:
+                self.enemies_list = [enemy for enemy in self.enemies_list if enemy.is_alive]
+        else:
+            dead_enemies = [enemy for enemy in self.enemies_list if not enemy.is_alive]
+            if dead_enemies:
+                self.enemies_list = [enemy for enemy in self.enemies_list if enemy.is_alive]
+
+        if dead_enemies and self.enemy_pool is not None:
+            self.enemy_pool.release(dead_enemies)
+        return dead_enemies
+
+    def add_building(self, building):
+        """
+        Ajoute un bâtiment au jeu (les murs sont enregistrés comme obstacles dans le monde
+        et rangés dans le calque des obstacles)
+        Args:
+            building: Instance du bâtiment
+        Returns:
+            True si le bâtiment est ajouté, False si sa case est déjà occupée
+        """
+        if not self.building_index.add(building):
+            return False
+        self.buildings_list.add(building)
+        if self.production is not None and building.category == 'producer':
+            self.production.add(building)
+        if getattr(building, 'is_obstacle', False):
+            self.world.set_obstacle(building.grid_x, building.grid_y, True)
+            self.obstacles.add(building)
+            if self.pathfinder is not None:
+                self.pathfinder.on_tile_changed(building.grid_x, building.grid_y)
+        if isinstance(building, Turret):
+            self.turret_coverage.add(building)
+        return True
+
+    def remove_building(self, building):
+        """
+        Retire un bâtiment du jeu (bâtiment détruit) : registre, index des cases, moteur de
+        production, calque des obstacles et carte de couverture des tourelles
+        Args:
+            building: Instance du bâtiment
+        Returns:
+            True si le bâtiment est retiré, False s'il n'était pas dans le jeu
+        """
+        if not self.buildings_list.remove(building):
+            return False
+        self.building_index.remove(building)
+        if self.production is not None and building.category == 'producer':
+            self.production.remove(building)
+        if getattr(building, 'is_obstacle', False):
+            self.obstacles.remove(building)
+            self.world.set_obstacle(building.grid_x, building.grid_y, False)
+            if self.pathfinder is not None:
+                self.pathfinder.on_tile_changed(building.grid_x, building.grid_y)
+        if isinstance(building, Turret):
+            self.turret_coverage.remove(building)
+        return True
+
+    def create_pathfinder(self):
+        """
+        Construit le pathfinding hiérarchique du monde actuel
+        Returns:
+            HierarchicalPathfinder, ou None pour le monde infini
+        """
+        if self.world.is_infinite:
+            return None
+        return HierarchicalPathfinder(self.world)
+
+    def update_debug_path(self):
+        """Recalcule l'itinéraire affiché en mode debug si le joueur ou la souris a changé de case"""
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        start_x = int(self.player.position_x // TILE_SIZE)
+        start_y = int(self.player.position_y // TILE_SIZE)
+        goal_x = int((mouse_x + self.camera_offset_x) // TILE_SIZE)
+        goal_y = int((mouse_y + self.camera_offset_y) // TILE_SIZE)
+        path = self.debug_path
+        if path is not None and not path.is_stale and path.waypoints[0] == (start_x, start_y) \
+                and path.goal == (goal_x, goal_y):
+            return
+        self.debug_path = self.pathfinder.find_path(start_x, start_y, goal_x, goal_y)
+
     def render(self):
         """Dessine tous les éléments du jeu à l'écran"""
         # Fond noir
@@ -556,17 +825,38 @@ class Game:
         # Dessiner le monde (grille de terrain)
         self.world.draw(self.screen, self.camera_offset_x, self.camera_offset_y)
 
+        # Zones défendues par les tourelles (F4)
+        if self.show_turret_coverage:
+            self.turret_coverage.draw(self.screen, self.camera_offset_x, self.camera_offset_y,
+                                      self.screen_width, self.screen_height)
+
         # Dessiner tous les bâtiments
         for building in self.buildings_list:
             building.draw(self.screen, self.camera_offset_x, self.camera_offset_y)
 
-        # Dessiner tous les ennemis
-        for enemy in self.enemies_list:
+        # Dessiner les ennemis visibles à l'écran
+        if self.enemy_store is not None:
+            enemies_on_screen = self.enemy_store.visible_enemies(self.camera_offset_x, self.camera_offset_y,
+                                                                 self.screen_width, self.screen_height)
+        else:
+            enemies_on_screen = visible_enemies(self.enemies_list, self.camera_offset_x, self.camera_offset_y,
+                                                self.screen_width, self.screen_height)
+        for enemy in enemies_on_screen:
             enemy.draw(self.screen, self.camera_offset_x, self.camera_offset_y)
 
+        # Dessiner les projectiles visibles
+        if self.projectiles is not None:
+            self.projectiles.draw(self.screen, self.camera_offset_x, self.camera_offset_y,
+                                  self.screen_width, self.screen_height)
+
         # Dessiner le joueur
         self.player.draw(self.screen, self.camera_offset_x, self.camera_offset_y)
 
+        # Mode debug : clusters du pathfinding et itinéraire vers la souris
+        if self.show_path_debug and self.pathfinder is not None:
+            self.update_debug_path()
+            self.pathfinder.draw_debug(self.screen, self.camera_offset_x, self.camera_offset_y, self.debug_path)
+
         # Appliquer l'overlay de nuit si c'est la nuit
         day_progress = (self.total_elapsed_time % SECONDS_PER_DAY) / SECONDS_PER_DAY
         self.is_night = day_progress > DAY_PHASE_DURATION
@@ -666,7 +956,8 @@ class Game:
             # Dessiner le jeu
             self.render()
 
-        # Fermer Pygame proprement
+        # Arrêter la génération du monde en arrière-plan et fermer Pygame proprement
+        self.world.close()
         pygame.quit()
         sys.exit()
 
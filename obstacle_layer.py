@@ -0,0 +1,157 @@
+"""
+OBSTACLE_LAYER.PY
+=================
+Ce fichier contient le calque des obstacles : les murs rangés par case, {(case_x, case_y): mur}.
+- "Murs à moins de R pixels" ne lit que les cases voisines dont le centre peut être à portée,
+  quel que soit le nombre de murs de la base.
+- Un mur dont la durabilité tombe à zéro (via damage) quitte le calque en O(1) et est noté
+  dans la liste des murs détruits, que Game.update relève une fois par frame.
+Les entrées (centre_x, centre_y, mur) et le compteur de version suivent l'interface de
+SpatialHash, ce qui permet à EnemyStore de mettre en cache ses tableaux de murs.
+"""
+
+import math
+from constants import *
+
+
+class ObstacleLayer:
+    """Murs indexés par case, requêtes de proximité par cases voisines"""
+
+    def __init__(self):
+        """Initialise un calque vide"""
+        self._tiles = {}
+        # Murs détruits depuis le dernier relevé (voir pop_destroyed)
+        self._destroyed = []
+        # Incrémenté à chaque modification (permet de savoir si des données dérivées sont à jour)
+        self.version = 0
+
+    def __len__(self):
+        return len(self._tiles)
+
+    # --- Mise à jour ---
+
+    def clear(self):
+        """Vide le calque"""
+        self._tiles.clear()
+        self._destroyed.clear()
+        self.version += 1
+
+    def add(self, wall):
+        """
+        Ajoute un mur sur sa case
+        Args:
+            wall: Mur (grid_x, grid_y)
+        """
+        self._tiles[(wall.grid_x, wall.grid_y)] = wall
+        self.version += 1
+
+    def remove(self, wall):
+        """
+        Retire un mur de sa case
+        Args:
+            wall: Mur à retirer
+        Returns:
+            True si le mur était dans le calque
+        """
+        tile = (wall.grid_x, wall.grid_y)
+        if self._tiles.get(tile) is not wall:
+            return False
+        del self._tiles[tile]
+        self.version += 1
+        return True
+
+    def damage(self, wall, damage_amount):
+        """
+        Inflige des dégâts à un mur ; s'il est détruit, il quitte le calque immédiatement
+        Args:
+            wall: Mur attaqué
+            damage_amount: Quantité de dégâts
+        Returns:
+            True si le mur est détruit
+        """
+        if not wall.take_damage(damage_amount):
+            return False
+        if self.remove(wall):
+            self._destroyed.append(wall)
+        return True
+
+    def pop_destroyed(self):
+        """
+        Relève les murs détruits depuis le dernier appel
+        Returns:
+            Liste des murs détruits (retirés du calque)
+        """
+        destroyed, self._destroyed = self._destroyed, []
+        return destroyed
+
+    # --- Requêtes ---
+
+    def get(self, grid_x, grid_y):
+        """Retourne le mur d'une case, ou None"""
+        return self._tiles.get((grid_x, grid_y))
+
+    def entries(self):
+        """Génère toutes les entrées (centre_x, centre_y, mur) du calque"""
+        for (grid_x, grid_y), wall in self._tiles.items():
+            yield grid_x * TILE_SIZE + TILE_SIZE // 2, grid_y * TILE_SIZE + TILE_SIZE // 2, wall
+
+    def _tile_range(self, position, radius):
+        """Cases dont le centre peut être à moins de radius pixels d'une coordonnée (sur un axe)"""
+        half = TILE_SIZE // 2
+        return range(math.ceil((position - radius - half) / TILE_SIZE),
+                     math.floor((position + radius - half) / TILE_SIZE) + 1)
+
+    def query_radius(self, position_x, position_y, radius):
+        """
+        Liste les murs dont le centre est dans un cercle
+        Args:
+            position_x, position_y: Centre du cercle en pixels
+            radius: Rayon en pixels (inclus)
+        Returns:
+            Liste des murs
+        """
+        tiles = self._tiles
+        radius_sq = radius * radius
+        found = []
+        for grid_y in self._tile_range(position_y, radius):
+            center_y = grid_y * TILE_SIZE + TILE_SIZE // 2
+            for grid_x in self._tile_range(position_x, radius):
+                wall = tiles.get((grid_x, grid_y))
+                if wall is None:
+                    continue
+                center_x = grid_x * TILE_SIZE + TILE_SIZE // 2
+                if (center_x - position_x) ** 2 + (center_y - position_y) ** 2 <= radius_sq:
+                    found.append(wall)
+        return found
+
+    def nearest(self, position_x, position_y, max_distance, predicate=None):
+        """
+        Trouve le mur le plus proche d'une position (centre du mur à max_distance pixels au plus)
+        Args:
+            position_x, position_y: Position de départ en pixels
+            max_distance: Distance maximale en pixels (incluse)
+            predicate: Fonction mur -> bool pour ignorer certains murs (optionnelle)
+        Returns:
+            Le mur le plus proche, ou None
+        """
+        tiles = self._tiles
+        if not tiles:
+            return None
+
+        best_wall = None
+        best_distance_sq = max_distance * max_distance
+        for grid_y in self._tile_range(position_y, max_distance):
+            center_y = grid_y * TILE_SIZE + TILE_SIZE // 2
+            for grid_x in self._tile_range(position_x, max_distance):
+                wall = tiles.get((grid_x, grid_y))
+                if wall is None:
+                    continue
+                center_x = grid_x * TILE_SIZE + TILE_SIZE // 2
+                distance_sq = (center_x - position_x) ** 2 + (center_y - position_y) ** 2
+                if distance_sq > best_distance_sq or (distance_sq == best_distance_sq and best_wall is not None):
+                    continue
+                if predicate is not None and not predicate(wall):
+                    continue
+                best_distance_sq = distance_sq
+                best_wall = wall
+        return best_wall
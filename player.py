@@ -81,22 +81,12 @@ class Player:
         # Vérifier le terrain actuel pour appliquer les effets (désert)
         current_grid_x = int(self.position_x // TILE_SIZE)
         current_grid_y = int(self.position_y // TILE_SIZE)
-        movement_speed = PLAYER_MOVEMENT_SPEED
-
-        if 0 <= current_grid_x < GRID_SIZE and 0 <= current_grid_y < GRID_SIZE:
-            current_terrain = world.grid_terrain[current_grid_y][current_grid_x]
-            # Pénalité de vitesse dans le désert
-            if current_terrain == TERRAIN_DESERT or current_terrain == TERRAIN_ENERGY_CRYSTAL:
-                movement_speed *= DESERT_SPEED_PENALTY
+        movement_speed = PLAYER_MOVEMENT_SPEED * world.get_speed_multiplier(current_grid_x, current_grid_y)
 
         # Calculer la nouvelle position
         new_position_x = self.position_x + direction_x * movement_speed
         new_position_y = self.position_y + direction_y * movement_speed
 
-        # Vérifier les limites du monde
-        map_width = GRID_SIZE * TILE_SIZE
-        map_height = GRID_SIZE * TILE_SIZE
-
         # Convertir en coordonnées de grille pour vérifier le terrain
         grid_x = int(new_position_x // TILE_SIZE)
         grid_y = int(new_position_y // TILE_SIZE)
@@ -106,11 +96,12 @@ class Player:
         can_move_y = world.is_tile_walkable(int(self.position_x // TILE_SIZE), grid_y)
 
         # Déplacer sur X si possible
-        if 0 <= new_position_x <= map_width - self.player_size and can_move_x:
+        # (le monde vérifie ses propres limites : aucune dans un monde infini)
+        if can_move_x and world.contains_position(new_position_x, self.position_y, self.player_size):
             self.position_x = new_position_x
 
         # Déplacer sur Y si possible
-        if 0 <= new_position_y <= map_height - self.player_size and can_move_y:
+        if can_move_y and world.contains_position(self.position_x, new_position_y, self.player_size):
             self.position_y = new_position_y
 
     def harvest_resource(self, world, mouse_x, mouse_y, camera_offset_x, camera_offset_y):
@@ -124,51 +115,30 @@ class Player:
             True si une ressource a été récoltée, False sinon
         """
         # Convertir position souris en position grille (avec décalage caméra)
-        grid_x = (mouse_x + camera_offset_x) // TILE_SIZE
-        grid_y = (mouse_y + camera_offset_y) // TILE_SIZE
-
-        # Vérifier que c'est dans les limites
-        if 0 <= grid_x < GRID_SIZE and 0 <= grid_y < GRID_SIZE:
-            terrain_type = world.grid_terrain[grid_y][grid_x]
-
-            # Calculer quantité récoltée (bonus si outils)
-            harvest_amount = PLAYER_HARVEST_AMOUNT
-            if self.inventory.get('tools', 0) > 0:
-                harvest_amount = int(PLAYER_HARVEST_AMOUNT * TOOL_HARVEST_MULTIPLIER)
-
-            # Bonus de recherche niveau 1 : Outils Améliorés (+2 récolte)
-            research_level = self.inventory.get('_research_level', 0)
-            if research_level >= 1:
-                harvest_amount += 2
-
-            # Récolter selon le type de terrain
-            if terrain_type == TERRAIN_METAL:
-                self.inventory[RESOURCE_METAL] += harvest_amount
-                world.grid_terrain[grid_y][grid_x] = TERRAIN_GRASS  # Ressource épuisée
-                world.depleted_tiles[(grid_x, grid_y)] = RESOURCE_RESPAWN_TIME
-                return True
-            elif terrain_type == TERRAIN_FOOD:
-                self.inventory[RESOURCE_FOOD] += harvest_amount
-                world.grid_terrain[grid_y][grid_x] = TERRAIN_GRASS
-                world.depleted_tiles[(grid_x, grid_y)] = RESOURCE_RESPAWN_TIME
-                return True
-            elif terrain_type == TERRAIN_WOOD:
-                self.inventory[RESOURCE_WOOD] += harvest_amount
-                world.grid_terrain[grid_y][grid_x] = TERRAIN_GRASS
-                world.depleted_tiles[(grid_x, grid_y)] = RESOURCE_RESPAWN_TIME
-                return True
-            elif terrain_type == TERRAIN_STONE:
-                self.inventory[RESOURCE_STONE] += harvest_amount
-                world.grid_terrain[grid_y][grid_x] = TERRAIN_GRASS
-                world.depleted_tiles[(grid_x, grid_y)] = RESOURCE_RESPAWN_TIME
-                return True
-            elif terrain_type == TERRAIN_ENERGY_CRYSTAL:
-                self.inventory[RESOURCE_ENERGY] += harvest_amount
-                world.grid_terrain[grid_y][grid_x] = TERRAIN_DESERT  # Redevient désert
-                world.depleted_tiles[(grid_x, grid_y)] = RESOURCE_RESPAWN_TIME
-                return True
-
-        return False
+        grid_x = int((mouse_x + camera_offset_x) // TILE_SIZE)
+        grid_y = int((mouse_y + camera_offset_y) // TILE_SIZE)
+
+        # Terrain de la case (None si hors des limites)
+        terrain_type = world.get_terrain(grid_x, grid_y)
+        if terrain_type not in TERRAIN_HARVEST_RESULTS:
+            return False
+
+        # Calculer quantité récoltée (bonus si outils)
+        harvest_amount = PLAYER_HARVEST_AMOUNT
+        if self.inventory.get('tools', 0) > 0:
+            harvest_amount = int(PLAYER_HARVEST_AMOUNT * TOOL_HARVEST_MULTIPLIER)
+
+        # Bonus de recherche niveau 1 : Outils Améliorés (+2 récolte)
+        research_level = self.inventory.get('_research_level', 0)
+        if research_level >= 1:
+            harvest_amount += 2
+
+        # Récolter selon le type de terrain (table ressource / terrain épuisé)
+        resource, depleted_terrain = TERRAIN_HARVEST_RESULTS[terrain_type]
+        self.inventory[resource] += harvest_amount
+        world.set_terrain(grid_x, grid_y, depleted_terrain)  # Ressource épuisée
+        world.schedule_respawn(grid_x, grid_y, RESOURCE_RESPAWN_TIME)
+        return True
 
     def eat_food(self, amount=50):
         """
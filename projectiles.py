@@ -0,0 +1,247 @@
+"""
+PROJECTILES.PY
+==============
+Ce fichier contient les projectiles tirés par les tourelles.
+Tous les projectiles sont rangés dans des tableaux NumPy parallèles alloués d'avance (position,
+vitesse, dégâts, tireur, durée de vie restante) : les projectiles actifs occupent les cases
+0 à count - 1, un projectile terminé libère sa case en fin de frame (tableaux recompactés).
+À chaque frame, une seule passe vectorisée les fait avancer, puis les collisions sont cherchées
+sur une grille des ennemis (CellGrid, spatial_hash.py) : chaque projectile ne teste que les
+ennemis des 4 cellules les plus proches de sa position. Le test porte sur le segment parcouru pendant
+la frame, un projectile rapide ne traverse donc pas un ennemi sans le toucher.
+Un projectile touche le premier ennemi rencontré sur son trajet, puis disparaît.
+"""
+
+import pygame
+import numpy as np
+from constants import *
+from spatial_hash import CellGrid
+
+# Tableaux des projectiles : (nom, type NumPy)
+PROJECTILE_FIELDS = (
+    ('position_x', np.float64),
+    ('position_y', np.float64),
+    ('velocity_x', np.float64),
+    ('velocity_y', np.float64),
+    ('damage', np.float64),
+    ('owner', np.int64),
+    ('time_to_live', np.float64),
+)
+
+# Couleur des projectiles à l'écran
+PROJECTILE_COLOR = (255, 220, 80)
+
+
+class ProjectileSystem:
+    """Projectiles des tourelles : la case i de chaque tableau décrit le projectile i"""
+
+    def __init__(self, capacity=PROJECTILE_CAPACITY, radius=PROJECTILE_RADIUS):
+        """
+        Initialise un système vide
+        Args:
+            capacity: Nombre de projectiles alloués au départ (agrandi au besoin)
+            radius: Rayon des projectiles en pixels
+        """
+        self.capacity = capacity
+        self.radius = radius
+        self.count = 0
+        for name, dtype in PROJECTILE_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+        # Statistiques (tirs, projectiles ayant touché un ennemi)
+        self.fired = 0
+        self.hits = 0
+
+        # Sprite d'un projectile (créé au premier dessin)
+        self._sprite = None
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Retire tous les projectiles (chargement d'une partie)"""
+        self.count = 0
+
+    def fire(self, start_x, start_y, target_x, target_y, damage, owner, speed=PROJECTILE_SPEED, time_to_live=PROJECTILE_TTL):
+        """
+        Tire un projectile vers un point
+        Args:
+            start_x, start_y: Position de départ en pixels
+            target_x, target_y: Point visé en pixels
+            damage: Dégâts infligés à l'ennemi touché
+            owner: Identifiant du tireur (tourelle)
+            speed: Vitesse en pixels par seconde
+            time_to_live: Durée de vie en secondes
+        Returns:
+            True si le projectile est tiré (False si le point visé est le point de départ)
+        """
+        direction_x = target_x - start_x
+        direction_y = target_y - start_y
+        length = (direction_x * direction_x + direction_y * direction_y) ** 0.5
+        if length == 0:
+            return False
+
+        # Tableaux pleins : doubler leur taille
+        if self.count == self.capacity:
+            self.capacity *= 2
+            for name, _ in PROJECTILE_FIELDS:
+                array = getattr(self, name)
+                grown = np.zeros(self.capacity, dtype=array.dtype)
+                grown[:self.count] = array[:self.count]
+                setattr(self, name, grown)
+
+        slot = self.count
+        self.position_x[slot] = start_x
+        self.position_y[slot] = start_y
+        self.velocity_x[slot] = direction_x / length * speed
+        self.velocity_y[slot] = direction_y / length * speed
+        self.damage[slot] = damage
+        self.owner[slot] = owner
+        self.time_to_live[slot] = time_to_live
+        self.count += 1
+        self.fired += 1
+        return True
+
+    # --- Simulation ---
+
+    def update(self, delta_time, enemies_list, enemy_store=None):
+        """
+        Fait avancer tous les projectiles, inflige les dégâts des collisions et retire
+        les projectiles terminés (ennemi touché ou durée de vie écoulée)
+        Args:
+            delta_time: Temps écoulé depuis la dernière frame
+            enemies_list: Liste des ennemis
+            enemy_store: Stockage NumPy des ennemis (optionnel, positions lues dans ses tableaux)
+        Returns:
+            Nombre de projectiles ayant touché un ennemi
+        """
+        count = self.count
+        if count == 0:
+            return 0
+
+        # Déplacement de tous les projectiles en une passe (départ gardé pour le test du segment)
+        position_x, position_y = self.position_x[:count], self.position_y[:count]
+        start_x, start_y = position_x.copy(), position_y.copy()
+        position_x += self.velocity_x[:count] * delta_time
+        position_y += self.velocity_y[:count] * delta_time
+        time_to_live = self.time_to_live[:count]
+        time_to_live -= delta_time
+
+        finished = time_to_live <= 0
+        hit_count = self._resolve_hits(delta_time, start_x, start_y, finished, enemies_list, enemy_store)
+
+        # Recompacter : les projectiles restants reprennent les premières cases
+        if finished.any():
+            remaining = np.flatnonzero(~finished)
+            for name, _ in PROJECTILE_FIELDS:
+                array = getattr(self, name)
+                array[:len(remaining)] = array[remaining]
+            self.count = len(remaining)
+        return hit_count
+
+    def _enemy_targets(self, enemies_list, enemy_store):
+        """
+        Centres, rayons et objets des ennemis vivants
+        Returns:
+            Tuple (centre x, centre y, rayon, ennemis) ; tableaux vides s'il n'y a aucun ennemi vivant
+        """
+        if enemy_store is not None:
+            slots = np.flatnonzero(enemy_store.is_alive[:enemy_store.count])
+            half_size = enemy_store.enemy_size[slots] / 2
+            return (enemy_store.position_x[slots] + half_size, enemy_store.position_y[slots] + half_size,
+                    half_size, [enemy_store.enemies[slot] for slot in slots.tolist()])
+
+        alive = [enemy for enemy in enemies_list if enemy.is_alive]
+        half_size = np.fromiter((enemy.enemy_size for enemy in alive), dtype=np.float64, count=len(alive)) / 2
+        center_x = np.fromiter((enemy.position_x for enemy in alive), dtype=np.float64, count=len(alive)) + half_size
+        center_y = np.fromiter((enemy.position_y for enemy in alive), dtype=np.float64, count=len(alive)) + half_size
+        return center_x, center_y, half_size, alive
+
+    def _resolve_hits(self, delta_time, start_x, start_y, finished, enemies_list, enemy_store):
+        """
+        Cherche le premier ennemi touché par chaque projectile pendant la frame et inflige les dégâts
+        Args:
+            delta_time: Temps écoulé depuis la dernière frame
+            start_x, start_y: Positions des projectiles avant le déplacement
+            finished: Tableau des projectiles terminés (complété avec ceux qui touchent)
+            enemies_list, enemy_store: Voir update
+        Returns:
+            Nombre de projectiles ayant touché un ennemi
+        """
+        center_x, center_y, enemy_radius, targets = self._enemy_targets(enemies_list, enemy_store)
+        if not targets:
+            return 0
+        count = self.count
+        end_x, end_y = self.position_x[:count], self.position_y[:count]
+        step_x, step_y = end_x - start_x, end_y - start_y
+
+        # Cellules deux fois plus grandes que la portée d'un test (rayons et trajet de la frame) :
+        # tout ennemi touché est dans le carré de 4 cellules le plus proche de la position d'arrivée
+        max_step = float(np.sqrt((self.velocity_x[:count] ** 2 + self.velocity_y[:count] ** 2).max())) * delta_time
+        reach = enemy_radius.max() + self.radius + max_step
+        grid = CellGrid(center_x, center_y, max(PROJECTILE_GRID_CELL_SIZE, 2 * reach))
+
+        # Paires (projectile, ennemi candidat) : tous les ennemis des 4 cellules de chaque projectile
+        starts, sizes, _ = grid.blocks(end_x, end_y)
+        sizes[finished] = 0
+        occupied = np.flatnonzero(sizes)
+        if len(occupied) == 0:
+            return 0
+        starts, sizes = starts.ravel()[occupied], sizes.ravel()[occupied]
+        total = int(sizes.sum())
+        ranks = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        pair_bullets = np.repeat(occupied // 4, sizes)
+        pair_enemies = grid.order[np.repeat(starts, sizes) + ranks]
+
+        # Point du segment parcouru le plus proche du centre de l'ennemi (t : fraction du trajet)
+        segment_x, segment_y = step_x[pair_bullets], step_y[pair_bullets]
+        relative_x = center_x[pair_enemies] - start_x[pair_bullets]
+        relative_y = center_y[pair_enemies] - start_y[pair_bullets]
+        length_sq = np.maximum(segment_x * segment_x + segment_y * segment_y, 1e-12)
+        along = np.clip((relative_x * segment_x + relative_y * segment_y) / length_sq, 0, 1)
+        gap_x = relative_x - along * segment_x
+        gap_y = relative_y - along * segment_y
+        reach = enemy_radius[pair_enemies] + self.radius
+        touching = np.flatnonzero(gap_x * gap_x + gap_y * gap_y <= reach * reach)
+        if len(touching) == 0:
+            return 0
+
+        # Premier ennemi rencontré sur le trajet de chaque projectile (à égalité, le premier de la liste)
+        touching = touching[np.lexsort((pair_enemies[touching], along[touching], pair_bullets[touching]))]
+        _, first = np.unique(pair_bullets[touching], return_index=True)
+        hit_bullets = pair_bullets[touching[first]]
+        hit_enemies = pair_enemies[touching[first]]
+        finished[hit_bullets] = True
+
+        # Dégâts cumulés par ennemi touché
+        damaged, position = np.unique(hit_enemies, return_inverse=True)
+        damage = np.bincount(position, weights=self.damage[hit_bullets])
+        for enemy_index, amount in zip(damaged.tolist(), damage.tolist()):
+            targets[enemy_index].take_damage(amount)
+
+        self.hits += len(hit_bullets)
+        return len(hit_bullets)
+
+    # --- Rendu ---
+
+    def draw(self, screen, camera_offset_x, camera_offset_y, screen_width, screen_height):
+        """
+        Dessine les projectiles visibles à l'écran
+        Args:
+            screen: Surface Pygame
+            camera_offset_x, camera_offset_y: Décalage de la caméra
+            screen_width, screen_height: Taille de l'écran
+        """
+        if self.count == 0:
+            return
+        if self._sprite is None:
+            self._sprite = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(self._sprite, PROJECTILE_COLOR, (self.radius, self.radius), self.radius)
+
+        screen_x = self.position_x[:self.count] - camera_offset_x - self.radius
+        screen_y = self.position_y[:self.count] - camera_offset_y - self.radius
+        visible = np.flatnonzero((screen_x > -self.radius * 2) & (screen_x < screen_width)
+                                 & (screen_y > -self.radius * 2) & (screen_y < screen_height))
+        sprite = self._sprite
+        screen.blits([(sprite, position) for position in zip(screen_x[visible].tolist(), screen_y[visible].tolist())],
+                     doreturn=False)
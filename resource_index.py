@@ -0,0 +1,268 @@
+"""
+RESOURCE_INDEX.PY
+=================
+Ce fichier contient l'index spatial des ressources du monde.
+Pour chaque type de terrain récoltable (métal, nourriture, bois, pierre, cristaux),
+les cases sont rangées dans des seaux de RESOURCE_INDEX_BUCKET_SIZE x RESOURCE_INDEX_BUCKET_SIZE cases.
+Les requêtes (ressource la plus proche, cases dans un rayon, comptage dans un rectangle)
+ne parcourent que les seaux concernés au lieu de toute la carte.
+L'index est tenu à jour par le monde à chaque modification de terrain (récolte, respawn).
+"""
+
+import math
+import numpy as np
+from constants import *
+
+# Terrains indexés : ceux qui donnent une ressource à la récolte
+INDEXED_TERRAINS = list(TERRAIN_HARVEST_RESULTS)
+INDEXED_CODES = {TERRAIN_CODES[terrain_type]: terrain_type for terrain_type in INDEXED_TERRAINS}
+
+
+class ResourceIndex:
+    """Index par seaux des cases de ressources, une grille de seaux par type de terrain"""
+
+    def __init__(self, bucket_size=RESOURCE_INDEX_BUCKET_SIZE):
+        """
+        Initialise un index vide
+        Args:
+            bucket_size: Côté d'un seau en cases
+        """
+        self.bucket_size = bucket_size
+
+        # Seaux non vides : {terrain: {(bucket_x, bucket_y): set((x, y))}}
+        self._buckets = {terrain_type: {} for terrain_type in INDEXED_TERRAINS}
+        # Nombre total de cases par terrain
+        self.counts = {terrain_type: 0 for terrain_type in INDEXED_TERRAINS}
+        # Étendue des seaux déjà utilisés : [min_x, min_y, max_x, max_y] (limite les recherches)
+        self._bucket_bounds = None
+
+    # --- Mise à jour ---
+
+    def _expand_bounds(self, bucket_x, bucket_y):
+        """Agrandit l'étendue connue des seaux"""
+        if self._bucket_bounds is None:
+            self._bucket_bounds = [bucket_x, bucket_y, bucket_x, bucket_y]
+            return
+        bounds = self._bucket_bounds
+        bounds[0] = min(bounds[0], bucket_x)
+        bounds[1] = min(bounds[1], bucket_y)
+        bounds[2] = max(bounds[2], bucket_x)
+        bounds[3] = max(bounds[3], bucket_y)
+
+    def add(self, terrain_type, grid_x, grid_y):
+        """Ajoute une case de ressource à l'index"""
+        bucket_key = (grid_x // self.bucket_size, grid_y // self.bucket_size)
+        bucket = self._buckets[terrain_type].get(bucket_key)
+        if bucket is None:
+            bucket = self._buckets[terrain_type][bucket_key] = set()
+            self._expand_bounds(*bucket_key)
+        if (grid_x, grid_y) not in bucket:
+            bucket.add((grid_x, grid_y))
+            self.counts[terrain_type] += 1
+
+    def remove(self, terrain_type, grid_x, grid_y):
+        """Retire une case de ressource de l'index (sans effet si elle n'y est pas)"""
+        bucket_key = (grid_x // self.bucket_size, grid_y // self.bucket_size)
+        bucket = self._buckets[terrain_type].get(bucket_key)
+        if bucket is None or (grid_x, grid_y) not in bucket:
+            return
+        bucket.remove((grid_x, grid_y))
+        self.counts[terrain_type] -= 1
+        if not bucket:
+            del self._buckets[terrain_type][bucket_key]
+
+    def update_tile(self, grid_x, grid_y, old_terrain, new_terrain):
+        """
+        Répercute le changement de terrain d'une case (récolte ou respawn)
+        Args:
+            grid_x, grid_y: Coordonnées de la case
+            old_terrain, new_terrain: Terrain avant et après la modification
+        """
+        if old_terrain == new_terrain:
+            return
+        if old_terrain in self._buckets:
+            self.remove(old_terrain, grid_x, grid_y)
+        if new_terrain in self._buckets:
+            self.add(new_terrain, grid_x, grid_y)
+
+    def add_region(self, codes, start_x=0, start_y=0):
+        """
+        Indexe toutes les ressources d'une zone de terrain (carte complète ou chunk)
+        Args:
+            codes: Tableau uint8 (hauteur, largeur) de codes de terrain
+            start_x, start_y: Position de la zone dans le monde (en cases)
+        """
+        size = self.bucket_size
+        for code, terrain_type in INDEXED_CODES.items():
+            tile_ys, tile_xs = np.nonzero(codes == code)
+            if len(tile_xs) == 0:
+                continue
+            tile_xs = tile_xs + start_x
+            tile_ys = tile_ys + start_y
+
+            # Regrouper les cases par seau (tri par clé de seau) puis remplir chaque seau d'un coup
+            bucket_xs, bucket_ys = tile_xs // size, tile_ys // size
+            order = np.lexsort((bucket_xs, bucket_ys))
+            tile_xs, tile_ys = tile_xs[order], tile_ys[order]
+            bucket_xs, bucket_ys = bucket_xs[order], bucket_ys[order]
+            starts = np.flatnonzero(np.r_[True, (bucket_xs[1:] != bucket_xs[:-1]) | (bucket_ys[1:] != bucket_ys[:-1])])
+            ends = np.r_[starts[1:], len(tile_xs)]
+
+            buckets = self._buckets[terrain_type]
+            for first, last in zip(starts.tolist(), ends.tolist()):
+                bucket_key = (int(bucket_xs[first]), int(bucket_ys[first]))
+                bucket = buckets.get(bucket_key)
+                if bucket is None:
+                    bucket = buckets[bucket_key] = set()
+                    self._expand_bounds(*bucket_key)
+                size_before = len(bucket)
+                bucket.update(zip(tile_xs[first:last].tolist(), tile_ys[first:last].tolist()))
+                self.counts[terrain_type] += len(bucket) - size_before
+
+    def remove_region(self, start_x, start_y, width, height):
+        """
+        Retire de l'index toutes les ressources d'une zone (chunk déchargé)
+        Args:
+            start_x, start_y: Coin haut-gauche de la zone (en cases)
+            width, height: Taille de la zone (en cases)
+        """
+        end_x, end_y = start_x + width, start_y + height
+        for terrain_type, buckets in self._buckets.items():
+            for bucket_key in self._bucket_keys_in_rect(start_x, start_y, end_x - 1, end_y - 1):
+                bucket = buckets.get(bucket_key)
+                if bucket is None:
+                    continue
+                inside = {(x, y) for (x, y) in bucket if start_x <= x < end_x and start_y <= y < end_y}
+                bucket -= inside
+                self.counts[terrain_type] -= len(inside)
+                if not bucket:
+                    del buckets[bucket_key]
+
+    def clear(self):
+        """Vide l'index"""
+        for terrain_type in INDEXED_TERRAINS:
+            self._buckets[terrain_type].clear()
+            self.counts[terrain_type] = 0
+        self._bucket_bounds = None
+
+    # --- Requêtes ---
+
+    def _bucket_keys_in_rect(self, min_x, min_y, max_x, max_y):
+        """Génère les clés des seaux qui intersectent un rectangle (bornes incluses, en cases)"""
+        size = self.bucket_size
+        for bucket_y in range(min_y // size, max_y // size + 1):
+            for bucket_x in range(min_x // size, max_x // size + 1):
+                yield bucket_x, bucket_y
+
+    def nearest(self, terrain_type, grid_x, grid_y, max_distance=None):
+        """
+        Trouve la case de ressource la plus proche d'une position
+        Les seaux sont parcourus en anneaux carrés de plus en plus larges ; la recherche
+        s'arrête dès qu'aucun anneau suivant ne peut contenir de case plus proche.
+        Args:
+            terrain_type: Terrain recherché (TERRAIN_METAL, TERRAIN_WOOD, ...)
+            grid_x, grid_y: Position de départ (en cases)
+            max_distance: Distance maximale de recherche en cases (optionnelle)
+        Returns:
+            Tuple (x, y) de la case la plus proche, ou None
+        """
+        buckets = self._buckets[terrain_type]
+        if not buckets:
+            return None
+
+        size = self.bucket_size
+        center_x, center_y = grid_x // size, grid_y // size
+
+        # Nombre d'anneaux nécessaires pour couvrir tous les seaux connus
+        min_x, min_y, max_x, max_y = self._bucket_bounds
+        max_ring = max(center_x - min_x, max_x - center_x, center_y - min_y, max_y - center_y)
+        if max_distance is not None:
+            max_ring = min(max_ring, max_distance // size + 1)
+
+        best_position = None
+        best_distance_sq = float('inf') if max_distance is None else max_distance * max_distance
+        for ring in range(max_ring + 1):
+            # Toute case d'un anneau r est à au moins (r - 1) * size cases de la position
+            if best_position is not None and ((ring - 1) * size) ** 2 >= best_distance_sq:
+                break
+
+            for bucket_key in self._ring_keys(center_x, center_y, ring):
+                bucket = buckets.get(bucket_key)
+                if bucket is None:
+                    continue
+                for x, y in bucket:
+                    distance_sq = (x - grid_x) ** 2 + (y - grid_y) ** 2
+                    if distance_sq < best_distance_sq or (distance_sq == best_distance_sq and best_position is None):
+                        best_distance_sq = distance_sq
+                        best_position = (x, y)
+        return best_position
+
+    @staticmethod
+    def _ring_keys(center_x, center_y, ring):
+        """Génère les clés des seaux situés exactement à `ring` seaux du centre (anneau carré)"""
+        if ring == 0:
+            yield center_x, center_y
+            return
+        for offset in range(-ring, ring + 1):
+            yield center_x + offset, center_y - ring
+            yield center_x + offset, center_y + ring
+        for offset in range(-ring + 1, ring):
+            yield center_x - ring, center_y + offset
+            yield center_x + ring, center_y + offset
+
+    def within_radius(self, terrain_type, grid_x, grid_y, radius):
+        """
+        Liste les cases de ressource dans un cercle
+        Args:
+            terrain_type: Terrain recherché
+            grid_x, grid_y: Centre du cercle (en cases)
+            radius: Rayon en cases
+        Returns:
+            Liste de tuples (x, y)
+        """
+        buckets = self._buckets[terrain_type]
+        radius_sq = radius * radius
+        radius_tiles = int(math.ceil(radius))
+
+        found = []
+        for bucket_key in self._bucket_keys_in_rect(grid_x - radius_tiles, grid_y - radius_tiles,
+                                                    grid_x + radius_tiles, grid_y + radius_tiles):
+            bucket = buckets.get(bucket_key)
+            if bucket is None:
+                continue
+            found.extend((x, y) for (x, y) in bucket if (x - grid_x) ** 2 + (y - grid_y) ** 2 <= radius_sq)
+        return found
+
+    def count_in_rect(self, terrain_type, min_x, min_y, max_x, max_y):
+        """
+        Compte les cases de ressource dans un rectangle
+        Les seaux entièrement inclus sont comptés sans parcourir leurs cases.
+        Args:
+            terrain_type: Terrain recherché
+            min_x, min_y, max_x, max_y: Bornes du rectangle en cases (incluses)
+        Returns:
+            Nombre de cases
+        """
+        buckets = self._buckets[terrain_type]
+        size = self.bucket_size
+
+        # Ne parcourir que la partie du rectangle qui contient des seaux
+        if self._bucket_bounds is None:
+            return 0
+        bounds = self._bucket_bounds
+        min_x, min_y = max(min_x, bounds[0] * size), max(min_y, bounds[1] * size)
+        max_x, max_y = min(max_x, bounds[2] * size + size - 1), min(max_y, bounds[3] * size + size - 1)
+        if min_x > max_x or min_y > max_y:
+            return 0
+
+        count = 0
+        for bucket_x, bucket_y in self._bucket_keys_in_rect(min_x, min_y, max_x, max_y):
+            bucket = buckets.get((bucket_x, bucket_y))
+            if bucket is None:
+                continue
+            if (min_x <= bucket_x * size and bucket_x * size + size - 1 <= max_x
+                    and min_y <= bucket_y * size and bucket_y * size + size - 1 <= max_y):
+                count += len(bucket)
+            else:
+                count += sum(1 for (x, y) in bucket if min_x <= x <= max_x and min_y <= y <= max_y)
+        return count
@@ -24,8 +24,12 @@ class SaveSystem:
         Returns:
             bool: True si sauvegarde réussie, False sinon
         """
+        # Timers des producteurs tenus par le moteur de production (voir production.py)
+        if getattr(game, 'production', None) is not None:
+            game.production.sync_timers()
+
         save_data = {
-            'version': '1.0',  # Pour compatibilité future
+            'version': '1.1',  # Pour compatibilité future
             'player': {
                 'position_x': game.player.position_x,
                 'position_y': game.player.position_y,
@@ -34,11 +38,7 @@ class SaveSystem:
                 'hunger_level': game.player.hunger_level,
                 'is_alive': game.player.is_alive
             },
-            'world': {
-                'grid_terrain': game.world.grid_terrain,  # Grille 2D
-                'original_terrain': game.world.original_terrain,  # Terrain original pour respawn
-                'depleted_tiles': [[x, y, timer] for (x, y), timer in game.world.depleted_tiles.items()]
-            },
+            'world': game.world.to_save_data(),  # Terrain encodé + ressources épuisées
             'buildings': [
                 {
                     'type': building.__class__.__name__.lower(),
@@ -46,13 +46,15 @@ class SaveSystem:
                     'grid_y': building.grid_y,
                     'production_timer': building.production_timer,
                     # Pour laboratoire
-                    'research_level': getattr(building, 'research_level', 0)
+                    'research_level': getattr(building, 'research_level', 0),
+                    # Pour tourelle
+                    'targeting': getattr(building, 'targeting', TURRET_DEFAULT_TARGETING)
                 }
                 for building in game.buildings_list
             ],
             'enemies': [
                 {
-                    'type': enemy.__class__.__name__.lower(),
+                    'type': enemy.enemy_type,
                     'position_x': enemy.position_x,
                     'position_y': enemy.position_y,
                     'health_points': enemy.health_points,
@@ -62,9 +64,9 @@ class SaveSystem:
             ],
             'timers': {
                 'total_elapsed_time': game.total_elapsed_time,
-                'zombie_spawn_timer': game.zombie_spawn_timer,
-                'mutant_spawn_timer': game.mutant_spawn_timer,
-                'wolf_spawn_timer': game.wolf_spawn_timer
+                'zombie_spawn_timer': game.spawn_director.timers['zombie'],
+                'mutant_spawn_timer': game.spawn_director.timers['mutant'],
+                'wolf_spawn_timer': game.spawn_director.timers['wolf']
             },
             'game_state': game.game_state,
             'has_won': game.has_won,
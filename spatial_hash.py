@@ -0,0 +1,321 @@
+"""
+SPATIAL_HASH.PY
+===============
+Ce fichier contient la grille de hachage spatial des entités mobiles (ennemis, joueurs).
+Le plan est découpé en cellules carrées de SPATIAL_HASH_CELL_SIZE pixels ; chaque entité
+est rangée dans la cellule qui contient sa position. Les requêtes (entités dans un rayon,
+entité la plus proche) ne parcourent que les cellules concernées au lieu de toute la liste.
+La grille des ennemis est reconstruite une fois par frame dans Game.update
+(les murs, fixes, sont rangés par case dans obstacle_layer.py).
+CellGrid est la même grille pour les calculs NumPy par lots (séparation des foules, collisions
+des projectiles) : les positions sont triées par cellule au lieu d'être rangées dans un dictionnaire.
+"""
+
+import numpy as np
+from constants import *
+
+
+class SpatialHash:
+    """Grille uniforme de cellules : {(cellule_x, cellule_y): [(x, y, entité), ...]}"""
+
+    def __init__(self, cell_size=SPATIAL_HASH_CELL_SIZE):
+        """
+        Initialise une grille vide
+        Args:
+            cell_size: Côté d'une cellule en pixels
+        """
+        self.cell_size = cell_size
+        self._cells = {}
+        self._count = 0
+        # Étendue des cellules occupées : [min_x, min_y, max_x, max_y] (limite les recherches)
+        self._cell_bounds = None
+        # Incrémenté à chaque modification (permet de savoir si des données dérivées sont à jour)
+        self.version = 0
+
+    def __len__(self):
+        return self._count
+
+    # --- Mise à jour ---
+
+    def clear(self):
+        """Vide la grille"""
+        self._cells.clear()
+        self._count = 0
+        self._cell_bounds = None
+        self.version += 1
+
+    def insert(self, entity, position_x, position_y):
+        """
+        Ajoute une entité à la grille
+        Args:
+            entity: Entité à ranger (ennemi, mur, joueur...)
+            position_x, position_y: Position de l'entité en pixels
+        """
+        cell_key = (int(position_x // self.cell_size), int(position_y // self.cell_size))
+        cell = self._cells.get(cell_key)
+        if cell is None:
+            cell = self._cells[cell_key] = []
+            self._expand_bounds(*cell_key)
+        cell.append((position_x, position_y, entity))
+        self._count += 1
+        self.version += 1
+
+    def remove(self, entity, position_x, position_y):
+        """
+        Retire une entité de la grille (sans effet si elle n'y est pas)
+        Args:
+            entity: Entité à retirer
+            position_x, position_y: Position utilisée lors de l'insertion
+        """
+        cell_key = (int(position_x // self.cell_size), int(position_y // self.cell_size))
+        cell = self._cells.get(cell_key)
+        if cell is None:
+            return
+        for index, (_, _, other) in enumerate(cell):
+            if other is entity:
+                del cell[index]
+                self._count -= 1
+                self.version += 1
+                break
+        if not cell:
+            del self._cells[cell_key]
+
+    def rebuild(self, entities, positions_x=None, positions_y=None):
+        """
+        Reconstruit la grille à partir des positions actuelles des entités
+        Args:
+            entities: Entités ayant position_x et position_y (ennemis, joueurs)
+            positions_x, positions_y: Positions déjà rangées dans des tableaux, dans l'ordre
+                                      des entités (optionnelles, voir EnemyStore)
+        """
+        cells = self._cells
+        cells.clear()
+        size = self.cell_size
+        if positions_x is None:
+            positions = [(entity.position_x, entity.position_y) for entity in entities]
+        else:
+            positions = zip(positions_x.tolist(), positions_y.tolist())
+        for entity, (position_x, position_y) in zip(entities, positions):
+            cell_key = (int(position_x // size), int(position_y // size))
+            cell = cells.get(cell_key)
+            if cell is None:
+                cells[cell_key] = [(position_x, position_y, entity)]
+            else:
+                cell.append((position_x, position_y, entity))
+        self._count = len(entities)
+        self.version += 1
+
+        if cells:
+            cell_xs = [cell_x for cell_x, _ in cells]
+            cell_ys = [cell_y for _, cell_y in cells]
+            self._cell_bounds = [min(cell_xs), min(cell_ys), max(cell_xs), max(cell_ys)]
+        else:
+            self._cell_bounds = None
+
+    def _expand_bounds(self, cell_x, cell_y):
+        """Agrandit l'étendue connue des cellules"""
+        if self._cell_bounds is None:
+            self._cell_bounds = [cell_x, cell_y, cell_x, cell_y]
+            return
+        bounds = self._cell_bounds
+        bounds[0] = min(bounds[0], cell_x)
+        bounds[1] = min(bounds[1], cell_y)
+        bounds[2] = max(bounds[2], cell_x)
+        bounds[3] = max(bounds[3], cell_y)
+
+    # --- Requêtes ---
+
+    def entries(self):
+        """Génère toutes les entrées (x, y, entité) de la grille"""
+        for cell in self._cells.values():
+            yield from cell
+
+    def query_radius(self, position_x, position_y, radius):
+        """
+        Liste les entités dans un cercle (zones d'effet, portée d'une tourelle)
+        Args:
+            position_x, position_y: Centre du cercle en pixels
+            radius: Rayon en pixels
+        Returns:
+            Liste des entités dont la position est dans le cercle
+        """
+        cells = self._cells
+        size = self.cell_size
+        radius_sq = radius * radius
+
+        found = []
+        for cell_y in range(int((position_y - radius) // size), int((position_y + radius) // size) + 1):
+            for cell_x in range(int((position_x - radius) // size), int((position_x + radius) // size) + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell is None:
+                    continue
+                for x, y, entity in cell:
+                    if (x - position_x) ** 2 + (y - position_y) ** 2 <= radius_sq:
+                        found.append(entity)
+        return found
+
+    def nearest(self, position_x, position_y, max_distance=None, predicate=None):
+        """
+        Trouve l'entité la plus proche d'une position
+        Avec une distance maximale, seules les cellules qui touchent le cercle sont parcourues.
+        Sinon, les cellules sont parcourues en anneaux carrés de plus en plus larges ; la recherche
+        s'arrête dès qu'aucun anneau suivant ne peut contenir d'entité plus proche.
+        Args:
+            position_x, position_y: Position de départ en pixels
+            max_distance: Distance maximale en pixels (optionnelle, incluse)
+            predicate: Fonction entité -> bool pour ignorer certaines entités (optionnelle)
+        Returns:
+            L'entité la plus proche, ou None
+        """
+        if not self._cells:
+            return None
+
+        cells = self._cells
+        size = self.cell_size
+        if max_distance is not None:
+            # Rayon borné : parcourir directement les cellules du carré englobant le cercle
+            best_entity = None
+            best_distance_sq = max_distance * max_distance
+            for cell_y in range(int((position_y - max_distance) // size), int((position_y + max_distance) // size) + 1):
+                for cell_x in range(int((position_x - max_distance) // size), int((position_x + max_distance) // size) + 1):
+                    cell = cells.get((cell_x, cell_y))
+                    if cell is None:
+                        continue
+                    for x, y, entity in cell:
+                        distance_sq = (x - position_x) ** 2 + (y - position_y) ** 2
+                        if distance_sq > best_distance_sq or (distance_sq == best_distance_sq and best_entity is not None):
+                            continue
+                        if predicate is not None and not predicate(entity):
+                            continue
+                        best_distance_sq = distance_sq
+                        best_entity = entity
+            return best_entity
+
+        # Rayon libre : anneaux de cellules autour de la position
+        center_x, center_y = int(position_x // size), int(position_y // size)
+
+        # Nombre d'anneaux nécessaires pour couvrir toutes les cellules occupées
+        min_x, min_y, max_x, max_y = self._cell_bounds
+        max_ring = max(center_x - min_x, max_x - center_x, center_y - min_y, max_y - center_y)
+
+        best_entity = None
+        best_distance_sq = float('inf')
+        for ring in range(max_ring + 1):
+            # Toute position d'un anneau r est à au moins (r - 1) * size pixels du point de départ
+            if best_entity is not None and ((ring - 1) * size) ** 2 >= best_distance_sq:
+                break
+
+            for cell_key in self._ring_keys(center_x, center_y, ring):
+                cell = cells.get(cell_key)
+                if cell is None:
+                    continue
+                for x, y, entity in cell:
+                    distance_sq = (x - position_x) ** 2 + (y - position_y) ** 2
+                    if distance_sq > best_distance_sq or (distance_sq == best_distance_sq and best_entity is not None):
+                        continue
+                    if predicate is not None and not predicate(entity):
+                        continue
+                    best_distance_sq = distance_sq
+                    best_entity = entity
+        return best_entity
+
+    @staticmethod
+    def _ring_keys(center_x, center_y, ring):
+        """Génère les clés des cellules situées exactement à `ring` cellules du centre (anneau carré)"""
+        if ring == 0:
+            yield center_x, center_y
+            return
+        for offset in range(-ring, ring + 1):
+            yield center_x + offset, center_y - ring
+            yield center_x + offset, center_y + ring
+        for offset in range(-ring + 1, ring):
+            yield center_x - ring, center_y + offset
+            yield center_x + ring, center_y + offset
+
+
+class CellGrid:
+    """
+    Grille uniforme triée (NumPy) : les positions sont triées par cellule, chaque cellule occupée
+    étant une tranche de `order`. Reconstruite à chaque calcul, elle sert aux requêtes par lots
+    (les 9 cellules autour de milliers de points en quelques passes vectorisées).
+    """
+
+    def __init__(self, position_x, position_y, cell_size):
+        """
+        Trie des positions par cellule
+        Args:
+            position_x, position_y: Tableaux des positions en pixels (au moins une)
+            cell_size: Côté d'une cellule en pixels
+        """
+        self.cell_size = cell_size
+        cell_x = np.floor_divide(position_x, cell_size).astype(np.int64)
+        cell_y = np.floor_divide(position_y, cell_size).astype(np.int64)
+        # Clé compacte ; une marge d'une cellule vide tout autour évite que les voisines
+        # d'une cellule du bord débordent sur la ligne suivante
+        self.origin_x = int(cell_x.min()) - 1
+        self.origin_y = int(cell_y.min()) - 1
+        self.width = int(cell_x.max()) - self.origin_x + 2
+        self.height = int(cell_y.max()) - self.origin_y + 2
+        self.keys = (cell_y - self.origin_y) * self.width + (cell_x - self.origin_x)
+
+        self.order = np.argsort(self.keys, kind='stable')
+        self.cell_keys, self.cell_starts, self.cell_sizes = np.unique(self.keys[self.order], return_index=True,
+                                                                      return_counts=True)
+        # Décalages de clé des 4 cellules voisines « en avant » (droite, puis ligne du dessous) : avec
+        # la cellule elle-même, chaque paire de cellules voisines n'est vue qu'une fois
+        self.forward = np.array([1, self.width - 1, self.width, self.width + 1])
+
+        # Grille peu étendue : tables (début, taille) de toutes les cellules, lues directement par clé
+        # (les voisines des cellules du bord dépassent d'au plus une ligne et une cellule)
+        self._dense_starts = None
+        cell_total = self.width * self.height
+        if cell_total <= CELL_GRID_DENSE_LIMIT:
+            self._padding = self.width + 1
+            self._dense_starts = np.zeros(cell_total + 2 * self._padding, dtype=np.int64)
+            self._dense_sizes = np.zeros(cell_total + 2 * self._padding, dtype=np.int64)
+            self._dense_starts[self.cell_keys + self._padding] = self.cell_starts
+            self._dense_sizes[self.cell_keys + self._padding] = self.cell_sizes
+
+    def lookup(self, keys):
+        """
+        Tranches de `order` de cellules données par leur clé
+        Args:
+            keys: Tableau de clés (forme quelconque) de cellules de la grille ou de leurs voisines
+        Returns:
+            Tuple (débuts, tailles) de même forme ; taille 0 pour une cellule vide
+        """
+        if self._dense_starts is not None:
+            keys = keys + self._padding
+            return self._dense_starts[keys], self._dense_sizes[keys]
+        cell_index = np.minimum(np.searchsorted(self.cell_keys, keys), len(self.cell_keys) - 1)
+        sizes = np.where(self.cell_keys[cell_index] == keys, self.cell_sizes[cell_index], 0)
+        return self.cell_starts[cell_index], sizes
+
+    def blocks(self, position_x, position_y):
+        """
+        Tranches des 4 cellules (carré 2 x 2) les plus proches de positions quelconques : tout point
+        à moins d'une demi-cellule d'une position est dans l'une d'elles
+        Args:
+            position_x, position_y: Tableaux des positions en pixels
+        Returns:
+            Tuple (débuts, tailles, dedans) : débuts et tailles de forme (nombre de positions, 4),
+            dedans faux pour les positions hors de la grille (tailles nulles)
+        """
+        cell_x = position_x / self.cell_size - self.origin_x
+        cell_y = position_y / self.cell_size - self.origin_y
+        # Colonne et ligne de gauche et du haut du carré : du côté de la moitié de cellule occupée
+        left = np.floor(cell_x - 0.5).astype(np.int64)
+        top = np.floor(cell_y - 0.5).astype(np.int64)
+        inside = (left >= -1) & (left < self.width) & (top >= -1) & (top < self.height)
+        keys = np.where(inside, top * self.width + left, 0)[:, None] + np.array([0, 1, self.width, self.width + 1])
+        starts, sizes = self.lookup(keys)
+        sizes[~inside] = 0
+        return starts, sizes, inside
+
+    def forward_neighbors(self, keys):
+        """
+        Tranches des 4 cellules voisines « en avant » de chaque clé (voir forward)
+        Returns:
+            Tuple (débuts, tailles) de forme (nombre de clés, 4)
+        """
+        return self.lookup(keys[:, None] + self.forward)
@@ -0,0 +1,266 @@
+"""
+SPAWN_DIRECTOR.PY
+=================
+Ce fichier contient le directeur des apparitions : il décide seul de toutes les apparitions d'ennemis.
+- Calendrier : un minuteur par type d'ennemi (SPAWN_SCHEDULE), accéléré la nuit.
+- Budget de menace : chaque phase (jour, puis nuit) a un budget (ENEMY_THREAT par ennemi),
+  qui grandit avec les jours survécus. Budget épuisé : plus d'apparitions jusqu'à la phase suivante.
+- Plafond : jamais plus de SPAWN_MAX_LIVE_ENEMIES ennemis vivants ; une apparition bloquée par
+  le plafond attend qu'une place se libère.
+- Points d'apparition : tirés dans une bande juste au-delà des bords de l'écran d'un joueur,
+  sur une case libre et reliée à ce joueur, hors de la vue de tous les joueurs et hors de
+  la portée des tourelles (carte de couverture, turret_coverage.py) : les ennemis arrivent
+  par les zones peu défendues au lieu d'apparaître sous le feu.
+Game crée les ennemis aux positions décidées ; les décisions et compteurs sont gardés pour
+la télémétrie (voir telemetry).
+"""
+
+import random
+from collections import deque
+from constants import *
+
+# Noms des ennemis pour les messages d'apparition (singulier, pluriel)
+ENEMY_NAMES = {'zombie': ('Un zombie', 'zombies'), 'mutant': ('Un mutant', 'mutants'), 'wolf': ('Un loup', 'loups')}
+
+
+def spawn_message(kind, count):
+    """
+    Message affiché quand un groupe d'ennemis apparaît
+    Args:
+        kind: Type d'ennemi
+        count: Nombre d'ennemis apparus
+    Returns:
+        Texte du message
+    """
+    if kind == 'wolf':
+        return f"Une meute de {count} loup(s) est apparue !"
+    singular, plural = ENEMY_NAMES.get(kind, (f"Un {kind}", kind))
+    if count == 1:
+        return f"{singular} est apparu !"
+    return f"{count} {plural} sont apparus !"
+
+
+class SpawnDirector:
+    """Calendrier, budget de menace, plafond et points d'apparition des ennemis"""
+
+    def __init__(self, schedule=SPAWN_SCHEDULE, threat=ENEMY_THREAT, max_live=SPAWN_MAX_LIVE_ENEMIES,
+                 day_budget=SPAWN_DAY_THREAT_BUDGET, night_budget=SPAWN_NIGHT_THREAT_BUDGET,
+                 budget_growth=SPAWN_THREAT_BUDGET_GROWTH):
+        """
+        Initialise le directeur
+        Args:
+            schedule: {type: (intervalle en secondes, taille min, taille max du groupe)}
+            threat: {type: menace d'un ennemi}
+            max_live: Nombre maximal d'ennemis vivants
+            day_budget, night_budget: Menace pouvant apparaître pendant le premier jour et la première nuit
+            budget_growth: Hausse relative des budgets par jour survécu
+        """
+        self.schedule = schedule
+        self.threat = threat
+        self.max_live = max_live
+        self.day_budget = day_budget
+        self.night_budget = night_budget
+        self.budget_growth = budget_growth
+
+        # Minuteurs d'apparition par type (sauvegardés avec la partie)
+        self.timers = {kind: 0.0 for kind in schedule}
+
+        # Phase en cours (jour, nuit ?) et menace dépensée sur son budget
+        self.phase = None
+        self.threat_budget = 0
+        self.threat_spent = 0
+
+        # Télémétrie : ennemis apparus par type, limites rencontrées, dernières décisions
+        self.spawned = {kind: 0 for kind in schedule}
+        self.limits = {'cap': 0, 'budget': 0, 'no_point': 0}
+        self.decisions = deque(maxlen=SPAWN_DECISION_LOG_SIZE)
+        # Types dont l'apparition attend une place sous le plafond
+        self._held = set()
+
+    # --- Phases ---
+
+    def _enter_phase(self, elapsed_time):
+        """Ouvre le budget d'une nouvelle phase (jour ou nuit) si elle vient de commencer"""
+        day = int(elapsed_time // SECONDS_PER_DAY) + 1
+        is_night = (elapsed_time % SECONDS_PER_DAY) / SECONDS_PER_DAY > DAY_PHASE_DURATION
+        if self.phase == (day, is_night):
+            return
+        self.phase = (day, is_night)
+        base_budget = self.night_budget if is_night else self.day_budget
+        self.threat_budget = base_budget * (1 + self.budget_growth * (day - 1))
+        self.threat_spent = 0
+
+    # --- Décisions ---
+
+    def update(self, delta_time, elapsed_time, live_count, player_positions, views, world, coverage=None):
+        """
+        Fait avancer le calendrier et décide des apparitions de la frame
+        Args:
+            delta_time: Temps écoulé depuis la dernière frame
+            elapsed_time: Temps total de la partie (jour ou nuit)
+            live_count: Nombre d'ennemis vivants
+            player_positions: Positions (x, y) des joueurs
+            views: Zones visibles (gauche, haut, droite, bas) des joueurs, en pixels, même ordre
+            world: Instance du monde (cases libres et reliées)
+            coverage: Carte de couverture des tourelles (optionnelle, zones défendues évitées)
+        Returns:
+            Liste de (type, [(x, y), ...]) : groupes d'ennemis à créer
+        """
+        self._enter_phase(elapsed_time)
+        multiplier = NIGHT_ENEMY_SPAWN_MULTIPLIER if self.phase[1] else 1.0
+
+        groups = []
+        for kind, (interval, min_size, max_size) in self.schedule.items():
+            self.timers[kind] += delta_time * multiplier
+            if self.timers[kind] < interval:
+                continue
+
+            positions, limit = self._plan(kind, random.randint(min_size, max_size), live_count,
+                                          player_positions, views, world, elapsed_time, kind in self._held,
+                                          coverage=coverage)
+            if limit == 'cap' and not positions:
+                # Pas de place : l'apparition attend, minuteur arrêté à l'échéance
+                self._held.add(kind)
+                self.timers[kind] = interval
+                continue
+            self._held.discard(kind)
+            self.timers[kind] = 0
+            if positions:
+                groups.append((kind, positions))
+                live_count += len(positions)
+        return groups
+
+    def plan_wave(self, kind, count, live_count, player_positions, views, world, elapsed_time, edge_weights=None,
+                  coverage=None):
+        """
+        Décide d'une vague demandée hors calendrier (soumise au plafond et au budget)
+        Args:
+            kind: Type d'ennemi
+            count: Nombre d'ennemis demandés
+            live_count, player_positions, views, world, elapsed_time, coverage: Voir update
+            edge_weights: Poids des bords de l'écran (haut, droite, bas, gauche), optionnel
+        Returns:
+            Positions (x, y) des ennemis à créer (parfois moins que demandé)
+        """
+        self._enter_phase(elapsed_time)
+        positions, _ = self._plan(kind, count, live_count, player_positions, views, world, elapsed_time,
+                                  edge_weights=edge_weights, coverage=coverage)
+        return positions
+
+    def _plan(self, kind, count, live_count, player_positions, views, world, elapsed_time,
+              already_held=False, edge_weights=None, coverage=None):
+        """
+        Réduit un groupe au plafond et au budget, puis lui trouve des points d'apparition
+        Returns:
+            Tuple (positions, limite rencontrée : 'cap', 'budget', 'no_point' ou None)
+        """
+        limit = None
+        allowed = min(count, max(0, self.max_live - live_count))
+        if allowed < count:
+            limit = 'cap'
+        threat = self.threat.get(kind, 1)
+        if threat > 0:
+            affordable = max(0, int((self.threat_budget - self.threat_spent) // threat))
+            if affordable < allowed:
+                allowed, limit = affordable, 'budget'
+
+        positions = []
+        for _ in range(allowed):
+            point = self.pick_spawn_point(player_positions, views, world, edge_weights, coverage)
+            if point is None:
+                limit = 'no_point'
+                break
+            positions.append(point)
+
+        self.threat_spent += threat * len(positions)
+        self.spawned[kind] = self.spawned.get(kind, 0) + len(positions)
+        # Une attente sous le plafond n'est comptée et notée qu'une fois
+        if not (limit == 'cap' and not positions and already_held):
+            if limit is not None:
+                self.limits[limit] += 1
+            self.decisions.append({'time': elapsed_time, 'kind': kind, 'requested': count,
+                                   'spawned': len(positions), 'limit': limit, 'live': live_count,
+                                   'threat_left': self.threat_budget - self.threat_spent})
+        return positions, limit
+
+    # --- Points d'apparition ---
+
+    def pick_spawn_point(self, player_positions, views, world, edge_weights=None, coverage=None):
+        """
+        Tire un point juste au-delà d'un bord de l'écran d'un joueur, sur une case libre
+        reliée à ce joueur, hors de la vue de tous les joueurs et hors de portée des tourelles
+        Args:
+            player_positions, views, world, coverage: Voir update
+            edge_weights: Poids des bords (haut, droite, bas, gauche), optionnel (bords équiprobables)
+        Returns:
+            Tuple (x, y) en pixels, ou None si aucun essai n'a abouti
+        """
+        if not player_positions:
+            return None
+        margin = SPAWN_OFFSCREEN_MARGIN
+        for _ in range(SPAWN_POINT_ATTEMPTS):
+            index = random.randrange(len(player_positions))
+            left, top, right, bottom = views[index]
+            left, top, right, bottom = left - margin, top - margin, right + margin, bottom + margin
+            depth = random.uniform(0, SPAWN_BAND_WIDTH)
+
+            # Bord de l'écran (0=haut, 1=droite, 2=bas, 3=gauche), puis position le long du bord
+            if edge_weights is None:
+                edge = random.randint(0, 3)
+            else:
+                edge = random.choices(range(4), weights=edge_weights)[0]
+            if edge == 0:
+                spawn_x, spawn_y = random.uniform(left - depth, right + depth), top - depth
+            elif edge == 1:
+                spawn_x, spawn_y = right + depth, random.uniform(top - depth, bottom + depth)
+            elif edge == 2:
+                spawn_x, spawn_y = random.uniform(left - depth, right + depth), bottom + depth
+            else:
+                spawn_x, spawn_y = left - depth, random.uniform(top - depth, bottom + depth)
+
+            # Hors de la vue de tous les joueurs
+            if any(view_left - margin < spawn_x < view_right + margin and view_top - margin < spawn_y < view_bottom + margin
+                   for view_left, view_top, view_right, view_bottom in views):
+                continue
+            # Hors de portée des tourelles
+            if coverage is not None and coverage.is_covered(spawn_x, spawn_y):
+                continue
+            grid_x, grid_y = int(spawn_x // TILE_SIZE), int(spawn_y // TILE_SIZE)
+            player_x, player_y = player_positions[index]
+            if world.is_tile_open(grid_x, grid_y) and world.are_connected(
+                    grid_x, grid_y, int(player_x // TILE_SIZE), int(player_y // TILE_SIZE), through_walls=True):
+                return spawn_x, spawn_y
+        return None
+
+    # --- Sauvegarde et télémétrie ---
+
+    def load_timers(self, timers):
+        """
+        Restaure les minuteurs d'une sauvegarde
+        Args:
+            timers: {type: temps écoulé}, types manquants remis à zéro
+        """
+        for kind in self.timers:
+            self.timers[kind] = timers.get(kind, 0)
+        self._held.clear()
+
+    def telemetry(self, live_count):
+        """
+        Résume l'état du directeur
+        Args:
+            live_count: Nombre d'ennemis vivants
+        Returns:
+            Dictionnaire (phase, vivants et plafond, budget, apparitions, limites, attentes)
+        """
+        day, is_night = self.phase if self.phase is not None else (1, False)
+        return {
+            'day': day,
+            'phase': 'nuit' if is_night else 'jour',
+            'live': live_count,
+            'cap': self.max_live,
+            'threat_budget': self.threat_budget,
+            'threat_spent': self.threat_spent,
+            'spawned': dict(self.spawned),
+            'limits': dict(self.limits),
+            'held': sorted(self._held),
+        }
@@ -0,0 +1,230 @@
+"""
+TERRAIN_GRID.PY
+===============
+Ce fichier contient la grille de terrain compacte du monde.
+Chaque case est stockée comme un code entier uint8 (index dans TERRAIN_TYPES)
+dans un tableau NumPy, au lieu d'une liste de listes de chaînes de caractères.
+Les propriétés des terrains (franchissable, couleur, vitesse) deviennent des tables indexées par code.
+Le terrain du monde est un LayeredTerrain : la grille générée, jamais modifiée,
+plus un calque clairsemé des cases modifiées (récoltes).
+"""
+
+import base64
+import zlib
+import numpy as np
+from constants import *
+
+
+# === TABLES DE CORRESPONDANCE (indexées par code de terrain) ===
+TERRAIN_GRASS_CODE = TERRAIN_CODES[TERRAIN_GRASS]
+WALKABLE_BY_CODE = [terrain_type not in TERRAIN_BLOCKING for terrain_type in TERRAIN_TYPES]
+SPEED_BY_CODE = [TERRAIN_SPEED_MULTIPLIERS.get(terrain_type, 1.0) for terrain_type in TERRAIN_TYPES]
+COLOR_TABLE = np.array([TERRAIN_COLORS[terrain_type] for terrain_type in TERRAIN_TYPES], dtype=np.uint8)
+WALKABLE_TABLE = np.array(WALKABLE_BY_CODE, dtype=bool)
+
+
+class TerrainRow:
+    """Vue sur une ligne de la grille : permet l'accès historique grid_terrain[y][x]"""
+
+    __slots__ = ('codes_row',)
+
+    def __init__(self, codes_row):
+        self.codes_row = codes_row
+
+    def __getitem__(self, grid_x):
+        return TERRAIN_TYPES[self.codes_row[grid_x]]
+
+    def __setitem__(self, grid_x, terrain_type):
+        self.codes_row[grid_x] = TERRAIN_CODES[terrain_type]
+
+    def __len__(self):
+        return len(self.codes_row)
+
+    def __iter__(self):
+        return (TERRAIN_TYPES[code] for code in self.codes_row.tolist())
+
+
+class TerrainGrid:
+    """Grille de terrain stockée comme un tableau uint8 (hauteur x largeur)"""
+
+    def __init__(self, width, height, fill_terrain=TERRAIN_GRASS, codes=None):
+        """
+        Initialise la grille
+        Args:
+            width, height: Dimensions en cases
+            fill_terrain: Terrain de remplissage initial
+            codes: Tableau uint8 existant à utiliser directement (optionnel)
+        """
+        if codes is None:
+            codes = np.full((height, width), TERRAIN_CODES[fill_terrain], dtype=np.uint8)
+        self.codes = codes
+        self.width = width
+        self.height = height
+
+    # --- Accès compatible avec l'ancienne liste de listes ---
+
+    def __getitem__(self, grid_y):
+        return TerrainRow(self.codes[grid_y])
+
+    def __len__(self):
+        return self.height
+
+    def __iter__(self):
+        return (TerrainRow(codes_row) for codes_row in self.codes)
+
+    # --- Accès direct ---
+
+    def get(self, grid_x, grid_y):
+        """Retourne le nom du terrain d'une case"""
+        return TERRAIN_TYPES[self.codes[grid_y, grid_x]]
+
+    def get_code(self, grid_x, grid_y):
+        """Retourne le code entier du terrain d'une case"""
+        return int(self.codes[grid_y, grid_x])
+
+    def set(self, grid_x, grid_y, terrain_type):
+        """Modifie le terrain d'une case"""
+        self.codes[grid_y, grid_x] = TERRAIN_CODES[terrain_type]
+
+    def mask(self, terrain_type):
+        """Retourne le masque booléen des cases d'un type de terrain"""
+        return self.codes == TERRAIN_CODES[terrain_type]
+
+    def copy(self):
+        """Retourne une copie indépendante de la grille"""
+        return TerrainGrid(self.width, self.height, codes=self.codes.copy())
+
+    # --- Conversion pour la sauvegarde ---
+
+    @classmethod
+    def from_list(cls, rows):
+        """Construit une grille depuis une liste de listes de noms (ancien format)"""
+        codes = np.array([[TERRAIN_CODES[terrain_type] for terrain_type in row] for row in rows], dtype=np.uint8)
+        return cls(codes.shape[1], codes.shape[0], codes=codes)
+
+    def to_save_string(self):
+        """Encode la grille en texte compact (zlib + base64) pour le JSON"""
+        return base64.b64encode(zlib.compress(self.codes.tobytes())).decode('ascii')
+
+    @classmethod
+    def from_save_string(cls, width, height, encoded):
+        """Décode une grille encodée par to_save_string"""
+        raw = zlib.decompress(base64.b64decode(encoded))
+        codes = np.frombuffer(raw, dtype=np.uint8).reshape((height, width)).copy()
+        return cls(width, height, codes=codes)
+
+
+class LayeredRow:
+    """Vue sur une ligne d'un terrain en couches : accès historique grid_terrain[y][x]"""
+
+    __slots__ = ('terrain', 'grid_y')
+
+    def __init__(self, terrain, grid_y):
+        self.terrain = terrain
+        self.grid_y = grid_y
+
+    def __getitem__(self, grid_x):
+        return self.terrain.get(grid_x, self.grid_y)
+
+    def __setitem__(self, grid_x, terrain_type):
+        self.terrain.set(grid_x, self.grid_y, terrain_type)
+
+    def __len__(self):
+        return self.terrain.width
+
+
+class LayeredTerrain:
+    """
+    Terrain en deux couches : une base immuable (le terrain généré, éventuellement
+    projetée depuis le cache disque) et un calque clairsemé des cases modifiées.
+    La mémoire et la sauvegarde ne grandissent qu'avec le nombre de modifications.
+    """
+
+    def __init__(self, base_codes):
+        """
+        Initialise le terrain
+        Args:
+            base_codes: Tableau uint8 (hauteur, largeur) du terrain généré (jamais modifié)
+        """
+        self.base = base_codes
+        if self.base.flags.writeable:
+            self.base.flags.writeable = False
+        self.height, self.width = base_codes.shape
+
+        # Calque des modifications : {(x, y): code}, seulement là où le terrain diffère de la base
+        self.overlay = {}
+
+    # --- Accès compatible avec l'ancienne liste de listes ---
+
+    def __getitem__(self, grid_y):
+        return LayeredRow(self, grid_y)
+
+    def __len__(self):
+        return self.height
+
+    # --- Accès direct ---
+
+    def get_code(self, grid_x, grid_y):
+        """Retourne le code actuel d'une case (calque, sinon base)"""
+        code = self.overlay.get((grid_x, grid_y))
+        if code is None:
+            return self.base[grid_y, grid_x]
+        return code
+
+    def get(self, grid_x, grid_y):
+        """Retourne le nom du terrain actuel d'une case"""
+        return TERRAIN_TYPES[self.get_code(grid_x, grid_y)]
+
+    def get_original(self, grid_x, grid_y):
+        """Retourne le nom du terrain généré d'une case (avant toute modification)"""
+        return TERRAIN_TYPES[self.base[grid_y, grid_x]]
+
+    def set(self, grid_x, grid_y, terrain_type):
+        """Modifie une case ; revenir au terrain de base retire l'entrée du calque"""
+        code = TERRAIN_CODES[terrain_type]
+        if code == self.base[grid_y, grid_x]:
+            self.overlay.pop((grid_x, grid_y), None)
+        else:
+            self.overlay[(grid_x, grid_y)] = code
+
+    def region(self, start_x, start_y, end_x, end_y):
+        """
+        Retourne les codes actuels d'une zone rectangulaire (copie de la base + calque)
+        Args:
+            start_x, start_y: Coin haut-gauche (inclus, en cases)
+            end_x, end_y: Coin bas-droit (exclu, en cases)
+        Returns:
+            Tableau uint8 (hauteur, largeur)
+        """
+        codes = np.array(self.base[start_y:end_y, start_x:end_x])
+        for (grid_x, grid_y), code in self.overlay.items():
+            if start_x <= grid_x < end_x and start_y <= grid_y < end_y:
+                codes[grid_y - start_y, grid_x - start_x] = code
+        return codes
+
+    def to_array(self):
+        """Retourne une copie complète du terrain actuel"""
+        return self.region(0, 0, self.width, self.height)
+
+    # --- Conversion pour la sauvegarde ---
+
+    def overlay_to_list(self):
+        """Retourne le calque sous forme de liste [[x, y, code], ...] pour le JSON"""
+        return [[grid_x, grid_y, int(code)] for (grid_x, grid_y), code in self.overlay.items()]
+
+    def load_overlay(self, entries):
+        """Remplace le calque par une liste [[x, y, code], ...]"""
+        self.overlay = {}
+        for grid_x, grid_y, code in entries:
+            if code != self.base[grid_y, grid_x]:
+                self.overlay[(grid_x, grid_y)] = code
+
+    def load_overlay_from_diff(self, current_codes):
+        """
+        Construit le calque en comparant un terrain complet à la base (anciennes sauvegardes)
+        Args:
+            current_codes: Tableau uint8 (hauteur, largeur) du terrain actuel
+        """
+        tile_ys, tile_xs = np.nonzero(current_codes != self.base)
+        self.overlay = {(grid_x, grid_y): int(current_codes[grid_y, grid_x])
+                        for grid_x, grid_y in zip(tile_xs.tolist(), tile_ys.tolist())}
@@ -0,0 +1,139 @@
+"""
+TERRAIN_RENDERER.PY
+===================
+Ce fichier gère le rendu du terrain par chunks pré-rendus et mis en cache.
+Le monde est découpé en blocs de RENDER_CHUNK_SIZE x RENDER_CHUNK_SIZE cases.
+Chaque bloc est dessiné une seule fois sur une surface, puis simplement blitté
+à chaque frame : le coût du rendu dépend de la taille de l'écran, plus de celle de la carte.
+"""
+
+from collections import OrderedDict
+import numpy as np
+import pygame
+from constants import *
+from terrain_grid import COLOR_TABLE
+
+
+class ChunkedTerrainRenderer:
+    """Rendu du terrain par chunks avec cache LRU des surfaces"""
+
+    def __init__(self, world, width_tiles=None, height_tiles=None):
+        """
+        Initialise le renderer
+        Args:
+            world: Instance du monde (fournit les codes de terrain via get_codes_region)
+            width_tiles, height_tiles: Dimensions de la carte en cases (None pour un monde infini)
+        """
+        self.world = world
+        self.width_tiles = width_tiles
+        self.height_tiles = height_tiles
+        self.chunk_pixel_size = RENDER_CHUNK_SIZE * TILE_SIZE
+
+        # Cache des surfaces : {(chunk_x, chunk_y): pygame.Surface}, du moins au plus récent
+        self._surfaces = OrderedDict()
+
+        # Statistiques (utiles pour les benchmarks)
+        self.chunks_rendered = 0
+
+    def invalidate_tile(self, grid_x, grid_y):
+        """
+        Marque le chunk contenant une case comme à redessiner
+        Args:
+            grid_x, grid_y: Coordonnées de la case modifiée
+        """
+        chunk_key = (grid_x // RENDER_CHUNK_SIZE, grid_y // RENDER_CHUNK_SIZE)
+        self._surfaces.pop(chunk_key, None)
+
+    def invalidate_all(self):
+        """Vide le cache (après un chargement de partie par exemple)"""
+        self._surfaces.clear()
+
+    def _render_chunk(self, chunk_x, chunk_y):
+        """
+        Dessine un chunk complet sur une nouvelle surface
+        Args:
+            chunk_x, chunk_y: Coordonnées du chunk
+        Returns:
+            pygame.Surface contenant le chunk, ou None si le terrain n'est pas encore disponible
+        """
+        start_x = chunk_x * RENDER_CHUNK_SIZE
+        start_y = chunk_y * RENDER_CHUNK_SIZE
+        end_x = start_x + RENDER_CHUNK_SIZE
+        end_y = start_y + RENDER_CHUNK_SIZE
+        if self.width_tiles is not None:
+            end_x = min(end_x, self.width_tiles)
+            end_y = min(end_y, self.height_tiles)
+
+        # Couleur de chaque case via la table des codes, agrandie à TILE_SIZE pixels
+        codes = self.world.get_codes_region(start_x, start_y, end_x, end_y)
+        if codes is None:
+            # Terrain pas encore généré (monde streamé) : rien à dessiner pour l'instant
+            return None
+        pixels = np.zeros((self.chunk_pixel_size, self.chunk_pixel_size, 3), dtype=np.uint8)
+        tile_colors = COLOR_TABLE[codes]
+        tile_pixels = tile_colors.repeat(TILE_SIZE, axis=0).repeat(TILE_SIZE, axis=1)
+        pixels[:tile_pixels.shape[0], :tile_pixels.shape[1]] = tile_pixels
+
+        # Bordure noire d'1 pixel autour de chaque case (grille)
+        pixels[0::TILE_SIZE, :] = 0
+        pixels[TILE_SIZE - 1::TILE_SIZE, :] = 0
+        pixels[:, 0::TILE_SIZE] = 0
+        pixels[:, TILE_SIZE - 1::TILE_SIZE] = 0
+
+        # surfarray attend des tableaux indexés (x, y)
+        surface = pygame.surfarray.make_surface(pixels.transpose(1, 0, 2))
+
+        self.chunks_rendered += 1
+        return surface
+
+    def _get_chunk_surface(self, chunk_x, chunk_y):
+        """Retourne la surface d'un chunk (depuis le cache ou en la dessinant), ou None"""
+        chunk_key = (chunk_x, chunk_y)
+        surface = self._surfaces.get(chunk_key)
+        if surface is None:
+            surface = self._render_chunk(chunk_x, chunk_y)
+            if surface is not None:
+                self._surfaces[chunk_key] = surface
+        else:
+            self._surfaces.move_to_end(chunk_key)
+        return surface
+
+    def draw(self, screen, camera_offset_x, camera_offset_y):
+        """
+        Dessine les chunks visibles à l'écran
+        Args:
+            screen: Surface Pygame où dessiner
+            camera_offset_x, camera_offset_y: Décalage de la caméra
+        """
+        screen_width, screen_height = screen.get_size()
+        camera_offset_x = int(camera_offset_x)
+        camera_offset_y = int(camera_offset_y)
+
+        # Plage de chunks qui intersectent la caméra
+        first_chunk_x = camera_offset_x // self.chunk_pixel_size
+        first_chunk_y = camera_offset_y // self.chunk_pixel_size
+        last_chunk_x = (camera_offset_x + screen_width) // self.chunk_pixel_size
+        last_chunk_y = (camera_offset_y + screen_height) // self.chunk_pixel_size
+
+        # Carte de taille fixe : ne pas dépasser les bords
+        if self.width_tiles is not None:
+            chunks_wide = (self.width_tiles + RENDER_CHUNK_SIZE - 1) // RENDER_CHUNK_SIZE
+            chunks_high = (self.height_tiles + RENDER_CHUNK_SIZE - 1) // RENDER_CHUNK_SIZE
+            first_chunk_x = max(0, first_chunk_x)
+            first_chunk_y = max(0, first_chunk_y)
+            last_chunk_x = min(chunks_wide - 1, last_chunk_x)
+            last_chunk_y = min(chunks_high - 1, last_chunk_y)
+
+        for chunk_y in range(first_chunk_y, last_chunk_y + 1):
+            for chunk_x in range(first_chunk_x, last_chunk_x + 1):
+                surface = self._get_chunk_surface(chunk_x, chunk_y)
+                if surface is None:
+                    continue
+                screen.blit(surface, (chunk_x * self.chunk_pixel_size - camera_offset_x,
+                                      chunk_y * self.chunk_pixel_size - camera_offset_y))
+
+        # Limiter la mémoire : garder au moins deux écrans de chunks en cache
+        visible_count = (last_chunk_x - first_chunk_x + 1) * (last_chunk_y - first_chunk_y + 1)
+        max_cached = max(RENDER_CHUNK_CACHE_SIZE, visible_count * 2)
+        while len(self._surfaces) > max_cached:
+            self._surfaces.popitem(last=False)
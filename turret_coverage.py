@@ -0,0 +1,236 @@
+"""
+TURRET_COVERAGE.PY
+==================
+Ce fichier contient la carte de couverture des tourelles : pour chaque case, les tourelles
+dont la portée l'atteint, {(case_x, case_y): [(tourelle, bord), ...]}.
+La carte n'est calculée qu'à la pose ou au retrait d'une tourelle (Game.add_building et
+Game.remove_building) :
+- une case entièrement dans la portée est couverte sans condition ;
+- une case coupée par le cercle de portée est une case de bord : seuls les ennemis de ces cases
+  demandent un test de distance.
+Quand au moins TURRET_COVERAGE_BATCH_MIN tourelles sont prêtes à tirer à la même frame, les ennemis
+sont triés par case en une passe NumPy et chaque tourelle prête reçoit la liste des ennemis à sa
+portée, sans calcul de distance pour les cases pleines. En dessous, le tri coûte plus que les
+quelques requêtes dans la grille spatiale des ennemis (spatial_hash.py), que Game garde alors.
+La même carte sert à l'affichage des zones défendues (F4) et au directeur des apparitions,
+qui évite de faire apparaître des ennemis sous le feu des tourelles.
+"""
+
+import pygame
+import numpy as np
+from constants import *
+
+# Couleur de l'affichage des zones défendues (plus opaque là où plusieurs tourelles se recouvrent)
+COVERAGE_COLOR = (80, 160, 255)
+COVERAGE_ALPHA_PER_TURRET = 35
+COVERAGE_MAX_ALPHA = 140
+
+# Clé entière d'une case (cases négatives comprises) : (case_y + décalage) * largeur + case_x + décalage
+TILE_KEY_OFFSET = 1 << 20
+TILE_KEY_STRIDE = 1 << 21
+
+
+def tile_keys(tile_x, tile_y):
+    """Clés entières de cases (tableaux NumPy d'entiers)"""
+    return (tile_y + TILE_KEY_OFFSET) * TILE_KEY_STRIDE + tile_x + TILE_KEY_OFFSET
+
+
+def turret_center(turret):
+    """Centre d'une tourelle en pixels"""
+    return turret.grid_x * TILE_SIZE + TILE_SIZE // 2, turret.grid_y * TILE_SIZE + TILE_SIZE // 2
+
+
+class TurretCoverage:
+    """Tourelles qui couvrent chaque case, calculées à la pose des tourelles"""
+
+    def __init__(self, turret_range=TURRET_RANGE):
+        """
+        Initialise une carte vide
+        Args:
+            turret_range: Portée des tourelles en pixels
+        """
+        self.turret_range = turret_range
+        self._tiles = {}
+        # Cases couvertes par chaque tourelle : [(case, bord), ...]
+        self._turret_tiles = {}
+        # Mêmes cases en tableaux, pour la recherche des cibles : (clés des cases, cases de bord)
+        self._turret_keys = {}
+        # Incrémenté à chaque modification (permet de savoir si des données dérivées sont à jour)
+        self.version = 0
+        # Surfaces de l'affichage, par nombre de tourelles
+        self._overlay_tiles = {}
+
+    def __len__(self):
+        return len(self._turret_tiles)
+
+    # --- Mise à jour ---
+
+    def clear(self):
+        """Vide la carte"""
+        self._tiles.clear()
+        self._turret_tiles.clear()
+        self._turret_keys.clear()
+        self.version += 1
+
+    def add(self, turret):
+        """
+        Ajoute les cases couvertes par une tourelle
+        Args:
+            turret: Tourelle (grid_x, grid_y)
+        """
+        if turret in self._turret_tiles:
+            return
+        center_x, center_y = turret_center(turret)
+        range_sq = self.turret_range ** 2
+        reach = self.turret_range // TILE_SIZE + 1
+
+        covered = []
+        for tile_y in range(turret.grid_y - reach, turret.grid_y + reach + 1):
+            for tile_x in range(turret.grid_x - reach, turret.grid_x + reach + 1):
+                left, top = tile_x * TILE_SIZE, tile_y * TILE_SIZE
+                right, bottom = left + TILE_SIZE, top + TILE_SIZE
+                # Point de la case le plus proche du centre, puis coin le plus éloigné
+                near_x = min(max(center_x, left), right)
+                near_y = min(max(center_y, top), bottom)
+                if (near_x - center_x) ** 2 + (near_y - center_y) ** 2 > range_sq:
+                    continue
+                far_x = max(abs(left - center_x), abs(right - center_x))
+                far_y = max(abs(top - center_y), abs(bottom - center_y))
+                partial = far_x * far_x + far_y * far_y > range_sq
+                self._tiles.setdefault((tile_x, tile_y), []).append((turret, partial))
+                covered.append(((tile_x, tile_y), partial))
+        self._turret_tiles[turret] = covered
+        self._turret_keys[turret] = (
+            tile_keys(np.array([tile[0] for tile, _ in covered], dtype=np.int64),
+                      np.array([tile[1] for tile, _ in covered], dtype=np.int64)),
+            np.array([partial for _, partial in covered], dtype=bool))
+        self.version += 1
+
+    def remove(self, turret):
+        """
+        Retire les cases couvertes par une tourelle
+        Args:
+            turret: Tourelle à retirer
+        Returns:
+            True si la tourelle était dans la carte
+        """
+        covered = self._turret_tiles.pop(turret, None)
+        if covered is None:
+            return False
+        del self._turret_keys[turret]
+        for tile, _ in covered:
+            entries = [entry for entry in self._tiles[tile] if entry[0] is not turret]
+            if entries:
+                self._tiles[tile] = entries
+            else:
+                del self._tiles[tile]
+        self.version += 1
+        return True
+
+    # --- Requêtes ---
+
+    def is_covered(self, position_x, position_y):
+        """
+        Indique si une position est dans la portée d'au moins une tourelle
+        Args:
+            position_x, position_y: Position en pixels
+        """
+        entries = self._tiles.get((int(position_x // TILE_SIZE), int(position_y // TILE_SIZE)))
+        if not entries:
+            return False
+        range_sq = self.turret_range ** 2
+        for turret, partial in entries:
+            if not partial:
+                return True
+            center_x, center_y = turret_center(turret)
+            if (position_x - center_x) ** 2 + (position_y - center_y) ** 2 <= range_sq:
+                return True
+        return False
+
+    def targets(self, turrets, enemies, positions_x=None, positions_y=None):
+        """
+        Donne à chaque tourelle les ennemis vivants de ses cases (test de distance sur les cases
+        de bord seulement). Les ennemis sont triés une fois par case, puis les cases de toutes
+        les tourelles sont cherchées en une passe (np.searchsorted)
+        Args:
+            turrets: Tourelles à servir (celles prêtes à tirer)
+            enemies: Ennemis (position_x, position_y, is_alive)
+            positions_x, positions_y: Positions déjà rangées dans des tableaux, dans l'ordre
+                                      des ennemis (optionnelles, voir EnemyStore)
+        Returns:
+            {tourelle: [ennemis vivants à portée]}
+        """
+        found = {turret: [] for turret in turrets}
+        turrets = [turret for turret in found if turret in self._turret_keys]
+        if not turrets or not enemies:
+            return found
+
+        # Ennemis triés par case
+        if positions_x is None:
+            positions_x = np.fromiter((enemy.position_x for enemy in enemies), dtype=np.float64, count=len(enemies))
+            positions_y = np.fromiter((enemy.position_y for enemy in enemies), dtype=np.float64, count=len(enemies))
+        keys = tile_keys(np.floor(positions_x / TILE_SIZE).astype(np.int64),
+                         np.floor(positions_y / TILE_SIZE).astype(np.int64))
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+
+        # Cases de toutes les tourelles, à la suite
+        turret_keys = [self._turret_keys[turret] for turret in turrets]
+        covered_keys = np.concatenate([keys for keys, _ in turret_keys])
+        partial = np.concatenate([partial for _, partial in turret_keys])
+        tile_counts = np.array([len(keys) for keys, _ in turret_keys])
+        center = np.array([turret_center(turret) for turret in turrets], dtype=np.float64)
+
+        # Paires (case d'une tourelle, ennemi de la case)
+        first = np.searchsorted(sorted_keys, covered_keys, side='left')
+        sizes = np.searchsorted(sorted_keys, covered_keys, side='right') - first
+        total = int(sizes.sum())
+        if total == 0:
+            return found
+        ranks = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        pair_enemies = order[np.repeat(first, sizes) + ranks]
+        pair_turrets = np.repeat(np.repeat(np.arange(len(turrets)), tile_counts), sizes)
+
+        # Test de distance pour les seules cases de bord
+        edge = np.flatnonzero(np.repeat(partial, sizes))
+        gap_x = positions_x[pair_enemies[edge]] - center[pair_turrets[edge], 0]
+        gap_y = positions_y[pair_enemies[edge]] - center[pair_turrets[edge], 1]
+        keep = np.ones(total, dtype=bool)
+        keep[edge] = gap_x * gap_x + gap_y * gap_y <= self.turret_range ** 2
+        pair_enemies, pair_turrets = pair_enemies[keep], pair_turrets[keep]
+
+        # Listes par tourelle (paires déjà rangées par tourelle)
+        bounds = np.cumsum(np.bincount(pair_turrets, minlength=len(turrets))).tolist()
+        pair_enemies = pair_enemies.tolist()
+        start = 0
+        for turret, end in zip(turrets, bounds):
+            candidates = found[turret]
+            for enemy_index in pair_enemies[start:end]:
+                enemy = enemies[enemy_index]
+                if enemy.is_alive:
+                    candidates.append(enemy)
+            start = end
+        return found
+
+    # --- Affichage ---
+
+    def draw(self, screen, camera_offset_x, camera_offset_y, screen_width, screen_height):
+        """
+        Affiche les cases défendues visibles (plus opaques où plusieurs tourelles se recouvrent)
+        Args:
+            screen: Surface Pygame
+            camera_offset_x, camera_offset_y: Décalage de la caméra
+            screen_width, screen_height: Taille de l'écran
+        """
+        first_x, first_y = int(camera_offset_x // TILE_SIZE), int(camera_offset_y // TILE_SIZE)
+        last_x = int((camera_offset_x + screen_width) // TILE_SIZE)
+        last_y = int((camera_offset_y + screen_height) // TILE_SIZE)
+        for (tile_x, tile_y), entries in self._tiles.items():
+            if not (first_x <= tile_x <= last_x and first_y <= tile_y <= last_y):
+                continue
+            surface = self._overlay_tiles.get(len(entries))
+            if surface is None:
+                surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+                surface.fill((*COVERAGE_COLOR, min(COVERAGE_MAX_ALPHA, COVERAGE_ALPHA_PER_TURRET * len(entries))))
+                self._overlay_tiles[len(entries)] = surface
+            screen.blit(surface, (tile_x * TILE_SIZE - camera_offset_x, tile_y * TILE_SIZE - camera_offset_y))
@@ -188,8 +188,8 @@ class UserInterface:
         help_x = 10
         help_y = screen.get_height() - 250
 
-        # Fond (augmenté pour 6 lignes au lieu de 5)
-        help_background = pygame.Surface((250, 120), pygame.SRCALPHA)
+        # Fond (augmenté pour 7 lignes)
+        help_background = pygame.Surface((250, 138), pygame.SRCALPHA)
         help_background.fill((0, 0, 0, 150))
         screen.blit(help_background, (help_x, help_y))
 
@@ -200,7 +200,8 @@ class UserInterface:
             "1-9,0: Bâtiments | C: Craft",
             "E: Manger | F5: Save",
             "F9: Load | F11: Plein écran",
-            "ESC: Quitter"
+            "F3: Debug chemins | F4: Défenses",
+            "T: Cible tourelle | ESC: Quitter"
         ]
 
         for index, control_text in enumerate(controls):
@@ -0,0 +1,294 @@
+"""
+WALKABILITY.PY
+==============
+Ce fichier contient la carte de franchissabilité du monde (carte de taille fixe).
+- Deux bitmaps compactes (1 bit par case, octets "little-endian" par ligne) :
+  terrain franchissable (eau et montagnes exclues) et case libre (terrain franchissable sans mur).
+- Un étiquetage des régions connexes (4-voisinage) des cases libres, et des cases
+  franchissables en ignorant les murs : "B est-il atteignable depuis A ?" en O(1).
+L'étiquetage initial se fait par segments de lignes avec union-find. Ensuite, les murs
+construits ou détruits mettent à jour les régions de façon incrémentale :
+- mur détruit : la case rejoint ses voisines (fusion de régions par union-find)
+- mur construit : recherches en largeur simultanées depuis les voisines, arrêtées dès
+  qu'elles se rejoignent ; seule une partie réellement isolée reçoit une nouvelle étiquette.
+"""
+
+from collections import deque
+import numpy as np
+from constants import *
+from terrain_grid import WALKABLE_TABLE
+
+NEIGHBOR_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def pack_bits(mask):
+    """
+    Compacte un masque booléen (hauteur, largeur) en bitmap : 1 bit par case
+    Returns:
+        bytearray de hauteur * ceil(largeur / 8) octets
+    """
+    return bytearray(np.packbits(mask, axis=1, bitorder='little').tobytes())
+
+
+def label_regions(open_mask):
+    """
+    Étiquette les régions connexes (4-voisinage) d'un masque de cases libres
+    Chaque ligne est découpée en segments de cases libres ; un segment est uni (union-find)
+    aux segments de la ligne précédente qui le chevauchent.
+    Args:
+        open_mask: Tableau booléen (hauteur, largeur)
+    Returns:
+        Tuple (étiquettes int32 (hauteur, largeur) avec 0 pour les cases bloquées, nombre d'étiquettes + 1)
+    """
+    height, width = open_mask.shape
+    labels = np.zeros((height, width), dtype=np.int32)
+    parent = [0]
+
+    def find(label):
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    previous_runs = []
+    for y in range(height):
+        # Débuts et fins des segments de cases libres de la ligne
+        edges = np.diff(np.concatenate(([0], open_mask[y].view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1).tolist()
+        ends = np.flatnonzero(edges == -1).tolist()
+
+        runs = []
+        previous_index = 0
+        for start, end in zip(starts, ends):
+            # Sauter les segments précédents qui se terminent avant celui-ci
+            while previous_index < len(previous_runs) and previous_runs[previous_index][1] <= start:
+                previous_index += 1
+
+            label = 0
+            overlap_index = previous_index
+            while overlap_index < len(previous_runs) and previous_runs[overlap_index][0] < end:
+                other = find(previous_runs[overlap_index][2])
+                if label == 0:
+                    label = other
+                elif other != label:
+                    parent[other] = label
+                overlap_index += 1
+
+            if label == 0:
+                label = len(parent)
+                parent.append(label)
+            labels[y, start:end] = label
+            runs.append((start, end, label))
+        previous_runs = runs
+
+    # Remplacer chaque étiquette par sa racine, puis renuméroter de façon compacte (0 reste 0)
+    roots = np.array([find(label) for label in range(len(parent))], dtype=np.int32)
+    _, compact = np.unique(roots, return_inverse=True)
+    compact = compact.astype(np.int32)
+    return compact[labels], int(compact.max()) + 1
+
+
+class WalkabilityMap:
+    """Bitmaps de franchissabilité et régions connexes d'une carte de taille fixe"""
+
+    def __init__(self, terrain_codes):
+        """
+        Construit la carte depuis les codes de terrain
+        Args:
+            terrain_codes: Tableau uint8 (hauteur, largeur)
+        """
+        self.height, self.width = terrain_codes.shape
+        self.row_bytes = (self.width + 7) // 8
+        self.rebuild(terrain_codes)
+
+    def rebuild(self, terrain_codes, walls=()):
+        """
+        Recalcule tout (chargement de partie, modification du terrain)
+        Args:
+            terrain_codes: Tableau uint8 (hauteur, largeur)
+            walls: Cases (x, y) occupées par un mur
+        """
+        self.walls = set(walls)
+        walkable_mask = WALKABLE_TABLE[terrain_codes]
+        open_mask = walkable_mask.copy()
+        for grid_x, grid_y in self.walls:
+            open_mask[grid_y, grid_x] = False
+
+        self.walkable_bits = pack_bits(walkable_mask)
+        self.open_bits = pack_bits(open_mask)
+
+        # Régions en ignorant les murs (ne changent qu'avec le terrain)
+        self.terrain_labels, _ = label_regions(walkable_mask)
+
+        # Régions des cases libres, mises à jour avec les murs (union-find sur les étiquettes)
+        self.labels, label_count = label_regions(open_mask)
+        self._parent = list(range(label_count))
+
+    # --- Accès aux bitmaps ---
+
+    def _get_bit(self, bits, grid_x, grid_y):
+        """Lit le bit d'une case (False hors de la carte)"""
+        if not (0 <= grid_x < self.width and 0 <= grid_y < self.height):
+            return False
+        return (bits[grid_y * self.row_bytes + (grid_x >> 3)] >> (grid_x & 7)) & 1 == 1
+
+    def _set_bit(self, bits, grid_x, grid_y, value):
+        """Écrit le bit d'une case"""
+        byte_index = grid_y * self.row_bytes + (grid_x >> 3)
+        if value:
+            bits[byte_index] |= 1 << (grid_x & 7)
+        else:
+            bits[byte_index] &= ~(1 << (grid_x & 7)) & 0xFF
+
+    def is_walkable(self, grid_x, grid_y):
+        """Terrain franchissable (les murs ne sont pas pris en compte)"""
+        return self._get_bit(self.walkable_bits, grid_x, grid_y)
+
+    def is_open(self, grid_x, grid_y):
+        """Case libre : terrain franchissable et pas de mur"""
+        return self._get_bit(self.open_bits, grid_x, grid_y)
+
+    # --- Régions ---
+
+    def _find(self, label):
+        """Racine d'une étiquette (union-find avec compression de chemin)"""
+        parent = self._parent
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    def region_id(self, grid_x, grid_y, through_walls=False):
+        """
+        Identifiant de la région d'une case
+        Args:
+            grid_x, grid_y: Coordonnées de la case
+            through_walls: Si True, les murs sont considérés comme franchissables
+        Returns:
+            Identifiant (> 0), ou 0 si la case est bloquée ou hors de la carte
+        """
+        if through_walls:
+            if not self.is_walkable(grid_x, grid_y):
+                return 0
+            return int(self.terrain_labels[grid_y, grid_x])
+        if not self.is_open(grid_x, grid_y):
+            return 0
+        return self._find(int(self.labels[grid_y, grid_x]))
+
+    def are_connected(self, start_x, start_y, goal_x, goal_y, through_walls=False):
+        """
+        Vérifie si une case est atteignable depuis une autre
+        Args:
+            start_x, start_y: Case de départ
+            goal_x, goal_y: Case d'arrivée
+            through_walls: Si True, les murs sont considérés comme franchissables (ils peuvent être détruits)
+        Returns:
+            True si un chemin existe
+        """
+        start_region = self.region_id(start_x, start_y, through_walls)
+        return start_region != 0 and start_region == self.region_id(goal_x, goal_y, through_walls)
+
+    # --- Mises à jour incrémentales ---
+
+    def set_wall(self, grid_x, grid_y, has_wall):
+        """
+        Ajoute ou retire un mur sur une case
+        Args:
+            grid_x, grid_y: Coordonnées de la case
+            has_wall: True si un mur vient d'être construit, False s'il a été détruit
+        """
+        if has_wall:
+            self.walls.add((grid_x, grid_y))
+        else:
+            self.walls.discard((grid_x, grid_y))
+
+        is_open = self.is_walkable(grid_x, grid_y) and not has_wall
+        if is_open == self.is_open(grid_x, grid_y):
+            return
+        self._set_bit(self.open_bits, grid_x, grid_y, is_open)
+        if is_open:
+            self._open_tile(grid_x, grid_y)
+        else:
+            self._close_tile(grid_x, grid_y)
+
+    def _open_neighbors(self, grid_x, grid_y):
+        """Liste les cases libres voisines d'une case"""
+        return [(grid_x + dx, grid_y + dy) for dx, dy in NEIGHBOR_OFFSETS
+                if self.is_open(grid_x + dx, grid_y + dy)]
+
+    def _new_label(self):
+        """Crée une nouvelle étiquette de région"""
+        label = len(self._parent)
+        self._parent.append(label)
+        return label
+
+    def _open_tile(self, grid_x, grid_y):
+        """Une case devient libre : elle relie les régions voisines"""
+        roots = {self._find(int(self.labels[y, x])) for x, y in self._open_neighbors(grid_x, grid_y)}
+        if not roots:
+            self.labels[grid_y, grid_x] = self._new_label()
+            return
+
+        target = roots.pop()
+        for root in roots:
+            self._parent[root] = target
+        self.labels[grid_y, grid_x] = target
+
+    def _close_tile(self, grid_x, grid_y):
+        """
+        Une case devient bloquée : sa région peut se couper en plusieurs morceaux
+        Une recherche en largeur part de chaque voisine libre, en alternance. Les recherches
+        qui se rencontrent fusionnent ; une recherche épuisée sans avoir rencontré les autres
+        a parcouru une partie isolée, qui reçoit une nouvelle étiquette. On s'arrête dès qu'il
+        ne reste qu'un groupe : le coût dépend de la plus petite partie, pas de la région entière.
+        """
+        self.labels[grid_y, grid_x] = 0
+        neighbors = self._open_neighbors(grid_x, grid_y)
+        if len(neighbors) < 2:
+            return
+
+        # Groupes de recherche (union-find local) : case visitée -> recherche qui l'a atteinte
+        group_parent = list(range(len(neighbors)))
+        frontiers = [deque([neighbor]) for neighbor in neighbors]
+        members = [[neighbor] for neighbor in neighbors]
+        owner = {neighbor: index for index, neighbor in enumerate(neighbors)}
+
+        def find_group(group):
+            while group_parent[group] != group:
+                group_parent[group] = group_parent[group_parent[group]]
+                group = group_parent[group]
+            return group
+
+        active = set(range(len(neighbors)))
+        while len(active) > 1:
+            for group in list(active):
+                if group not in active or len(active) <= 1:
+                    continue
+                frontier = frontiers[group]
+                if not frontier:
+                    # Partie isolée : nouvelle étiquette pour toutes ses cases
+                    new_label = self._new_label()
+                    for x, y in members[group]:
+                        self.labels[y, x] = new_label
+                    active.discard(group)
+                    continue
+
+                x, y = frontier.popleft()
+                for dx, dy in NEIGHBOR_OFFSETS:
+                    next_tile = (x + dx, y + dy)
+                    other = owner.get(next_tile)
+                    if other is None:
+                        if self.is_open(*next_tile):
+                            owner[next_tile] = group
+                            frontier.append(next_tile)
+                            members[group].append(next_tile)
+                        continue
+                    other = find_group(other)
+                    if other != group:
+                        # Les deux recherches se rejoignent : fusionner dans ce groupe
+                        group_parent[other] = group
+                        frontier.extend(frontiers[other])
+                        members[group].extend(members[other])
+                        frontiers[other] = deque()
+                        members[other] = []
+                        active.discard(other)
@@ -2,62 +2,312 @@
 WORLD.PY
 ========
 Ce fichier gère le monde du jeu : la grille, le terrain, la génération procédurale.
-Le monde est une grille 20x20 avec différents types de terrain (herbe, métal, nourriture).
+Le terrain est stocké comme une grille compacte de codes uint8 (voir terrain_grid.py) :
+une base générée immuable et un calque clairsemé des cases modifiées.
 """
 
+import heapq
 import random
-import pygame
+import numpy as np
 from constants import *
+from terrain_grid import TerrainGrid, LayeredTerrain, WALKABLE_BY_CODE, SPEED_BY_CODE
+from walkability import WalkabilityMap
+from terrain_renderer import ChunkedTerrainRenderer
+from resource_index import ResourceIndex
+import worldgen
+import world_cache
+
+# Codes entiers des terrains utilisés par la génération
+GRASS = TERRAIN_CODES[TERRAIN_GRASS]
+METAL = TERRAIN_CODES[TERRAIN_METAL]
+FOOD = TERRAIN_CODES[TERRAIN_FOOD]
+WOOD = TERRAIN_CODES[TERRAIN_WOOD]
+STONE = TERRAIN_CODES[TERRAIN_STONE]
+WATER = TERRAIN_CODES[TERRAIN_WATER]
+MOUNTAIN = TERRAIN_CODES[TERRAIN_MOUNTAIN]
+FOREST = TERRAIN_CODES[TERRAIN_FOREST]
+DESERT = TERRAIN_CODES[TERRAIN_DESERT]
+ENERGY_CRYSTAL = TERRAIN_CODES[TERRAIN_ENERGY_CRYSTAL]
 
 
 class World:
     """Classe représentant le monde du jeu"""
 
-    def __init__(self, seed=None):
+    # Carte de taille fixe (voir ChunkedWorld pour le monde infini)
+    mode = 'fixed'
+    is_infinite = False
+
+    def __init__(self, seed=None, generator=WORLD_GENERATOR, use_cache=WORLD_CACHE_ENABLED):
         """
-        Initialise le monde avec une grille vide
+        Initialise le monde et génère le terrain
         Args:
             seed: Graine aléatoire optionnelle pour génération reproductible
+            generator: 'noise' (générateur vectorisé, voir worldgen.py) ou 'legacy'
+            use_cache: Relire le terrain depuis le cache disque s'il a déjà été généré (voir world_cache.py)
+        """
+        # Tirer une seed si aucune n'est fournie (gardée pour pouvoir régénérer le même monde)
+        if seed is None:
+            seed = random.randrange(2 ** 31)
+        self.seed = seed
+        self.generator = generator
+
+        self.use_cache = use_cache
+
+        # Terrain = base générée immuable + calque des cases modifiées (récoltes)
+        self.terrain = LayeredTerrain(self._load_base_codes(seed, generator))
+
+        # Index spatial des ressources (requêtes "ressource la plus proche")
+        self.resource_index = ResourceIndex()
+        self.resource_index.add_region(self.terrain.base)
+
+        # Bitmaps de franchissabilité et régions connexes (murs compris)
+        self.walkability = WalkabilityMap(self.terrain.base)
+        # Incrémenté quand la franchissabilité ou les murs changent (champ de flux à recalculer)
+        self.navigation_version = 0
+
+        self._init_respawns()
+
+        # Rendu du terrain par chunks mis en cache
+        self.renderer = ChunkedTerrainRenderer(self, GRID_SIZE, GRID_SIZE)
+
+    def _load_base_codes(self, seed, generator):
+        """
+        Retourne le terrain généré d'un monde (depuis le cache disque, ou en le générant)
+        Args:
+            seed: Graine du monde
+            generator: 'noise' ou 'legacy'
+        Returns:
+            Tableau uint8 (GRID_SIZE, GRID_SIZE) en lecture seule
+        """
+        # Monde déjà généré : projection du fichier en mémoire, sans génération
+        if self.use_cache:
+            codes = world_cache.load_terrain(seed, GRID_SIZE, GRID_SIZE, generator)
+            if codes is not None:
+                return codes
+
+        codes = self._generate_codes(seed, generator)
+        if self.use_cache:
+            world_cache.store_terrain(seed, GRID_SIZE, GRID_SIZE, generator, codes)
+        return codes
+
+    def _generate_codes(self, seed, generator):
+        """
+        Génère le terrain de la carte
+        Args:
+            seed: Graine du monde
+            generator: 'noise' ou 'legacy'
+        Returns:
+            Tableau uint8 (GRID_SIZE, GRID_SIZE) de codes de terrain
         """
-        # Définir la seed si fournie
-        if seed is not None:
+        if generator == 'legacy':
+            # Ancien générateur case par case basé sur le module random
             random.seed(seed)
 
-        # Créer une grille 20x20 remplie d'herbe
-        self.grid_terrain = [[TERRAIN_GRASS for x in range(GRID_SIZE)] for y in range(GRID_SIZE)]
+            # Créer une grille remplie d'herbe (un code uint8 par case)
+            self.terrain = TerrainGrid(GRID_SIZE, GRID_SIZE)
 
-        # Générer le terrain procédural (lacs, montagnes, biomes)
-        self.generate_terrain()
+            # Générer le terrain procédural (lacs, montagnes, biomes)
+            self.generate_terrain()
 
-        # Générer des ressources aléatoirement sur la carte
-        self.generate_resources()
+            # Générer des ressources aléatoirement sur la carte
+            self.generate_resources()
+            return self.terrain.codes
 
-        # Sauvegarder le terrain original pour la régénération
-        self.original_terrain = [row[:] for row in self.grid_terrain]
+        # Générateur par champs de bruit : toute la carte en quelques passes NumPy
+        return worldgen.generate_world(seed, GRID_SIZE, GRID_SIZE)
 
-        # Dictionnaire des ressources épuisées : {(x, y): timer_restant}
+    def _init_respawns(self):
+        """Initialise l'état des respawns de ressources"""
+        # Ressources épuisées : {(x, y): instant de respawn (temps du monde en secondes)}
         self.depleted_tiles = {}
+        # File de priorité (tas min) des respawns : [(instant, x, y)]
+        self._respawn_heap = []
+        # Temps écoulé dans le monde (horloge des respawns)
+        self.world_time = 0.0
 
     def update(self, delta_time):
         """
         Met à jour le monde (régénération des ressources)
+        Seules les cases dont le respawn est arrivé à échéance sont traitées.
         Args:
             delta_time: Temps écoulé depuis la dernière frame
         """
-        # Mettre à jour les timers de respawn
-        tiles_to_respawn = []
+        self.world_time += delta_time
+
+        # Dépiler les respawns échus (le plus proche est toujours en tête du tas)
+        while self._respawn_heap and self._respawn_heap[0][0] <= self.world_time:
+            respawn_time, x, y = heapq.heappop(self._respawn_heap)
+
+            # Ignorer les entrées périmées (case re-planifiée depuis)
+            if self.depleted_tiles.get((x, y)) != respawn_time:
+                continue
+            del self.depleted_tiles[(x, y)]
+
+            # Restaurer le terrain original
+            self.restore_original_terrain(x, y)
+
+    def schedule_respawn(self, grid_x, grid_y, delay=RESOURCE_RESPAWN_TIME):
+        """
+        Planifie la régénération d'une ressource épuisée
+        Args:
+            grid_x, grid_y: Coordonnées de la case épuisée
+            delay: Délai avant respawn en secondes
+        """
+        respawn_time = self.world_time + delay
+        self.depleted_tiles[(grid_x, grid_y)] = respawn_time
+        heapq.heappush(self._respawn_heap, (respawn_time, grid_x, grid_y))
+
+    def set_focus(self, position_x, position_y):
+        """
+        Indique la position du joueur (la carte fixe est déjà entièrement générée)
+        Args:
+            position_x, position_y: Position du joueur en pixels
+        """
+
+    def close(self):
+        """Libère les ressources du monde (rien à faire pour une carte fixe)"""
+
+    def get_original_terrain(self, grid_x, grid_y):
+        """Retourne le terrain d'origine d'une case (avant récolte)"""
+        return self.terrain.get_original(grid_x, grid_y)
+
+    def restore_original_terrain(self, grid_x, grid_y):
+        """Rend à une case son terrain d'origine (respawn d'une ressource)"""
+        self.set_terrain(grid_x, grid_y, self.get_original_terrain(grid_x, grid_y))
+
+    def in_bounds(self, grid_x, grid_y):
+        """Vérifie qu'une case fait partie de la carte"""
+        return 0 <= grid_x < GRID_SIZE and 0 <= grid_y < GRID_SIZE
+
+    def contains_position(self, position_x, position_y, size):
+        """
+        Vérifie qu'une entité reste entièrement dans la carte
+        Args:
+            position_x, position_y: Position du coin haut-gauche (en pixels)
+            size: Taille de l'entité (en pixels)
+        Returns:
+            True si l'entité est dans les limites de la carte
+        """
+        map_size = GRID_SIZE * TILE_SIZE
+        return 0 <= position_x <= map_size - size and 0 <= position_y <= map_size - size
+
+    def get_spawn_position(self):
+        """Retourne la position d'apparition du joueur (centre de la carte, en pixels)"""
+        return (GRID_SIZE * TILE_SIZE) // 2, (GRID_SIZE * TILE_SIZE) // 2
+
+    def get_codes_region(self, start_x, start_y, end_x, end_y):
+        """
+        Retourne les codes de terrain d'une zone rectangulaire (pour le rendu)
+        Args:
+            start_x, start_y: Coin haut-gauche (inclus, en cases)
+            end_x, end_y: Coin bas-droit (exclu, en cases)
+        Returns:
+            Tableau uint8 (hauteur, largeur)
+        """
+        return self.terrain.region(start_x, start_y, end_x, end_y)
+
+    @property
+    def grid_terrain(self):
+        """Accès compatible grid_terrain[y][x] (retourne le nom du terrain)"""
+        return self.terrain
+
+    def get_terrain(self, grid_x, grid_y):
+        """
+        Retourne le type de terrain d'une case
+        Args:
+            grid_x, grid_y: Coordonnées de la case dans la grille
+        Returns:
+            Nom du terrain, ou None si hors de la carte
+        """
+        if not (0 <= grid_x < GRID_SIZE and 0 <= grid_y < GRID_SIZE):
+            return None
+        return self.terrain.get(grid_x, grid_y)
+
+    def get_speed_multiplier(self, grid_x, grid_y):
+        """
+        Retourne le multiplicateur de vitesse du terrain d'une case (désert = plus lent)
+        Args:
+            grid_x, grid_y: Coordonnées de la case dans la grille
+        """
+        if not (0 <= grid_x < GRID_SIZE and 0 <= grid_y < GRID_SIZE):
+            return 1.0
+        return SPEED_BY_CODE[self.terrain.get_code(grid_x, grid_y)]
 
-        for pos, timer in list(self.depleted_tiles.items()):
-            self.depleted_tiles[pos] -= delta_time
-            if self.depleted_tiles[pos] <= 0:
-                tiles_to_respawn.append(pos)
+    def set_terrain(self, grid_x, grid_y, terrain_type):
+        """
+        Modifie le type de terrain d'une case et invalide son chunk de rendu
+        Args:
+            grid_x, grid_y: Coordonnées de la case dans la grille
+            terrain_type: Nouveau type de terrain
+        """
+        old_terrain = self.terrain.get(grid_x, grid_y)
+        self.terrain.set(grid_x, grid_y, terrain_type)
+        self.resource_index.update_tile(grid_x, grid_y, old_terrain, terrain_type)
+        self.renderer.invalidate_tile(grid_x, grid_y)
 
-        # Régénérer les ressources
-        for x, y in tiles_to_respawn:
-            if 0 <= x < GRID_SIZE and 0 <= y < GRID_SIZE:
-                # Restaurer le terrain original
-                self.grid_terrain[y][x] = self.original_terrain[y][x]
-                del self.depleted_tiles[(x, y)]
+        # Les récoltes ne changent pas la franchissabilité ; un autre changement recalcule les régions
+        if WALKABLE_BY_CODE[TERRAIN_CODES[old_terrain]] != WALKABLE_BY_CODE[TERRAIN_CODES[terrain_type]]:
+            self.walkability.rebuild(self.terrain.to_array(), self.walkability.walls)
+            self.navigation_version += 1
+
+    def to_save_data(self):
+        """
+        Sérialise le monde pour la sauvegarde : seed et cases modifiées seulement
+        (le terrain de base est régénéré depuis la seed au chargement)
+        Returns:
+            dict: Seed, générateur, calque des modifications, ressources épuisées
+        """
+        return {
+            'mode': self.mode,
+            'seed': self.seed,
+            'generator': self.generator,
+            'width': self.terrain.width,
+            'height': self.terrain.height,
+            'overlay': self.terrain.overlay_to_list(),
+            # Temps restant avant respawn (format historique [x, y, timer])
+            'depleted_tiles': [[x, y, max(0.0, respawn_time - self.world_time)]
+                               for (x, y), respawn_time in self.depleted_tiles.items()]
+        }
+
+    def load_save_data(self, world_data):
+        """
+        Restaure le monde depuis une sauvegarde
+        Formats acceptés : seed + calque (actuel), grilles encodées ou listes de listes (anciens,
+        le calque est alors reconstruit en comparant le terrain actuel au terrain original).
+        Args:
+            world_data: Dictionnaire produit par to_save_data
+        """
+        if 'overlay' in world_data:
+            seed = world_data['seed']
+            generator = world_data.get('generator', WORLD_GENERATOR)
+            if (seed, generator) != (self.seed, self.generator) or world_data['width'] != self.terrain.width:
+                self.terrain = LayeredTerrain(self._load_base_codes(seed, generator))
+            self.seed, self.generator = seed, generator
+            self.terrain.load_overlay(world_data['overlay'])
+        else:
+            if 'terrain' in world_data:
+                width, height = world_data['width'], world_data['height']
+                current = TerrainGrid.from_save_string(width, height, world_data['terrain'])
+                original = TerrainGrid.from_save_string(width, height, world_data['original_terrain'])
+            else:
+                # Ancien format : listes de listes de noms de terrain
+                current = TerrainGrid.from_list(world_data['grid_terrain'])
+                original = TerrainGrid.from_list(world_data.get('original_terrain', world_data['grid_terrain']))
+            self.terrain = LayeredTerrain(original.codes)
+            self.terrain.load_overlay_from_diff(current.codes)
+
+        # Restaurer les tiles épuisées
+        self._init_respawns()
+        for x, y, remaining_time in world_data.get('depleted_tiles', []):
+            self.schedule_respawn(x, y, remaining_time)
+
+        current_codes = self.terrain.to_array()
+        self.resource_index.clear()
+        self.resource_index.add_region(current_codes)
+        # Les murs sont réenregistrés par le jeu en restaurant les bâtiments
+        self.walkability = WalkabilityMap(current_codes)
+        self.navigation_version += 1
+        self.renderer.invalidate_all()
 
     def generate_terrain(self):
         """Génère le terrain procédural avec lacs, montagnes, forêts et déserts"""
@@ -75,6 +325,7 @@ class World:
 
     def _generate_water_bodies(self):
         """Crée des lacs avec croissance par cluster"""
+        codes = self.terrain.codes
         num_lakes = 2  # Nombre de lacs
 
         for _ in range(num_lakes):
@@ -85,7 +336,7 @@ class World:
             # Taille du lac
             lake_size = random.randint(5, 12)
             water_tiles = [(seed_x, seed_y)]
-            self.grid_terrain[seed_y][seed_x] = TERRAIN_WATER
+            codes[seed_y, seed_x] = WATER
 
             # Croissance du lac (algorithme cellulaire)
             for _ in range(lake_size):
@@ -100,12 +351,13 @@ class World:
                         # Vérifier les limites
                         if 0 <= new_x < GRID_SIZE and 0 <= new_y < GRID_SIZE:
                             # 70% de chance d'expansion
-                            if random.random() < 0.7 and self.grid_terrain[new_y][new_x] == TERRAIN_GRASS:
-                                self.grid_terrain[new_y][new_x] = TERRAIN_WATER
+                            if random.random() < 0.7 and codes[new_y, new_x] == GRASS:
+                                codes[new_y, new_x] = WATER
                                 water_tiles.append((new_x, new_y))
 
     def _generate_mountains(self):
         """Génère des chaînes de montagnes linéaires"""
+        codes = self.terrain.codes
         num_ranges = 2  # Nombre de chaînes
 
         for _ in range(num_ranges):
@@ -124,11 +376,12 @@ class World:
                 y = (start_y + i * direction[1]) % GRID_SIZE
 
                 # Ne pas écraser l'eau
-                if self.grid_terrain[y][x] not in [TERRAIN_WATER]:
-                    self.grid_terrain[y][x] = TERRAIN_MOUNTAIN
+                if codes[y, x] != WATER:
+                    codes[y, x] = MOUNTAIN
 
     def _generate_biomes(self):
         """Crée des zones de forêt (patches circulaires)"""
+        codes = self.terrain.codes
         num_forests = 3  # Nombre de forêts
 
         for _ in range(num_forests):
@@ -148,12 +401,13 @@ class World:
                         distance = (dx**2 + dy**2)**0.5
 
                         # Si dans le rayon et herbe, transformer en forêt
-                        if distance <= radius and self.grid_terrain[y][x] == TERRAIN_GRASS:
+                        if distance <= radius and codes[y, x] == GRASS:
                             if random.random() < 0.7:  # 70% de densité
-                                self.grid_terrain[y][x] = TERRAIN_FOREST
+                                codes[y, x] = FOREST
 
     def _generate_desert(self):
         """Crée des zones désertiques (patches circulaires)"""
+        codes = self.terrain.codes
         num_deserts = random.randint(1, 2)  # 1-2 zones désertiques
 
         for _ in range(num_deserts):
@@ -173,65 +427,62 @@ class World:
                         distance = (dx**2 + dy**2)**0.5
 
                         # Si dans le rayon et herbe, transformer en désert
-                        if distance <= radius and self.grid_terrain[y][x] == TERRAIN_GRASS:
-                            self.grid_terrain[y][x] = TERRAIN_DESERT
+                        if distance <= radius and codes[y, x] == GRASS:
+                            codes[y, x] = DESERT
 
     def generate_resources(self):
         """
         Génère des ressources selon les biomes
         Bois dans forêts, pierre près montagnes, etc.
+        Les parcours de toute la carte sont faits avec des masques NumPy.
         """
+        codes = self.terrain.codes
+
         # Placer du métal aléatoirement sur l'herbe (15 sources)
         metal_count = 0
         attempts = 0
         while metal_count < 15 and attempts < 100:
             x, y = random.randint(0, GRID_SIZE - 1), random.randint(0, GRID_SIZE - 1)
-            if self.grid_terrain[y][x] == TERRAIN_GRASS:
-                self.grid_terrain[y][x] = TERRAIN_METAL
+            if codes[y, x] == GRASS:
+                codes[y, x] = METAL
                 metal_count += 1
             attempts += 1
 
         # Placer de la pierre près des montagnes (8 sources)
+        # Masque des cases d'herbe voisines (4 directions) d'une montagne
+        mountain = codes == MOUNTAIN
+        near_mountain = np.zeros_like(mountain)
+        near_mountain[1:, :] |= mountain[:-1, :]
+        near_mountain[:-1, :] |= mountain[1:, :]
+        near_mountain[:, 1:] |= mountain[:, :-1]
+        near_mountain[:, :-1] |= mountain[:, 1:]
         stone_count = 0
-        for y in range(GRID_SIZE):
-            for x in range(GRID_SIZE):
-                if self.grid_terrain[y][x] == TERRAIN_GRASS:
-                    # Vérifier si à côté d'une montagne
-                    near_mountain = False
-                    for dy, dx in [(-1,0), (1,0), (0,-1), (0,1)]:
-                        ny, nx = y + dy, x + dx
-                        if 0 <= ny < GRID_SIZE and 0 <= nx < GRID_SIZE:
-                            if self.grid_terrain[ny][nx] == TERRAIN_MOUNTAIN:
-                                near_mountain = True
-                                break
-
-                    if near_mountain and random.random() < 0.4 and stone_count < 8:
-                        self.grid_terrain[y][x] = TERRAIN_STONE
-                        stone_count += 1
+        for y, x in zip(*np.nonzero(near_mountain & (codes == GRASS))):
+            if random.random() < 0.4:
+                codes[y, x] = STONE
+                stone_count += 1
+                if stone_count >= 8:
+                    break
 
         # Placer du bois dans les forêts (30% des tiles de forêt)
-        for y in range(GRID_SIZE):
-            for x in range(GRID_SIZE):
-                if self.grid_terrain[y][x] == TERRAIN_FOREST:
-                    if random.random() < 0.3:
-                        self.grid_terrain[y][x] = TERRAIN_WOOD
+        for y, x in zip(*np.nonzero(codes == FOREST)):
+            if random.random() < 0.3:
+                codes[y, x] = WOOD
 
         # Placer de la nourriture sur l'herbe (12 sources)
         food_count = 0
         attempts = 0
         while food_count < 12 and attempts < 100:
             x, y = random.randint(0, GRID_SIZE - 1), random.randint(0, GRID_SIZE - 1)
-            if self.grid_terrain[y][x] == TERRAIN_GRASS:
-                self.grid_terrain[y][x] = TERRAIN_FOOD
+            if codes[y, x] == GRASS:
+                codes[y, x] = FOOD
                 food_count += 1
             attempts += 1
 
         # Placer des cristaux d'énergie dans les déserts (40% des tiles de désert)
-        for y in range(GRID_SIZE):
-            for x in range(GRID_SIZE):
-                if self.grid_terrain[y][x] == TERRAIN_DESERT:
-                    if random.random() < 0.4:
-                        self.grid_terrain[y][x] = TERRAIN_ENERGY_CRYSTAL
+        for y, x in zip(*np.nonzero(codes == DESERT)):
+            if random.random() < 0.4:
+                codes[y, x] = ENERGY_CRYSTAL
 
     def get_terrain_color(self, terrain_type):
         """
@@ -241,27 +492,7 @@ class World:
         Returns:
             Tuple RGB représentant la couleur
         """
-        if terrain_type == TERRAIN_GRASS:
-            return COLOR_GREEN
-        elif terrain_type == TERRAIN_METAL:
-            return COLOR_GRAY
-        elif terrain_type == TERRAIN_FOOD:
-            return COLOR_DARK_GREEN
-        elif terrain_type == TERRAIN_WOOD:
-            return COLOR_WOOD_BROWN
-        elif terrain_type == TERRAIN_STONE:
-            return COLOR_STONE_GRAY
-        elif terrain_type == TERRAIN_WATER:
-            return COLOR_WATER_BLUE
-        elif terrain_type == TERRAIN_MOUNTAIN:
-            return COLOR_MOUNTAIN_GRAY
-        elif terrain_type == TERRAIN_FOREST:
-            return COLOR_FOREST_GREEN
-        elif terrain_type == TERRAIN_DESERT:
-            return COLOR_DESERT_YELLOW
-        elif terrain_type == TERRAIN_ENERGY_CRYSTAL:
-            return (0, 255, 255)  # Cyan brillant pour les cristaux d'énergie
-        return COLOR_BLACK
+        return TERRAIN_COLORS.get(terrain_type, COLOR_BLACK)
 
     def is_tile_walkable(self, grid_x, grid_y):
         """
@@ -271,23 +502,59 @@ class World:
         Returns:
             True si la case est franchissable, False sinon
         """
-        # Vérifier les limites
-        if not (0 <= grid_x < GRID_SIZE and 0 <= grid_y < GRID_SIZE):
-            return False
+        # Bitmap précalculée : eau, montagnes et hors carte bloquent le passage
+        return self.walkability.is_walkable(grid_x, grid_y)
 
-        # Eau et montagnes bloquent le passage
-        terrain = self.grid_terrain[grid_y][grid_x]
-        return terrain not in [TERRAIN_WATER, TERRAIN_MOUNTAIN]
+    def is_tile_open(self, grid_x, grid_y):
+        """
+        Vérifie si une case est libre pour les ennemis (franchissable et sans mur)
+        Args:
+            grid_x, grid_y: Coordonnées de la case dans la grille
+        Returns:
+            True si la case est libre, False sinon
+        """
+        return self.walkability.is_open(grid_x, grid_y)
 
-    def is_tile_buildable(self, grid_x, grid_y, buildings_list):
+    def set_obstacle(self, grid_x, grid_y, is_obstacle):
+        """
+        Enregistre la construction ou la destruction d'un mur (met à jour les régions connexes)
+        Args:
+            grid_x, grid_y: Coordonnées de la case du mur
+            is_obstacle: True si un mur est construit, False s'il est détruit
+        """
+        self.walkability.set_wall(grid_x, grid_y, is_obstacle)
+        self.navigation_version += 1
+
+    def get_obstacle_tiles(self):
+        """Retourne l'ensemble des cases (x, y) occupées par un mur"""
+        return self.walkability.walls
+
+    def are_connected(self, start_x, start_y, goal_x, goal_y, through_walls=False):
+        """
+        Vérifie en O(1) si une case est atteignable depuis une autre
+        Args:
+            start_x, start_y: Case de départ
+            goal_x, goal_y: Case d'arrivée
+            through_walls: Si True, les murs comptent comme franchissables (ils peuvent être détruits)
+        Returns:
+            True si un chemin existe
+        """
+        return self.walkability.are_connected(start_x, start_y, goal_x, goal_y, through_walls)
+
+    def is_tile_buildable(self, grid_x, grid_y, buildings_list, building_index=None):
         """
         Vérifie si une case est constructible (pas de bâtiment déjà présent)
         Args:
             grid_x, grid_y: Coordonnées de la case dans la grille
             buildings_list: Liste de tous les bâtiments existants
+            building_index: Index d'occupation des cases (BuildingIndex, optionnel,
+                            remplace le parcours de buildings_list)
         Returns:
             True si la case est libre, False sinon
         """
+        if building_index is not None:
+            return not building_index.is_occupied(grid_x, grid_y)
+
         # Vérifier qu'il n'y a pas déjà un bâtiment à cet endroit
         for building in buildings_list:
             if building.grid_x == grid_x and building.grid_y == grid_y:
@@ -297,26 +564,9 @@ class World:
     def draw(self, screen, camera_offset_x, camera_offset_y):
         """
         Dessine le monde (la grille de terrain) à l'écran
+        Seuls les chunks visibles sont blittés depuis le cache du renderer.
         Args:
             screen: Surface Pygame où dessiner
             camera_offset_x, camera_offset_y: Décalage de la caméra
         """
-        # Parcourir toute la grille
-        for grid_y in range(GRID_SIZE):
-            for grid_x in range(GRID_SIZE):
-                # Calculer la position en pixels (avec décalage caméra)
-                pixel_x = grid_x * TILE_SIZE - camera_offset_x
-                pixel_y = grid_y * TILE_SIZE - camera_offset_y
-
-                # Ne dessiner que les cases visibles à l'écran
-                if -TILE_SIZE < pixel_x < SCREEN_WIDTH and -TILE_SIZE < pixel_y < SCREEN_HEIGHT:
-                    # Obtenir le type de terrain et sa couleur
-                    terrain_type = self.grid_terrain[grid_y][grid_x]
-                    terrain_color = self.get_terrain_color(terrain_type)
-
-                    # Dessiner la case
-                    tile_rect = pygame.Rect(pixel_x, pixel_y, TILE_SIZE, TILE_SIZE)
-                    pygame.draw.rect(screen, terrain_color, tile_rect)
-
-                    # Bordure noire pour mieux voir la grille
-                    pygame.draw.rect(screen, COLOR_BLACK, tile_rect, 1)
+        self.renderer.draw(screen, camera_offset_x, camera_offset_y)
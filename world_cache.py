@@ -0,0 +1,104 @@
+"""
+WORLD_CACHE.PY
+==============
+Ce fichier gère le cache disque des mondes générés.
+Un monde ne dépend que de (seed, taille de la carte, générateur) : le terrain généré est
+écrit une fois dans un fichier binaire compact (en-tête + 1 octet par case), puis projeté
+en mémoire en lecture seule (np.memmap) aux lancements suivants, sans aucune génération.
+La base projetée n'est jamais modifiée : les cases récoltées vivent dans le calque de
+LayeredTerrain (terrain_grid.py).
+L'en-tête contient la version du générateur et une empreinte de ses paramètres :
+un fichier produit par un autre générateur est détecté comme périmé et régénéré.
+"""
+
+import os
+import struct
+import zlib
+import numpy as np
+import constants
+from constants import *
+import worldgen
+
+# En-tête : signature, version du format, seed, largeur, hauteur, version du générateur, empreinte
+HEADER_FORMAT = '<4sIqIIII'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+CACHE_MAGIC = b'WLDC'
+CACHE_FORMAT_VERSION = 1
+
+
+def generator_fingerprint(generator):
+    """
+    Empreinte des paramètres du générateur (change si une constante WORLDGEN_* est modifiée)
+    L'ancien générateur n'a pas de paramètres : ses nombres de lacs, de montagnes et de
+    ressources sont écrits en dur dans World.generate_terrain / generate_resources.
+    Son empreinte ne dépend que de son nom ; seule la version du générateur
+    (worldgen.WORLDGEN_VERSION, aussi dans l'en-tête) périme ses fichiers.
+    Args:
+        generator: 'noise' ou 'legacy'
+    Returns:
+        Entier 32 bits
+    """
+    if generator == 'legacy':
+        parameters = [generator]
+    else:
+        parameters = [generator] + [(name, value) for name, value in sorted(vars(constants).items())
+                                    if name.startswith('WORLDGEN_')]
+    return zlib.crc32(repr(parameters).encode('utf-8'))
+
+
+def cache_path(seed, width, height, generator, directory=WORLD_CACHE_DIR):
+    """Retourne le chemin du fichier de cache d'un monde"""
+    return os.path.join(directory, f"world_{seed}_{width}x{height}_{generator}_v{worldgen.WORLDGEN_VERSION}.bin")
+
+
+def load_terrain(seed, width, height, generator, mode='r', directory=WORLD_CACHE_DIR):
+    """
+    Projette en mémoire le terrain d'un monde déjà généré
+    Args:
+        seed, width, height, generator: Clé du monde
+        mode: Mode du memmap ('r' lecture seule, 'c' copie à l'écriture : les modifications restent en RAM)
+        directory: Dossier du cache
+    Returns:
+        np.memmap uint8 (height, width), ou None si absent ou périmé
+    """
+    path = cache_path(seed, width, height, generator, directory)
+    try:
+        with open(path, 'rb') as cache_file:
+            header = cache_file.read(HEADER_SIZE)
+    except FileNotFoundError:
+        return None
+
+    expected_header = _make_header(seed, width, height, generator)
+    if header != expected_header or os.path.getsize(path) != HEADER_SIZE + width * height:
+        print(f"♻️ Cache du monde périmé ({os.path.basename(path)}), régénération")
+        return None
+
+    return np.memmap(path, dtype=np.uint8, mode=mode, offset=HEADER_SIZE, shape=(height, width))
+
+
+def store_terrain(seed, width, height, generator, codes, directory=WORLD_CACHE_DIR):
+    """
+    Écrit le terrain généré d'un monde dans le cache
+    Le fichier est écrit à côté puis renommé : un lancement interrompu ne laisse pas de fichier tronqué.
+    Args:
+        seed, width, height, generator: Clé du monde
+        codes: Tableau uint8 (height, width) tel que généré
+        directory: Dossier du cache
+    """
+    path = cache_path(seed, width, height, generator, directory)
+    temporary_path = path + '.tmp'
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(temporary_path, 'wb') as cache_file:
+            cache_file.write(_make_header(seed, width, height, generator))
+            cache_file.write(np.ascontiguousarray(codes, dtype=np.uint8).tobytes())
+        os.replace(temporary_path, path)
+    except OSError as error:
+        # Le cache n'est qu'une accélération : le jeu continue sans
+        print(f"⚠️ Impossible d'écrire le cache du monde : {error}")
+
+
+def _make_header(seed, width, height, generator):
+    """Construit l'en-tête binaire attendu pour un monde"""
+    return struct.pack(HEADER_FORMAT, CACHE_MAGIC, CACHE_FORMAT_VERSION, seed, width, height,
+                       worldgen.WORLDGEN_VERSION, generator_fingerprint(generator))
@@ -0,0 +1,236 @@
+"""
+WORLDGEN.PY
+===========
+Ce fichier contient le générateur de monde vectorisé (NumPy).
+Le terrain est produit en bloc à partir de champs de bruit (value noise fractal) :
+altitude (lacs), crêtes (chaînes de montagnes), humidité (forêts et déserts).
+Les ressources sont ensuite réparties avec des masques de tableaux.
+
+Tout le hasard vient d'un hachage des coordonnées de la case et de la seed :
+une même seed donne toujours exactement le même monde, quelle que soit la taille
+de la zone générée ou l'ordre de génération (utile pour générer des morceaux de carte).
+"""
+
+import numpy as np
+from constants import *
+
+# Version du générateur : à incrémenter dès que le résultat change pour une même seed
+# (y compris pour l'ancien générateur de World, dont les paramètres sont écrits en dur)
+WORLDGEN_VERSION = 1
+
+# Codes entiers des terrains
+GRASS = TERRAIN_CODES[TERRAIN_GRASS]
+METAL = TERRAIN_CODES[TERRAIN_METAL]
+FOOD = TERRAIN_CODES[TERRAIN_FOOD]
+WOOD = TERRAIN_CODES[TERRAIN_WOOD]
+STONE = TERRAIN_CODES[TERRAIN_STONE]
+WATER = TERRAIN_CODES[TERRAIN_WATER]
+MOUNTAIN = TERRAIN_CODES[TERRAIN_MOUNTAIN]
+FOREST = TERRAIN_CODES[TERRAIN_FOREST]
+DESERT = TERRAIN_CODES[TERRAIN_DESERT]
+ENERGY_CRYSTAL = TERRAIN_CODES[TERRAIN_ENERGY_CRYSTAL]
+
+# "Sels" des différents champs de bruit (chaque champ est indépendant)
+SALT_ELEVATION = 1
+SALT_RIDGES = 2
+SALT_MOISTURE = 3
+SALT_SCATTER = 4
+
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+
+def _hash_coords(seed, salt, ix, iy):
+    """
+    Hache des coordonnées entières en entiers 64 bits pseudo-aléatoires
+    Args:
+        seed: Graine du monde
+        salt: Identifiant du champ (pour décorréler les champs)
+        ix, iy: Tableaux d'entiers (peuvent être négatifs), diffusables ensemble
+    Returns:
+        Tableau uint64
+    """
+    key = np.uint64((seed * 0x9E3779B97F4A7C15 + salt * 0xBF58476D1CE4E5B9) & _MASK_64)
+    hx = np.asarray(ix, dtype=np.int64).view(np.uint64) * np.uint64(0xD6E8FEB86659FD93)
+    hy = np.asarray(iy, dtype=np.int64).view(np.uint64) * np.uint64(0xA0761D6478BD642F)
+    h = hx ^ hy ^ key
+    # Finaliseur de splitmix64
+    h ^= h >> np.uint64(30)
+    h *= np.uint64(0xBF58476D1CE4E5B9)
+    h ^= h >> np.uint64(27)
+    h *= np.uint64(0x94D049BB133111EB)
+    h ^= h >> np.uint64(31)
+    return h
+
+
+def _hash_to_unit(h):
+    """Convertit des hachages uint64 en flottants float32 dans [0, 1)"""
+    return (h >> np.uint64(40)).astype(np.float32) * np.float32(1.0 / (1 << 24))
+
+
+def _smoothstep(t):
+    """Courbe d'interpolation douce 3t² - 2t³"""
+    return t * t * (3.0 - 2.0 * t)
+
+
+def value_noise(seed, salt, x0, y0, width, height, scale):
+    """
+    Bruit de valeurs interpolé sur une zone rectangulaire
+    Les valeurs aléatoires sont posées sur un réseau de pas `scale` cases,
+    puis interpolées (séparément en x puis en y).
+    Args:
+        seed, salt: Graine et identifiant du champ
+        x0, y0: Coin haut-gauche de la zone (en cases)
+        width, height: Taille de la zone (en cases)
+        scale: Taille d'une cellule du réseau (en cases)
+    Returns:
+        Tableau float32 (height, width) dans [0, 1)
+    """
+    # Coordonnées des cases dans le repère du réseau
+    xs = (np.arange(x0, x0 + width, dtype=np.float64) + 0.5) / scale
+    ys = (np.arange(y0, y0 + height, dtype=np.float64) + 0.5) / scale
+    cell_x = np.floor(xs).astype(np.int64)
+    cell_y = np.floor(ys).astype(np.int64)
+    fx = _smoothstep((xs - cell_x).astype(np.float32))
+    fy = _smoothstep((ys - cell_y).astype(np.float32))
+
+    # Valeurs aléatoires aux nœuds du réseau couvrant la zone
+    first_x, first_y = cell_x[0], cell_y[0]
+    lattice_x = np.arange(first_x, cell_x[-1] + 2, dtype=np.int64)
+    lattice_y = np.arange(first_y, cell_y[-1] + 2, dtype=np.int64)
+    lattice = _hash_to_unit(_hash_coords(seed, salt, lattice_x[np.newaxis, :], lattice_y[:, np.newaxis]))
+
+    # Interpolation en x (petit tableau : une ligne par nœud en y)
+    local_x = cell_x - first_x
+    rows = lattice[:, local_x] * (1.0 - fx) + lattice[:, local_x + 1] * fx
+
+    # Interpolation en y (tableau final)
+    local_y = cell_y - first_y
+    noise = rows[local_y]
+    noise *= (1.0 - fy)[:, np.newaxis]
+    noise += rows[local_y + 1] * fy[:, np.newaxis]
+    return noise
+
+
+def fractal_noise(seed, salt, x0, y0, width, height, scale, octaves):
+    """
+    Somme de plusieurs octaves de bruit (détails de plus en plus fins)
+    Returns:
+        Tableau float32 (height, width) normalisé dans [0, 1)
+    """
+    total = value_noise(seed, salt * 16, x0, y0, width, height, scale)
+    amplitude = 1.0
+    amplitude_sum = 1.0
+    for octave in range(1, octaves):
+        amplitude *= 0.5
+        scale = max(1.0, scale / 2.0)
+        octave_noise = value_noise(seed, salt * 16 + octave, x0, y0, width, height, scale)
+        octave_noise *= np.float32(amplitude)
+        total += octave_noise
+        amplitude_sum += amplitude
+    total *= np.float32(1.0 / amplitude_sum)
+    return total
+
+
+def _count_in_box(mask, radius):
+    """
+    Compte les cases vraies dans un carré de rayon donné autour de chaque case
+    (convolution par un noyau carré via une table de sommes cumulées)
+    Args:
+        mask: Tableau booléen (height, width)
+        radius: Demi-côté du carré en cases
+    Returns:
+        Tableau int32 (height, width)
+    """
+    height, width = mask.shape
+    padded = np.pad(mask.astype(np.int32), radius)
+    integral = np.zeros((padded.shape[0] + 1, padded.shape[1] + 1), dtype=np.int32)
+    integral[1:, 1:] = padded.cumsum(axis=0).cumsum(axis=1)
+    size = 2 * radius + 1
+    return (integral[size:size + height, size:size + width]
+            - integral[:height, size:size + width]
+            - integral[size:size + height, :width]
+            + integral[:height, :width])
+
+
+def generate_region(seed, x0, y0, width, height):
+    """
+    Génère les codes de terrain d'une zone rectangulaire du monde
+    Args:
+        seed: Graine du monde
+        x0, y0: Coin haut-gauche de la zone (en cases)
+        width, height: Taille de la zone (en cases)
+    Returns:
+        Tableau uint8 (height, width) de codes de terrain
+    """
+    # Marge autour de la zone pour que les voisinages (pierre près des montagnes)
+    # soient identiques quel que soit le découpage
+    margin = WORLDGEN_STONE_RADIUS
+    gx0, gy0 = x0 - margin, y0 - margin
+    gwidth, gheight = width + 2 * margin, height + 2 * margin
+
+    elevation = fractal_noise(seed, SALT_ELEVATION, gx0, gy0, gwidth, gheight,
+                              WORLDGEN_ELEVATION_SCALE, WORLDGEN_OCTAVES)
+    ridges = fractal_noise(seed, SALT_RIDGES, gx0, gy0, gwidth, gheight,
+                           WORLDGEN_RIDGE_SCALE, WORLDGEN_OCTAVES)
+    moisture = fractal_noise(seed, SALT_MOISTURE, gx0, gy0, gwidth, gheight,
+                             WORLDGEN_MOISTURE_SCALE, WORLDGEN_OCTAVES)
+
+    codes = np.full((gheight, gwidth), GRASS, dtype=np.uint8)
+
+    # Lacs : zones basses
+    water = elevation < WORLDGEN_WATER_LEVEL
+    codes[water] = WATER
+
+    # Chaînes de montagnes : crêtes étroites (bruit "ridged") hors de l'eau
+    ridge_strength = 1.0 - np.abs(2.0 * ridges - 1.0)
+    mountain = (ridge_strength > WORLDGEN_MOUNTAIN_RIDGE) & (elevation > WORLDGEN_MOUNTAIN_MIN_ELEVATION) & ~water
+    codes[mountain] = MOUNTAIN
+
+    # Biomes selon l'humidité
+    grass = codes == GRASS
+    codes[grass & (moisture > WORLDGEN_FOREST_MOISTURE)] = FOREST
+    codes[grass & (moisture < WORLDGEN_DESERT_MOISTURE)] = DESERT
+
+    # Un seul tirage aléatoire par case pour toutes les ressources
+    tile_x = np.arange(gx0, gx0 + gwidth, dtype=np.int64)
+    tile_y = np.arange(gy0, gy0 + gheight, dtype=np.int64)
+    scatter = _hash_to_unit(_hash_coords(seed, SALT_SCATTER, tile_x[np.newaxis, :], tile_y[:, np.newaxis]))
+
+    # Pierre sur l'herbe proche des montagnes (distance via convolution)
+    grass = codes == GRASS
+    near_mountain = _count_in_box(mountain, WORLDGEN_STONE_RADIUS) > 0
+    codes[grass & near_mountain & (scatter < WORLDGEN_STONE_DENSITY)] = STONE
+
+    # Métal et nourriture éparpillés sur l'herbe (plages de tirage disjointes)
+    grass = codes == GRASS
+    codes[grass & (scatter < WORLDGEN_METAL_DENSITY)] = METAL
+    food_band = (scatter >= WORLDGEN_METAL_DENSITY) & (scatter < WORLDGEN_METAL_DENSITY + WORLDGEN_FOOD_DENSITY)
+    codes[grass & food_band] = FOOD
+
+    # Bois dans les forêts, cristaux d'énergie dans les déserts
+    codes[(codes == FOREST) & (scatter < WORLDGEN_WOOD_DENSITY)] = WOOD
+    codes[(codes == DESERT) & (scatter < WORLDGEN_CRYSTAL_DENSITY)] = ENERGY_CRYSTAL
+
+    return codes[margin:margin + height, margin:margin + width].copy()
+
+
+def generate_world(seed, width, height):
+    """
+    Génère une carte complète de taille fixe
+    Le centre (point d'apparition du joueur) est dégagé des obstacles.
+    Args:
+        seed: Graine du monde
+        width, height: Taille de la carte en cases
+    Returns:
+        Tableau uint8 (height, width) de codes de terrain
+    """
+    codes = generate_region(seed, 0, 0, width, height)
+
+    # Dégager une clairière au point d'apparition
+    radius = WORLDGEN_SPAWN_CLEAR_RADIUS
+    center_x, center_y = width // 2, height // 2
+    ys, xs = np.ogrid[:height, :width]
+    clearing = (xs - center_x) ** 2 + (ys - center_y) ** 2 <= radius * radius
+    codes[clearing & ((codes == WATER) | (codes == MOUNTAIN))] = GRASS
+
+    return codes